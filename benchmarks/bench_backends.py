@@ -0,0 +1,112 @@
+"""Benchmark bulk ingestion throughput of the database backends.
+
+Writes the same synthetic posts to each backend in collector-sized batches,
+then re-sends them twice: once unchanged (the dedup path) and once with new
+engagement numbers (the metrics-refresh path). PostgreSQL and MySQL are only
+included when a connection URL is given.
+
+Usage:
+    uv run python -m benchmarks.bench_backends --posts 100000 --batch-size 500 \\
+        --postgres-url postgresql+psycopg://socflow@localhost/socflow_bench \\
+        --mysql-url mysql+pymysql://socflow@localhost/socflow_bench
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List
+
+from src.database.base import DatabaseManager
+from src.database.sqlite import SQLiteManager
+from src.models.base import BasePost, Metrics
+
+PLATFORMS = ["reddit", "bluesky", "mastodon"]
+
+
+def make_posts(count: int, likes: int = 0) -> List[BasePost]:
+    """Build synthetic posts spread across platforms and a year of dates."""
+    start = datetime(2024, 1, 1)
+    return [
+        BasePost(
+            platform=PLATFORMS[i % len(PLATFORMS)],
+            object_id=f"post_{i}",
+            author_handle=f"user_{i % 500}",
+            text=f"Synthetic post {i} " + "lorem ipsum " * 20,
+            created_at=start + timedelta(minutes=5 * i),
+            metrics=Metrics(likes=likes + i % 100, comments=i % 10),
+            raw_data={"id": i, "payload": "x" * 512},
+        )
+        for i in range(count)
+    ]
+
+
+def timed_pass(manager: DatabaseManager, posts: List[BasePost], batch_size: int) -> Dict[str, float]:
+    """Insert ``posts`` in batches and return posts/second plus the summed counts."""
+    totals = {"inserted": 0, "updated": 0, "metrics_updated": 0, "skipped": 0}
+    started = time.perf_counter()
+    for start in range(0, len(posts), batch_size):
+        result = manager.insert_posts(posts[start:start + batch_size])
+        for key in totals:
+            totals[key] += result[key]
+    elapsed = time.perf_counter() - started
+    return {"posts_per_s": len(posts) / elapsed, **totals}
+
+
+def run(manager: DatabaseManager, count: int, batch_size: int) -> Dict[str, Dict[str, float]]:
+    """Run the insert, unchanged and metrics-refresh passes on one backend."""
+    manager.create_tables(PLATFORMS)
+    return {
+        "insert": timed_pass(manager, make_posts(count), batch_size),
+        "unchanged": timed_pass(manager, make_posts(count), batch_size),
+        "metrics": timed_pass(manager, make_posts(count, likes=1000), batch_size),
+    }
+
+
+def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--posts', type=int, default=50_000, help='Posts per pass')
+    parser.add_argument('--batch-size', type=int, default=500, help='Posts per insert_posts call')
+    parser.add_argument('--postgres-url', help='SQLAlchemy URL of an empty PostgreSQL database')
+    parser.add_argument('--mysql-url', help='SQLAlchemy URL of an empty MySQL/MariaDB database')
+    args = parser.parse_args()
+    
+    results = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = SQLiteManager(f"sqlite:///{Path(tmpdir) / 'bench.db'}")
+        try:
+            results["sqlite"] = run(manager, args.posts, args.batch_size)
+        finally:
+            manager.close()
+    
+    if args.postgres_url:
+        from src.database.postgresql import PostgreSQLManager
+        
+        manager = PostgreSQLManager(args.postgres_url)
+        try:
+            results["postgresql"] = run(manager, args.posts, args.batch_size)
+        finally:
+            manager.close()
+    
+    if args.mysql_url:
+        from src.database.mysql import MySQLManager
+        
+        manager = MySQLManager(args.mysql_url)
+        try:
+            results["mysql"] = run(manager, args.posts, args.batch_size)
+        finally:
+            manager.close()
+    
+    print(f"{'backend':<12}{'pass':<12}{'posts/s':>12}{'inserted':>10}{'updated':>10}{'metrics':>10}{'skipped':>10}")
+    for backend, passes in results.items():
+        for name, result in passes.items():
+            print(
+                f"{backend:<12}{name:<12}{result['posts_per_s']:>12.0f}{result['inserted']:>10}"
+                f"{result['updated']:>10}{result['metrics_updated']:>10}{result['skipped']:>10}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""Benchmark the typical read queries against a large synthetic SQLite database.
+
+Builds (or reuses) a database of synthetic posts spread over a year, three
+platforms, a few hundred subreddits and a few dozen Mastodon instances, then
+runs the manager's read methods for the common query shapes. Every SQL
+statement a method issues is checked with ``EXPLAIN QUERY PLAN``: it must use
+the expected index and must not sort in a temporary B-tree. Timings are the
+median and 95th percentile over randomized parameters.
+
+``--legacy-indexes`` swaps the composite indexes for the old single-column
+ones on the same file, for a before/after comparison.
+
+Usage:
+    uv run python -m benchmarks.bench_queries --rows 2000000 --db /tmp/bench_queries.db
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from sqlalchemy import event, text
+
+from src.database.sqlite import SQLiteManager
+
+PLATFORMS = ["reddit", "bluesky", "mastodon"]
+SUBREDDITS = [f"subreddit_{i}" for i in range(300)]
+INSTANCES = [f"instance{i}.social" for i in range(40)]
+START = datetime(2024, 1, 1)
+SPAN = timedelta(days=365)
+
+COMPOSITE_INDEXES = ("ix_posts_platform_created_at", "ix_posts_subreddit_created_at", "ix_posts_instance_created_at")
+LEGACY_INDEXES = {
+    "ix_posts_platform": "CREATE INDEX IF NOT EXISTS ix_posts_platform ON posts (platform)",
+    "ix_posts_object_id": "CREATE INDEX IF NOT EXISTS ix_posts_object_id ON posts (object_id)",
+}
+
+INSERT_COLUMNS = (
+    "platform", "object_id", "author_handle", "text", "created_at", "updated_at", "metrics",
+    "text_hash", "metrics_hash", "subreddit", "instance", "is_comment", "is_nsfw",
+)
+
+
+def synthetic_rows(count: int, seed: int = 7):
+    """Yield ``posts`` rows in ``INSERT_COLUMNS`` order, created in random order."""
+    rng = random.Random(seed)
+    for i in range(count):
+        platform = PLATFORMS[i % len(PLATFORMS)]
+        created_at = START + timedelta(seconds=rng.randrange(int(SPAN.total_seconds())))
+        stamp = created_at.strftime("%Y-%m-%d %H:%M:%S.%f")
+        yield (
+            platform,
+            f"post_{i}",
+            f"user_{rng.randrange(50_000)}",
+            f"Synthetic post {i} " + "lorem ipsum " * rng.randrange(2, 12),
+            stamp,
+            stamp,
+            '{"likes": %d}' % rng.randrange(1000),
+            f"{rng.getrandbits(64):016x}",
+            f"{rng.getrandbits(64):016x}",
+            rng.choice(SUBREDDITS) if platform == "reddit" else None,
+            rng.choice(INSTANCES) if platform == "mastodon" else None,
+            0,
+            0,
+        )
+
+
+def populate(manager: SQLiteManager, count: int, chunk_size: int = 50_000) -> None:
+    """Bulk-load synthetic rows directly, bypassing change detection."""
+    statement = (
+        f"INSERT INTO posts ({', '.join(INSERT_COLUMNS)}) "
+        f"VALUES ({', '.join('?' * len(INSERT_COLUMNS))})"
+    )
+    rows = synthetic_rows(count)
+    loaded = 0
+    started = time.perf_counter()
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        with manager.engine.begin() as conn:
+            conn.exec_driver_sql(statement, chunk)
+        loaded += len(chunk)
+        print(f"\rLoaded {loaded:,}/{count:,} rows ({time.perf_counter() - started:.0f}s)", end="", file=sys.stderr)
+    print(file=sys.stderr)
+    with manager.engine.begin() as conn:
+        conn.execute(text("ANALYZE"))
+
+
+def use_legacy_indexes(manager: SQLiteManager) -> None:
+    """Replace the composite indexes with the previous single-column ones."""
+    with manager.engine.begin() as conn:
+        for name in COMPOSITE_INDEXES:
+            conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+        for ddl in LEGACY_INDEXES.values():
+            conn.execute(text(ddl))
+        conn.execute(text("ANALYZE"))
+
+
+def random_range(rng: random.Random, days: int) -> Tuple[datetime, datetime]:
+    """A random ``days``-long window inside the synthetic time span."""
+    since = START + timedelta(days=rng.randrange(SPAN.days - days))
+    return since, since + timedelta(days=days)
+
+
+# (name, expected index, call) — each call runs one manager read method
+CASES: List[Tuple[str, str, Callable[[SQLiteManager, random.Random], object]]] = [
+    (
+        "platform, 1-day range",
+        "ix_posts_platform_created_at",
+        lambda m, rng: list(m.iter_posts(rng.choice(PLATFORMS), *random_range(rng, 1), batch_size=1000)),
+    ),
+    (
+        "platform, 7-day range, first 1000",
+        "ix_posts_platform_created_at",
+        lambda m, rng: list(islice(m.iter_posts(rng.choice(PLATFORMS), *random_range(rng, 7), batch_size=1000), 1000)),
+    ),
+    (
+        "all platforms, 1-day range",
+        "ix_posts_created_at",
+        lambda m, rng: list(m.iter_posts(None, *random_range(rng, 1), batch_size=1000)),
+    ),
+    (
+        "latest 50 per platform",
+        "ix_posts_platform_created_at",
+        lambda m, rng: m.get_latest_posts(platform=rng.choice(PLATFORMS), limit=50),
+    ),
+    (
+        "latest 50 per subreddit",
+        "ix_posts_subreddit_created_at",
+        lambda m, rng: m.get_latest_posts(subreddit=rng.choice(SUBREDDITS), limit=50),
+    ),
+    (
+        "latest 50 per instance",
+        "ix_posts_instance_created_at",
+        lambda m, rng: m.get_latest_posts(instance=rng.choice(INSTANCES), limit=50),
+    ),
+]
+
+
+class PlanRecorder:
+    """Collect the SELECT statements run on an engine, for EXPLAIN QUERY PLAN."""
+    
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements: List[Tuple[str, object]] = []
+        event.listen(engine, "before_cursor_execute", self._record)
+    
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and " posts" in statement:
+            self.statements.append((statement, parameters))
+    
+    def close(self) -> None:
+        event.remove(self.engine, "before_cursor_execute", self._record)
+    
+    def plans(self) -> List[str]:
+        """Query plan of each recorded statement, one string per statement."""
+        plans = []
+        with self.engine.connect() as conn:
+            for statement, parameters in self.statements:
+                rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+                plans.append("; ".join(row[-1] for row in rows))
+        return plans
+
+
+def run_case(manager: SQLiteManager, call, expected: str, repeat: int, seed: int) -> Dict[str, object]:
+    """Time one query shape and check the plan of every statement it ran."""
+    rng = random.Random(seed)
+    recorder = PlanRecorder(manager.read_engine)
+    timings = []
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            call(manager, rng)
+            timings.append(time.perf_counter() - started)
+    finally:
+        recorder.close()
+    
+    plans = recorder.plans()
+    problems = sorted({
+        plan for plan in plans
+        if f"INDEX {expected} " not in f"{plan} " or "TEMP B-TREE" in plan
+    })
+    timings.sort()
+    return {
+        "median_ms": statistics.median(timings) * 1000,
+        "p95_ms": timings[min(len(timings) - 1, int(len(timings) * 0.95))] * 1000,
+        "plan": plans[0] if plans else "",
+        "problems": problems,
+    }
+
+
+def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=2_000_000, help='Synthetic posts to load into a new database')
+    parser.add_argument('--db', help='Database file; reused if it already holds posts (default: temporary)')
+    parser.add_argument('--repeat', type=int, default=50, help='Runs per query shape')
+    parser.add_argument('--legacy-indexes', action='store_true',
+                        help='Benchmark the previous single-column indexes instead')
+    parser.add_argument('--seed', type=int, default=1, help='Seed for query parameters')
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(args.db) if args.db else Path(tmpdir) / "bench_queries.db"
+        manager = SQLiteManager(f"sqlite:///{db_path}")
+        try:
+            manager.create_tables(PLATFORMS)
+            if manager.get_post_count() == 0:
+                populate(manager, args.rows)
+            if args.legacy_indexes:
+                use_legacy_indexes(manager)
+            
+            print(f"{manager.get_post_count():,} posts, {'legacy' if args.legacy_indexes else 'composite'} indexes\n")
+            print(f"{'query':<36}{'median ms':>11}{'p95 ms':>10}  plan")
+            failures = 0
+            for name, expected, call in CASES:
+                result = run_case(manager, call, expected, args.repeat, args.seed)
+                status = "ok" if not result["problems"] else "MISS"
+                print(f"{name:<36}{result['median_ms']:>11.2f}{result['p95_ms']:>10.2f}  {status}: {result['plan']}")
+                for plan in result["problems"]:
+                    print(f"{'':<57}expected {expected}, got: {plan}")
+                failures += bool(result["problems"])
+        finally:
+            manager.close()
+    
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Benchmark TUI-style reads while collectors are writing.
+
+Runs one writer thread that inserts collector-sized batches and several reader
+threads that poll per-platform post counts (what the TUI refreshes), first with
+the legacy connection setup and then with the SQLite performance profile.
+
+Usage:
+    uv run python -m benchmarks.bench_sqlite_profile --duration 10 --readers 3
+"""
+
+import argparse
+import statistics
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+from src.config.settings import SQLitePerformanceConfig
+from src.database.sqlite import SQLiteManager
+from src.models.base import BasePost, Metrics
+
+PLATFORMS = ["reddit", "bluesky", "mastodon"]
+
+
+def make_batch(start: int, size: int) -> List[BasePost]:
+    """Build a batch of synthetic posts spread across platforms."""
+    return [
+        BasePost(
+            platform=PLATFORMS[i % len(PLATFORMS)],
+            object_id=f"post_{i}",
+            author_handle=f"user_{i % 500}",
+            text=f"Synthetic post {i} " + "lorem ipsum " * 20,
+            created_at=datetime.now(),
+            metrics=Metrics(likes=i % 100, comments=i % 10),
+            raw_data={"id": i, "payload": "x" * 512},
+        )
+        for i in range(start, start + size)
+    ]
+
+
+def run(profile: SQLitePerformanceConfig, duration: float, readers: int, batch_size: int) -> Dict[str, float]:
+    """Run one benchmark round and return latency/throughput figures."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = SQLiteManager(f"sqlite:///{Path(tmpdir) / 'bench.db'}", performance=profile)
+        manager.create_tables(PLATFORMS)
+        
+        # Seed so counts have something to scan
+        for start in range(0, 50_000, 1000):
+            manager.insert_posts(make_batch(start, 1000))
+        
+        stop = threading.Event()
+        read_latencies: List[float] = []
+        latency_lock = threading.Lock()
+        written = [0]
+        
+        def writer():
+            next_id = 1_000_000
+            while not stop.is_set():
+                manager.insert_posts(make_batch(next_id, batch_size))
+                next_id += batch_size
+                written[0] += batch_size
+        
+        def reader():
+            local = []
+            while not stop.is_set():
+                for platform in PLATFORMS:
+                    started = time.perf_counter()
+                    manager.get_post_count(platform)
+                    local.append(time.perf_counter() - started)
+            with latency_lock:
+                read_latencies.extend(local)
+        
+        threads = [threading.Thread(target=writer)]
+        threads += [threading.Thread(target=reader) for _ in range(readers)]
+        for thread in threads:
+            thread.start()
+        time.sleep(duration)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        manager.close()
+    
+    read_latencies.sort()
+    return {
+        "reads": len(read_latencies),
+        "read_p50_ms": statistics.median(read_latencies) * 1000,
+        "read_p99_ms": read_latencies[int(len(read_latencies) * 0.99) - 1] * 1000,
+        "read_max_ms": read_latencies[-1] * 1000,
+        "writes_per_s": written[0] / duration,
+    }
+
+
+def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--duration', type=float, default=10.0, help='Seconds per round')
+    parser.add_argument('--readers', type=int, default=3, help='Concurrent reader threads')
+    parser.add_argument('--batch-size', type=int, default=50, help='Posts per collector batch')
+    args = parser.parse_args()
+    
+    rounds = {
+        "legacy": SQLitePerformanceConfig(enabled=False),
+        "profile": SQLitePerformanceConfig(),
+    }
+    
+    print(f"{'setup':<10}{'reads':>10}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}{'writes/s':>12}")
+    for name, profile in rounds.items():
+        result = run(profile, args.duration, args.readers, args.batch_size)
+        print(
+            f"{name:<10}{result['reads']:>10}{result['read_p50_ms']:>10.2f}"
+            f"{result['read_p99_ms']:>10.2f}{result['read_max_ms']:>10.2f}{result['writes_per_s']:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,12 @@
 """Main SocFlow application."""
 
+import asyncio
 import os
+import threading
+from concurrent.futures import Future
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import click
 from tqdm import tqdm
@@ -10,9 +14,28 @@ from tqdm import tqdm
 from .collectors.reddit import RedditCollector
 from .collectors.bluesky import BlueskyCollector
 from .collectors.mastodon import MastodonCollector
+from .collectors.jetstream import JetstreamCollector
 from .config.settings import Settings, load_settings, save_user_config
+from .database.dedup import DedupFilter
 from .database.factory import create_database_manager
+from .database.replica import SnapshotReplica
+from .database.retention import compact_database
+from .database.writer import DatabaseWriter, PlatformWriters
+from .exporters import create_exporter, iter_batches
+from .utils.cursors import CursorStore
 from .utils.logger import setup_logger
+from .utils.rate_limit import IDLE_POLL_INTERVAL
+
+
+def _chain_future(source: Future, target: Future) -> None:
+    """Resolve ``target`` with the outcome of ``source`` once it is done."""
+    def copy(_):
+        if source.exception() is not None:
+            target.set_exception(source.exception())
+        else:
+            target.set_result(source.result())
+    
+    source.add_done_callback(copy)
 
 
 class SocFlowApp:
@@ -27,6 +50,12 @@ class SocFlowApp:
         self.settings = load_settings(config_path)
         self.logger = setup_logger(self.settings.app.log_level)
         self.db_manager = None
+        self.db_writer = None
+        self.dedup = None
+        self._dedup_warmed = False
+        self._dedup_lock = threading.Lock()
+        self.replica = None
+        self.cursors = None
         self.collectors = {}
         self._setup_database()
         self._setup_collectors()
@@ -36,12 +65,45 @@ class SocFlowApp:
         try:
             self.db_manager = create_database_manager(self.settings.database)
             self.logger.info(f"Database manager created: {self.settings.database.type}")
+            
+            writer_config = self.settings.database.writer
+            if writer_config.enabled:
+                # Separate databases have a write lock per platform, so give each its own writer
+                writer_class = PlatformWriters if self.settings.database.separate_databases else DatabaseWriter
+                self.db_writer = writer_class(
+                    self.db_manager,
+                    max_batch_size=writer_config.max_batch_size,
+                    max_latency=writer_config.max_latency_ms / 1000,
+                    max_queue_size=writer_config.max_queue_size,
+                )
+                self.logger.info("Database writer thread started")
+            
+            dedup_config = self.settings.database.dedup
+            if dedup_config.enabled:
+                self.dedup = DedupFilter(
+                    lru_size=dedup_config.lru_size,
+                    bloom_capacity=dedup_config.bloom_capacity,
+                    error_rate=dedup_config.error_rate,
+                )
+            
+            replica_config = self.settings.database.read_replica
+            if replica_config.enabled:
+                if self.settings.database.type == "sqlite":
+                    db_path = Path(self.settings.database.path or "data/socflow.db")
+                    directory = Path(replica_config.directory or db_path.parent / "snapshots")
+                    self.replica = SnapshotReplica(self.db_manager, self.settings.database, directory.resolve())
+                    self.logger.info(f"Analytics reads served from snapshots in {directory}")
+                else:
+                    self.logger.warning("read_replica is only supported for SQLite; reading the live database")
         except Exception as e:
             self.logger.error(f"Failed to setup database: {e}")
             raise
     
     def _setup_collectors(self) -> None:
         """Setup data collectors."""
+        cursor_path = Path(self.settings.app.cursor_path or Path(self.settings.app.output_dir) / "cursors.json")
+        self.cursors = CursorStore(cursor_path)
+        
         # Reddit collector
         if self.settings.collectors.reddit.enabled:
             try:
@@ -71,16 +133,143 @@ class SocFlowApp:
             except Exception as e:
                 self.logger.warning(f"Mastodon collector disabled: {e}")
                 self.settings.collectors.mastodon.enabled = False
+        
+        # Bluesky Jetstream streaming collector
+        if self.settings.collectors.jetstream.enabled:
+            jetstream_config = self.settings.collectors.jetstream.dict()
+            self.collectors["jetstream"] = JetstreamCollector(jetstream_config)
+            self.logger.info(f"Jetstream collector initialized ({jetstream_config['uri']})")
+        
+        # Continuous collection resumes from the cursors of the last stored batch
+        for collector in self.collectors.values():
+            collector.cursors = self.cursors
+    
+    @property
+    def read_db(self):
+        """Database manager for analytics reads (stats, dashboard, export).
+        
+        The snapshot replica when enabled, taking a new snapshot if the current
+        one is older than ``read_replica.max_staleness_seconds``; otherwise the
+        live database.
+        """
+        if self.replica:
+            return self.replica.get()
+        return self.db_manager
     
     def create_tables(self) -> None:
         """Create database tables."""
         if not self.db_manager:
             raise RuntimeError("Database manager not initialized")
         
-        platforms = list(self.collectors.keys())
+        # Several collectors may feed one platform (Jetstream stores Bluesky posts)
+        platforms = list(dict.fromkeys(collector.get_platform_name() for collector in self.collectors.values()))
         self.db_manager.create_tables(platforms)
         self.logger.info(f"Created tables for platforms: {platforms}")
     
+    def _warm_dedup(self) -> None:
+        """Load recently stored posts into the dedup filter, once, before the first write.
+        
+        Only commands that store posts pay for the scan; stats, export and
+        search never touch the filter.
+        """
+        with self._dedup_lock:
+            if self._dedup_warmed:
+                return
+            self._dedup_warmed = True
+            try:
+                loaded = self.dedup.warm(self.db_manager, self.settings.database.dedup.warm_limit)
+                self.logger.info(f"Dedup filter warmed with {loaded} stored posts")
+                # The Bloom filter now knows every stored key, so its misses need no lookup
+                self.db_manager.key_filter = self.dedup
+            except Exception as e:
+                # Fresh database without tables yet - start cold
+                self.logger.debug(f"Dedup filter not warmed: {e}")
+    
+    def submit_posts(self, posts: List[Any]) -> Future:
+        """Hand a batch of posts to the database.
+        
+        Posts the dedup filter knows are stored and unchanged are dropped
+        first. With the writer enabled the batch is queued and this returns
+        immediately; otherwise the posts are inserted before returning.
+        
+        Args:
+            posts: Posts to store
+            
+        Returns:
+            Future resolving to the batch's insert counts
+        """
+        submitted, dropped = self._filter_stored(posts)
+        
+        if self.db_writer:
+            write_future = self.db_writer.submit(submitted)
+        else:
+            write_future = Future()
+            try:
+                write_future.set_result(self.db_manager.insert_posts(submitted))
+            except Exception as e:
+                write_future.set_exception(e)
+        
+        if not self.dedup:
+            return write_future
+        
+        future = Future()
+        
+        def on_written(write_future):
+            error = write_future.exception()
+            if error:
+                future.set_exception(error)
+                return
+            future.set_result(self._record_written(submitted, dropped, write_future.result()))
+        
+        write_future.add_done_callback(on_written)
+        return future
+    
+    async def submit_posts_async(self, posts: List[Any], async_db=None) -> Dict[str, int]:
+        """Store a batch of posts from an event loop.
+        
+        Posts go through the same dedup filter as :meth:`submit_posts`. With
+        the writer enabled the batch joins its queue and group commits;
+        otherwise it is inserted with ``async_db`` when given, or in a worker
+        thread. The loop is never blocked either way.
+        
+        Args:
+            posts: Posts to store
+            async_db: Connected :class:`AsyncDatabaseManager` on the same database
+            
+        Returns:
+            The batch's insert counts
+        """
+        if self.db_writer or async_db is None:
+            # A full writer queue or a direct insert blocks the caller
+            future = await asyncio.to_thread(self.submit_posts, posts)
+            return await asyncio.wrap_future(future)
+        
+        submitted, dropped = await asyncio.to_thread(self._filter_stored, posts)
+        async_db.key_filter = self.db_manager.key_filter
+        counts = await async_db.insert_posts(submitted)
+        return self._record_written(submitted, dropped, counts)
+    
+    def _filter_stored(self, posts: List[Any]) -> Tuple[List[Any], int]:
+        """Drop posts the dedup filter knows are stored and unchanged.
+        
+        Returns:
+            ``(posts to write, number dropped)``
+        """
+        if not self.dedup:
+            return posts, 0
+        self._warm_dedup()
+        submitted = self.dedup.filter(posts)
+        return submitted, len(posts) - len(submitted)
+    
+    def _record_written(self, submitted: List[Any], dropped: int, counts: Dict[str, int]) -> Dict[str, int]:
+        """Count posts the dedup filter dropped as skipped, and remember the written ones."""
+        if not self.dedup:
+            return counts
+        self.dedup.remember(submitted)
+        counts = dict(counts)
+        counts["skipped"] += dropped
+        return counts
+    
     def collect_data(self, platforms: Optional[List[str]] = None, **kwargs) -> Dict[str, int]:
         """Collect data from specified platforms.
         
@@ -115,9 +304,12 @@ class SocFlowApp:
                 posts = collector.collect(**kwargs)
                 
                 if posts:
-                    self.db_manager.insert_posts(posts)
+                    counts = self.submit_posts(posts).result()
                     results[platform] = len(posts)
-                    self.logger.info(f"Collected {len(posts)} posts from {platform}")
+                    self.logger.info(
+                        f"Collected {len(posts)} posts from {platform} "
+                        f"({counts['inserted']} new, {counts['updated']} updated, {counts['skipped']} unchanged)"
+                    )
                 else:
                     results[platform] = 0
                     self.logger.warning(f"No posts collected from {platform}")
@@ -193,21 +385,30 @@ class SocFlowApp:
                         time.sleep(5)
                         continue
                     
+                    if collector.restore_cursors_after_failed_write():
+                        self.logger.warning(f"Refetching unsaved posts from {platform} after a failed write")
+                    
                     # Collect a batch of posts
                     self.logger.debug(f"Collecting from {platform}...")
                     posts = collector.collect_continuous(**kwargs)
+                    checkpoint = collector.checkpoint()
                     
                     if posts:
-                        posts_queue.put((platform, posts))
+                        # Cursors are committed once these posts and every earlier batch are stored
+                        write = Future()
+                        collector.commit_after_write(checkpoint, write)
+                        posts_queue.put((platform, posts, write))
                         self.logger.info(f"Collected {len(posts)} posts from {platform}")
                     else:
+                        collector.commit_after_write(checkpoint)
+                        # Nothing new yet; busy cycles are paced by the collectors' rate limiter
                         self.logger.debug(f"No posts collected from {platform}")
-                    
-                    # Small delay between collections to avoid rate limiting
-                    time.sleep(5)
+                        time.sleep(IDLE_POLL_INTERVAL)
                     
                 except Exception as e:
                     self.logger.error(f"Error collecting from {platform}: {e}")
+                    # The cursors may have moved past posts that were never handed over
+                    collector.restore_cursors()
                     time.sleep(10)  # Wait longer on error
         
         # Start collection threads for each platform
@@ -231,23 +432,55 @@ class SocFlowApp:
             self.logger.warning("No active collection threads started")
             return
         
+        compact_interval = self.settings.database.retention.interval_minutes * 60
+        if compact_interval > 0:
+            def compact_periodically():
+                """Apply retention policies in the background between collections."""
+                while True:
+                    time.sleep(compact_interval)
+                    try:
+                        self.compact()
+                    except Exception as e:
+                        self.logger.error(f"Error compacting database: {e}")
+            
+            threading.Thread(target=compact_periodically, name="Compactor", daemon=True).start()
+            self.logger.info(f"Compacting the database every {compact_interval // 60} minutes")
+        
         try:
             while True:
                 try:
                     # Get posts from any platform
-                    platform, posts = posts_queue.get(timeout=10)
+                    platform, posts, write = posts_queue.get(timeout=10)
                     
                     if posts:
                         # Store original count for deduplication reporting
                         original_count = len(posts)
                         # Database insert is thread-safe (handled by database manager)
-                        self.db_manager.insert_posts(posts)
+                        try:
+                            future = self.submit_posts(posts)
+                        except Exception as e:
+                            self.logger.error(f"Error saving posts from {platform}: {e}")
+                            write.set_exception(e)
+                            continue
+                        _chain_future(future, write)
                         
                         # Thread-safe update of shared counter
                         with collection_lock:
                             total_collected[platform] += original_count
                             current_total = total_collected[platform]
-                        self.logger.info(f"📊 Processed {original_count} posts from {platform} (Total processed: {current_total})")
+                        
+                        def log_counts(future, platform=platform, original_count=original_count, current_total=current_total):
+                            if future.exception():
+                                self.logger.error(f"Error saving posts from {platform}: {future.exception()}")
+                                return
+                            counts = future.result()
+                            self.logger.info(
+                                f"📊 Processed {original_count} posts from {platform} "
+                                f"({counts['inserted']} new, {counts['updated']} updated) "
+                                f"(Total processed: {current_total})"
+                            )
+                        
+                        future.add_done_callback(log_counts)
                     else:
                         self.logger.debug(f"No posts to save from {platform}")
                     
@@ -272,64 +505,183 @@ class SocFlowApp:
         if not self.db_manager:
             return {}
         
+        counts = self.read_db.get_post_counts()
         stats = {
-            "total_posts": self.db_manager.get_post_count(),
+            "total_posts": sum(counts.values()),
             "by_platform": {}
         }
         
-        for platform in self.collectors.keys():
-            count = self.db_manager.get_post_count(platform)
-            stats["by_platform"][platform] = count
+        for collector in self.collectors.values():
+            platform = collector.get_platform_name()
+            stats["by_platform"][platform] = counts.get(platform, 0)
+        
+        if self.dedup:
+            stats["dedup"] = self.dedup.stats()
         
         return stats
     
-    def export_data(self, output_path: str, platform: Optional[str] = None) -> None:
+    def export_data(
+        self,
+        output_path: str,
+        platform: Optional[str] = None,
+        chunk_size: int = 10000,
+        partitioned: bool = False,
+        compression: str = "snappy",
+        row_group_size: Optional[int] = None,
+        workers: int = 4,
+        incremental: bool = False,
+        include_raw: bool = False
+    ) -> int:
         """Export data to file.
         
+        Posts are streamed from the database and written chunk by chunk, so
+        memory use is bounded by ``chunk_size`` rather than the table size.
+        
+        In incremental mode only posts inserted or changed since the previous
+        incremental export to the same destination are written, appended to
+        the file (JSON Lines, CSV) or as a new part file (Parquet). Changed
+        posts appear again, so consumers keep the row with the latest
+        ``updated_at`` per ``(platform, object_id)``. The watermark is only
+        advanced once the output is complete.
+        
         Args:
-            output_path: Path to output file
+            output_path: Path to output file (.json, .jsonl, .csv or .parquet)
             platform: Platform to export. If None, exports all platforms.
+            chunk_size: Number of posts fetched and written per chunk
+            partitioned: Write a ``platform=.../date=...`` Parquet dataset to the
+                ``output_path`` directory instead of a single file
+            compression: Parquet compression codec
+            row_group_size: Rows per Parquet row group
+            workers: Partitions written concurrently when partitioned
+            incremental: Export only posts changed since the last incremental run
+            include_raw: Fill the ``raw_data`` column with each post's platform payload
+            
+        Returns:
+            Number of posts exported
         """
         if not self.db_manager:
             raise RuntimeError("Database manager not initialized")
         
-        posts = self.db_manager.get_posts(platform=platform)
+        output_path = Path(output_path)
+        exporter = create_exporter(
+            output_path,
+            partitioned=partitioned,
+            compression=compression,
+            row_group_size=row_group_size,
+            max_workers=workers,
+            append=incremental,
+            sorted_by_date=not incremental
+        )
         
-        if not posts:
+        if incremental:
+            destination = self._export_destination(output_path, platform)
+            watermark = self.db_manager.get_export_watermark(destination)
+            # The watermark lives in the live database; a stale snapshot only delays posts to the next run
+            posts = self.read_db.iter_changed_posts(
+                after=watermark, platform=platform, batch_size=chunk_size, include_raw=include_raw
+            )
+        else:
+            posts = self.read_db.iter_posts(platform=platform, batch_size=chunk_size, include_raw=include_raw)
+        
+        last_post = None
+        with exporter:
+            for batch in iter_batches(posts, chunk_size):
+                exporter.write_batch(batch)
+                last_post = batch[-1]
+        
+        if incremental and last_post is not None:
+            self.db_manager.set_export_watermark(
+                destination,
+                datetime.fromisoformat(last_post["updated_at"]),
+                last_post["id"]
+            )
+        
+        if exporter.rows_written == 0:
             self.logger.warning("No data to export")
-            return
+            return 0
         
-        # Create output directory if it doesn't exist
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        self.logger.info(f"Exported {exporter.rows_written} posts to {output_path}")
+        return exporter.rows_written
+    
+    def search(
+        self,
+        query: str,
+        platform: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: int = 20,
+        offset: int = 0,
+        include_raw: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Full-text search over collected posts.
         
-        # Export based on file extension
-        if output_path.suffix == ".json":
-            import json
-            with open(output_path, 'w') as f:
-                json.dump(posts, f, indent=2, default=str)
-        elif output_path.suffix == ".csv":
-            import pandas as pd
-            df = pd.DataFrame(posts)
-            df.to_csv(output_path, index=False)
-        elif output_path.suffix == ".parquet":
-            try:
-                import pyarrow
-            except ImportError:
-                raise ImportError(
-                    "pyarrow is required for Parquet export. "
-                    "Install it with: pip install pyarrow or pip install socflow[parquet]"
-                )
-            import pandas as pd
-            df = pd.DataFrame(posts)
-            df.to_parquet(output_path, index=False)
-        else:
-            raise ValueError(f"Unsupported file format: {output_path.suffix}")
+        Args:
+            query: Search query (FTS5 syntax for SQLite)
+            platform: Filter by platform
+            since: Only posts created at or after this time
+            until: Only posts created before this time
+            limit: Maximum number of results
+            offset: Number of results to skip
+            include_raw: Also load each post's raw platform payload
+            
+        Returns:
+            Matching post dictionaries, best match first
+        """
+        if not self.db_manager:
+            raise RuntimeError("Database manager not initialized")
         
-        self.logger.info(f"Exported {len(posts)} posts to {output_path}")
+        return self.db_manager.search(
+            query, platform=platform, since=since, until=until, limit=limit, offset=offset, include_raw=include_raw
+        )
+    
+    def compact(self, platforms: Optional[List[str]] = None, full_vacuum: bool = False) -> Dict[str, Any]:
+        """Apply the retention policies and reclaim the space they free.
+        
+        Safe to run while collectors are writing: deletions and vacuum steps
+        run in small batches, except the optional full ``VACUUM``.
+        
+        Args:
+            platforms: Platforms to apply policies to. If None, all platforms.
+            full_vacuum: Rebuild the database with ``VACUUM`` first
+            
+        Returns:
+            Summary from :func:`compact_database`
+        """
+        if not self.db_manager:
+            raise RuntimeError("Database manager not initialized")
+        
+        result = compact_database(
+            self.db_manager, self.settings.database.retention, platforms=platforms, full_vacuum=full_vacuum
+        )
+        for platform, count in result["deleted_posts"].items():
+            self.logger.info(f"Deleted {count} expired posts from {platform}")
+        for platform, count in result["dropped_raw"].items():
+            self.logger.info(f"Dropped {count} expired raw payloads from {platform}")
+        self.logger.info(f"Reclaimed {result['freed_bytes'] / 1e6:.1f} MB")
+        if result["files_without_incremental"]:
+            self.logger.warning(
+                f"{result['free_bytes'] / 1e6:.1f} MB of free pages cannot be reclaimed incrementally; "
+                "run `socflow compact --full` once to enable incremental vacuum"
+            )
+        return result
+    
+    @staticmethod
+    def _export_destination(output_path: Path, platform: Optional[str]) -> str:
+        """Key identifying an export target in the watermark table."""
+        destination = str(output_path.resolve())
+        if platform:
+            destination += f"#platform={platform}"
+        return destination
     
     def close(self) -> None:
         """Close application and cleanup resources."""
+        for collector in self.collectors.values():
+            collector.close()
+        if self.db_writer:
+            # Flush queued batches before the connection goes away
+            self.db_writer.close()
+        if self.replica:
+            self.replica.close()
         if self.db_manager:
             self.db_manager.close()
         self.logger.info("Application closed")
@@ -449,6 +801,13 @@ def stats(ctx, platform):
             for platform_name, count in stats['by_platform'].items():
                 click.echo(f"  {platform_name}: {count} posts")
         
+        if 'dedup' in stats:
+            dedup = stats['dedup']
+            click.echo("\nDedup filter (this process):")
+            click.echo(f"  Hits: {dedup['hits']} (hit rate {dedup['hit_rate']:.1%})")
+            click.echo(f"  Misses: {dedup['misses']} ({dedup['definitely_new']} definitely new, {dedup['lookups_skipped']} lookups skipped)")
+            click.echo(f"  Cached keys: {dedup['cached_keys']}, Bloom keys: {dedup['bloom_keys']}")
+        
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
     finally:
@@ -456,15 +815,34 @@ def stats(ctx, platform):
 
 
 @cli.command()
-@click.option('--output', '-o', required=True, help='Output file path')
+@click.option('--output', '-o', required=True, help='Output file path (directory with --partitioned)')
 @click.option('--platform', '-p', help='Platform to export')
+@click.option('--chunk-size', default=10000, type=int, help='Posts fetched and written per chunk (default: 10000)')
+@click.option('--partitioned', is_flag=True, help='Write a Parquet dataset partitioned by platform and date')
+@click.option('--compression', default='snappy',
+              type=click.Choice(['snappy', 'zstd', 'gzip', 'brotli', 'lz4', 'none']),
+              help='Parquet compression codec (default: snappy)')
+@click.option('--row-group-size', type=int, help='Rows per Parquet row group')
+@click.option('--workers', default=4, type=int, help='Partitions written in parallel (default: 4)')
+@click.option('--incremental', is_flag=True, help='Only export posts new or changed since the last incremental export')
+@click.option('--include-raw', is_flag=True, help='Include raw platform payloads in the raw_data column')
 @click.pass_context
-def export(ctx, output, platform):
+def export(ctx, output, platform, chunk_size, partitioned, compression, row_group_size, workers, incremental, include_raw):
     """Export collected data."""
     app = SocFlowApp(ctx.obj['config'])
     
     try:
-        app.export_data(output, platform)
+        app.export_data(
+            output,
+            platform,
+            chunk_size=chunk_size,
+            partitioned=partitioned,
+            compression=compression,
+            row_group_size=row_group_size,
+            workers=workers,
+            incremental=incremental,
+            include_raw=include_raw
+        )
         click.echo(f"Data exported to {output}")
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
@@ -472,6 +850,77 @@ def export(ctx, output, platform):
         app.close()
 
 
+@cli.command()
+@click.option('--platform', '-p', 'platforms', multiple=True, help='Platform to apply retention to (repeatable)')
+@click.option('--full', is_flag=True,
+              help='Run a full VACUUM first; needed once to enable incremental vacuum on older databases (blocks writers)')
+@click.pass_context
+def compact(ctx, platforms, full):
+    """Apply retention policies and reclaim disk space."""
+    app = SocFlowApp(ctx.obj['config'])
+    
+    try:
+        result = app.compact(platforms=list(platforms) if platforms else None, full_vacuum=full)
+        
+        for platform, count in result['deleted_posts'].items():
+            click.echo(f"  {platform}: {count} posts deleted")
+        for platform, count in result['dropped_raw'].items():
+            click.echo(f"  {platform}: {count} raw payloads dropped")
+        click.echo(f"Reclaimed {result['freed_bytes'] / 1e6:.1f} MB")
+        if result['files_without_incremental']:
+            click.echo(
+                f"{result['free_bytes'] / 1e6:.1f} MB still free inside the database; "
+                "run 'socflow compact --full' once to enable incremental vacuum"
+            )
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+    finally:
+        app.close()
+
+
+@cli.command()
+@click.argument('query')
+@click.option('--platform', '-p', help='Platform to search')
+@click.option('--since', type=click.DateTime(), help='Only posts created at or after this time')
+@click.option('--until', type=click.DateTime(), help='Only posts created before this time')
+@click.option('--limit', '-n', default=20, type=int, help='Maximum number of results (default: 20)')
+@click.option('--offset', default=0, type=int, help='Number of results to skip (default: 0)')
+@click.option('--json', 'as_json', is_flag=True, help='Print results as JSON Lines')
+@click.pass_context
+def search(ctx, query, platform, since, until, limit, offset, as_json):
+    """Full-text search collected posts.
+    
+    QUERY uses SQLite FTS5 syntax, e.g. '"large language model" OR llm*'.
+    """
+    app = SocFlowApp(ctx.obj['config'])
+    
+    try:
+        results = app.search(query, platform=platform, since=since, until=until, limit=limit, offset=offset)
+        
+        if as_json:
+            import json
+            for post in results:
+                click.echo(json.dumps(post, default=str))
+            return
+        
+        if not results:
+            click.echo("No matching posts")
+            return
+        
+        for rank, post in enumerate(results, start=offset + 1):
+            click.echo(f"{rank:>4}. [{post['platform']}] {post['created_at']} @{post['author_handle']}")
+            if post.get('title'):
+                click.echo(f"      {post['title']}")
+            click.echo(f"      {post['snippet']}")
+            if post.get('url'):
+                click.echo(f"      {post['url']}")
+        
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+    finally:
+        app.close()
+
+
 @cli.group()
 @click.pass_context
 def config(ctx):
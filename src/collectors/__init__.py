@@ -4,5 +4,6 @@ from .base import BaseCollector
 from .reddit import RedditCollector
 from .bluesky import BlueskyCollector
 from .mastodon import MastodonCollector
+from .jetstream import JetstreamCollector
 
-__all__ = ["BaseCollector", "RedditCollector", "BlueskyCollector", "MastodonCollector"]
+__all__ = ["BaseCollector", "RedditCollector", "BlueskyCollector", "MastodonCollector", "JetstreamCollector"]
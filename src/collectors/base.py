@@ -1,9 +1,13 @@
 """Base collector interface."""
 
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
 from typing import Any, Dict, List, Optional
 
 from ..models.base import BasePost
+from ..utils.cursors import CursorStore
+from ..utils.rate_limit import rate_limiter
 
 
 class BaseCollector(ABC):
@@ -17,6 +21,17 @@ class BaseCollector(ABC):
         """
         self.config = config
         self.enabled = config.get("enabled", True)
+        # Identifies the quota holder in the shared rate limiter; set by subclasses
+        self.account = ""
+        # Where incremental collection left off; the app replaces this with its persistent store
+        self.cursors = CursorStore()
+        # Last checkpoint commit handed over; later commits wait for it (see commit_after_write)
+        self._write_lock = threading.Lock()
+        self._last_commit = _completed_future()
+        self._write_generation = 0
+        self._write_failed = False
+        if config.get("requests_per_minute"):
+            rate_limiter.configure(self.get_platform_name(), config["requests_per_minute"])
     
     @abstractmethod
     def collect(self, **kwargs) -> List[BasePost]:
@@ -48,6 +63,112 @@ class BaseCollector(ABC):
         """
         pass
     
+    def _acquire(self, instance: str = "", requests: int = 1) -> None:
+        """Wait until the platform quota allows the next API call.
+        
+        Args:
+            instance: Server the call goes to, for platforms with per-instance quotas
+            requests: Number of HTTP requests the call makes (e.g. listing pages)
+        """
+        rate_limiter.acquire(self.get_platform_name(), self.account, instance, requests)
+    
+    def checkpoint(self) -> Dict[str, Any]:
+        """Snapshot the collector's cursors after handing over a batch of posts.
+        
+        Returns:
+            Cursor values to pass to :meth:`commit_checkpoint` once the posts are stored
+        """
+        return self.cursors.snapshot(self.cursor_namespace)
+    
+    def commit_checkpoint(self, checkpoint: Dict[str, Any]) -> None:
+        """Persist cursors taken by :meth:`checkpoint`, so collection resumes after them.
+        
+        Args:
+            checkpoint: Cursor values from :meth:`checkpoint`
+        """
+        self.cursors.commit(self.cursor_namespace, checkpoint)
+    
+    def commit_after_write(self, checkpoint: Dict[str, Any], write: Optional[Future] = None) -> Future:
+        """Commit a checkpoint once its posts and every batch handed over before it are stored.
+        
+        Commits are chained in the order they are handed over, so a cycle
+        that found nothing new never persists cursors past posts that are
+        still queued or being written. If the write or any earlier one fails,
+        nothing more is committed and the next
+        :meth:`restore_cursors_after_failed_write` rolls the cursors back.
+        
+        Args:
+            checkpoint: Cursor values from :meth:`checkpoint`
+            write: Future of the write of the checkpoint's posts; None when there were none
+            
+        Returns:
+            Future resolving once the checkpoint is committed
+        """
+        committed: Future = Future()
+        with self._write_lock:
+            previous, self._last_commit = self._last_commit, committed
+            generation = self._write_generation
+        
+        def finish(_):
+            error = previous.exception() or (write.exception() if write is not None else None)
+            if error is None:
+                try:
+                    self.commit_checkpoint(checkpoint)
+                except Exception as e:
+                    error = e
+            if error is None:
+                committed.set_result(None)
+                return
+            with self._write_lock:
+                # Failures of commits handed over before a restore are already handled
+                if generation == self._write_generation:
+                    self._write_failed = True
+            committed.set_exception(error)
+        
+        if write is None:
+            previous.add_done_callback(finish)
+        else:
+            previous.add_done_callback(lambda _: write.add_done_callback(finish))
+        return committed
+    
+    def restore_cursors(self) -> None:
+        """Roll the in-memory cursors back to the last committed checkpoint.
+        
+        Called by the collecting thread between cycles after a failed
+        collection or write, so the posts that were lost are fetched again.
+        """
+        with self._write_lock:
+            self._write_generation += 1
+            self._write_failed = False
+            self._last_commit = _completed_future()
+        self.cursors.restore(self.cursor_namespace)
+        self._cursors_restored()
+    
+    def restore_cursors_after_failed_write(self) -> bool:
+        """Restore the cursors if a write handed to :meth:`commit_after_write` failed.
+        
+        Returns:
+            True if the cursors were rolled back
+        """
+        with self._write_lock:
+            failed = self._write_failed
+        if failed:
+            self.restore_cursors()
+        return failed
+    
+    def _cursors_restored(self) -> None:
+        """Drop in-memory collection state that is ahead of the restored cursors."""
+        pass
+    
+    @property
+    def cursor_namespace(self) -> str:
+        """Namespace of the collector's cursors in :attr:`cursors`; the platform by default."""
+        return self.get_platform_name()
+    
+    def close(self) -> None:
+        """Release connections held between collection cycles."""
+        pass
+    
     def is_enabled(self) -> bool:
         """Check if collector is enabled.
         
@@ -63,3 +184,10 @@ class BaseCollector(ABC):
             Configuration dictionary
         """
         return self.config
+
+
+def _completed_future() -> Future:
+    """A future that has already succeeded."""
+    future: Future = Future()
+    future.set_result(None)
+    return future
@@ -4,13 +4,18 @@ import asyncio
 import json
 import os
 import websockets
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from atproto import Client, models
+from atproto import Client, Request, models
 
 from ..models.bluesky import BlueskyPost
+from ..utils.rate_limit import rate_limiter
 from .base import BaseCollector
 
+# Most posts app.bsky.feed.searchPosts returns per request
+SEARCH_PAGE_LIMIT = 100
+
 
 class BlueskyCollector(BaseCollector):
     """Bluesky data collector."""
@@ -33,12 +38,18 @@ class BlueskyCollector(BaseCollector):
         if not handle or not password:
             raise ValueError("Bluesky credentials not found. Set BLUESKY_HANDLE and BLUESKY_PASSWORD environment variables.")
         
-        self.client = Client()
+        self.account = handle
+        # Every response carries RateLimit-* headers; feed them to the shared limiter
+        self.client = Client(request=Request(event_hooks={"response": [self._record_limits]}))
         try:
             self.client.login(handle, password)
         except Exception as e:
             raise ValueError(f"Failed to login to Bluesky: {e}")
     
+    def _record_limits(self, response) -> None:
+        """httpx response hook: update the rate limiter from a response's quota headers."""
+        rate_limiter.update_from_headers(response.headers, "bluesky", self.account)
+    
     def collect(self, keywords: Optional[List[str]] = None, **kwargs) -> List[BlueskyPost]:
         """Collect data from Bluesky.
         
@@ -80,6 +91,9 @@ class BlueskyCollector(BaseCollector):
     def collect_continuous(self, keywords: Optional[List[str]] = None, hashtags: Optional[List[str]] = None, **kwargs) -> List[BlueskyPost]:
         """Collect data continuously from Bluesky using search and hashtag methods.
         
+        Keyword and hashtag searches are incremental: each cycle only fetches
+        the posts published since the previous one (see :meth:`_search_incremental`).
+        
         Args:
             keywords: Optional keywords to search for
             hashtags: Optional hashtags to search for
@@ -105,7 +119,7 @@ class BlueskyCollector(BaseCollector):
             if keywords:
                 for keyword in keywords[:5]:  # Limit to first 5 keywords for performance
                     try:
-                        search_posts = self._search_by_keyword(keyword, batch_size)
+                        search_posts = self._search_incremental(keyword)
                         posts.extend(search_posts)
                         print(f"🔍 Searched '{keyword}' - found {len(search_posts)} posts")
                     except Exception as e:
@@ -116,7 +130,7 @@ class BlueskyCollector(BaseCollector):
             if hashtags:
                 for hashtag in hashtags[:5]:  # Limit to first 5 hashtags for performance
                     try:
-                        hashtag_posts = self._search_by_hashtag(hashtag, batch_size)
+                        hashtag_posts = self._search_incremental(hashtag if hashtag.startswith('#') else f"#{hashtag}")
                         posts.extend(hashtag_posts)
                         print(f"🏷️ Searched '{hashtag}' - found {len(hashtag_posts)} posts")
                     except Exception as e:
@@ -142,25 +156,15 @@ class BlueskyCollector(BaseCollector):
             max_posts: Maximum number of posts to collect
             
         Returns:
-            List of posts matching the keyword
+            List of posts matching the keyword, newest first
         """
         posts = []
         
         try:
-            # Search for posts containing the keyword
-            # Limit to 30 posts per search (Bluesky API limit is 100)
-            limit = min(max_posts, 30)
-            search_results = self.client.app.bsky.feed.search_posts(
-                params={"q": keyword, "limit": limit}
-            )
-            
-            for post_data in search_results.posts:
-                try:
-                    post = BlueskyPost.from_atproto_record(post_data)
-                    posts.append(post)
-                except Exception as e:
-                    print(f"Error processing post: {e}")
-                    continue
+            for page, _ in self._search_pages(keyword, min(max_posts, SEARCH_PAGE_LIMIT)):
+                posts.extend(self._convert_post_views(page[:max_posts - len(posts)]))
+                if len(posts) >= max_posts:
+                    break
         
         except Exception as e:
             print(f"Error searching for keyword '{keyword}': {e}")
@@ -175,33 +179,129 @@ class BlueskyCollector(BaseCollector):
             max_posts: Maximum number of posts to collect
             
         Returns:
-            List of Bluesky posts
+            List of Bluesky posts, newest first
         """
-        posts = []
+        # Ensure hashtag starts with #
+        if not hashtag.startswith('#'):
+            hashtag = f"#{hashtag}"
+        return self._search_by_keyword(hashtag, max_posts)
+    
+    def _search_pages(
+        self,
+        query: str,
+        limit: int,
+        since: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> Iterator[Tuple[List[Any], Optional[str]]]:
+        """Page through ``app.bsky.feed.searchPosts`` results, newest first.
         
-        try:
-            # Ensure hashtag starts with #
-            if not hashtag.startswith('#'):
-                hashtag = f"#{hashtag}"
+        Args:
+            query: Search query
+            limit: Posts per request (at most 100)
+            since: Only return posts whose sort timestamp is at or after this
+            cursor: Cursor of the page to start from
             
-            # Search for posts containing the hashtag
-            # Limit to 30 posts per search (Bluesky API limit is 100)
-            limit = min(max_posts, 30)
-            search_results = self.client.app.bsky.feed.search_posts(
-                params={"q": hashtag, "limit": limit}
-            )
+        Yields:
+            ``(post views, cursor of the next page)``; the cursor is None on the last page
+        """
+        while True:
+            params = {"q": query, "limit": limit, "sort": "latest"}
+            if since:
+                params["since"] = since
+            if cursor:
+                params["cursor"] = cursor
+            self._acquire()
+            results = self.client.app.bsky.feed.search_posts(params=params)
+            cursor = results.cursor if results.posts else None
+            yield results.posts, cursor
+            if not cursor:
+                return
+    
+    def _search_incremental(self, query: str) -> List[BlueskyPost]:
+        """Collect the posts matching a query since the previous cycle.
+        
+        Each query keeps a watermark in :attr:`cursors`: the newest sort
+        timestamp seen and the posts seen at exactly that time. Searches pass
+        it as ``since`` and page with ``sort=latest`` until they reach it. If
+        ``max_pages_per_cycle`` runs out first, the paging cursor is stored and
+        the next cycle resumes there before moving the watermark. The first
+        search of a query only takes the newest page.
+        
+        Args:
+            query: Search query (keyword or ``#hashtag``)
             
-            for post_view in search_results.posts:
-                try:
-                    post = BlueskyPost.from_atproto_record(post_view)
-                    posts.append(post)
-                except Exception as e:
-                    print(f"Error processing hashtag post: {e}")
-                    continue
-                    
+        Returns:
+            New posts matching the query
+        """
+        state = self.cursors.get("bluesky", query) or {"since": None, "seen": []}
+        since, seen = state["since"], set(state["seen"])
+        resume = state.get("resume") or {"cursor": None, "newest": None, "newest_seen": []}
+        newest, newest_seen = resume["newest"], set(resume["newest_seen"])
+        page_size = self.config.get("page_size", SEARCH_PAGE_LIMIT)
+        max_pages = self.config.get("max_pages_per_cycle", 10) if since else 1
+        
+        cursor = resume["cursor"]
+        views = []
+        caught_up = False
+        try:
+            for pages, (page, next_cursor) in enumerate(self._search_pages(query, page_size, since, cursor), 1):
+                for view in page:
+                    sort_at = self._sort_at(view)
+                    if since and (sort_at < since or (sort_at == since and view.uri in seen)):
+                        # Reached the posts stored by a previous cycle
+                        caught_up = True
+                        continue
+                    views.append(view)
+                    if newest is None or sort_at > newest:
+                        newest, newest_seen = sort_at, {view.uri}
+                    elif sort_at == newest:
+                        newest_seen.add(view.uri)
+                cursor = next_cursor
+                if caught_up or not cursor or pages >= max_pages:
+                    caught_up = caught_up or not cursor or not since
+                    break
         except Exception as e:
-            print(f"Error searching hashtag '{hashtag}': {e}")
+            # Keep the pages fetched so far; the resume cursor matches them
+            print(f"Error searching '{query}': {e}")
+        
+        if caught_up:
+            if newest is not None:
+                state = {"since": newest, "seen": sorted(newest_seen)}
+            else:
+                state = {"since": since, "seen": sorted(seen)}
+        elif cursor:
+            state["resume"] = {"cursor": cursor, "newest": newest, "newest_seen": sorted(newest_seen)}
+        self.cursors.set("bluesky", query, state)
+        return self._convert_post_views(views)
+    
+    @staticmethod
+    def _sort_at(post_view: Any) -> str:
+        """The timestamp search results are sorted and filtered by, as fixed-width UTC.
         
+        Bluesky sorts on the earlier of the record's ``createdAt`` and the
+        post's ``indexedAt``, so backdated posts do not jump the queue.
+        """
+        stamps = []
+        record = getattr(post_view, "record", None)
+        for value in (getattr(post_view, "indexed_at", None), getattr(record, "created_at", None)):
+            try:
+                stamp = datetime.fromisoformat(value.replace("Z", "+00:00"))
+            except (AttributeError, ValueError):
+                continue
+            if stamp.tzinfo is None:
+                stamp = stamp.replace(tzinfo=timezone.utc)
+            stamps.append(stamp.astimezone(timezone.utc))
+        stamp = min(stamps) if stamps else datetime.now(timezone.utc)
+        return stamp.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+    
+    def _convert_post_views(self, post_views: List[Any]) -> List[BlueskyPost]:
+        """Convert post views to posts, skipping the ones that fail to parse."""
+        posts = []
+        for post_view in post_views:
+            try:
+                posts.append(BlueskyPost.from_atproto_record(post_view))
+            except Exception as e:
+                print(f"Error processing post: {e}")
         return posts
     
     def _get_public_feed(self, max_posts: int) -> List[BlueskyPost]:
@@ -218,6 +318,7 @@ class BlueskyCollector(BaseCollector):
         try:
             # Get public feed using the get_timeline API
             # This should give us public posts, not personal timeline
+            self._acquire()
             public_feed = self.client.app.bsky.feed.get_timeline()
             
             for feed_item in public_feed.feed[:max_posts]:
@@ -247,6 +348,7 @@ class BlueskyCollector(BaseCollector):
         
         try:
             # Get timeline (limit parameter not supported in this API version)
+            self._acquire()
             timeline = self.client.app.bsky.feed.get_timeline()
             
             for feed_item in timeline.feed:
@@ -373,6 +475,7 @@ class BlueskyCollector(BaseCollector):
         
         try:
             # Get public feed (firehose) - use standard timeline
+            self._acquire()
             public_feed = self.client.app.bsky.feed.get_timeline()
             
             for feed_item in public_feed.feed:
@@ -409,6 +512,7 @@ class BlueskyCollector(BaseCollector):
         
         try:
             # Get user profile
+            self._acquire(requests=2)
             profile = self.client.app.bsky.actor.get_profile(actor=handle)
             
             # Get user's posts
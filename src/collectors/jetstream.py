@@ -0,0 +1,256 @@
+"""Bluesky Jetstream streaming collector."""
+
+import asyncio
+import json
+import queue
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import websockets
+
+from ..models.bluesky import BlueskyPost
+from .base import BaseCollector
+
+DEFAULT_JETSTREAM_URI = "wss://jetstream2.us-west.bsky.network/subscribe"
+POST_COLLECTION = "app.bsky.feed.post"
+
+# Seconds between checks of the stop flag while the stream is quiet
+RECEIVE_TIMEOUT = 1.0
+
+
+class JetstreamCollector(BaseCollector):
+    """Collect Bluesky posts from a long-lived Jetstream subscription.
+    
+    A background thread keeps one websocket open and queues every new or
+    edited post. :meth:`collect_continuous` drains the queue in micro-batches,
+    so the continuous loop stores posts seconds after they are published.
+    The stream reconnects with exponential backoff and resumes from the
+    ``time_us`` of the last event received. Across restarts it resumes from
+    the cursor committed after the last stored batch.
+    """
+    
+    def __init__(self, config: Dict[str, Any]):
+        """Initialize Jetstream collector without connecting.
+        
+        Args:
+            config: Jetstream collector configuration
+        """
+        super().__init__(config)
+        self.uri = config.get("uri") or DEFAULT_JETSTREAM_URI
+        self.reconnects = 0
+        self._events: "queue.Queue[Tuple[BlueskyPost, int]]" = queue.Queue(maxsize=config.get("max_queue_size", 10000))
+        # time_us of the last event received, to reconnect without a gap
+        self._time_us: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+    
+    def collect(self, max_posts: Optional[int] = None, **kwargs) -> List[BlueskyPost]:
+        """Collect posts from the stream until ``max_posts`` or a quiet batch.
+        
+        Args:
+            max_posts: Maximum number of posts to collect. If None, uses config default.
+            **kwargs: Additional collection parameters
+            
+        Returns:
+            List of collected Bluesky posts
+        """
+        if not self.is_enabled():
+            return []
+        
+        if not self.validate_config():
+            raise ValueError("Invalid Jetstream collector configuration")
+        
+        max_posts = max_posts or self.config.get("max_posts", 1000)
+        posts = []
+        try:
+            while len(posts) < max_posts:
+                batch = self.collect_continuous(max_batch_size=max_posts - len(posts))
+                if not batch:
+                    break
+                posts.extend(batch)
+        finally:
+            self.close()
+        return posts
+    
+    def collect_continuous(self, max_batch_size: Optional[int] = None, **kwargs) -> List[BlueskyPost]:
+        """Return the next micro-batch of streamed posts.
+        
+        Waits up to ``batch_latency_ms`` for the first post, then takes posts
+        until ``batch_size`` or until ``batch_latency_ms`` has passed since
+        the first one. The cursor is advanced to the last post returned.
+        
+        Args:
+            max_batch_size: Most posts to return; defaults to ``batch_size``
+            **kwargs: Additional collection parameters
+            
+        Returns:
+            List of streamed posts, possibly empty
+        """
+        if not self.is_enabled():
+            return []
+        
+        self.start()
+        max_batch_size = max_batch_size or self.config.get("batch_size", 500)
+        latency = self.config.get("batch_latency_ms", 1000) / 1000
+        
+        posts = []
+        time_us = None
+        deadline = None
+        while len(posts) < max_batch_size:
+            timeout = latency if deadline is None else deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                post, time_us = self._events.get(timeout=timeout)
+            except queue.Empty:
+                break
+            posts.append(post)
+            if deadline is None:
+                deadline = time.monotonic() + latency
+        
+        if time_us is not None:
+            self.cursors.set(self.cursor_namespace, "time_us", time_us)
+        return posts
+    
+    def start(self) -> None:
+        """Start the streaming thread if it is not running."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=lambda: asyncio.run(self._stream()), name="Jetstream", daemon=True)
+            self._thread.start()
+    
+    def close(self) -> None:
+        """Stop the streaming thread; queued posts are kept for the next start."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=RECEIVE_TIMEOUT * 5)
+            self._thread = None
+    
+    def _cursors_restored(self) -> None:
+        """Reconnect from the committed cursor; queued posts are after it and will be replayed."""
+        self.close()
+        self._time_us = None
+        while True:
+            try:
+                self._events.get_nowait()
+            except queue.Empty:
+                break
+    
+    def _subscribe_url(self) -> str:
+        """Subscription URL for the post collection, resuming from the latest cursor."""
+        parts = urlsplit(self.uri)
+        params = [(key, value) for key, value in parse_qsl(parts.query) if key not in ("wantedCollections", "cursor")]
+        params.append(("wantedCollections", POST_COLLECTION))
+        
+        time_us = self._time_us
+        if time_us is None:
+            time_us = self.cursors.get(self.cursor_namespace, "time_us")
+        if time_us is not None:
+            # Replay a little: events may arrive slightly out of order across reconnects
+            rewind_us = int(self.config.get("cursor_rewind_seconds", 3) * 1_000_000)
+            params.append(("cursor", str(max(int(time_us) - rewind_us, 0))))
+        return urlunsplit(parts._replace(query=urlencode(params)))
+    
+    async def _stream(self) -> None:
+        """Keep a subscription open until :meth:`close`, reconnecting with backoff."""
+        initial_delay = self.config.get("reconnect_initial_seconds", 1.0)
+        max_delay = self.config.get("reconnect_max_seconds", 60.0)
+        delay = initial_delay
+        
+        while not self._stop.is_set():
+            try:
+                async with websockets.connect(self._subscribe_url(), max_size=None) as websocket:
+                    while not self._stop.is_set():
+                        try:
+                            message = await asyncio.wait_for(websocket.recv(), timeout=RECEIVE_TIMEOUT)
+                        except asyncio.TimeoutError:
+                            continue
+                        await self._handle_message(message)
+                        # Connected and receiving: the next failure starts a fresh backoff
+                        delay = initial_delay
+            except Exception as e:
+                if self._stop.is_set():
+                    break
+                self.reconnects += 1
+                wait = delay * random.uniform(0.5, 1.0)
+                print(f"Jetstream connection lost ({e}); reconnecting in {wait:.1f}s")
+                # Wakes early when the collector is closed
+                await asyncio.to_thread(self._stop.wait, wait)
+                delay = min(delay * 2, max_delay)
+    
+    async def _handle_message(self, message: Any) -> None:
+        """Queue the post of a create or update commit; other events only move the cursor."""
+        try:
+            event = json.loads(message)
+        except ValueError as e:
+            print(f"Error decoding Jetstream event: {e}")
+            return
+        
+        time_us = event.get("time_us")
+        commit = event.get("commit") or {}
+        if (
+            event.get("kind") == "commit"
+            and commit.get("collection") == POST_COLLECTION
+            and commit.get("operation") in ("create", "update")
+        ):
+            try:
+                post = BlueskyPost.from_jetstream_event(event)
+            except Exception as e:
+                print(f"Error processing Jetstream post: {e}")
+            else:
+                item = (post, time_us)
+                try:
+                    self._events.put_nowait(item)
+                except queue.Full:
+                    # Ingest is behind: hold the stream until there is room or the collector is closed
+                    while True:
+                        if self._stop.is_set():
+                            # Dropped; leave the cursor before it so the next start replays it
+                            return
+                        try:
+                            await asyncio.to_thread(self._events.put, item, timeout=RECEIVE_TIMEOUT)
+                            break
+                        except queue.Full:
+                            continue
+        
+        if time_us is not None:
+            self._time_us = time_us
+    
+    @property
+    def cursor_namespace(self) -> str:
+        """Jetstream cursors are kept apart from the Bluesky search watermarks."""
+        return "jetstream"
+    
+    def validate_config(self) -> bool:
+        """Validate Jetstream collector configuration.
+        
+        Returns:
+            True if configuration is valid, False otherwise
+        """
+        if not self.enabled:
+            return True
+        
+        if urlsplit(self.uri).scheme not in ("ws", "wss"):
+            print(f"Invalid Jetstream URI: {self.uri}")
+            return False
+        
+        batch_size = self.config.get("batch_size", 500)
+        if not isinstance(batch_size, int) or batch_size <= 0:
+            print("Invalid batch_size configuration")
+            return False
+        
+        return True
+    
+    def get_platform_name(self) -> str:
+        """Get platform name.
+        
+        Returns:
+            Platform name
+        """
+        return "bluesky"
@@ -1,11 +1,13 @@
 """Mastodon data collector."""
 
 import os
+import time
 from typing import Any, Dict, List, Optional
 
 from mastodon import Mastodon
 
 from ..models.mastodon import MastodonPost
+from ..utils.rate_limit import rate_limiter
 from .base import BaseCollector
 
 
@@ -20,6 +22,8 @@ class MastodonCollector(BaseCollector):
         """
         super().__init__(config)
         self.clients = {}
+        # Feeds polled since startup; the first poll of each may open a gap
+        self._polled = set()
         self._setup_clients()
     
     def _setup_clients(self) -> None:
@@ -43,6 +47,17 @@ class MastodonCollector(BaseCollector):
                 print(f"Failed to connect to {instance}: {e}")
                 continue
     
+    def _record_limits(self, client: Mastodon) -> None:
+        """Feed the quota Mastodon.py read from the X-RateLimit headers into the shared rate limiter.
+        
+        Quotas are per account and instance, so each instance has its own bucket.
+        """
+        rate_limiter.bucket("mastodon", self.account, client.api_base_url).update(
+            client.ratelimit_remaining,
+            client.ratelimit_reset - time.time(),
+            client.ratelimit_limit
+        )
+    
     def collect(self, instances: Optional[List[str]] = None, hashtags: Optional[List[str]] = None, **kwargs) -> List[MastodonPost]:
         """Collect data from Mastodon.
         
@@ -86,7 +101,12 @@ class MastodonCollector(BaseCollector):
         return posts
     
     def collect_continuous(self, instances: Optional[List[str]] = None, hashtags: Optional[List[str]] = None, **kwargs) -> List[MastodonPost]:
-        """Collect data continuously from Mastodon.
+        """Collect the statuses published since the previous cycle.
+        
+        Each feed (an instance's public timeline, or one hashtag on an
+        instance) keeps a ``min_id`` cursor in :attr:`cursors`. Cycles page
+        forward from it until they catch up, so every status is fetched once
+        and bursts between polls are not lost. See :meth:`_poll_feed`.
         
         Args:
             instances: List of instances to collect from. If None, uses config default.
@@ -103,21 +123,126 @@ class MastodonCollector(BaseCollector):
             instances = self.config.get("instances", ["https://mastodon.social"])
         
         posts = []
-        batch_size = 15  # Increased batch size for better performance
         
         for instance in instances:
             if instance not in self.clients:
                 continue
             
+            client = self.clients[instance]
+            for hashtag in hashtags or [None]:
+                feed = f"{instance}#tag:{hashtag}" if hashtag else f"{instance}#public"
+                state = self.cursors.get("mastodon", feed) or {"min_id": None, "gaps": []}
+                statuses = []
+                try:
+                    self._poll_feed(client, feed, hashtag, state, statuses)
+                except Exception as e:
+                    # Keep the pages fetched so far; the cursor matches them
+                    print(f"Error collecting {feed}: {e}")
+                self.cursors.set("mastodon", feed, state)
+                posts.extend(self._convert_statuses(client, statuses))
+        
+        return posts
+    
+    def _poll_feed(
+        self,
+        client: Mastodon,
+        feed: str,
+        hashtag: Optional[str],
+        state: Dict[str, Any],
+        statuses: List[Any]
+    ) -> None:
+        """Fetch a feed's new statuses and fill its gaps, within the page budget.
+        
+        The first poll of a feed in this process takes the newest page. If
+        the stored ``min_id`` is older than that page, the statuses in between
+        are recorded as a gap; a feed without a cursor gets an open-ended gap
+        of ``backfill_pages``. Later polls page forward with ``min_id``. Pages
+        left over fill gaps backwards with ``max_id``, newest gap first.
+        
+        ``state`` and ``statuses`` are updated page by page, so they stay
+        consistent if a request fails.
+        
+        Args:
+            client: Mastodon client of the feed's instance
+            feed: Cursor key of the feed
+            hashtag: Hashtag to follow, or None for the public timeline
+            state: Feed cursor: ``min_id`` and a list of ``gaps``
+            statuses: Receives the fetched statuses
+        """
+        page_size = self.config.get("page_size", 40)
+        pages_left = self.config.get("max_pages_per_cycle", 10)
+        
+        if feed not in self._polled or state["min_id"] is None:
+            page = self._fetch_page(client, hashtag)
+            pages_left -= 1
+            self._polled.add(feed)
+            if page:
+                oldest = min(int(status["id"]) for status in page)
+                if state["min_id"] is not None:
+                    last_seen = int(state["min_id"])
+                    page = [status for status in page if int(status["id"]) > last_seen]
+                    if len(page) == page_size:
+                        # More statuses were published while we were away than one page holds
+                        state["gaps"].insert(0, {"since_id": state["min_id"], "max_id": str(oldest), "pages_left": None})
+                elif self.config.get("backfill_pages", 0) > 0 and len(page) == page_size:
+                    state["gaps"].insert(0, {"since_id": None, "max_id": str(oldest), "pages_left": self.config["backfill_pages"]})
+                statuses.extend(page)
+                if page:
+                    state["min_id"] = str(max(int(status["id"]) for status in page))
+        else:
+            # Catch up with what was published since the last poll
+            while pages_left > 0:
+                page = self._fetch_page(client, hashtag, min_id=state["min_id"])
+                pages_left -= 1
+                if not page:
+                    break
+                statuses.extend(page)
+                state["min_id"] = str(max(int(status["id"]) for status in page))
+                if len(page) < page_size:
+                    break
+        
+        # Spend the rest of the budget on gaps, newest first
+        while pages_left > 0 and state["gaps"]:
+            gap = state["gaps"][0]
+            page = self._fetch_page(client, hashtag, max_id=gap["max_id"], since_id=gap["since_id"])
+            pages_left -= 1
+            statuses.extend(page)
+            if page:
+                gap["max_id"] = str(min(int(status["id"]) for status in page))
+            if gap["pages_left"] is not None:
+                gap["pages_left"] -= 1
+            if len(page) < page_size or gap["pages_left"] == 0:
+                state["gaps"].pop(0)
+    
+    def _fetch_page(self, client: Mastodon, hashtag: Optional[str], **params) -> List[Any]:
+        """Fetch one page of a hashtag or the public timeline.
+        
+        Args:
+            client: Mastodon client
+            hashtag: Hashtag timeline to read, or None for the public timeline
+            **params: ``min_id``, ``max_id`` or ``since_id`` paging parameters
+            
+        Returns:
+            Statuses, newest first
+        """
+        params = {key: value for key, value in params.items() if value is not None}
+        self._acquire(client.api_base_url)
+        if hashtag:
+            page = client.timeline_hashtag(hashtag, limit=self.config.get("page_size", 40), **params)
+        else:
+            page = client.timeline_public(limit=self.config.get("page_size", 40), **params)
+        self._record_limits(client)
+        return list(page or [])
+    
+    def _convert_statuses(self, client: Mastodon, statuses: List[Any]) -> List[MastodonPost]:
+        """Convert statuses fetched from a client's instance to posts."""
+        instance = client.api_base_url.replace('https://', '').replace('http://', '')
+        posts = []
+        for status in statuses:
             try:
-                instance_posts = self._collect_from_instance(
-                    instance, batch_size, hashtags or []
-                )
-                posts.extend(instance_posts)
+                posts.append(MastodonPost.from_mastodon_status(status, instance))
             except Exception as e:
-                print(f"Error collecting from {instance}: {e}")
-                continue
-        
+                print(f"Error processing status: {e}")
         return posts
     
     def _collect_from_instance(
@@ -170,7 +295,9 @@ class MastodonCollector(BaseCollector):
         
         try:
             # Search for posts with the hashtag
+            self._acquire(client.api_base_url)
             search_results = client.timeline_hashtag(hashtag, limit=max_posts)
+            self._record_limits(client)
             
             for status in search_results:
                 try:
@@ -204,7 +331,9 @@ class MastodonCollector(BaseCollector):
         
         try:
             # Get public timeline
+            self._acquire(client.api_base_url)
             timeline = client.timeline_public(limit=max_posts)
+            self._record_limits(client)
             
             for status in timeline:
                 try:
@@ -247,10 +376,12 @@ class MastodonCollector(BaseCollector):
                 client = self.clients[instance]
                 
                 # Get user's posts
+                self._acquire(client.api_base_url)
                 user_posts = client.account_statuses(
                     account_id=username,
                     limit=max_posts
                 )
+                self._record_limits(client)
                 
                 for status in user_posts:
                     try:
@@ -1,5 +1,6 @@
 """Reddit data collector."""
 
+import math
 import os
 import time
 from typing import Any, Dict, List, Optional
@@ -7,8 +8,22 @@ from typing import Any, Dict, List, Optional
 import praw
 
 from ..models.reddit import RedditPost
+from ..utils.rate_limit import rate_limiter
 from .base import BaseCollector
 
+# Reddit's rate-limit windows are 10 minutes, aligned to the clock
+RATE_LIMIT_WINDOW = 600
+
+# Items per listing request, and the most a listing ever returns
+LISTING_PAGE_SIZE = 100
+LISTING_MAX_ITEMS = 1000
+
+# Incremental mode polls a subreddit once about this many new submissions are expected
+POLL_TARGET_ITEMS = LISTING_PAGE_SIZE // 2
+
+# Weight of the latest observation in a subreddit's submission rate
+VELOCITY_SMOOTHING = 0.5
+
 
 class RedditCollector(BaseCollector):
     """Reddit data collector."""
@@ -37,6 +52,27 @@ class RedditCollector(BaseCollector):
             client_secret=client_secret,
             user_agent=user_agent
         )
+        # Reddit's quota is per OAuth client
+        self.account = client_id
+    
+    def _acquire_listing(self, limit: Optional[int]) -> None:
+        """Wait for quota to fetch a listing of ``limit`` items."""
+        items = min(limit or LISTING_PAGE_SIZE, LISTING_MAX_ITEMS)
+        self._acquire(requests=max(1, math.ceil(items / LISTING_PAGE_SIZE)))
+    
+    def _record_limits(self) -> None:
+        """Feed the quota praw read from the last response into the shared rate limiter."""
+        limits = self.reddit.auth.limits
+        remaining = limits.get("remaining")
+        if remaining is None:
+            return
+        used = limits.get("used") or 0
+        reset_timestamp = limits.get("reset_timestamp")
+        if reset_timestamp:
+            reset_in = reset_timestamp - time.time()
+        else:
+            reset_in = RATE_LIMIT_WINDOW - time.time() % RATE_LIMIT_WINDOW
+        rate_limiter.bucket("reddit", self.account).update(remaining, reset_in, remaining + used)
     
     def collect(self, subreddits: Optional[List[str]] = None, keywords: Optional[List[str]] = None, **kwargs) -> List[RedditPost]:
         """Collect data from Reddit.
@@ -89,6 +125,11 @@ class RedditCollector(BaseCollector):
     def collect_continuous(self, subreddits: Optional[List[str]] = None, keywords: Optional[List[str]] = None, **kwargs) -> List[RedditPost]:
         """Collect data continuously from Reddit - collect ALL posts without keyword filtering.
         
+        With ``incremental`` enabled, each cycle reads only the submissions
+        published since the previous one from the ``new`` listing (see
+        :meth:`_collect_incremental`); otherwise it re-reads the first
+        listing page of ``sort_by``.
+        
         Args:
             subreddits: List of subreddits to collect from. If None, uses config default.
             keywords: Ignored - we collect all posts regardless of keywords
@@ -103,6 +144,9 @@ class RedditCollector(BaseCollector):
         if subreddits is None:
             subreddits = self.config.get("subreddits", ["all"])
         
+        if self.config.get("incremental", False):
+            return self._collect_incremental(subreddits)
+        
         posts = []
         batch_size = 50  # Increased batch size for better performance
         
@@ -130,6 +174,190 @@ class RedditCollector(BaseCollector):
         
         return posts
     
+    def _collect_incremental(self, subreddits: List[str]) -> List[RedditPost]:
+        """Collect new submissions from each subreddit that is due for a poll.
+        
+        Each subreddit keeps a cursor in :attr:`cursors`: the fullname of the
+        newest submission seen, its ``created_utc``, the submission rate and
+        the time of the last poll. A subreddit is polled once about
+        ``POLL_TARGET_ITEMS`` new submissions are expected (every cycle while
+        it is behind), or after ``max_poll_interval`` seconds. Busy subreddits
+        are read completely, a page per request, while quiet ones cost a
+        request now and then.
+        
+        Args:
+            subreddits: Subreddits to collect from
+            
+        Returns:
+            New submissions from the polled subreddits
+        """
+        posts = []
+        max_interval = self.config.get("max_poll_interval", 300)
+        
+        for subreddit_name in subreddits:
+            state = self.cursors.get("reddit", subreddit_name) or {}
+            now = time.time()
+            if state.get("before") and not state.get("behind"):
+                rate = state.get("rate") or 0.0
+                interval = min(POLL_TARGET_ITEMS / rate, max_interval) if rate > 0 else max_interval
+                if now - state["polled_at"] < interval:
+                    continue
+            
+            submissions = []
+            try:
+                self._poll_new(subreddit_name, state, submissions, now)
+            except Exception as e:
+                # Keep the pages fetched so far; the cursor matches them
+                print(f"Error collecting from r/{subreddit_name}: {e}")
+            self.cursors.set("reddit", subreddit_name, state)
+            
+            for submission in submissions:
+                try:
+                    posts.append(RedditPost.from_praw_submission(submission))
+                except Exception as e:
+                    print(f"Error processing submission {submission.id}: {e}")
+            if submissions:
+                print(f"📝 Collected {len(submissions)} new posts from r/{subreddit_name}")
+        
+        return posts
+    
+    def _poll_new(self, subreddit_name: str, state: Dict[str, Any], submissions: List[Any], now: float) -> None:
+        """Page forward through a subreddit's ``new`` listing from its cursor.
+        
+        Pages are requested with ``before=<newest fullname seen>``, so each
+        returns the submissions just after the previous page; paging stops at
+        a short page. A poll that runs out of ``max_pages_per_cycle`` marks the
+        subreddit as behind, and the next cycle continues from the same place.
+        A subreddit without a cursor starts from the newest page.
+        
+        ``before`` also returns nothing once its submission is deleted or
+        removed, so an empty first page is checked with ``/api/info``. Only a
+        cursor that is gone falls back to the newest page; if that page is
+        full of newer submissions, the ones between it and the old cursor are
+        recorded as a gap. Pages left over fill gaps backwards with
+        ``after=``, newest gap first.
+        
+        Args:
+            subreddit_name: Subreddit to poll
+            state: Subreddit cursor, updated page by page
+            submissions: Receives the new submissions, oldest page first
+            now: Time of the poll
+        """
+        if not state.get("before"):
+            page = self._fetch_new_page(subreddit_name, LISTING_PAGE_SIZE)
+            submissions.extend(reversed(page))
+            if page:
+                newest, oldest = page[0].created_utc, page[-1].created_utc
+                state.update({
+                    "before": page[0].fullname,
+                    "created_utc": newest,
+                    "rate": (len(page) - 1) / (newest - oldest) if newest > oldest else 0.0,
+                })
+            state["polled_at"] = now
+            return
+        
+        gaps = state.setdefault("gaps", [])
+        pages_left = self.config.get("max_pages_per_cycle", 10)
+        new_count = 0
+        state["behind"] = True
+        restarted = False
+        while pages_left > 0:
+            page = self._fetch_new_page(subreddit_name, LISTING_PAGE_SIZE, before=state["before"])
+            pages_left -= 1
+            if not page and new_count == 0 and self._is_gone(state["before"]):
+                restarted = True
+                newest = self._fetch_new_page(subreddit_name, LISTING_PAGE_SIZE)
+                pages_left -= 1
+                page = [submission for submission in newest if submission.created_utc > state["created_utc"]]
+                if len(page) == LISTING_PAGE_SIZE:
+                    # More was published since the cursor than one page holds
+                    gaps.insert(0, {"after": page[-1].fullname, "created_utc": state["created_utc"]})
+                elif not page and newest:
+                    # Nothing new; move the cursor off the missing submission
+                    state["before"] = newest[0].fullname
+            if not page:
+                state["behind"] = False
+                break
+            submissions.extend(reversed(page))
+            new_count += len(page)
+            state["before"] = page[0].fullname
+            state["created_utc"] = max(state["created_utc"], page[0].created_utc)
+            if restarted or len(page) < LISTING_PAGE_SIZE:
+                # Caught up: a short page, or the newest page after a restart
+                state["behind"] = False
+                break
+        
+        # Spend the rest of the budget on gaps, newest first
+        while pages_left > 0 and gaps:
+            gap = gaps[0]
+            page = [
+                submission
+                for submission in self._fetch_new_page(subreddit_name, LISTING_PAGE_SIZE, after=gap["after"])
+                if submission.created_utc > gap["created_utc"]
+            ]
+            pages_left -= 1
+            submissions.extend(reversed(page))
+            if page:
+                gap["after"] = page[-1].fullname
+            if len(page) < LISTING_PAGE_SIZE:
+                gaps.pop(0)
+        if gaps:
+            # Poll again next cycle to finish the backfill
+            state["behind"] = True
+        
+        elapsed = now - state["polled_at"]
+        if elapsed > 0:
+            observed = new_count / elapsed
+            state["rate"] = VELOCITY_SMOOTHING * observed + (1 - VELOCITY_SMOOTHING) * (state.get("rate") or 0.0)
+        state["polled_at"] = now
+    
+    def _is_gone(self, fullname: str) -> bool:
+        """Check whether a submission has left the listings.
+        
+        Args:
+            fullname: Submission fullname
+            
+        Returns:
+            True if the submission was deleted or removed
+        """
+        self._acquire()
+        things = list(self.reddit.get("api/info", params={"id": fullname}))
+        self._record_limits()
+        if not things:
+            return True
+        # Read attributes directly; praw objects fetch missing ones lazily
+        attributes = vars(things[0])
+        return bool(attributes.get("removed_by_category")) or attributes.get("author") is None
+    
+    def _fetch_new_page(
+        self,
+        subreddit_name: str,
+        limit: int,
+        before: Optional[str] = None,
+        after: Optional[str] = None
+    ) -> List[Any]:
+        """Fetch one page of a subreddit's ``new`` listing in a single request.
+        
+        Args:
+            subreddit_name: Subreddit name
+            limit: Submissions per page (at most 100)
+            before: Fullname to return the submissions published after
+            after: Fullname to return the submissions published before
+            
+        Returns:
+            Submissions, newest first
+        """
+        params = {"limit": limit}
+        if before:
+            params["before"] = before
+        if after:
+            params["after"] = after
+        self._acquire()
+        # Listing generators would follow up a short page with an extra request
+        listing = self.reddit.get(f"r/{subreddit_name}/new", params=params)
+        self._record_limits()
+        return list(listing)
+    
     def _search_multiple_subreddits(self, subreddits: List[str], keywords: List[str], batch_size: int) -> List[RedditPost]:
         """Search multiple subreddits with multiple keywords for maximum coverage.
         
@@ -143,28 +371,24 @@ class RedditCollector(BaseCollector):
         """
         posts = []
         
-        # Rate limiting settings
-        max_requests_per_minute = 95
-        delay_between_requests = 60 / max_requests_per_minute  # ~0.63 seconds
-        
         for subreddit_name in subreddits[:5]:  # Limit to first 5 subreddits
             try:
                 sub = self.reddit.subreddit(subreddit_name)
                 for keyword in keywords[:10]:  # Limit to first 10 keywords for performance
                     try:
                         print(f"🔍 Searching '{keyword}' in r/{subreddit_name}...")
+                        self._acquire_listing(batch_size)
                         search_results = sub.search(keyword, sort="new", limit=batch_size)
                         
                         for submission in search_results:
                             try:
                                 post = RedditPost.from_praw_submission(submission)
                                 posts.append(post)
-                                # Rate limiting
-                                time.sleep(delay_between_requests)
                             except Exception as e:
                                 print(f"Error processing post: {e}")
                                 continue
-                                
+                        self._record_limits()
+                        
                     except Exception as e:
                         print(f"Error searching '{keyword}' in r/{subreddit_name}: {e}")
                         time.sleep(10)  # Wait longer on error
@@ -196,6 +420,7 @@ class RedditCollector(BaseCollector):
         """
         subreddit = self.reddit.subreddit(subreddit_name)
         posts = []
+        self._acquire_listing(max_posts)
         
         # Get posts based on sort method
         if sort_by == "hot":
@@ -217,6 +442,7 @@ class RedditCollector(BaseCollector):
             except Exception as e:
                 print(f"Error processing submission {submission.id}: {e}")
                 continue
+        self._record_limits()
         
         return posts
     
@@ -234,6 +460,7 @@ class RedditCollector(BaseCollector):
         
         try:
             # Search across all of Reddit for the keyword
+            self._acquire_listing(max_posts)
             search_results = self.reddit.subreddit("all").search(keyword, limit=max_posts, sort="relevance", time_filter="week")
             
             for submission in search_results:
@@ -243,6 +470,7 @@ class RedditCollector(BaseCollector):
                 except Exception as e:
                     print(f"Error processing submission {submission.id}: {e}")
                     continue
+            self._record_limits()
         except Exception as e:
             print(f"Error searching Reddit for '{keyword}': {e}")
         
@@ -262,6 +490,8 @@ class RedditCollector(BaseCollector):
             return []
         
         try:
+            # One request for the submission and its comment tree
+            self._acquire()
             submission = self.reddit.submission(id=post_id)
             comments = []
             
@@ -274,6 +504,7 @@ class RedditCollector(BaseCollector):
                 except Exception as e:
                     print(f"Error processing comment {comment.id}: {e}")
                     continue
+            self._record_limits()
             
             return comments
         except Exception as e:
@@ -2,7 +2,7 @@
 
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import yaml
 from dotenv import load_dotenv
@@ -10,6 +10,188 @@ from pydantic import BaseModel, Field, validator
 from pydantic_settings import BaseSettings
 
 
+class WriterConfig(BaseModel):
+    """Background database writer configuration."""
+    
+    enabled: bool = Field(default=False, description="Route collector writes through a single writer thread")
+    max_batch_size: int = Field(default=1000, description="Maximum posts per group commit")
+    max_latency_ms: int = Field(default=250, description="Maximum time a batch waits before it is committed")
+    max_queue_size: int = Field(default=0, description="Maximum queued batches before submit blocks (0 = unbounded)")
+    
+    @validator('max_batch_size', 'max_latency_ms')
+    def validate_positive(cls, v):
+        if v <= 0:
+            raise ValueError("Writer batch size and latency must be positive")
+        return v
+
+
+class SQLitePerformanceConfig(BaseModel):
+    """SQLite performance profile applied to every new connection."""
+    
+    enabled: bool = Field(default=True, description="Apply the performance profile and split reader/writer pools")
+    journal_mode: str = Field(default="wal", description="Journal mode: wal, delete, truncate, persist, memory, off")
+    synchronous: str = Field(default="normal", description="Synchronous level: off, normal, full, extra")
+    mmap_size: int = Field(default=268435456, description="Bytes of the database file to memory-map (0 disables)")
+    cache_size: int = Field(default=-65536, description="Page cache size; negative values are KiB, positive values are pages")
+    temp_store: str = Field(default="memory", description="Where temporary tables live: default, file, memory")
+    page_size: int = Field(default=4096, description="Page size in bytes (only takes effect on a new database)")
+    auto_vacuum: str = Field(default="incremental", description="Auto-vacuum mode: none, full, incremental (new databases, or after a full VACUUM)")
+    busy_timeout_ms: int = Field(default=30000, description="How long to wait for a lock before failing")
+    reader_pool_size: int = Field(default=4, description="Number of pooled read-only connections")
+    
+    @validator('journal_mode')
+    def validate_journal_mode(cls, v):
+        allowed_modes = ['wal', 'delete', 'truncate', 'persist', 'memory', 'off']
+        if v.lower() not in allowed_modes:
+            raise ValueError(f"Journal mode must be one of {allowed_modes}")
+        return v.lower()
+    
+    @validator('synchronous')
+    def validate_synchronous(cls, v):
+        allowed_levels = ['off', 'normal', 'full', 'extra']
+        if v.lower() not in allowed_levels:
+            raise ValueError(f"Synchronous must be one of {allowed_levels}")
+        return v.lower()
+    
+    @validator('temp_store')
+    def validate_temp_store(cls, v):
+        allowed_stores = ['default', 'file', 'memory']
+        if v.lower() not in allowed_stores:
+            raise ValueError(f"Temp store must be one of {allowed_stores}")
+        return v.lower()
+    
+    @validator('auto_vacuum')
+    def validate_auto_vacuum(cls, v):
+        allowed_modes = ['none', 'full', 'incremental']
+        if v.lower() not in allowed_modes:
+            raise ValueError(f"Auto-vacuum mode must be one of {allowed_modes}")
+        return v.lower()
+    
+    @validator('reader_pool_size')
+    def validate_reader_pool_size(cls, v):
+        if v < 1:
+            raise ValueError("Reader pool size must be at least 1")
+        return v
+
+
+class DedupConfig(BaseModel):
+    """In-memory deduplication filter configuration."""
+    
+    enabled: bool = Field(default=False, description="Drop already-stored, unchanged posts before they reach the database")
+    lru_size: int = Field(default=100000, description="Number of recent post keys kept for exact matching")
+    bloom_capacity: int = Field(default=1000000, description="Initial capacity of the Bloom filter")
+    error_rate: float = Field(default=0.001, description="Target Bloom filter false-positive rate")
+    warm_limit: int = Field(default=100000, description="Recent posts loaded into the exact cache before the first write")
+    
+    @validator('error_rate')
+    def validate_error_rate(cls, v):
+        if not 0 < v < 1:
+            raise ValueError("Error rate must be between 0 and 1")
+        return v
+
+
+class SearchConfig(BaseModel):
+    """Full-text search configuration."""
+    
+    enabled: bool = Field(default=False, description="Maintain an FTS5 index over post text and titles (SQLite only)")
+    tokenizer: str = Field(default="unicode61 remove_diacritics 2", description="FTS5 tokenizer used when the index is created")
+
+
+class MetricsHistoryConfig(BaseModel):
+    """Engagement time-series configuration."""
+    
+    enabled: bool = Field(default=False, description="Append engagement samples to post_metrics_history when metrics change (SQLite only)")
+    intervals: List[Tuple[float, int]] = Field(
+        default=[(1, 1), (24, 15), (168, 60)],
+        description="(max post age in hours, min minutes between samples) tiers; fresh posts are sampled most often"
+    )
+    max_interval: int = Field(default=1440, description="Minutes between samples for posts older than every tier")
+    
+    @validator('intervals')
+    def validate_intervals(cls, v):
+        if any(age <= 0 or minutes < 0 for age, minutes in v):
+            raise ValueError("Interval tiers need a positive age and a non-negative interval")
+        return sorted(v)
+
+
+class RetentionPolicy(BaseModel):
+    """Retention limits for one platform's posts, by age since creation."""
+    
+    raw_data_days: Optional[int] = Field(default=None, description="Drop raw payloads of posts older than this many days")
+    post_days: Optional[int] = Field(default=None, description="Delete posts older than this many days")
+    
+    @validator('raw_data_days', 'post_days')
+    def validate_days(cls, v):
+        if v is not None and v <= 0:
+            raise ValueError("Retention periods must be positive")
+        return v
+
+
+class RetentionConfig(BaseModel):
+    """Retention and compaction configuration (SQLite only)."""
+    
+    default: RetentionPolicy = Field(default_factory=RetentionPolicy, description="Policy for platforms without their own")
+    platforms: Dict[str, RetentionPolicy] = Field(default_factory=dict, description="Per-platform policies")
+    batch_size: int = Field(default=1000, description="Rows deleted per transaction")
+    batch_pause_ms: int = Field(default=50, description="Pause between batches so collector writes get the lock")
+    vacuum_pages: int = Field(default=1000, description="Free pages returned to the file system per incremental vacuum step")
+    interval_minutes: int = Field(default=0, description="Compact in the background of continuous collection every N minutes (0 disables)")
+    
+    @validator('batch_size', 'vacuum_pages')
+    def validate_positive(cls, v):
+        if v <= 0:
+            raise ValueError("Retention batch sizes must be positive")
+        return v
+    
+    def policy_for(self, platform: str) -> RetentionPolicy:
+        """Policy that applies to a platform."""
+        return self.platforms.get(platform, self.default)
+
+
+class ReadReplicaConfig(BaseModel):
+    """Snapshot read replica configuration (SQLite only)."""
+    
+    enabled: bool = Field(default=False, description="Serve stats, dashboard and export reads from a periodic snapshot of the database")
+    directory: Optional[str] = Field(default=None, description="Where snapshots are kept; defaults to a snapshots directory next to the database")
+    max_staleness_seconds: int = Field(default=3600, description="Take a new snapshot when the current one is older than this")
+    
+    @validator('max_staleness_seconds')
+    def validate_max_staleness(cls, v):
+        if v < 0:
+            raise ValueError("Maximum staleness cannot be negative")
+        return v
+
+
+class PostgreSQLConfig(BaseModel):
+    """PostgreSQL backend configuration."""
+    
+    pool_size: int = Field(default=10, description="Pooled connections kept open")
+    max_overflow: int = Field(default=20, description="Additional connections beyond pool_size")
+    partition_interval: str = Field(default="month", description="Range partition width on created_at: day, week, month, year")
+    
+    @validator('partition_interval')
+    def validate_partition_interval(cls, v):
+        allowed_intervals = ['day', 'week', 'month', 'year']
+        if v.lower() not in allowed_intervals:
+            raise ValueError(f"Partition interval must be one of {allowed_intervals}")
+        return v.lower()
+
+
+class MySQLConfig(BaseModel):
+    """MySQL/MariaDB backend configuration."""
+    
+    pool_size: int = Field(default=10, description="Pooled connections kept open")
+    max_overflow: int = Field(default=20, description="Additional connections beyond pool_size")
+    pool_recycle: int = Field(default=3600, description="Seconds before a pooled connection is replaced (keep below the server's wait_timeout)")
+    rows_per_statement: int = Field(default=1000, description="Rows per multi-row upsert statement (bounded by max_allowed_packet)")
+    
+    @validator('rows_per_statement')
+    def validate_rows_per_statement(cls, v):
+        if v < 1:
+            raise ValueError("rows_per_statement must be at least 1")
+        return v
+
+
 class DatabaseConfig(BaseModel):
     """Database configuration."""
     
@@ -21,6 +203,15 @@ class DatabaseConfig(BaseModel):
     username: Optional[str] = None
     password: Optional[str] = None
     separate_databases: bool = Field(default=False, description="Use separate databases for each platform")
+    writer: WriterConfig = Field(default_factory=WriterConfig)
+    performance: SQLitePerformanceConfig = Field(default_factory=SQLitePerformanceConfig)
+    dedup: DedupConfig = Field(default_factory=DedupConfig)
+    search: SearchConfig = Field(default_factory=SearchConfig)
+    metrics_history: MetricsHistoryConfig = Field(default_factory=MetricsHistoryConfig)
+    retention: RetentionConfig = Field(default_factory=RetentionConfig)
+    read_replica: ReadReplicaConfig = Field(default_factory=ReadReplicaConfig)
+    postgresql: PostgreSQLConfig = Field(default_factory=PostgreSQLConfig)
+    mysql: MySQLConfig = Field(default_factory=MySQLConfig)
     
     @validator('type')
     def validate_type(cls, v):
@@ -41,6 +232,16 @@ class RedditConfig(BaseModel):
     max_posts_per_subreddit: int = Field(default=1000, description="Maximum posts to collect per subreddit")
     sort_by: str = Field(default="hot", description="Sort posts by: hot, new, top, rising")
     time_filter: str = Field(default="day", description="Time filter for top posts: hour, day, week, month, year, all")
+    requests_per_minute: Optional[float] = Field(default=None, description="Request rate until the API reports its quota; defaults to the platform's published limit")
+    incremental: bool = Field(default=False, description="Continuous collection reads only new submissions from the new listing")
+    max_pages_per_cycle: int = Field(default=10, description="Listing requests per subreddit and cycle in incremental mode")
+    max_poll_interval: float = Field(default=300, description="Longest wait in seconds between polls of a quiet subreddit in incremental mode")
+    
+    @validator('max_pages_per_cycle')
+    def validate_max_pages_per_cycle(cls, v):
+        if v < 1:
+            raise ValueError("max_pages_per_cycle must be at least 1")
+        return v
     
     @validator('sort_by')
     def validate_sort_by(cls, v):
@@ -65,6 +266,21 @@ class BlueskyConfig(BaseModel):
     password: Optional[str] = None
     max_posts: int = Field(default=1000, description="Maximum posts to collect")
     keywords: List[str] = Field(default=[], description="Keywords to search for")
+    requests_per_minute: Optional[float] = Field(default=None, description="Request rate until the API reports its quota; defaults to the platform's published limit")
+    page_size: int = Field(default=100, description="Posts per search request (Bluesky allows at most 100)")
+    max_pages_per_cycle: int = Field(default=10, description="Search requests per query and continuous collection cycle")
+    
+    @validator('page_size')
+    def validate_page_size(cls, v):
+        if not 1 <= v <= 100:
+            raise ValueError("page_size must be between 1 and 100")
+        return v
+    
+    @validator('max_pages_per_cycle')
+    def validate_max_pages_per_cycle(cls, v):
+        if v < 1:
+            raise ValueError("max_pages_per_cycle must be at least 1")
+        return v
 
 
 class MastodonConfig(BaseModel):
@@ -75,6 +291,42 @@ class MastodonConfig(BaseModel):
     access_token: Optional[str] = None
     max_posts_per_instance: int = Field(default=1000, description="Maximum posts to collect per instance")
     hashtags: List[str] = Field(default=[], description="Hashtags to search for")
+    requests_per_minute: Optional[float] = Field(default=None, description="Request rate until the API reports its quota; defaults to the platform's published limit")
+    page_size: int = Field(default=40, description="Statuses per timeline request (Mastodon allows at most 40)")
+    max_pages_per_cycle: int = Field(default=10, description="Timeline requests per feed and continuous collection cycle")
+    backfill_pages: int = Field(default=0, description="Older pages to backfill per feed the first time it is collected")
+    
+    @validator('page_size')
+    def validate_page_size(cls, v):
+        if not 1 <= v <= 40:
+            raise ValueError("page_size must be between 1 and 40")
+        return v
+    
+    @validator('max_pages_per_cycle')
+    def validate_max_pages_per_cycle(cls, v):
+        if v < 1:
+            raise ValueError("max_pages_per_cycle must be at least 1")
+        return v
+
+
+class JetstreamConfig(BaseModel):
+    """Bluesky Jetstream streaming collector configuration."""
+    
+    enabled: bool = Field(default=False, description="Enable the Jetstream streaming collector")
+    uri: str = Field(default="wss://jetstream2.us-west.bsky.network/subscribe", description="Jetstream subscribe endpoint")
+    max_posts: int = Field(default=1000, description="Maximum posts per one-shot collection")
+    batch_size: int = Field(default=500, description="Most posts handed to the database per micro-batch")
+    batch_latency_ms: int = Field(default=1000, description="Longest time a streamed post waits for its micro-batch")
+    max_queue_size: int = Field(default=10000, description="Posts buffered between the stream and the database before the stream pauses")
+    reconnect_initial_seconds: float = Field(default=1.0, description="First reconnect delay; doubles after each failed attempt")
+    reconnect_max_seconds: float = Field(default=60.0, description="Longest reconnect delay")
+    cursor_rewind_seconds: float = Field(default=3.0, description="Seconds replayed before the cursor when resuming")
+    
+    @validator('uri')
+    def validate_uri(cls, v):
+        if not v.startswith(('ws://', 'wss://')):
+            raise ValueError("uri must be a ws:// or wss:// URL")
+        return v
 
 
 class CollectorsConfig(BaseModel):
@@ -83,6 +335,7 @@ class CollectorsConfig(BaseModel):
     reddit: RedditConfig = Field(default_factory=RedditConfig)
     bluesky: BlueskyConfig = Field(default_factory=BlueskyConfig)
     mastodon: MastodonConfig = Field(default_factory=MastodonConfig)
+    jetstream: JetstreamConfig = Field(default_factory=JetstreamConfig)
 
 
 class AppConfig(BaseModel):
@@ -90,6 +343,7 @@ class AppConfig(BaseModel):
     
     name: str = Field(default="SocFlow", description="Application name")
     output_dir: str = Field(default="data", description="Output directory for data")
+    cursor_path: Optional[str] = Field(default=None, description="File holding continuous collection cursors; defaults to cursors.json in output_dir")
     log_level: str = Field(default="INFO", description="Logging level")
     debug: bool = Field(default=False, description="Enable debug mode")
     
@@ -1,7 +1,12 @@
 """Database management for SocFlow."""
 
+from .async_base import AsyncDatabaseManager
+from .async_sqlite import AsyncSQLiteManager
 from .base import DatabaseManager, DatabaseType
 from .sqlite import SQLiteManager
-from .factory import create_database_manager
+from .postgresql import PostgreSQLManager
+from .mysql import MySQLManager
+from .factory import create_async_database_manager, create_database_manager
+from .writer import DatabaseWriter, PlatformWriters
 
-__all__ = ["DatabaseManager", "DatabaseType", "SQLiteManager", "create_database_manager"]
+__all__ = ["DatabaseManager", "DatabaseType", "SQLiteManager", "PostgreSQLManager", "MySQLManager", "create_database_manager", "AsyncDatabaseManager", "AsyncSQLiteManager", "create_async_database_manager", "DatabaseWriter", "PlatformWriters"]
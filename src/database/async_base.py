@@ -0,0 +1,104 @@
+"""Base interface for asyncio-native database managers."""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from ..models.base import BasePost
+
+
+class AsyncDatabaseManager(ABC):
+    """Abstract base class for database managers used from an event loop.
+    
+    Every method is a coroutine, so a commit never blocks the loop and
+    asyncio collectors can overlap network I/O with persistence. Managers
+    must be connected before use, either with :meth:`connect` or with
+    ``async with``.
+    """
+    
+    def __init__(self, connection_string: str):
+        """Initialize database manager without connecting.
+        
+        Args:
+            connection_string: Database connection string
+        """
+        self.connection_string = connection_string
+        # DedupFilter whose Bloom misses skip the existence lookup, for managers that do one; set by the app
+        self.key_filter = None
+    
+    @abstractmethod
+    async def connect(self) -> None:
+        """Open the database connections."""
+        pass
+    
+    @abstractmethod
+    async def create_tables(self, platforms: List[str]) -> None:
+        """Create necessary tables.
+        
+        Args:
+            platforms: List of platform names to create tables for
+        """
+        pass
+    
+    @abstractmethod
+    async def insert_posts(self, posts: List[BasePost]) -> Dict[str, int]:
+        """Insert multiple posts.
+        
+        Same semantics as :meth:`DatabaseManager.insert_posts`.
+        
+        Args:
+            posts: List of posts to insert
+            
+        Returns:
+            Dictionary with ``inserted``, ``updated``, ``metrics_updated`` and ``skipped`` counts
+        """
+        pass
+    
+    @abstractmethod
+    def iter_posts(
+        self,
+        platform: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        batch_size: int = 1000,
+        include_raw: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream posts ordered by creation time using keyset pagination.
+        
+        Args:
+            platform: Filter by platform
+            since: Only posts created at or after this time
+            until: Only posts created before this time
+            batch_size: Number of rows fetched per query
+            include_raw: Also load each post's raw platform payload (``raw_data``)
+            
+        Yields:
+            Post dictionaries
+        """
+        pass
+    
+    @abstractmethod
+    async def get_post_count(self, platform: Optional[str] = None) -> int:
+        """Get total number of posts.
+        
+        Args:
+            platform: Filter by platform
+            
+        Returns:
+            Number of posts
+        """
+        pass
+    
+    @abstractmethod
+    async def close(self) -> None:
+        """Close database connections."""
+        pass
+    
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.connect()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
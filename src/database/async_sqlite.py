@@ -0,0 +1,360 @@
+"""aiosqlite-backed asyncio database manager.
+
+Reads and writes the same database file, schema and storage formats as
+:class:`SQLiteManager`, so both managers can be used on one database. Each
+aiosqlite connection runs its statements on its own thread, so a commit
+never blocks the event loop.
+"""
+
+import asyncio
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from ..config.settings import MetricsHistoryConfig, SearchConfig, SQLitePerformanceConfig
+from .async_base import AsyncDatabaseManager
+from .base import empty_insert_counts, post_row_to_dict
+from .sqlite import (
+    BULK_CHUNK_SIZE,
+    POST_COLUMNS,
+    SQLiteManager,
+    compile_statement,
+    history_insert_statement,
+    key_lookup_queries,
+    load_raw_payload,
+    metrics_update_statement,
+    plan_history_samples,
+    plan_post_writes,
+    post_upsert_statement,
+    raw_delete_statement,
+    raw_payload_row,
+    raw_upsert_statement,
+    utcnow,
+)
+
+# SQLiteManager's write statements, rendered once as SQL text
+UPSERT_SQL = compile_statement(post_upsert_statement(), POST_COLUMNS)
+METRICS_SQL = compile_statement(metrics_update_statement())
+RAW_SQL = compile_statement(raw_upsert_statement(), ["post_id", "codec", "data"])
+RAW_DELETE_SQL = compile_statement(raw_delete_statement())
+HISTORY_SQL = compile_statement(
+    history_insert_statement(), ["post_id", "observed_at", "likes", "shares", "comments", "score"]
+)
+
+
+def to_db_datetime(value: datetime) -> str:
+    """Format a datetime the way SQLAlchemy stores it in SQLite."""
+    return value.strftime("%Y-%m-%d %H:%M:%S.%f")
+
+
+def from_db_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Parse a datetime stored by SQLAlchemy (or :func:`to_db_datetime`)."""
+    return datetime.fromisoformat(value) if value else None
+
+
+class AsyncSQLiteManager(AsyncDatabaseManager):
+    """SQLite manager for asyncio code, built on aiosqlite.
+    
+    Writes go through one connection guarded by an :class:`asyncio.Lock`.
+    The lock only orders this manager's own writes; across threads and
+    processes, including :class:`SQLiteManager` writers, each batch runs in
+    a ``BEGIN IMMEDIATE`` transaction, so its hash lookup and upsert happen
+    under SQLite's write lock. Reads use a second, read-only connection,
+    which in WAL mode never waits on the writer.
+    """
+    
+    def __init__(
+        self,
+        connection_string: str,
+        performance: Optional[SQLitePerformanceConfig] = None,
+        search: Optional[SearchConfig] = None,
+        metrics_history: Optional[MetricsHistoryConfig] = None
+    ):
+        """Initialize SQLite manager without connecting.
+        
+        Args:
+            connection_string: Database connection string (``sqlite:///path``)
+            performance: Connection tuning profile; defaults to the standard profile
+            search: Full-text search settings, used when creating tables
+            metrics_history: Engagement time-series settings; off by default
+        """
+        super().__init__(connection_string)
+        self.performance = performance or SQLitePerformanceConfig()
+        self.search_config = search or SearchConfig()
+        self.history_config = metrics_history or MetricsHistoryConfig()
+        self.db_path = self.connection_string.replace("sqlite:///", "")
+        self._writer = None
+        self._reader = None
+        self._write_lock = asyncio.Lock()
+    
+    async def connect(self) -> None:
+        """Open the writer and reader connections."""
+        try:
+            import aiosqlite
+        except ImportError:
+            raise ImportError(
+                "aiosqlite is required for the asyncio database manager. "
+                "Install it with: pip install aiosqlite or pip install socflow[async]"
+            )
+        
+        if self._writer is not None:
+            return
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        
+        # Autocommit mode; transactions are opened explicitly
+        self._writer = await aiosqlite.connect(self.db_path, isolation_level=None)
+        if self.performance.enabled:
+            await self._writer.execute(f"PRAGMA journal_mode = {self.performance.journal_mode.upper()}")
+        await self._apply_pragmas(self._writer)
+        
+        self._reader = await aiosqlite.connect(self.db_path, isolation_level=None)
+        await self._apply_pragmas(self._reader)
+        await self._reader.execute("PRAGMA query_only = ON")
+    
+    async def _apply_pragmas(self, connection) -> None:
+        """Apply the per-connection pragmas of the performance profile."""
+        profile = self.performance
+        await connection.execute(f"PRAGMA busy_timeout = {int(profile.busy_timeout_ms)}")
+        if not profile.enabled:
+            return
+        await connection.execute(f"PRAGMA synchronous = {profile.synchronous.upper()}")
+        await connection.execute(f"PRAGMA cache_size = {int(profile.cache_size)}")
+        await connection.execute(f"PRAGMA mmap_size = {int(profile.mmap_size)}")
+        await connection.execute(f"PRAGMA temp_store = {profile.temp_store.upper()}")
+    
+    async def create_tables(self, platforms: List[str]) -> None:
+        """Create or migrate the schema.
+        
+        Schema setup is rare, so it reuses :class:`SQLiteManager`'s
+        migrations (tables, indexes, counter and search triggers) in a
+        worker thread rather than duplicating them.
+        """
+        def create() -> None:
+            manager = SQLiteManager(
+                self.connection_string,
+                performance=self.performance,
+                search=self.search_config,
+                metrics_history=self.history_config
+            )
+            try:
+                manager.create_tables(platforms)
+            finally:
+                manager.close()
+        
+        await asyncio.to_thread(create)
+    
+    async def insert_posts(self, posts: List["BasePost"]) -> Dict[str, int]:
+        """Insert multiple posts with deduplication and update handling.
+        
+        Stored hashes are looked up and the batch is written in one
+        ``BEGIN IMMEDIATE`` transaction, with the same change detection as
+        :meth:`SQLiteManager.insert_posts`.
+        
+        Returns:
+            Dictionary with ``inserted``, ``updated``, ``metrics_updated`` and ``skipped`` counts
+        """
+        if not posts:
+            return empty_insert_counts()
+        
+        async with self._write_lock:
+            await self._writer.execute("BEGIN IMMEDIATE")
+            try:
+                existing_posts = await self._get_existing_posts(posts)
+                # Stamped inside the write transaction; see SQLiteManager.iter_changed_posts
+                now = utcnow()
+                rows, metrics_rows, counts = plan_post_writes(posts, existing_posts, now)
+                raw_data = {key: row.pop("raw_data") for key, row in rows.items()}
+                
+                if rows:
+                    await self._writer.executemany(UPSERT_SQL, [
+                        {
+                            **row,
+                            "created_at": to_db_datetime(row["created_at"]),
+                            "updated_at": to_db_datetime(now),
+                        }
+                        for row in rows.values()
+                    ])
+                if metrics_rows:
+                    await self._writer.executemany(METRICS_SQL, [
+                        {**row, "new_updated_at": to_db_datetime(now)} for row in metrics_rows.values()
+                    ])
+                history = self.history_config.enabled and bool(rows or metrics_rows)
+                if rows or history:
+                    post_ids = await self._get_post_ids([*rows, *metrics_rows] if history else list(rows))
+                    await self._write_raw_payloads(raw_data, post_ids)
+                    if history:
+                        await self._append_metrics_history(posts, rows, metrics_rows, post_ids, now)
+                await self._writer.execute("COMMIT")
+            except BaseException:
+                await self._writer.execute("ROLLBACK")
+                raise
+        return counts
+    
+    async def _get_post_ids(self, post_keys: List[Tuple[str, str]]) -> Dict[Tuple[str, str], int]:
+        """Get rowids of stored posts on the writer connection."""
+        post_ids = {}
+        for sql, params in key_lookup_queries(post_keys, ("id",)):
+            cursor = await self._writer.execute(sql, params)
+            for platform, object_id, post_id in await cursor.fetchall():
+                post_ids[(platform, object_id)] = post_id
+            await cursor.close()
+        return post_ids
+    
+    async def _write_raw_payloads(
+        self,
+        raw_data: Dict[Tuple[str, str], Optional[str]],
+        post_ids: Dict[Tuple[str, str], int]
+    ) -> None:
+        """Store the compressed payloads of written posts, replacing older versions."""
+        payloads = [raw_payload_row(post_ids[key], raw) for key, raw in raw_data.items() if raw]
+        cleared = [{"row_id": post_ids[key]} for key, raw in raw_data.items() if not raw]
+        if payloads:
+            await self._writer.executemany(RAW_SQL, payloads)
+        if cleared:
+            await self._writer.executemany(RAW_DELETE_SQL, cleared)
+    
+    async def _append_metrics_history(
+        self,
+        posts: List["BasePost"],
+        rows: Dict[Tuple[str, str], Dict[str, Any]],
+        metrics_rows: Dict[Tuple[str, str], Dict[str, Any]],
+        post_ids: Dict[Tuple[str, str], int],
+        now: datetime
+    ) -> None:
+        """Append engagement samples for the posts a batch inserted or changed."""
+        metrics = {key: row["metrics"] for key, row in rows.items()}
+        metrics.update({key: row["new_metrics"] for key, row in metrics_rows.items()})
+        created_at = {(post.platform, post.object_id): post.created_at for post in posts}
+        observations = {
+            post_id: (created_at[key], metrics[key]) for key, post_id in post_ids.items()
+        }
+        
+        last_samples = {}
+        post_ids = list(observations)
+        for start in range(0, len(post_ids), BULK_CHUNK_SIZE):
+            chunk = post_ids[start:start + BULK_CHUNK_SIZE]
+            # SQLite takes the bare columns from the row holding max(observed_at)
+            cursor = await self._writer.execute(
+                "SELECT post_id, max(observed_at), likes, shares, comments, score "
+                f"FROM post_metrics_history WHERE post_id IN ({', '.join(['?'] * len(chunk))}) "
+                "GROUP BY post_id",
+                chunk,
+            )
+            for post_id, observed_at, *values in await cursor.fetchall():
+                last_samples[post_id] = (from_db_datetime(observed_at), tuple(values))
+            await cursor.close()
+        
+        samples = plan_history_samples(observations, last_samples, now, self.history_config)
+        if samples:
+            await self._writer.executemany(HISTORY_SQL, [
+                {**sample, "observed_at": to_db_datetime(sample["observed_at"])} for sample in samples
+            ])
+    
+    async def _get_existing_posts(self, posts: List["BasePost"]) -> Dict[Tuple[str, str], Tuple[str, str]]:
+        """Get stored ``(text_hash, metrics_hash)`` of the batch's posts on the writer connection."""
+        existing_posts = {}
+        post_keys = list(dict.fromkeys((post.platform, post.object_id) for post in posts))
+        if self.key_filter is not None:
+            unseen = self.key_filter.claim_unseen(post_keys)
+            post_keys = [key for key in post_keys if key not in unseen]
+        
+        for sql, params in key_lookup_queries(post_keys, ("text_hash", "metrics_hash")):
+            cursor = await self._writer.execute(sql, params)
+            for platform, object_id, text_hash, metrics_hash in await cursor.fetchall():
+                existing_posts[(platform, object_id)] = (text_hash, metrics_hash)
+            await cursor.close()
+        
+        return existing_posts
+    
+    async def iter_posts(
+        self,
+        platform: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        batch_size: int = 1000,
+        include_raw: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream posts in ``(created_at, id)`` order with constant memory.
+        
+        Each batch is a separate keyset query, so no cursor stays open
+        between batches and other queries can interleave on the reader.
+        """
+        columns = ", ".join(["id"] + POST_COLUMNS)
+        conditions = []
+        params: List[Any] = []
+        if platform:
+            conditions.append("platform = ?")
+            params.append(platform)
+        if since:
+            conditions.append("created_at >= ?")
+            params.append(to_db_datetime(since))
+        if until:
+            conditions.append("created_at < ?")
+            params.append(to_db_datetime(until))
+        
+        last_key = None
+        while True:
+            page_conditions = list(conditions)
+            page_params = list(params)
+            if last_key is not None:
+                page_conditions.append("(created_at, id) > (?, ?)")
+                page_params.extend(last_key)
+            where = f"WHERE {' AND '.join(page_conditions)} " if page_conditions else ""
+            
+            cursor = await self._reader.execute(
+                f"SELECT {columns} FROM posts {where}ORDER BY created_at, id LIMIT ?",
+                page_params + [batch_size],
+            )
+            rows = await cursor.fetchall()
+            await cursor.close()
+            
+            posts = []
+            for row in rows:
+                record = SimpleNamespace(**dict(zip(["id"] + POST_COLUMNS, row)))
+                # Keyset values stay in their stored form
+                last_key = (record.created_at, record.id)
+                record.created_at = from_db_datetime(record.created_at)
+                record.updated_at = from_db_datetime(record.updated_at)
+                posts.append(post_row_to_dict(record))
+            if include_raw and posts:
+                await self._load_raw_payloads(posts)
+            for post in posts:
+                yield post
+            
+            if len(rows) < batch_size:
+                return
+    
+    async def _load_raw_payloads(self, posts: List[Dict[str, Any]]) -> None:
+        """Fill in ``raw_data`` of post dictionaries from ``post_raw``."""
+        by_id = {post["id"]: post for post in posts}
+        post_ids = list(by_id)
+        for start in range(0, len(post_ids), BULK_CHUNK_SIZE):
+            chunk = post_ids[start:start + BULK_CHUNK_SIZE]
+            cursor = await self._reader.execute(
+                f"SELECT post_id, codec, data FROM post_raw WHERE post_id IN ({', '.join(['?'] * len(chunk))})",
+                chunk,
+            )
+            for post_id, codec, data in await cursor.fetchall():
+                by_id[post_id]["raw_data"] = load_raw_payload(codec, data)
+            await cursor.close()
+    
+    async def get_post_count(self, platform: Optional[str] = None) -> int:
+        """Get total number of posts from the trigger-maintained counters."""
+        query = "SELECT coalesce(sum(count), 0) FROM post_counts"
+        params: List[Any] = []
+        if platform:
+            query += " WHERE platform = ?"
+            params.append(platform)
+        cursor = await self._reader.execute(query, params)
+        (count,) = await cursor.fetchone()
+        await cursor.close()
+        return count
+    
+    async def close(self) -> None:
+        """Close database connections."""
+        for connection in (self._reader, self._writer):
+            if connection is not None:
+                await connection.close()
+        self._reader = None
+        self._writer = None
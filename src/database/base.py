@@ -1,14 +1,149 @@
 """Base database manager interface."""
 
+import json
 from abc import ABC, abstractmethod
+from datetime import date, datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 
 from ..models.base import BasePost
+from ..utils.hashing import hash_metrics, hash_text
+
+
+def empty_insert_counts() -> Dict[str, int]:
+    """Insert counts for a batch that wrote nothing."""
+    return {"inserted": 0, "updated": 0, "metrics_updated": 0, "skipped": 0}
+
+
+class BatchWriteError(Exception):
+    """Some batches of a group write failed after others were committed.
+    
+    Raised by :meth:`DatabaseManager.insert_post_batches` when the group was
+    not written atomically, so retrying it would write the committed batches
+    twice. Any other exception from that method means nothing was committed.
+    
+    Attributes:
+        results: Insert counts of each batch; meaningful for batches not in ``errors``
+        errors: Exception of each failed batch, by its index in the group
+    """
+    
+    def __init__(self, results: List[Dict[str, int]], errors: Dict[int, Exception]):
+        super().__init__(f"{len(errors)} of {len(results)} batches failed: {next(iter(errors.values()))}")
+        self.results = results
+        self.errors = errors
+
+
+def group_by_platform(posts: List[BasePost]) -> Dict[str, List[BasePost]]:
+    """Split posts by platform, keeping their order within each platform.
+    
+    Args:
+        posts: Posts from any number of platforms
+        
+    Returns:
+        Posts keyed by platform name
+    """
+    groups: Dict[str, List[BasePost]] = {}
+    for post in posts:
+        groups.setdefault(post.platform, []).append(post)
+    return groups
+
+
+def post_row_to_dict(row: Any) -> Dict[str, Any]:
+    """Convert a posts row (ORM object or result row) to a dictionary.
+    
+    Args:
+        row: Object exposing the posts columns as attributes
+        
+    Returns:
+        Post dictionary with JSON columns decoded
+    """
+    return {
+        "id": row.id,
+        "platform": row.platform,
+        "object_id": row.object_id,
+        "author_handle": row.author_handle,
+        "text": row.text,
+        "created_at": row.created_at.isoformat() if row.created_at else None,
+        "updated_at": row.updated_at.isoformat() if row.updated_at else None,
+        "tags": json.loads(row.tags) if row.tags else [],
+        "metrics": json.loads(row.metrics) if row.metrics else {},
+        "url": row.url,
+        "parent_id": row.parent_id,
+        "is_comment": bool(row.is_comment),
+        # Backends keeping payloads outside the row fill this in on request
+        "raw_data": json.loads(row.raw_data) if getattr(row, "raw_data", None) else None,
+        # Platform-specific fields
+        "subreddit": row.subreddit,
+        "title": row.title,
+        "is_nsfw": bool(row.is_nsfw),
+        "handle": row.handle,
+        "display_name": row.display_name,
+        "avatar_url": row.avatar_url,
+        "is_reply": bool(row.is_reply),
+        "is_repost": bool(row.is_repost),
+        "reply_to": row.reply_to,
+        "repost_of": row.repost_of,
+        "instance": row.instance,
+        "is_reblog": bool(row.is_reblog),
+        "is_sensitive": bool(row.is_sensitive),
+        "reblog_of": row.reblog_of,
+    }
+
+
+def post_to_row(post: BasePost) -> Dict[str, Any]:
+    """Convert a post to a column dictionary for bulk statements.
+    
+    Args:
+        post: Post to convert
+        
+    Returns:
+        Values for every ``posts`` column except ``id`` and ``updated_at``
+    """
+    # Only store tags for Bluesky platform
+    tags_json = json.dumps(post.tags) if post.platform == "bluesky" else None
+    metrics = post.metrics.dict()
+    
+    return dict(
+        # Core fields
+        platform=post.platform,
+        object_id=post.object_id,
+        author_handle=post.author_handle,
+        text=post.text,
+        created_at=post.created_at,
+        url=post.url,
+        parent_id=post.parent_id,
+        is_comment=1 if post.is_comment else 0,
+        raw_data=json.dumps(post.raw_data, default=str) if post.raw_data else None,
+        metrics=json.dumps(metrics, default=str),
+        text_hash=hash_text(post.text),
+        metrics_hash=hash_metrics(metrics),
+        
+        # Reddit-specific fields (only essential ones)
+        subreddit=getattr(post, 'subreddit', None),
+        title=getattr(post, 'title', None),
+        is_nsfw=1 if bool(getattr(post, 'is_nsfw', False)) else 0,
+        
+        # Bluesky-specific fields (only essential ones)
+        handle=getattr(post, 'handle', None),
+        display_name=getattr(post, 'display_name', None),
+        avatar_url=getattr(post, 'avatar_url', None),
+        is_reply=1 if bool(getattr(post, 'is_reply', False)) else 0,
+        is_repost=1 if bool(getattr(post, 'is_repost', False)) else 0,
+        reply_to=getattr(post, 'reply_to', None),
+        repost_of=getattr(post, 'repost_of', None),
+        tags=tags_json,  # Only for Bluesky
+        
+        # Mastodon-specific fields (only essential ones)
+        instance=getattr(post, 'instance', None),
+        is_reblog=1 if bool(getattr(post, 'is_reblog', False)) else 0,
+        is_sensitive=1 if bool(getattr(post, 'is_sensitive', False)) else 0,
+        reblog_of=getattr(post, 'reblog_of', None),
+    )
 
 
 class DatabaseType(Enum):
@@ -33,6 +168,8 @@ class DatabaseManager(ABC):
         self.separate_databases = separate_databases
         self.engine: Optional[Engine] = None
         self.session_factory: Optional[sessionmaker] = None
+        # DedupFilter whose Bloom misses skip the existence lookup, for managers that do one; set by the app
+        self.key_filter = None
         self._setup_connection()
     
     @abstractmethod
@@ -59,20 +196,56 @@ class DatabaseManager(ABC):
         pass
     
     @abstractmethod
-    def insert_posts(self, posts: List[BasePost]) -> None:
+    def insert_posts(self, posts: List[BasePost]) -> Dict[str, int]:
         """Insert multiple posts.
         
+        Posts already stored unchanged are skipped; posts whose text changed
+        are updated in place, and posts whose only change is engagement get
+        their metrics refreshed.
+        
         Args:
             posts: List of posts to insert
+            
+        Returns:
+            Dictionary with ``inserted``, ``updated``, ``metrics_updated`` and ``skipped`` counts
         """
         pass
     
+    def insert_post_batches(self, batches: List[List[BasePost]]) -> List[Dict[str, int]]:
+        """Insert several batches of posts, committing them as a group.
+        
+        Backends that can write all batches in one transaction should
+        override this; the default inserts each batch separately.
+        
+        Args:
+            batches: Batches of posts, in submission order
+            
+        Returns:
+            Insert counts for each batch, in the same order
+        
+        Raises:
+            BatchWriteError: If some batches failed after others were committed
+        """
+        results = [empty_insert_counts() for _ in batches]
+        errors = {}
+        for index, posts in enumerate(batches):
+            try:
+                results[index] = self.insert_posts(posts)
+            except Exception as e:
+                errors[index] = e
+        if errors:
+            if len(errors) == len(batches):
+                raise errors[0]
+            raise BatchWriteError(results, errors)
+        return results
+    
     @abstractmethod
     def get_posts(
         self, 
         platform: Optional[str] = None,
         limit: Optional[int] = None,
-        offset: Optional[int] = None
+        offset: Optional[int] = None,
+        include_raw: bool = False
     ) -> List[Dict[str, Any]]:
         """Get posts from database.
         
@@ -80,12 +253,137 @@ class DatabaseManager(ABC):
             platform: Filter by platform
             limit: Maximum number of posts to return
             offset: Number of posts to skip
+            include_raw: Also load each post's raw platform payload (``raw_data``);
+                it is None otherwise
             
         Returns:
             List of post dictionaries
         """
         pass
     
+    @abstractmethod
+    def get_latest_posts(
+        self,
+        platform: Optional[str] = None,
+        subreddit: Optional[str] = None,
+        instance: Optional[str] = None,
+        limit: int = 50,
+        include_raw: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Get the newest posts, optionally of one platform, subreddit or instance.
+        
+        Args:
+            platform: Filter by platform
+            subreddit: Filter by Reddit subreddit
+            instance: Filter by Mastodon instance
+            limit: Maximum number of posts to return
+            include_raw: Also load each post's raw platform payload (``raw_data``)
+            
+        Returns:
+            Post dictionaries, newest first
+        """
+        pass
+    
+    @abstractmethod
+    def iter_posts(
+        self,
+        platform: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        batch_size: int = 1000,
+        include_raw: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream posts ordered by creation time using keyset pagination.
+        
+        Unlike :meth:`get_posts`, memory use is bounded by ``batch_size``
+        regardless of how many posts match.
+        
+        Args:
+            platform: Filter by platform
+            since: Only posts created at or after this time
+            until: Only posts created before this time
+            batch_size: Number of rows fetched per query
+            include_raw: Also load each post's raw platform payload (``raw_data``);
+                it is None otherwise
+            
+        Yields:
+            Post dictionaries
+        """
+        pass
+    
+    @abstractmethod
+    def iter_changed_posts(
+        self,
+        after: Optional[Tuple[datetime, int]] = None,
+        platform: Optional[str] = None,
+        batch_size: int = 1000,
+        include_raw: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream posts inserted or changed since a watermark.
+        
+        Args:
+            after: ``(updated_at, id)`` of the last post already seen; None streams everything
+            platform: Filter by platform
+            batch_size: Number of rows fetched per query
+            include_raw: Also load each post's raw platform payload (``raw_data``);
+                it is None otherwise
+            
+        Yields:
+            Post dictionaries ordered by ``(updated_at, id)``
+        """
+        pass
+    
+    @abstractmethod
+    def get_export_watermark(self, destination: str) -> Optional[Tuple[datetime, int]]:
+        """Get the watermark stored for an export destination.
+        
+        Args:
+            destination: Destination identifier
+            
+        Returns:
+            ``(updated_at, id)`` of the last exported post, or None
+        """
+        pass
+    
+    @abstractmethod
+    def set_export_watermark(self, destination: str, last_updated_at: datetime, last_rowid: int) -> None:
+        """Store the watermark for an export destination.
+        
+        Args:
+            destination: Destination identifier
+            last_updated_at: ``updated_at`` of the last exported post
+            last_rowid: ``id`` of the last exported post
+        """
+        pass
+    
+    @abstractmethod
+    def search(
+        self,
+        query: str,
+        platform: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: int = 50,
+        offset: int = 0,
+        include_raw: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Full-text search over post text (and titles), ranked by relevance.
+        
+        Args:
+            query: Search query in the backend's full-text syntax
+            platform: Filter by platform
+            since: Only posts created at or after this time
+            until: Only posts created before this time
+            limit: Maximum number of results
+            offset: Number of results to skip, for paging
+            include_raw: Also load each post's raw platform payload (``raw_data``);
+                it is None otherwise
+            
+        Returns:
+            Post dictionaries with ``score`` and ``snippet`` keys, best match first
+        """
+        pass
+    
     @abstractmethod
     def get_post_count(self, platform: Optional[str] = None) -> int:
         """Get total number of posts.
@@ -98,6 +396,146 @@ class DatabaseManager(ABC):
         """
         pass
     
+    @abstractmethod
+    def get_post_counts(self) -> Dict[str, int]:
+        """Get the number of posts for every platform.
+        
+        Returns:
+            Mapping of platform name to post count
+        """
+        pass
+    
+    @abstractmethod
+    def get_daily_post_counts(
+        self,
+        platform: Optional[str] = None,
+        since: Optional[date] = None
+    ) -> List[Tuple[str, str, int]]:
+        """Get post counts per platform and creation day.
+        
+        Args:
+            platform: Filter by platform
+            since: Only days on or after this date
+            
+        Returns:
+            ``(platform, "YYYY-MM-DD", count)`` tuples ordered by day
+        """
+        pass
+    
+    @abstractmethod
+    def iter_post_keys(self, batch_size: int = 10000) -> Iterator[Tuple[str, str]]:
+        """Iterate over the key of every stored post.
+        
+        Args:
+            batch_size: Number of keys fetched per query
+            
+        Yields:
+            ``(platform, object_id)`` tuples
+        """
+        pass
+    
+    @abstractmethod
+    def get_recent_post_hashes(self, limit: int) -> List[Tuple[str, str, str, str]]:
+        """Get the most recently stored posts' keys and content hashes.
+        
+        Args:
+            limit: Maximum number of posts to return
+            
+        Returns:
+            ``(platform, object_id, text_hash, metrics_hash)`` tuples, newest first
+        """
+        pass
+    
+    def get_metrics_history(self, platform: str, object_id: str) -> List[Dict[str, Any]]:
+        """Get a post's engagement samples, oldest first.
+        
+        Backends that record ``post_metrics_history`` override this.
+        
+        Args:
+            platform: Platform of the post
+            object_id: Platform-specific post ID
+            
+        Returns:
+            Dictionaries with ``observed_at``, ``likes``, ``shares``, ``comments`` and ``score``
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not record metrics history")
+    
+    def delete_posts(
+        self,
+        platform: str,
+        created_before: datetime,
+        batch_size: int = 1000,
+        pause: float = 0.0
+    ) -> int:
+        """Delete a platform's posts created before a cutoff, in small batches.
+        
+        Backends that support retention override this.
+        
+        Args:
+            platform: Platform whose posts to delete
+            created_before: Delete posts created before this time
+            batch_size: Posts deleted per transaction
+            pause: Seconds to sleep between batches so other writers get the lock
+            
+        Returns:
+            Number of posts deleted
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support retention")
+    
+    def drop_raw_data(
+        self,
+        platform: str,
+        created_before: datetime,
+        batch_size: int = 1000,
+        pause: float = 0.0
+    ) -> int:
+        """Drop the raw payloads of a platform's posts created before a cutoff.
+        
+        The posts themselves are kept. Backends that support retention override this.
+        
+        Args:
+            platform: Platform whose payloads to drop
+            created_before: Drop payloads of posts created before this time
+            batch_size: Posts examined per transaction
+            pause: Seconds to sleep between batches so other writers get the lock
+            
+        Returns:
+            Number of payloads dropped
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support retention")
+    
+    def reclaim_space(self, pages_per_step: int = 1000, pause: float = 0.0) -> Dict[str, int]:
+        """Return free pages left by deletions to the file system without blocking writers for long.
+        
+        Backends that support retention override this.
+        
+        Args:
+            pages_per_step: Pages released per transaction
+            pause: Seconds to sleep between steps
+            
+        Returns:
+            Dictionary with ``freed_bytes``, ``free_bytes`` (still unreleased) and
+            ``files_without_incremental`` (files that need :meth:`vacuum` first)
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support retention")
+    
+    def vacuum(self) -> None:
+        """Rebuild the database files, reclaiming all free space.
+        
+        Blocks writers for the whole rebuild. Backends that support retention override this.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support retention")
+    
+    def backup_to(self, directory: Path) -> None:
+        """Write a consistent copy of the database files into a directory.
+        
+        Backends with file-based storage override this.
+        
+        Args:
+            directory: Target directory; files keep their names
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support snapshots")
+    
     @abstractmethod
     def close(self) -> None:
         """Close database connection."""
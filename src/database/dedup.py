@@ -0,0 +1,172 @@
+"""In-memory deduplication in front of the database.
+
+Polling collectors see the same posts over and over. :class:`DedupFilter`
+drops posts that are known to be stored already with identical text and
+metrics, so repeats never reach ``insert_posts``. Posts it knows are new skip
+the database's existence lookup when they are written.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+from ..utils.bloom import ScalableBloomFilter
+from ..utils.hashing import hash_metrics, hash_text
+from .base import DatabaseManager
+
+
+class DedupFilter:
+    """Scalable Bloom filter plus a bounded LRU of exact keys.
+    
+    The Bloom filter holds every ``(platform, object_id)`` stored when it was
+    warmed or written since. A key it has never seen is not in the database,
+    so the manager writing that post skips looking it up (see
+    :meth:`claim_unseen`). The LRU maps recently stored keys to their text
+    and metrics hashes; a post is only dropped when its key is in the LRU
+    with the same hashes, so a Bloom false positive can never drop a post
+    that still needs writing.
+    
+    Posts stored by another process after the warm scan are unknown to the
+    Bloom filter. Their first write from this process is an upsert without
+    a lookup: a text edit is applied, but a metrics-only change waits for
+    the next sighting.
+    """
+    
+    def __init__(self, lru_size: int = 100_000, bloom_capacity: int = 1_000_000, error_rate: float = 0.001):
+        """Initialize an empty filter.
+        
+        Args:
+            lru_size: Maximum number of exact keys kept
+            bloom_capacity: Initial capacity of the Bloom filter
+            error_rate: Target Bloom false-positive rate
+        """
+        self.lru_size = lru_size
+        self._bloom = ScalableBloomFilter(bloom_capacity, error_rate)
+        self._recent: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        # Bloom misses not written yet, whose writes need no existence lookup
+        self._unseen: Set[Tuple[str, str]] = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.definitely_new = 0
+        self.lookups_skipped = 0
+    
+    @staticmethod
+    def fingerprint(post: Any) -> str:
+        """Fingerprint of a post's content, matching the stored hash columns."""
+        return hash_text(post.text) + hash_metrics(post.metrics.dict())
+    
+    @staticmethod
+    def _bloom_key(platform: str, object_id: str) -> str:
+        """Bloom filter item for a post key."""
+        return f"{platform}\x1f{object_id}"
+    
+    def filter(self, posts: List[Any]) -> List[Any]:
+        """Drop posts that are already stored and unchanged.
+        
+        Args:
+            posts: Incoming posts
+        
+        Returns:
+            Posts that still need to be written, in their original order
+        """
+        kept = []
+        with self._lock:
+            for post in posts:
+                key = (post.platform, post.object_id)
+                bloom_key = self._bloom_key(*key)
+                if bloom_key not in self._bloom:
+                    # Later copies of the post hit the Bloom filter and are looked up
+                    self._bloom.add(bloom_key)
+                    self._unseen.add(key)
+                    self.definitely_new += 1
+                    self.misses += 1
+                    kept.append(post)
+                    continue
+                
+                stored = self._recent.get(key)
+                if stored is not None and stored == self.fingerprint(post):
+                    self._recent.move_to_end(key)
+                    self.hits += 1
+                else:
+                    self.misses += 1
+                    kept.append(post)
+        return kept
+    
+    def claim_unseen(self, keys: Iterable[Tuple[str, str]]) -> Set[Tuple[str, str]]:
+        """Take the keys that missed the Bloom filter, which are not stored.
+        
+        Database managers call this inside the write transaction of a batch
+        and skip the existence lookup for the keys returned. Each key is
+        handed out once, so a later write of the same post is looked up.
+        
+        Args:
+            keys: ``(platform, object_id)`` keys about to be written
+        
+        Returns:
+            The keys known not to be stored
+        """
+        with self._lock:
+            claimed = self._unseen.intersection(keys)
+            self._unseen -= claimed
+            self.lookups_skipped += len(claimed)
+        return claimed
+    
+    def remember(self, posts: List[Any]) -> None:
+        """Record posts that were written successfully."""
+        with self._lock:
+            for post in posts:
+                self._unseen.discard((post.platform, post.object_id))
+                self._add(post.platform, post.object_id, self.fingerprint(post))
+    
+    def _add(self, platform: str, object_id: str, fingerprint: str) -> None:
+        """Add a key to both structures (caller holds the lock)."""
+        bloom_key = self._bloom_key(platform, object_id)
+        if bloom_key not in self._bloom:
+            self._bloom.add(bloom_key)
+        
+        key = (platform, object_id)
+        self._recent[key] = fingerprint
+        self._recent.move_to_end(key)
+        while len(self._recent) > self.lru_size:
+            self._recent.popitem(last=False)
+    
+    def warm(self, db_manager: DatabaseManager, limit: int) -> int:
+        """Load stored keys into the Bloom filter and recent posts into the LRU.
+        
+        Args:
+            db_manager: Database to read from
+            limit: Number of most recent posts loaded into the LRU
+        
+        Returns:
+            Number of keys loaded into the Bloom filter
+        """
+        loaded = 0
+        with self._lock:
+            for platform, object_id in db_manager.iter_post_keys():
+                bloom_key = self._bloom_key(platform, object_id)
+                if bloom_key not in self._bloom:
+                    self._bloom.add(bloom_key)
+                loaded += 1
+            
+            # Oldest first so the newest posts end up most recently used
+            recent = db_manager.get_recent_post_hashes(min(limit, self.lru_size))
+            for platform, object_id, text_hash, metrics_hash in reversed(recent):
+                if text_hash and metrics_hash:
+                    self._add(platform, object_id, text_hash + metrics_hash)
+        return loaded
+    
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and sizes."""
+        with self._lock:
+            checked = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "definitely_new": self.definitely_new,
+                "lookups_skipped": self.lookups_skipped,
+                "hit_rate": self.hits / checked if checked else 0.0,
+                "cached_keys": len(self._recent),
+                "bloom_keys": len(self._bloom),
+                "bloom_bytes": self._bloom.size_bytes,
+            }
@@ -3,6 +3,7 @@
 from typing import Optional
 
 from ..config.settings import DatabaseConfig
+from .async_base import AsyncDatabaseManager
 from .base import DatabaseManager, DatabaseType
 from .sqlite import SQLiteManager
 
@@ -38,16 +39,89 @@ def create_database_manager(config: DatabaseConfig) -> DatabaseManager:
         
         return SQLiteManager(
             connection_string=connection_string,
-            separate_databases=config.separate_databases
+            separate_databases=config.separate_databases,
+            performance=config.performance,
+            search=config.search,
+            metrics_history=config.metrics_history
         )
     
     elif db_type == DatabaseType.POSTGRESQL:
-        # TODO: Implement PostgreSQL manager
-        raise NotImplementedError("PostgreSQL support not yet implemented")
+        from sqlalchemy.engine import URL
+        
+        from .postgresql import PostgreSQLManager
+        
+        connection_url = URL.create(
+            "postgresql+psycopg",
+            username=config.username,
+            password=config.password,
+            host=config.host or "localhost",
+            port=config.port or 5432,
+            database=config.name or "socflow",
+        )
+        return PostgreSQLManager(
+            connection_string=connection_url.render_as_string(hide_password=False),
+            separate_databases=config.separate_databases,
+            config=config.postgresql,
+            search=config.search
+        )
     
     elif db_type == DatabaseType.MYSQL:
-        # TODO: Implement MySQL manager
-        raise NotImplementedError("MySQL support not yet implemented")
+        from sqlalchemy.engine import URL
+        
+        from .mysql import MySQLManager
+        
+        connection_url = URL.create(
+            "mysql+pymysql",
+            username=config.username,
+            password=config.password,
+            host=config.host or "localhost",
+            port=config.port or 3306,
+            database=config.name or "socflow",
+        )
+        return MySQLManager(
+            connection_string=connection_url.render_as_string(hide_password=False),
+            separate_databases=config.separate_databases,
+            config=config.mysql,
+            search=config.search
+        )
     
     else:
         raise ValueError(f"Unsupported database type: {config.type}")
+
+
+def create_async_database_manager(config: DatabaseConfig) -> AsyncDatabaseManager:
+    """Create an asyncio database manager based on configuration.
+    
+    The manager is returned unconnected; call ``connect()`` or use it with
+    ``async with``.
+    
+    Args:
+        config: Database configuration
+        
+    Returns:
+        Async database manager instance
+        
+    Raises:
+        NotImplementedError: If the configuration has no async implementation
+    """
+    from pathlib import Path
+    
+    from .async_sqlite import AsyncSQLiteManager
+    
+    db_type = DatabaseType(config.type)
+    if db_type != DatabaseType.SQLITE:
+        raise NotImplementedError(f"Async database manager not yet implemented for {config.type}")
+    if config.separate_databases:
+        raise NotImplementedError("Async database manager does not support separate_databases")
+    
+    # Same path resolution as create_database_manager
+    db_path = Path(config.path) if config.path else Path("data") / "socflow.db"
+    if not db_path.is_absolute():
+        db_path = Path.cwd() / db_path
+    
+    return AsyncSQLiteManager(
+        connection_string=f"sqlite:///{db_path}",
+        performance=config.performance,
+        search=config.search,
+        metrics_history=config.metrics_history
+    )
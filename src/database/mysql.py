@@ -0,0 +1,691 @@
+"""MySQL/MariaDB database manager implementation.
+
+Several collector processes, possibly on different hosts, can write to one
+MySQL or MariaDB server at once. Batches are written with large multi-row
+``INSERT ... ON DUPLICATE KEY UPDATE`` statements, so a batch costs a
+handful of round trips regardless of its size, and reads that cover the
+whole table (``get_posts`` and exports) stream rows through a server-side
+cursor instead of buffering the result in memory.
+"""
+
+import re
+import time
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Date,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    UniqueConstraint,
+    create_engine,
+    func,
+    select,
+    text,
+    tuple_,
+)
+from sqlalchemy.dialects.mysql import DATETIME, MEDIUMTEXT
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from ..config.settings import MySQLConfig, SearchConfig
+from ..utils.hashing import HASH_SIZE
+from .base import DatabaseManager, empty_insert_counts, post_row_to_dict, post_to_row
+
+metadata = MetaData()
+
+# Microsecond precision keeps (updated_at, id) watermarks tight
+Timestamp = DATETIME(fsp=6)
+
+posts_table = Table(
+    "posts",
+    metadata,
+    Column("id", BigInteger, primary_key=True, autoincrement=True),
+    Column("platform", String(50), nullable=False),
+    Column("object_id", String(255), nullable=False),
+    Column("author_handle", String(255), nullable=False),
+    Column("text", MEDIUMTEXT, nullable=False),
+    Column("created_at", Timestamp, nullable=False),
+    Column("url", String(500)),
+    Column("parent_id", String(255)),
+    Column("is_comment", Integer, default=0),
+    Column("raw_data", MEDIUMTEXT),
+    Column("metrics", MEDIUMTEXT),
+    Column("text_hash", String(HASH_SIZE * 2)),
+    Column("metrics_hash", String(HASH_SIZE * 2)),
+    Column("updated_at", Timestamp),
+    Column("subreddit", String(255)),
+    Column("title", MEDIUMTEXT),
+    Column("is_nsfw", Integer, default=0),
+    Column("handle", String(255)),
+    Column("display_name", String(255)),
+    Column("avatar_url", String(500)),
+    Column("is_reply", Integer, default=0),
+    Column("is_repost", Integer, default=0),
+    Column("reply_to", String(255)),
+    Column("repost_of", String(255)),
+    Column("tags", MEDIUMTEXT),
+    Column("instance", String(255)),
+    Column("is_reblog", Integer, default=0),
+    Column("is_sensitive", Integer, default=0),
+    Column("reblog_of", String(255)),
+    UniqueConstraint("platform", "object_id", name="unique_platform_object"),
+    # InnoDB appends the primary key to secondary indexes, so these also
+    # serve (created_at, id) and (updated_at, id) keyset scans
+    Index("ix_posts_platform_created_at", "platform", "created_at"),
+    Index("ix_posts_subreddit_created_at", "subreddit", "created_at"),
+    Index("ix_posts_instance_created_at", "instance", "created_at"),
+    Index("ix_posts_created_at", "created_at"),
+    Index("ix_posts_updated_at", "updated_at"),
+    mysql_engine="InnoDB",
+    mysql_charset="utf8mb4",
+)
+
+post_counts_table = Table(
+    "post_counts",
+    metadata,
+    Column("platform", String(50), primary_key=True),
+    Column("day", Date, primary_key=True),
+    Column("count", BigInteger, nullable=False, default=0),
+    mysql_engine="InnoDB",
+    mysql_charset="utf8mb4",
+)
+
+export_watermarks_table = Table(
+    "export_watermarks",
+    metadata,
+    Column("destination", String(700), primary_key=True),
+    Column("last_rowid", BigInteger, nullable=False),
+    Column("last_updated_at", Timestamp, nullable=False),
+    Column("exported_at", Timestamp, nullable=False),
+    mysql_engine="InnoDB",
+    mysql_charset="utf8mb4",
+)
+
+# Columns sent with every upserted row, in VALUES order
+INSERT_COLUMNS = [
+    column.name for column in posts_table.columns if column.name not in ("id", "updated_at")
+]
+
+# Columns rewritten when a post's text changes; engagement-only changes
+# rewrite just the metrics
+EDIT_COLUMNS = ("text", "raw_data")
+
+
+def post_columns(include_raw: bool) -> List[Column]:
+    """``posts`` columns to read; the raw payload, often most of the row, only on request."""
+    return [column for column in posts_table.columns if include_raw or column.name != "raw_data"]
+
+# Row-level triggers keeping post_counts current. On a duplicate key the
+# AFTER INSERT trigger does not fire, so upserts only count new posts.
+POST_COUNT_TRIGGERS = {
+    "posts_count_insert": """
+        CREATE TRIGGER posts_count_insert AFTER INSERT ON posts FOR EACH ROW
+        INSERT INTO post_counts (platform, day, `count`) VALUES (NEW.platform, DATE(NEW.created_at), 1)
+        ON DUPLICATE KEY UPDATE `count` = `count` + 1
+    """,
+    "posts_count_delete": """
+        CREATE TRIGGER posts_count_delete AFTER DELETE ON posts FOR EACH ROW
+        UPDATE post_counts SET `count` = `count` - 1
+        WHERE platform = OLD.platform AND day = DATE(OLD.created_at)
+    """,
+}
+
+# MySQL error codes for a deadlock and a lock wait timeout
+RETRYABLE_ERRORS = (1213, 1205)
+
+# Transactions retried after a deadlock before the error is raised
+MAX_WRITE_ATTEMPTS = 3
+
+# Words of context around the first match in search snippets
+SNIPPET_WORDS = 16
+
+
+def _utc_naive(value: datetime) -> datetime:
+    """Convert a timezone-aware datetime to naive UTC; naive values pass through."""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _quote(name: str) -> str:
+    """Quote a column name for raw SQL."""
+    return f"`{name}`"
+
+
+def make_snippet(text_value: str, query: str, words: int = SNIPPET_WORDS) -> str:
+    """Excerpt of ``text_value`` around the first query term, matches in brackets.
+    
+    MySQL has no snippet function, so this mirrors SQLite's ``snippet()``
+    output for the returned page only.
+    
+    Args:
+        text_value: Post text
+        query: Boolean-mode search query
+        words: Number of words in the excerpt
+        
+    Returns:
+        Excerpt with ``...`` marking trimmed text
+    """
+    # Excluded (-term) words are not highlighted
+    terms = [term.lower().rstrip("*") for term in re.findall(r"(?<![-\w])[\w*]+", query)]
+    terms = [term for term in terms if term]
+    tokens = text_value.split()
+    
+    def matches(token: str) -> bool:
+        word = re.sub(r"\W", "", token).lower()
+        return any(word.startswith(term) for term in terms)
+    
+    first = next((i for i, token in enumerate(tokens) if matches(token)), 0)
+    start = max(0, min(first - words // 2, len(tokens) - words))
+    excerpt = [f"[{token}]" if matches(token) else token for token in tokens[start:start + words]]
+    
+    snippet = " ".join(excerpt)
+    if start > 0:
+        snippet = "..." + snippet
+    if start + words < len(tokens):
+        snippet += "..."
+    return snippet
+
+
+class MySQLManager(DatabaseManager):
+    """MySQL/MariaDB database manager with multi-row batched upserts.
+    
+    Connections come from a SQLAlchemy pool shared by all threads. Writes
+    from different processes are safe: each batch locks the rows it reads
+    back, and a transaction that loses a deadlock is retried.
+    """
+    
+    def __init__(
+        self,
+        connection_string: str,
+        separate_databases: bool = False,
+        config: Optional[MySQLConfig] = None,
+        search: Optional[SearchConfig] = None
+    ):
+        """Initialize MySQL manager.
+        
+        Args:
+            connection_string: SQLAlchemy URL (``mysql+pymysql://...``)
+            separate_databases: Not supported; all platforms share one database
+            config: Pool and statement size settings
+            search: Full-text search settings; the index is off by default
+        """
+        self.config = config or MySQLConfig()
+        self.search_config = search or SearchConfig()
+        self._upsert_statements: Dict[int, str] = {}
+        super().__init__(connection_string, separate_databases)
+    
+    def _setup_connection(self) -> None:
+        """Create the pooled engine."""
+        try:
+            import pymysql  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                "PyMySQL is required for MySQL/MariaDB support. "
+                "Install it with: pip install pymysql or pip install socflow[mysql]"
+            )
+        if self.separate_databases:
+            raise ValueError("separate_databases is not supported for MySQL")
+        
+        self.engine = create_engine(
+            self.connection_string,
+            echo=False,
+            pool_pre_ping=True,
+            pool_size=self.config.pool_size,
+            max_overflow=self.config.max_overflow,
+            pool_recycle=self.config.pool_recycle,
+            # Fewer gap locks between concurrent upserts than REPEATABLE READ
+            isolation_level="READ COMMITTED",
+            connect_args={"charset": "utf8mb4", "init_command": "SET time_zone = '+00:00'"},
+        )
+        self.session_factory = sessionmaker(bind=self.engine, expire_on_commit=False)
+    
+    def create_tables(self, platforms: List[str]) -> None:
+        """Create the posts table and supporting tables."""
+        with self.engine.begin() as conn:
+            metadata.create_all(conn)
+            # create_all skips existing tables; add indexes introduced since
+            for index in posts_table.indexes:
+                index.create(conn, checkfirst=True)
+            
+            installed = set(conn.execute(text(
+                "SELECT trigger_name FROM information_schema.triggers "
+                "WHERE trigger_schema = DATABASE() AND event_object_table = 'posts'"
+            )).scalars())
+            if not installed >= set(POST_COUNT_TRIGGERS):
+                for name, ddl in POST_COUNT_TRIGGERS.items():
+                    conn.exec_driver_sql(f"DROP TRIGGER IF EXISTS {name}")
+                    conn.exec_driver_sql(ddl)
+                # Trigger DDL commits implicitly; rebuild the counters afterwards
+                conn.execute(text("DELETE FROM post_counts"))
+                conn.execute(text(
+                    "INSERT INTO post_counts (platform, day, `count`) "
+                    "SELECT platform, DATE(created_at), count(*) FROM posts GROUP BY platform, DATE(created_at)"
+                ))
+            
+            if self.search_config.enabled and not self._has_search_index(conn):
+                conn.execute(text("ALTER TABLE posts ADD FULLTEXT INDEX ix_posts_search (`text`, title)"))
+    
+    @staticmethod
+    def _has_search_index(conn) -> bool:
+        """Whether the FULLTEXT index on posts exists."""
+        return bool(conn.execute(text(
+            "SELECT count(*) FROM information_schema.statistics "
+            "WHERE table_schema = DATABASE() AND table_name = 'posts' AND index_name = 'ix_posts_search'"
+        )).scalar_one())
+    
+    def insert_post(self, post: "BasePost") -> None:
+        """Insert a single post."""
+        self.insert_posts([post])
+    
+    def insert_posts(self, posts: List["BasePost"]) -> Dict[str, int]:
+        """Insert multiple posts with deduplication and update handling.
+        
+        The stored hashes of the batch's posts are read back with a locking
+        read, then every new or changed post is written with multi-row
+        ``INSERT ... ON DUPLICATE KEY UPDATE`` statements: new posts are
+        inserted, edited posts get their text rewritten, posts whose only
+        change is engagement get their metrics refreshed, and unchanged
+        posts are not sent at all.
+        
+        Returns:
+            Dictionary with ``inserted``, ``updated``, ``metrics_updated`` and ``skipped`` counts
+        """
+        if not posts:
+            return empty_insert_counts()
+        return self.insert_post_batches([posts])[0]
+    
+    def insert_post_batches(self, batches: List[List["BasePost"]]) -> List[Dict[str, int]]:
+        """Insert several batches in a single transaction (group commit).
+        
+        The transaction is retried from the start if it loses a deadlock to
+        another writer.
+        """
+        row_batches = [[post_to_row(post) for post in posts] for posts in batches]
+        for attempt in range(1, MAX_WRITE_ATTEMPTS + 1):
+            try:
+                with self.engine.begin() as conn:
+                    return [
+                        self._write_rows(conn, rows) if rows else empty_insert_counts()
+                        for rows in row_batches
+                    ]
+            except OperationalError as e:
+                code = e.orig.args[0] if e.orig is not None and e.orig.args else None
+                if code not in RETRYABLE_ERRORS or attempt == MAX_WRITE_ATTEMPTS:
+                    raise
+                time.sleep(0.05 * attempt)
+    
+    def _write_rows(self, conn, rows: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Upsert a batch of rows on an open connection (caller commits)."""
+        # Later occurrences of a post in the batch win; key order keeps
+        # concurrent writers locking rows in the same sequence
+        batch = {}
+        for row in rows:
+            row["created_at"] = _utc_naive(row["created_at"])
+            batch[(row["platform"], row["object_id"])] = row
+        keys = sorted(batch)
+        
+        cursor = conn.connection.dbapi_connection.cursor()
+        try:
+            stored = self._lock_existing(cursor, keys)
+            
+            # Counts come from the locked rows, not cursor.rowcount. With
+            # CLIENT_FOUND_ROWS off, ON DUPLICATE KEY UPDATE reports 1 per
+            # inserted row, 2 per updated row and 0 per duplicate left
+            # unchanged; SQLAlchemy's MySQL drivers turn the flag on, which
+            # reports an unchanged duplicate as 1, the same as an insert. A
+            # multi-row statement only returns the sum, and edits cannot be
+            # told apart from metrics refreshes either way.
+            changed = []
+            inserted = updated = metrics_updated = 0
+            for key in keys:
+                row = batch[key]
+                if key not in stored:
+                    inserted += 1
+                elif stored[key][0] != row["text_hash"]:
+                    updated += 1
+                elif stored[key][1] != row["metrics_hash"]:
+                    metrics_updated += 1
+                else:
+                    continue
+                changed.append(row)
+            
+            chunk_size = self.config.rows_per_statement
+            for start in range(0, len(changed), chunk_size):
+                chunk = changed[start:start + chunk_size]
+                cursor.execute(
+                    self._upsert_statement(conn, len(chunk)),
+                    [row[name] for row in chunk for name in INSERT_COLUMNS],
+                )
+        finally:
+            cursor.close()
+        
+        return {
+            "inserted": inserted,
+            "updated": updated,
+            "metrics_updated": metrics_updated,
+            "skipped": len(rows) - inserted - updated - metrics_updated,
+        }
+    
+    def _lock_existing(self, cursor, keys: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Tuple[str, str]]:
+        """Lock the stored rows for ``keys`` and return their ``(text_hash, metrics_hash)``."""
+        stored = {}
+        chunk_size = self.config.rows_per_statement
+        for start in range(0, len(keys), chunk_size):
+            chunk = keys[start:start + chunk_size]
+            cursor.execute(
+                "SELECT platform, object_id, text_hash, metrics_hash FROM posts "
+                f"WHERE (platform, object_id) IN ({', '.join(['(%s, %s)'] * len(chunk))}) FOR UPDATE",
+                [value for key in chunk for value in key],
+            )
+            for platform, object_id, text_hash, metrics_hash in cursor.fetchall():
+                stored[(platform, object_id)] = (text_hash, metrics_hash)
+        return stored
+    
+    def _upsert_statement(self, conn, row_count: int) -> str:
+        """Multi-row ``INSERT ... ON DUPLICATE KEY UPDATE`` for ``row_count`` rows.
+        
+        MySQL 8.0.20+ deprecates ``VALUES(col)`` in the update clause in favour
+        of a row alias, which MariaDB does not support, so the form is picked
+        from the connected server.
+        """
+        statement = self._upsert_statements.get(row_count)
+        if statement is not None:
+            return statement
+        
+        dialect = conn.dialect
+        if not dialect.is_mariadb and dialect.server_version_info >= (8, 0, 20):
+            alias, reference = " AS new", "new.{}"
+        else:
+            alias, reference = "", "VALUES({})"
+        
+        def new(name: str) -> str:
+            return reference.format(_quote(name))
+        
+        text_same = f"text_hash <=> {new('text_hash')}"
+        # Assignments are applied left to right and later ones see the new
+        # values, so the hashes are compared before they are overwritten
+        assignments = [
+            f"updated_at = IF({text_same} AND metrics_hash <=> {new('metrics_hash')}, "
+            f"updated_at, {new('updated_at')})",
+        ]
+        assignments += [
+            f"{_quote(name)} = IF({text_same}, {_quote(name)}, {new(name)})" for name in EDIT_COLUMNS
+        ]
+        assignments += [
+            # Only posts with a title (Reddit) overwrite it
+            f"title = IF({text_same}, title, coalesce({new('title')}, title))",
+            f"metrics = {new('metrics')}",
+            f"metrics_hash = {new('metrics_hash')}",
+            f"text_hash = {new('text_hash')}",
+        ]
+        
+        # updated_at is the statement time; see iter_changed_posts
+        placeholders = f"({', '.join(['%s'] * len(INSERT_COLUMNS))}, NOW(6))"
+        statement = (
+            f"INSERT INTO posts ({', '.join(_quote(name) for name in INSERT_COLUMNS)}, updated_at) "
+            f"VALUES {', '.join([placeholders] * row_count)}{alias} "
+            f"ON DUPLICATE KEY UPDATE {', '.join(assignments)}"
+        )
+        self._upsert_statements[row_count] = statement
+        return statement
+    
+    def get_posts(
+        self,
+        platform: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        include_raw: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Get posts from database, streamed from a server-side cursor."""
+        query = select(*post_columns(include_raw)).order_by(posts_table.c.created_at, posts_table.c.id)
+        if platform:
+            query = query.where(posts_table.c.platform == platform)
+        if offset:
+            query = query.offset(offset)
+        if limit:
+            query = query.limit(limit)
+        return list(self._iter_stream(query, 1000))
+    
+    def get_latest_posts(
+        self,
+        platform: Optional[str] = None,
+        subreddit: Optional[str] = None,
+        instance: Optional[str] = None,
+        limit: int = 50,
+        include_raw: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Get the newest posts, optionally of one platform, subreddit or instance."""
+        query = (
+            select(*post_columns(include_raw))
+            .order_by(posts_table.c.created_at.desc(), posts_table.c.id.desc())
+            .limit(limit)
+        )
+        if platform:
+            query = query.where(posts_table.c.platform == platform)
+        if subreddit:
+            query = query.where(posts_table.c.subreddit == subreddit)
+        if instance:
+            query = query.where(posts_table.c.instance == instance)
+        
+        with self.engine.connect() as conn:
+            return [post_row_to_dict(row) for row in conn.execute(query)]
+    
+    def iter_posts(
+        self,
+        platform: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        batch_size: int = 1000,
+        include_raw: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream posts in ``(created_at, id)`` order from a server-side cursor."""
+        query = select(*post_columns(include_raw)).order_by(posts_table.c.created_at, posts_table.c.id)
+        if platform:
+            query = query.where(posts_table.c.platform == platform)
+        if since:
+            query = query.where(posts_table.c.created_at >= _utc_naive(since))
+        if until:
+            query = query.where(posts_table.c.created_at < _utc_naive(until))
+        yield from self._iter_stream(query, batch_size)
+    
+    def iter_changed_posts(
+        self,
+        after: Optional[Tuple[datetime, int]] = None,
+        platform: Optional[str] = None,
+        batch_size: int = 1000,
+        include_raw: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream posts inserted or changed after a watermark, in ``(updated_at, id)`` order.
+        
+        Writes stamp ``updated_at`` with their statement time, which is never
+        earlier than their transaction's start, so no transaction still in
+        progress can commit a row older than the oldest running transaction.
+        Capping the scan there means a watermark taken from the last yielded
+        row never skips a row on the next run.
+        """
+        with self.engine.connect() as conn:
+            horizon = conn.execute(text(
+                "SELECT LEAST(NOW(6), coalesce(min(trx_started), NOW(6))) "
+                "FROM information_schema.innodb_trx WHERE trx_mysql_thread_id <> CONNECTION_ID()"
+            )).scalar_one()
+        
+        query = (
+            select(*post_columns(include_raw))
+            .where(posts_table.c.updated_at < horizon)
+            .order_by(posts_table.c.updated_at, posts_table.c.id)
+        )
+        if platform:
+            query = query.where(posts_table.c.platform == platform)
+        if after is not None:
+            query = query.where(tuple_(posts_table.c.updated_at, posts_table.c.id) > tuple_(*after))
+        yield from self._iter_stream(query, batch_size)
+    
+    def _iter_stream(self, query, batch_size: int) -> Iterator[Dict[str, Any]]:
+        """Run ``query`` on an unbuffered server-side cursor and yield post dictionaries.
+        
+        The connection stays checked out until the iterator is exhausted or
+        closed, so consumers should not hold it open indefinitely.
+        """
+        with self.engine.connect() as conn:
+            result = conn.execution_options(stream_results=True, yield_per=batch_size).execute(query)
+            for row in result:
+                yield post_row_to_dict(row)
+    
+    def get_export_watermark(self, destination: str) -> Optional[Tuple[datetime, int]]:
+        """Get the ``(updated_at, id)`` of the last post exported to a destination."""
+        table = export_watermarks_table
+        with self.engine.connect() as conn:
+            row = conn.execute(
+                select(table.c.last_updated_at, table.c.last_rowid)
+                .where(table.c.destination == destination)
+            ).first()
+        return (row.last_updated_at, row.last_rowid) if row else None
+    
+    def set_export_watermark(self, destination: str, last_updated_at: datetime, last_rowid: int) -> None:
+        """Record the last post exported to a destination."""
+        table = export_watermarks_table
+        stmt = mysql_insert(table).values(
+            destination=destination,
+            last_rowid=last_rowid,
+            last_updated_at=last_updated_at,
+            exported_at=func.now(6),
+        )
+        stmt = stmt.on_duplicate_key_update(
+            last_rowid=stmt.inserted.last_rowid,
+            last_updated_at=stmt.inserted.last_updated_at,
+            exported_at=stmt.inserted.exported_at,
+        )
+        with self.engine.begin() as conn:
+            conn.execute(stmt)
+    
+    def search(
+        self,
+        query: str,
+        platform: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: int = 50,
+        offset: int = 0,
+        include_raw: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Full-text search over post text and titles, best matches first.
+        
+        ``query`` uses boolean mode syntax (``"exact phrase"``, ``+required``,
+        ``-excluded``, ``prefix*``). The ``score`` is the negated ``MATCH``
+        relevance so that, as with SQLite's bm25, lower is better.
+        
+        Raises:
+            RuntimeError: If the full-text index has not been created
+        """
+        with self.engine.connect() as conn:
+            if not self._has_search_index(conn):
+                raise RuntimeError(
+                    "Full-text search is not enabled. Set database.search.enabled "
+                    "and run setup (e.g. make setup-db) to build the index."
+                )
+            
+            match = "MATCH(`text`, title) AGAINST (:query IN BOOLEAN MODE)"
+            conditions = [match]
+            params: Dict[str, Any] = {"query": query, "limit": limit, "offset": offset}
+            if platform:
+                conditions.append("platform = :platform")
+                params["platform"] = platform
+            if since:
+                conditions.append("created_at >= :since")
+                params["since"] = _utc_naive(since)
+            if until:
+                conditions.append("created_at < :until")
+                params["until"] = _utc_naive(until)
+            
+            columns = ", ".join(f"posts.`{column.name}`" for column in post_columns(include_raw))
+            rows = conn.execute(text(
+                f"SELECT {columns}, -{match} AS score FROM posts "
+                f"WHERE {' AND '.join(conditions)} "
+                "ORDER BY score LIMIT :limit OFFSET :offset"
+            ), params).all()
+        
+        results = []
+        for row in rows:
+            post = post_row_to_dict(row)
+            post["score"] = row.score
+            post["snippet"] = make_snippet(row.text, query)
+            results.append(post)
+        return results
+    
+    def get_post_count(self, platform: Optional[str] = None) -> int:
+        """Get total number of posts from the counters table."""
+        table = post_counts_table
+        query = select(func.coalesce(func.sum(table.c.count), 0))
+        if platform:
+            query = query.where(table.c.platform == platform)
+        with self.engine.connect() as conn:
+            return int(conn.execute(query).scalar_one())
+    
+    def get_post_counts(self) -> Dict[str, int]:
+        """Get the number of posts for every platform in one query."""
+        table = post_counts_table
+        with self.engine.connect() as conn:
+            rows = conn.execute(
+                select(table.c.platform, func.sum(table.c.count)).group_by(table.c.platform)
+            ).all()
+        return {platform: int(count) for platform, count in rows}
+    
+    def get_daily_post_counts(
+        self,
+        platform: Optional[str] = None,
+        since: Optional[date] = None
+    ) -> List[Tuple[str, str, int]]:
+        """Get post counts per platform and day."""
+        table = post_counts_table
+        query = (
+            select(table.c.platform, table.c.day, table.c.count)
+            .where(table.c.count > 0)
+            .order_by(table.c.day, table.c.platform)
+        )
+        if platform:
+            query = query.where(table.c.platform == platform)
+        if since:
+            query = query.where(table.c.day >= since)
+        with self.engine.connect() as conn:
+            return [(platform, day.isoformat(), count) for platform, day, count in conn.execute(query)]
+    
+    def iter_post_keys(self, batch_size: int = 10000) -> Iterator[Tuple[str, str]]:
+        """Iterate over the key of every stored post, paging by id."""
+        last_id = 0
+        while True:
+            with self.engine.connect() as conn:
+                rows = conn.execute(
+                    select(posts_table.c.id, posts_table.c.platform, posts_table.c.object_id)
+                    .where(posts_table.c.id > last_id)
+                    .order_by(posts_table.c.id)
+                    .limit(batch_size)
+                ).all()
+            if not rows:
+                return
+            for _, platform, object_id in rows:
+                yield platform, object_id
+            last_id = rows[-1][0]
+    
+    def get_recent_post_hashes(self, limit: int) -> List[Tuple[str, str, str, str]]:
+        """Get the most recently stored posts' keys and content hashes, newest first."""
+        table = posts_table
+        with self.engine.connect() as conn:
+            rows = conn.execute(
+                select(table.c.platform, table.c.object_id, table.c.text_hash, table.c.metrics_hash)
+                .order_by(table.c.id.desc())
+                .limit(limit)
+            ).all()
+        return [tuple(row) for row in rows]
+    
+    def close(self) -> None:
+        """Close database connection."""
+        if self.engine:
+            self.engine.dispose()
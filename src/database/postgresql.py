@@ -0,0 +1,752 @@
+"""PostgreSQL database manager implementation.
+
+Several collector processes can write to one PostgreSQL database at once.
+Batches are streamed into a per-session staging table with ``COPY`` and then
+merged into ``posts`` with a single ``INSERT ... ON CONFLICT`` statement, so a
+batch costs a handful of round trips regardless of its size.
+
+``posts`` is range-partitioned on ``created_at``. PostgreSQL requires unique
+constraints on a partitioned table to include the partition key, so the
+constraint on ``posts`` is ``(platform, object_id, created_at)``. A platform
+can report a different creation time for a post it already sent (Reddit
+edits, clock fixes), so that constraint alone would store it twice. The
+non-partitioned ``post_keys`` table holds the creation time each
+``(platform, object_id)`` was first stored with; the merge claims new keys
+there first and rewrites the batch's creation times to the stored ones.
+"""
+
+import re
+import threading
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Date,
+    DateTime,
+    Identity,
+    Index,
+    Integer,
+    MetaData,
+    PrimaryKeyConstraint,
+    String,
+    Table,
+    Text,
+    UniqueConstraint,
+    create_engine,
+    func,
+    select,
+    text,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import sessionmaker
+
+from ..config.settings import PostgreSQLConfig, SearchConfig
+from ..utils.hashing import HASH_SIZE
+from .base import DatabaseManager, empty_insert_counts, post_row_to_dict, post_to_row
+
+metadata = MetaData()
+
+posts_table = Table(
+    "posts",
+    metadata,
+    Column("id", BigInteger, Identity(), nullable=False),
+    Column("platform", String(50), nullable=False),
+    Column("object_id", String(255), nullable=False),
+    Column("author_handle", String(255), nullable=False),
+    Column("text", Text, nullable=False),
+    Column("created_at", DateTime, nullable=False),
+    Column("url", String(500)),
+    Column("parent_id", String(255)),
+    Column("is_comment", Integer, default=0),
+    Column("raw_data", Text),
+    Column("metrics", Text),
+    Column("text_hash", String(HASH_SIZE * 2)),
+    Column("metrics_hash", String(HASH_SIZE * 2)),
+    Column("updated_at", DateTime),
+    Column("subreddit", String(255)),
+    Column("title", Text),
+    Column("is_nsfw", Integer, default=0),
+    Column("handle", String(255)),
+    Column("display_name", String(255)),
+    Column("avatar_url", String(500)),
+    Column("is_reply", Integer, default=0),
+    Column("is_repost", Integer, default=0),
+    Column("reply_to", String(255)),
+    Column("repost_of", String(255)),
+    Column("tags", Text),
+    Column("instance", String(255)),
+    Column("is_reblog", Integer, default=0),
+    Column("is_sensitive", Integer, default=0),
+    Column("reblog_of", String(255)),
+    PrimaryKeyConstraint("id", "created_at"),
+    UniqueConstraint("platform", "object_id", "created_at", name="unique_platform_object"),
+    Index("ix_posts_platform_created_at", "platform", "created_at"),
+    # Partial: each community column is NULL for the other platforms
+    Index("ix_posts_subreddit_created_at", "subreddit", "created_at", postgresql_where=text("subreddit IS NOT NULL")),
+    Index("ix_posts_instance_created_at", "instance", "created_at", postgresql_where=text("instance IS NOT NULL")),
+    Index("ix_posts_updated_at", "updated_at", "id"),
+    postgresql_partition_by="RANGE (created_at)",
+)
+
+post_counts_table = Table(
+    "post_counts",
+    metadata,
+    Column("platform", String(50), primary_key=True),
+    Column("day", Date, primary_key=True),
+    Column("count", BigInteger, nullable=False, default=0),
+)
+
+# Enforces (platform, object_id) uniqueness, which the partitioned table cannot
+post_keys_table = Table(
+    "post_keys",
+    metadata,
+    Column("platform", String(50), primary_key=True),
+    Column("object_id", String(255), primary_key=True),
+    Column("created_at", DateTime, nullable=False),
+)
+
+export_watermarks_table = Table(
+    "export_watermarks",
+    metadata,
+    Column("destination", String(1000), primary_key=True),
+    Column("last_rowid", BigInteger, nullable=False),
+    Column("last_updated_at", DateTime, nullable=False),
+    Column("exported_at", DateTime, nullable=False),
+)
+
+# Columns copied into the staging table, in COPY order
+STAGING_COLUMNS = [
+    column.name for column in posts_table.columns if column.name not in ("id", "updated_at")
+]
+
+# Columns rewritten when a post's text changes; engagement-only changes
+# rewrite just the metrics
+EDIT_COLUMNS = ("text", "raw_data")
+
+
+def post_columns(include_raw: bool) -> List[Column]:
+    """``posts`` columns to read; the raw payload, often most of the row, only on request."""
+    return [column for column in posts_table.columns if include_raw or column.name != "raw_data"]
+
+# Statement-level triggers keeping post_counts (and post_keys, on delete)
+# current from the rows each statement inserted or deleted (transition tables only hold rows that were
+# actually inserted, not those an upsert updated)
+POST_COUNT_TRIGGERS = {
+    "posts_count_insert": """
+        CREATE OR REPLACE FUNCTION posts_count_insert() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            INSERT INTO post_counts (platform, day, count)
+            SELECT platform, created_at::date, count(*) FROM new_rows GROUP BY 1, 2
+            ON CONFLICT (platform, day) DO UPDATE SET count = post_counts.count + EXCLUDED.count;
+            RETURN NULL;
+        END
+        $$;
+        CREATE TRIGGER posts_count_insert AFTER INSERT ON posts
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION posts_count_insert();
+    """,
+    "posts_count_delete": """
+        CREATE OR REPLACE FUNCTION posts_count_delete() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            UPDATE post_counts c SET count = c.count - d.count
+            FROM (SELECT platform, created_at::date AS day, count(*) AS count FROM old_rows GROUP BY 1, 2) d
+            WHERE c.platform = d.platform AND c.day = d.day;
+            DELETE FROM post_keys k USING old_rows o
+            WHERE k.platform = o.platform AND k.object_id = o.object_id AND k.created_at = o.created_at;
+            RETURN NULL;
+        END
+        $$;
+        CREATE TRIGGER posts_count_delete AFTER DELETE ON posts
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION posts_count_delete();
+    """,
+}
+
+# Text search document, shared by the GIN index and the search query
+SEARCH_DOCUMENT = "to_tsvector('simple', text || ' ' || coalesce(title, ''))"
+
+
+def _utc_naive(value: datetime) -> datetime:
+    """Convert a timezone-aware datetime to naive UTC; naive values pass through."""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def partition_bounds(day: date, interval: str) -> Tuple[date, date]:
+    """First day of the partition containing ``day`` and the first day after it.
+    
+    Args:
+        day: Any day inside the partition
+        interval: Partition width: day, week, month or year
+        
+    Returns:
+        ``(start, end)`` with ``end`` exclusive
+    """
+    if interval == "day":
+        return day, day + timedelta(days=1)
+    if interval == "week":
+        start = day - timedelta(days=day.weekday())
+        return start, start + timedelta(days=7)
+    if interval == "month":
+        start = day.replace(day=1)
+        if start.month == 12:
+            return start, start.replace(year=start.year + 1, month=1)
+        return start, start.replace(month=start.month + 1)
+    start = day.replace(month=1, day=1)
+    return start, start.replace(year=start.year + 1)
+
+
+# FROM/TO clause of a range partition, as printed by pg_get_expr
+_PARTITION_BOUND = re.compile(r"FROM \((.+?)\) TO \((.+?)\)")
+
+
+def _parse_bound(value: str) -> datetime:
+    """Parse one side of a partition bound; MINVALUE/MAXVALUE become the extremes."""
+    if value == "MINVALUE":
+        return datetime.min
+    if value == "MAXVALUE":
+        return datetime.max
+    return datetime.fromisoformat(value.strip("'"))
+
+
+def uncovered_ranges(
+    start: datetime,
+    end: datetime,
+    existing: List[Tuple[datetime, datetime]]
+) -> List[Tuple[datetime, datetime]]:
+    """Parts of ``[start, end)`` not covered by any existing partition.
+    
+    Partitions made with another ``partition_interval`` may cover a range
+    wholly, partly or not at all; only the gaps between them can be created
+    without overlapping.
+    
+    Args:
+        start: Start of the wanted range
+        end: Exclusive end of the wanted range
+        existing: ``(start, end)`` bounds of the existing partitions
+        
+    Returns:
+        Uncovered ``(start, end)`` ranges, in order
+    """
+    gaps = []
+    cursor = start
+    for low, high in sorted(existing):
+        if high <= cursor or low >= end:
+            continue
+        if low > cursor:
+            gaps.append((cursor, low))
+        cursor = max(cursor, high)
+        if cursor >= end:
+            break
+    if cursor < end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+class PostgreSQLManager(DatabaseManager):
+    """PostgreSQL database manager with COPY-based bulk ingestion.
+    
+    Connections come from a SQLAlchemy pool shared by all threads. Writes
+    from different processes are safe: conflicts are resolved by the merge
+    statement, not by an in-process lock.
+    """
+    
+    def __init__(
+        self,
+        connection_string: str,
+        separate_databases: bool = False,
+        config: Optional[PostgreSQLConfig] = None,
+        search: Optional[SearchConfig] = None
+    ):
+        """Initialize PostgreSQL manager.
+        
+        Args:
+            connection_string: SQLAlchemy URL (``postgresql+psycopg://...``)
+            separate_databases: Not supported; all platforms share one database
+            config: Pool and partitioning settings
+            search: Full-text search settings; the index is off by default
+        """
+        self.config = config or PostgreSQLConfig()
+        self.search_config = search or SearchConfig()
+        self._known_partitions: set = set()
+        self._partition_lock = threading.Lock()
+        super().__init__(connection_string, separate_databases)
+    
+    def _setup_connection(self) -> None:
+        """Create the pooled engine."""
+        try:
+            import psycopg  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                "psycopg is required for PostgreSQL support. "
+                "Install it with: pip install 'psycopg[binary]' or pip install socflow[postgresql]"
+            )
+        if self.separate_databases:
+            raise ValueError("separate_databases is not supported for PostgreSQL")
+        
+        self.engine = create_engine(
+            self.connection_string,
+            echo=False,
+            pool_pre_ping=True,
+            pool_size=self.config.pool_size,
+            max_overflow=self.config.max_overflow,
+            connect_args={"options": "-c timezone=UTC"},
+        )
+        self.session_factory = sessionmaker(bind=self.engine, expire_on_commit=False)
+    
+    def create_tables(self, platforms: List[str]) -> None:
+        """Create the partitioned posts table and supporting tables."""
+        with self.engine.begin() as conn:
+            has_keys = conn.execute(text("SELECT to_regclass('post_keys') IS NOT NULL")).scalar_one()
+            metadata.create_all(conn)
+            if not has_keys:
+                # Databases created before post_keys; keep the first creation time of each post
+                conn.execute(text("LOCK TABLE posts IN SHARE ROW EXCLUSIVE MODE"))
+                conn.execute(text(
+                    "INSERT INTO post_keys (platform, object_id, created_at) "
+                    "SELECT DISTINCT ON (platform, object_id) platform, object_id, created_at FROM posts "
+                    "ORDER BY platform, object_id, created_at, id"
+                ))
+            # create_all skips existing tables; add indexes introduced since
+            for index in posts_table.indexes:
+                index.create(conn, checkfirst=True)
+            
+            installed = set(conn.execute(text(
+                "SELECT tgname FROM pg_trigger WHERE tgrelid = 'posts'::regclass AND NOT tgisinternal"
+            )).scalars())
+            # Triggers installed before post_keys existed do not clean it up
+            if not has_keys or not installed >= set(POST_COUNT_TRIGGERS):
+                # Rebuild the counters in the same transaction the triggers start in
+                conn.execute(text("LOCK TABLE posts IN SHARE ROW EXCLUSIVE MODE"))
+                for name, ddl in POST_COUNT_TRIGGERS.items():
+                    conn.execute(text(f"DROP TRIGGER IF EXISTS {name} ON posts"))
+                    conn.exec_driver_sql(ddl)
+                conn.execute(text("DELETE FROM post_counts"))
+                conn.execute(text(
+                    "INSERT INTO post_counts (platform, day, count) "
+                    "SELECT platform, created_at::date, count(*) FROM posts GROUP BY 1, 2"
+                ))
+            
+            if self.search_config.enabled:
+                conn.execute(text(
+                    f"CREATE INDEX IF NOT EXISTS ix_posts_search ON posts USING GIN ({SEARCH_DOCUMENT})"
+                ))
+    
+    def _ensure_partitions(self, created_at_values: List[datetime]) -> None:
+        """Create any missing range partitions for the given creation times.
+        
+        Runs in its own short transaction, serialized across processes by an
+        advisory lock, because attaching a partition locks the parent table.
+        The bounds of the existing partitions are read first, so partitions
+        made with an earlier ``partition_interval`` are reused and new ones
+        only fill the gaps between them.
+        """
+        interval = self.config.partition_interval
+        needed = {partition_bounds(value.date(), interval) for value in created_at_values}
+        missing = needed - self._known_partitions
+        if not missing:
+            return
+        
+        with self._partition_lock:
+            with self.engine.begin() as conn:
+                conn.execute(text("SELECT pg_advisory_xact_lock(hashtext('socflow_posts_partitions'))"))
+                existing = []
+                for (bound,) in conn.execute(text(
+                    "SELECT pg_get_expr(c.relpartbound, c.oid) FROM pg_inherits i "
+                    "JOIN pg_class c ON c.oid = i.inhrelid WHERE i.inhparent = 'posts'::regclass"
+                )):
+                    match = _PARTITION_BOUND.search(bound)
+                    if match:
+                        existing.append((_parse_bound(match.group(1)), _parse_bound(match.group(2))))
+                
+                for start, end in sorted(missing):
+                    for low, high in uncovered_ranges(
+                        datetime.combine(start, datetime.min.time()),
+                        datetime.combine(end, datetime.min.time()),
+                        existing
+                    ):
+                        conn.execute(text(
+                            f"CREATE TABLE posts_p{low:%Y%m%d}_{high:%Y%m%d} PARTITION OF posts "
+                            f"FOR VALUES FROM ('{low.isoformat(' ')}') TO ('{high.isoformat(' ')}')"
+                        ))
+                        existing.append((low, high))
+            self._known_partitions |= missing
+    
+    def insert_post(self, post: "BasePost") -> None:
+        """Insert a single post."""
+        self.insert_posts([post])
+    
+    def insert_posts(self, posts: List["BasePost"]) -> Dict[str, int]:
+        """Insert multiple posts with deduplication and update handling.
+        
+        The batch is copied into a staging table and merged with one
+        ``INSERT ... ON CONFLICT DO UPDATE``: new posts are inserted, edited
+        posts get their text rewritten, posts whose only change is engagement
+        get their metrics refreshed, and unchanged posts are not touched.
+        
+        Returns:
+            Dictionary with ``inserted``, ``updated``, ``metrics_updated`` and ``skipped`` counts
+        """
+        if not posts:
+            return empty_insert_counts()
+        
+        rows = [post_to_row(post) for post in posts]
+        self._ensure_partitions([_utc_naive(row["created_at"]) for row in rows])
+        with self.engine.begin() as conn:
+            return self._write_rows(conn, rows)
+    
+    def insert_post_batches(self, batches: List[List["BasePost"]]) -> List[Dict[str, int]]:
+        """Insert several batches in a single transaction (group commit)."""
+        row_batches = [[post_to_row(post) for post in posts] for posts in batches]
+        self._ensure_partitions([
+            _utc_naive(row["created_at"]) for rows in row_batches for row in rows
+        ])
+        results = []
+        with self.engine.begin() as conn:
+            for rows in row_batches:
+                results.append(self._write_rows(conn, rows) if rows else empty_insert_counts())
+        return results
+    
+    def _write_rows(self, conn, rows: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Stage and merge a batch of rows on an open connection (caller commits)."""
+        column_list = ", ".join(STAGING_COLUMNS)
+        cursor = conn.connection.dbapi_connection.cursor()
+        try:
+            # One staging table per session, emptied at every commit
+            cursor.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS posts_staging ON COMMIT DELETE ROWS AS "
+                f"SELECT {column_list}, 0 AS seq FROM posts WITH NO DATA"
+            )
+            cursor.execute("TRUNCATE posts_staging")
+            
+            with cursor.copy(f"COPY posts_staging ({column_list}, seq) FROM STDIN") as copy:
+                for seq, row in enumerate(rows):
+                    row["created_at"] = _utc_naive(row["created_at"])
+                    copy.write_row([row[name] for name in STAGING_COLUMNS] + [seq])
+            
+            # Later occurrences of a post in the batch win
+            batch = (
+                f"SELECT DISTINCT ON (platform, object_id) {column_list} "
+                "FROM posts_staging ORDER BY platform, object_id, seq DESC"
+            )
+            # Claim new keys in key order; a concurrent writer of the same key
+            # waits here until the first one commits, then sees its row
+            cursor.execute(
+                "INSERT INTO post_keys (platform, object_id, created_at) "
+                f"SELECT platform, object_id, created_at FROM ({batch}) b "
+                "ORDER BY platform, object_id ON CONFLICT DO NOTHING"
+            )
+            cursor.execute(
+                "UPDATE posts_staging s SET created_at = k.created_at FROM post_keys k "
+                "WHERE k.platform = s.platform AND k.object_id = s.object_id AND k.created_at <> s.created_at"
+            )
+            cursor.execute(
+                "SELECT "
+                "count(*) FILTER (WHERE p.id IS NULL), "
+                "count(*) FILTER (WHERE p.id IS NOT NULL AND p.text_hash IS DISTINCT FROM b.text_hash), "
+                "count(*) FILTER (WHERE p.id IS NOT NULL AND p.text_hash IS NOT DISTINCT FROM b.text_hash "
+                "AND p.metrics_hash IS DISTINCT FROM b.metrics_hash) "
+                f"FROM ({batch}) b LEFT JOIN posts p "
+                "ON p.platform = b.platform AND p.object_id = b.object_id AND p.created_at = b.created_at"
+            )
+            inserted, updated, metrics_updated = cursor.fetchone()
+            
+            text_changed = "p.text_hash IS DISTINCT FROM EXCLUDED.text_hash"
+            assignments = [
+                f"{name} = CASE WHEN {text_changed} THEN EXCLUDED.{name} ELSE p.{name} END"
+                for name in EDIT_COLUMNS
+            ]
+            assignments += [
+                # Only posts with a title (Reddit) overwrite it
+                f"title = CASE WHEN {text_changed} THEN coalesce(EXCLUDED.title, p.title) ELSE p.title END",
+                "text_hash = EXCLUDED.text_hash",
+                "metrics = EXCLUDED.metrics",
+                "metrics_hash = EXCLUDED.metrics_hash",
+                "updated_at = EXCLUDED.updated_at",
+            ]
+            # updated_at is the transaction start time; see iter_changed_posts
+            cursor.execute(
+                f"INSERT INTO posts AS p ({column_list}, updated_at) "
+                f"SELECT {column_list}, now() AT TIME ZONE 'UTC' FROM ({batch}) b "
+                "ON CONFLICT (platform, object_id, created_at) DO UPDATE SET "
+                f"{', '.join(assignments)} "
+                f"WHERE {text_changed} OR p.metrics_hash IS DISTINCT FROM EXCLUDED.metrics_hash"
+            )
+        finally:
+            cursor.close()
+        
+        return {
+            "inserted": inserted,
+            "updated": updated,
+            "metrics_updated": metrics_updated,
+            "skipped": len(rows) - inserted - updated - metrics_updated,
+        }
+    
+    def get_posts(
+        self,
+        platform: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        include_raw: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Get posts from database."""
+        query = select(*post_columns(include_raw)).order_by(posts_table.c.created_at, posts_table.c.id)
+        if platform:
+            query = query.where(posts_table.c.platform == platform)
+        if offset:
+            query = query.offset(offset)
+        if limit:
+            query = query.limit(limit)
+        
+        with self.engine.connect() as conn:
+            return [post_row_to_dict(row) for row in conn.execute(query)]
+    
+    def get_latest_posts(
+        self,
+        platform: Optional[str] = None,
+        subreddit: Optional[str] = None,
+        instance: Optional[str] = None,
+        limit: int = 50,
+        include_raw: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Get the newest posts, optionally of one platform, subreddit or instance."""
+        query = (
+            select(*post_columns(include_raw))
+            .order_by(posts_table.c.created_at.desc(), posts_table.c.id.desc())
+            .limit(limit)
+        )
+        if platform:
+            query = query.where(posts_table.c.platform == platform)
+        if subreddit:
+            query = query.where(posts_table.c.subreddit == subreddit)
+        if instance:
+            query = query.where(posts_table.c.instance == instance)
+        
+        with self.engine.connect() as conn:
+            return [post_row_to_dict(row) for row in conn.execute(query)]
+    
+    def iter_posts(
+        self,
+        platform: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        batch_size: int = 1000,
+        include_raw: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream posts in ``(created_at, id)`` order using keyset pagination."""
+        query = select(*post_columns(include_raw))
+        if platform:
+            query = query.where(posts_table.c.platform == platform)
+        if since:
+            query = query.where(posts_table.c.created_at >= _utc_naive(since))
+        if until:
+            query = query.where(posts_table.c.created_at < _utc_naive(until))
+        yield from self._iter_keyset(query, posts_table.c.created_at, None, batch_size)
+    
+    def iter_changed_posts(
+        self,
+        after: Optional[Tuple[datetime, int]] = None,
+        platform: Optional[str] = None,
+        batch_size: int = 1000,
+        include_raw: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream posts inserted or changed after a watermark, in ``(updated_at, id)`` order.
+        
+        Writes stamp ``updated_at`` with their transaction's start time, so
+        no transaction still in progress can commit a row older than the
+        oldest running transaction. Capping the scan there means a watermark
+        taken from the last yielded row never skips a row on the next run.
+        """
+        with self.engine.connect() as conn:
+            horizon = conn.execute(text(
+                "SELECT LEAST(now(), coalesce(min(xact_start), now())) AT TIME ZONE 'UTC' "
+                "FROM pg_stat_activity "
+                "WHERE datname = current_database() AND pid <> pg_backend_pid() AND xact_start IS NOT NULL"
+            )).scalar_one()
+        
+        query = select(*post_columns(include_raw)).where(posts_table.c.updated_at < horizon)
+        if platform:
+            query = query.where(posts_table.c.platform == platform)
+        yield from self._iter_keyset(query, posts_table.c.updated_at, after, batch_size)
+    
+    def _iter_keyset(self, base_query, order_column, after, batch_size: int) -> Iterator[Dict[str, Any]]:
+        """Page through ``base_query`` ordered by ``(order_column, id)``."""
+        base_query = base_query.order_by(order_column, posts_table.c.id).limit(batch_size)
+        last_key = after
+        while True:
+            query = base_query
+            if last_key is not None:
+                query = query.where(tuple_(order_column, posts_table.c.id) > tuple_(*last_key))
+            
+            with self.engine.connect() as conn:
+                rows = conn.execute(query).fetchall()
+            
+            for row in rows:
+                yield post_row_to_dict(row)
+            
+            if len(rows) < batch_size:
+                return
+            last_key = (getattr(rows[-1], order_column.name), rows[-1].id)
+    
+    def get_export_watermark(self, destination: str) -> Optional[Tuple[datetime, int]]:
+        """Get the ``(updated_at, id)`` of the last post exported to a destination."""
+        table = export_watermarks_table
+        with self.engine.connect() as conn:
+            row = conn.execute(
+                select(table.c.last_updated_at, table.c.last_rowid)
+                .where(table.c.destination == destination)
+            ).first()
+        return (row.last_updated_at, row.last_rowid) if row else None
+    
+    def set_export_watermark(self, destination: str, last_updated_at: datetime, last_rowid: int) -> None:
+        """Record the last post exported to a destination."""
+        table = export_watermarks_table
+        stmt = pg_insert(table).values(
+            destination=destination,
+            last_rowid=last_rowid,
+            last_updated_at=last_updated_at,
+            exported_at=func.timezone("UTC", func.now()),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.destination],
+            set_={
+                "last_rowid": stmt.excluded.last_rowid,
+                "last_updated_at": stmt.excluded.last_updated_at,
+                "exported_at": stmt.excluded.exported_at,
+            },
+        )
+        with self.engine.begin() as conn:
+            conn.execute(stmt)
+    
+    def search(
+        self,
+        query: str,
+        platform: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: int = 50,
+        offset: int = 0,
+        include_raw: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Full-text search over post text and titles, best matches first.
+        
+        ``query`` uses web search syntax (``"exact phrase"``, ``or``,
+        ``-excluded``). The ``score`` is the negated ``ts_rank_cd`` so that,
+        as with SQLite's bm25, lower is better.
+        
+        Raises:
+            RuntimeError: If the full-text index has not been created
+        """
+        with self.engine.connect() as conn:
+            has_index = conn.execute(text("SELECT to_regclass('ix_posts_search') IS NOT NULL")).scalar_one()
+            if not has_index:
+                raise RuntimeError(
+                    "Full-text search is not enabled. Set database.search.enabled "
+                    "and run setup (e.g. make setup-db) to build the index."
+                )
+            
+            conditions = [f"{SEARCH_DOCUMENT} @@ q"]
+            params: Dict[str, Any] = {"query": query, "limit": limit, "offset": offset}
+            if platform:
+                conditions.append("platform = :platform")
+                params["platform"] = platform
+            if since:
+                conditions.append("created_at >= :since")
+                params["since"] = _utc_naive(since)
+            if until:
+                conditions.append("created_at < :until")
+                params["until"] = _utc_naive(until)
+            
+            columns = ", ".join(f"posts.{column.name}" for column in post_columns(include_raw))
+            # Headlines are costly, so only build them for the returned page
+            rows = conn.execute(text(
+                "SELECT m.*, ts_headline('simple', m.text, m.q, "
+                "'StartSel=[, StopSel=], MaxWords=16, MinWords=5') AS snippet FROM ("
+                f"SELECT {columns}, q, -ts_rank_cd({SEARCH_DOCUMENT}, q) AS score "
+                "FROM posts, websearch_to_tsquery('simple', :query) AS q "
+                f"WHERE {' AND '.join(conditions)} "
+                "ORDER BY score LIMIT :limit OFFSET :offset"
+                ") m ORDER BY m.score"
+            ), params).all()
+        
+        results = []
+        for row in rows:
+            post = post_row_to_dict(row)
+            post["score"] = row.score
+            post["snippet"] = row.snippet
+            results.append(post)
+        return results
+    
+    def get_post_count(self, platform: Optional[str] = None) -> int:
+        """Get total number of posts from the counters table."""
+        table = post_counts_table
+        query = select(func.coalesce(func.sum(table.c.count), 0))
+        if platform:
+            query = query.where(table.c.platform == platform)
+        with self.engine.connect() as conn:
+            return int(conn.execute(query).scalar_one())
+    
+    def get_post_counts(self) -> Dict[str, int]:
+        """Get the number of posts for every platform in one query."""
+        table = post_counts_table
+        with self.engine.connect() as conn:
+            rows = conn.execute(
+                select(table.c.platform, func.sum(table.c.count)).group_by(table.c.platform)
+            ).all()
+        return {platform: int(count) for platform, count in rows}
+    
+    def get_daily_post_counts(
+        self,
+        platform: Optional[str] = None,
+        since: Optional[date] = None
+    ) -> List[Tuple[str, str, int]]:
+        """Get post counts per platform and day."""
+        table = post_counts_table
+        query = (
+            select(table.c.platform, table.c.day, table.c.count)
+            .where(table.c.count > 0)
+            .order_by(table.c.day, table.c.platform)
+        )
+        if platform:
+            query = query.where(table.c.platform == platform)
+        if since:
+            query = query.where(table.c.day >= since)
+        with self.engine.connect() as conn:
+            return [(platform, day.isoformat(), count) for platform, day, count in conn.execute(query)]
+    
+    def iter_post_keys(self, batch_size: int = 10000) -> Iterator[Tuple[str, str]]:
+        """Iterate over the key of every stored post, paging by id."""
+        last_id = 0
+        while True:
+            with self.engine.connect() as conn:
+                rows = conn.execute(
+                    select(posts_table.c.id, posts_table.c.platform, posts_table.c.object_id)
+                    .where(posts_table.c.id > last_id)
+                    .order_by(posts_table.c.id)
+                    .limit(batch_size)
+                ).all()
+            if not rows:
+                return
+            for _, platform, object_id in rows:
+                yield platform, object_id
+            last_id = rows[-1][0]
+    
+    def get_recent_post_hashes(self, limit: int) -> List[Tuple[str, str, str, str]]:
+        """Get the most recently stored posts' keys and content hashes, newest first."""
+        table = posts_table
+        with self.engine.connect() as conn:
+            rows = conn.execute(
+                select(table.c.platform, table.c.object_id, table.c.text_hash, table.c.metrics_hash)
+                .order_by(table.c.id.desc())
+                .limit(limit)
+            ).all()
+        return [tuple(row) for row in rows]
+    
+    def close(self) -> None:
+        """Close database connection."""
+        if self.engine:
+            self.engine.dispose()
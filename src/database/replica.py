@@ -0,0 +1,152 @@
+"""Snapshot read replica for analytics reads.
+
+Dashboards, stats and exports can read from a copy of the database instead
+of the live file, so their scans never compete with ingest for the page
+cache, checkpoints or the disk. :class:`SnapshotReplica` keeps numbered
+snapshot generations in a directory, takes a new one with the online backup
+API once the newest is older than the configured staleness, and shares fresh
+generations between processes (``socflow stats`` reuses the snapshot a
+running TUI took).
+"""
+
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Set, Tuple
+
+from ..config.settings import DatabaseConfig
+from .base import DatabaseManager
+from .factory import create_database_manager
+
+# Generations kept on disk; older ones are removed after a new snapshot
+KEEP_GENERATIONS = 2
+
+# Another process may still read a generation it took; it is only removed
+# once older than the staleness limit plus this margin
+FOREIGN_GENERATION_GRACE = 24 * 3600
+
+
+class SnapshotReplica:
+    """Read-only copy of a database, refreshed when it becomes stale.
+    
+    Each snapshot is a directory named ``<unix ms>-<pid>`` holding copies of
+    every database file. A new generation never overwrites an open one, so
+    queries running on the previous snapshot finish undisturbed. A process
+    removes the old generations it took itself once it has moved off them;
+    generations taken by other processes are left to them until they are a
+    day past the staleness limit.
+    """
+    
+    def __init__(self, source: DatabaseManager, config: DatabaseConfig, directory: Path):
+        """Initialize the replica without taking a snapshot.
+        
+        Args:
+            source: Manager of the live database
+            config: Database configuration, used to open snapshots like the live database
+            directory: Directory holding the snapshot generations
+        """
+        self.source = source
+        self.config = config
+        self.directory = directory
+        self.max_staleness = config.read_replica.max_staleness_seconds
+        self._manager: Optional[DatabaseManager] = None
+        self._taken_at = 0.0
+        # Generations this process took
+        self._created: Set[Path] = set()
+        self._lock = threading.Lock()
+    
+    def get(self) -> DatabaseManager:
+        """Get a manager over a snapshot no older than the configured staleness.
+        
+        Returns:
+            Database manager reading the current snapshot
+        """
+        with self._lock:
+            if self._is_stale(self._taken_at):
+                generation = self._latest_generation()
+                if generation is None or self._is_stale(generation[0]):
+                    generation = self._take_snapshot()
+                if self._manager is None or generation[0] > self._taken_at:
+                    self._open(generation)
+            return self._manager
+    
+    def refresh(self) -> DatabaseManager:
+        """Take a new snapshot now, regardless of staleness.
+        
+        Returns:
+            Database manager reading the new snapshot
+        """
+        with self._lock:
+            self._open(self._take_snapshot())
+            return self._manager
+    
+    @property
+    def age(self) -> Optional[float]:
+        """Seconds since the current snapshot was taken, or None before the first."""
+        return time.time() - self._taken_at if self._manager is not None else None
+    
+    def _is_stale(self, taken_at: float) -> bool:
+        """Whether a snapshot taken at a Unix time is too old to serve."""
+        return time.time() - taken_at > self.max_staleness
+    
+    def _generations(self) -> List[Tuple[float, Path]]:
+        """Complete snapshot generations on disk, oldest first."""
+        generations = []
+        if self.directory.is_dir():
+            for path in self.directory.iterdir():
+                stamp, _, pid = path.name.partition("-")
+                if path.is_dir() and stamp.isdigit() and pid.isdigit():
+                    generations.append((int(stamp) / 1000, path))
+        return sorted(generations)
+    
+    def _latest_generation(self) -> Optional[Tuple[float, Path]]:
+        """Newest complete generation, possibly taken by another process."""
+        generations = self._generations()
+        return generations[-1] if generations else None
+    
+    def _take_snapshot(self) -> Tuple[float, Path]:
+        """Copy the live database into a new generation directory."""
+        taken_at = time.time()
+        name = f"{int(taken_at * 1000)}-{os.getpid()}"
+        staging = self.directory / f".{name}.tmp"
+        try:
+            self.source.backup_to(staging)
+        except Exception:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        # Publish the generation only once every file is complete
+        path = self.directory / name
+        staging.rename(path)
+        self._created.add(path)
+        return taken_at, path
+    
+    def _open(self, generation: Tuple[float, Path]) -> None:
+        """Switch reads to a generation and remove superseded ones."""
+        taken_at, path = generation
+        main_name = Path(self.config.path or "socflow.db").name
+        config = self.config.copy(update={"path": str(path / main_name)})
+        
+        previous = self._manager
+        self._manager = create_database_manager(config)
+        self._taken_at = taken_at
+        if previous is not None:
+            previous.close()
+        
+        foreign_cutoff = time.time() - self.max_staleness - FOREIGN_GENERATION_GRACE
+        for old_taken_at, old_path in self._generations()[:-KEEP_GENERATIONS]:
+            if old_path == path:
+                continue
+            if old_path in self._created:
+                self._created.discard(old_path)
+                shutil.rmtree(old_path, ignore_errors=True)
+            elif old_taken_at < foreign_cutoff:
+                shutil.rmtree(old_path, ignore_errors=True)
+    
+    def close(self) -> None:
+        """Close the snapshot manager; snapshots stay on disk for reuse."""
+        with self._lock:
+            if self._manager is not None:
+                self._manager.close()
+                self._manager = None
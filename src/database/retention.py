@@ -0,0 +1,65 @@
+"""Retention and compaction for long-running collections.
+
+:func:`compact_database` applies the configured retention policies — drop
+raw payloads after N days, delete posts after M days — in small batches,
+then hands the freed pages back to the file system with incremental vacuum
+steps. Collectors keep writing throughout; no step holds a write lock for
+more than one batch.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from ..config.settings import RetentionConfig
+from .base import DatabaseManager
+
+
+def compact_database(
+    db_manager: DatabaseManager,
+    config: RetentionConfig,
+    platforms: Optional[List[str]] = None,
+    full_vacuum: bool = False,
+    now: Optional[datetime] = None
+) -> Dict[str, Any]:
+    """Apply retention policies and reclaim the space they free.
+    
+    Args:
+        db_manager: Database to compact (SQLite only)
+        config: Retention policies and batching settings
+        platforms: Platforms to apply policies to; defaults to every stored
+            or configured platform
+        full_vacuum: Rebuild the files with ``VACUUM`` before reclaiming space.
+            Needed once for databases created before incremental auto-vacuum
+            was configured; blocks writers while it runs.
+        now: Reference time for the age cutoffs (UTC); defaults to the current time
+        
+    Returns:
+        Dictionary with ``deleted_posts`` and ``dropped_raw`` per platform, and
+        the ``freed_bytes``, ``free_bytes`` and ``files_without_incremental``
+        of :meth:`DatabaseManager.reclaim_space`
+    """
+    # created_at is stored as naive UTC
+    now = now or datetime.now(timezone.utc)
+    if now.tzinfo is not None:
+        now = now.astimezone(timezone.utc).replace(tzinfo=None)
+    pause = config.batch_pause_ms / 1000
+    if platforms is None:
+        platforms = sorted(set(db_manager.get_post_counts()) | set(config.platforms))
+    
+    result: Dict[str, Any] = {"deleted_posts": {}, "dropped_raw": {}}
+    for platform in platforms:
+        policy = config.policy_for(platform)
+        # Delete first so raw payloads of deleted posts are not dropped twice
+        if policy.post_days is not None:
+            result["deleted_posts"][platform] = db_manager.delete_posts(
+                platform, now - timedelta(days=policy.post_days), batch_size=config.batch_size, pause=pause
+            )
+        if policy.raw_data_days is not None:
+            result["dropped_raw"][platform] = db_manager.drop_raw_data(
+                platform, now - timedelta(days=policy.raw_data_days), batch_size=config.batch_size, pause=pause
+            )
+    
+    if full_vacuum:
+        db_manager.vacuum()
+    result.update(db_manager.reclaim_space(pages_per_step=config.vacuum_pages, pause=pause))
+    return result
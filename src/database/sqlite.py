@@ -4,19 +4,193 @@ This module is designed for Python 3.14+ with GIL removed, enabling true concurr
 All database operations are thread-safe using proper connection pooling and locks.
 """
 
+import heapq
 import json
+import re
+import sqlite3
 import threading
+import time
+from contextlib import ExitStack, contextmanager
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from itertools import chain
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from sqlalchemy import Column, DateTime, Integer, String, Text, create_engine, text, UniqueConstraint
+from sqlalchemy import Column, DateTime, Float, Index, Integer, LargeBinary, String, Text, bindparam, create_engine, event, func, inspect, select, text, tuple_, UniqueConstraint
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.dialects.sqlite import dialect as sqlite_dialect, insert as sqlite_insert
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
-from .base import DatabaseManager
+from ..config.settings import MetricsHistoryConfig, SearchConfig, SQLitePerformanceConfig
+from ..utils.compression import compress, decompress
+from ..utils.hashing import HASH_SIZE, hash_metrics, hash_text
+from .base import BatchWriteError, DatabaseManager, empty_insert_counts, group_by_platform, post_row_to_dict, post_to_row
 
 Base = declarative_base()
 
+# Keys per lookup query; keeps bound parameters well below SQLite's limit
+BULK_CHUNK_SIZE = 500
+
+# Platform names become file names and ATTACH schema names
+PLATFORM_NAME = re.compile(r"^[a-z0-9_]+$")
+
+
+def utcnow() -> datetime:
+    """Current UTC time as a naive datetime, the form stored in ``updated_at``."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def plan_post_writes(
+    posts: List["BasePost"],
+    existing_posts: Dict[Tuple[str, str], Tuple[str, str]],
+    now: datetime
+) -> Tuple[Dict[Tuple[str, str], Dict[str, Any]], Dict[Tuple[str, str], Dict[str, Any]], Dict[str, int]]:
+    """Sort a batch into upserts and metrics refreshes against the stored hashes.
+    
+    Args:
+        posts: Incoming posts, in batch order
+        existing_posts: Stored ``(text_hash, metrics_hash)`` keyed by
+            ``(platform, object_id)``; updated in place as the batch is applied
+        now: ``updated_at`` stamp for every written row
+        
+    Returns:
+        ``(rows, metrics_rows, counts)``: full rows to upsert and metrics
+        refreshes (``key_*``/``new_*`` parameters), both keyed by post key,
+        and the batch's insert counts
+    """
+    rows = {}
+    metrics_rows = {}
+    inserted = 0
+    updated = 0
+    
+    for post in posts:
+        post_key = (post.platform, post.object_id)
+        row = post_to_row(post)
+        row["updated_at"] = now
+        
+        if post_key not in existing_posts:
+            # New post
+            rows[post_key] = row
+            inserted += 1
+        else:
+            stored_text_hash, stored_metrics_hash = existing_posts[post_key]
+            if stored_text_hash != row["text_hash"]:
+                # Post has been edited - the last version in the batch wins
+                if post_key not in rows:
+                    updated += 1
+                rows[post_key] = row
+                metrics_rows.pop(post_key, None)
+            elif stored_metrics_hash != row["metrics_hash"]:
+                if post_key in rows:
+                    # Already being written in this batch - keep the latest engagement
+                    rows[post_key]["metrics"] = row["metrics"]
+                    rows[post_key]["metrics_hash"] = row["metrics_hash"]
+                else:
+                    # Only engagement changed - refresh metrics without rewriting the post
+                    metrics_rows[post_key] = {
+                        "key_platform": post.platform,
+                        "key_object_id": post.object_id,
+                        "new_metrics": row["metrics"],
+                        "new_metrics_hash": row["metrics_hash"],
+                        "new_updated_at": now,
+                    }
+        
+        existing_posts[post_key] = (row["text_hash"], row["metrics_hash"])
+    
+    counts = {
+        "inserted": inserted,
+        "updated": updated,
+        "metrics_updated": len(metrics_rows),
+        "skipped": len(posts) - inserted - updated - len(metrics_rows),
+    }
+    return rows, metrics_rows, counts
+
+
+def metrics_sample(metrics: Optional[str]) -> Tuple[int, int, int, int]:
+    """``(likes, shares, comments, score)`` of a stored metrics JSON string.
+    
+    Platforms without a net score (Bluesky, Mastodon) fall back to
+    ``upvotes - downvotes``.
+    """
+    values = json.loads(metrics) if metrics else {}
+    score = values.get("score")
+    if score is None:
+        score = (values.get("upvotes") or 0) - (values.get("downvotes") or 0)
+    return (
+        int(values.get("likes") or 0),
+        int(values.get("shares") or 0),
+        int(values.get("comments") or 0),
+        int(score),
+    )
+
+
+def sample_interval(age: timedelta, config: MetricsHistoryConfig) -> timedelta:
+    """Minimum time between two engagement samples of a post of the given age."""
+    hours = age.total_seconds() / 3600
+    for max_age, minutes in config.intervals:
+        if hours < max_age:
+            return timedelta(minutes=minutes)
+    return timedelta(minutes=config.max_interval)
+
+
+def plan_history_samples(
+    observations: Dict[int, Tuple[datetime, Optional[str]]],
+    last_samples: Dict[int, Tuple[datetime, Tuple[int, int, int, int]]],
+    now: datetime,
+    config: MetricsHistoryConfig
+) -> List[Dict[str, Any]]:
+    """Pick the engagement samples to append for a written batch.
+    
+    A post gets a sample when it has none yet, or when its values differ
+    from its last sample and the post's age tier interval has passed since
+    that sample. Changes in between are dropped, not queued; the next
+    sample records whatever the values are by then.
+    
+    Args:
+        observations: ``(created_at, metrics JSON)`` keyed by post rowid
+        last_samples: ``(observed_at, values)`` of each post's newest sample
+        now: ``observed_at`` stamp of the new samples (naive UTC)
+        config: Sampling intervals
+        
+    Returns:
+        ``post_metrics_history`` rows to insert
+    """
+    samples = []
+    for post_id, (created_at, metrics) in observations.items():
+        values = metrics_sample(metrics)
+        last = last_samples.get(post_id)
+        if last is not None:
+            observed_at, last_values = last
+            if values == last_values:
+                continue
+            if created_at.tzinfo is not None:
+                created_at = created_at.astimezone(timezone.utc).replace(tzinfo=None)
+            if now - observed_at < sample_interval(now - created_at, config):
+                continue
+        likes, shares, comments, score = values
+        samples.append({
+            "post_id": post_id,
+            "observed_at": now,
+            "likes": likes,
+            "shares": shares,
+            "comments": comments,
+            "score": score,
+        })
+    return samples
+
+
+def raw_payload_row(post_id: int, raw_data: str) -> Dict[str, Any]:
+    """``post_raw`` row holding a post's compressed raw payload (JSON text)."""
+    codec, data = compress(raw_data.encode("utf-8"))
+    return {"post_id": post_id, "codec": codec, "data": data}
+
+
+def load_raw_payload(codec: str, data: bytes) -> Any:
+    """Decode a payload stored by :func:`raw_payload_row`."""
+    return json.loads(decompress(codec, data))
+
 
 class PostTable(Base):
     """SQLite table for posts - simplified schema."""
@@ -24,23 +198,38 @@ class PostTable(Base):
     __tablename__ = "posts"
     __table_args__ = (
         UniqueConstraint('platform', 'object_id', name='unique_platform_object'),
+        # Covers the change-detection lookup so it never reads the row itself
+        Index('ix_posts_identity_hashes', 'platform', 'object_id', 'text_hash', 'metrics_hash'),
+        # Incremental export scans rows changed since a watermark
+        Index('ix_posts_updated_at', 'updated_at'),
+        # Time ranges within a platform, subreddit or instance; the implicit
+        # rowid suffix also serves the (created_at, id) keyset order. Partial,
+        # since each community column is NULL for the other platforms
+        Index('ix_posts_platform_created_at', 'platform', 'created_at'),
+        Index('ix_posts_subreddit_created_at', 'subreddit', 'created_at', sqlite_where=text('subreddit IS NOT NULL')),
+        Index('ix_posts_instance_created_at', 'instance', 'created_at', sqlite_where=text('instance IS NOT NULL')),
     )
     
     # Core fields (required for all platforms)
     id = Column(Integer, primary_key=True, autoincrement=True)
-    platform = Column(String(50), nullable=False, index=True)
-    object_id = Column(String(255), nullable=False, index=True)
+    platform = Column(String(50), nullable=False)
+    object_id = Column(String(255), nullable=False)
     author_handle = Column(String(255), nullable=False)
     text = Column(Text, nullable=False)
     created_at = Column(DateTime, nullable=False, index=True)
     url = Column(String(500))
     parent_id = Column(String(255))
     is_comment = Column(Integer, default=0)  # 0 or 1
-    raw_data = Column(Text)  # JSON string
+    # raw_data lives compressed in post_raw, keeping rows small for scans
     
     # Metrics (stored as JSON for flexibility)
     metrics = Column(Text)  # JSON string
     
+    # Change detection (see utils.hashing)
+    text_hash = Column(String(HASH_SIZE * 2))  # Hash of normalized text
+    metrics_hash = Column(String(HASH_SIZE * 2))  # Hash of metrics JSON
+    updated_at = Column(DateTime, default=utcnow)  # Last insert, edit or metrics refresh (UTC)
+    
     # Reddit-specific fields (only essential ones)
     subreddit = Column(String(255))
     title = Column(Text)
@@ -64,49 +253,248 @@ class PostTable(Base):
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return {
-            "id": self.id,
-            "platform": self.platform,
-            "object_id": self.object_id,
-            "author_handle": self.author_handle,
-            "text": self.text,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "tags": json.loads(self.tags) if self.tags else [],
-            "metrics": json.loads(self.metrics) if self.metrics else {},
-            "url": self.url,
-            "parent_id": self.parent_id,
-            "is_comment": bool(self.is_comment),
-            "raw_data": json.loads(self.raw_data) if self.raw_data else None,
-            # Platform-specific fields
-            "subreddit": self.subreddit,
-            "title": self.title,
-            "flair": self.flair,
-            "is_self": bool(self.is_self),
-            "is_nsfw": bool(self.is_nsfw),
-            "is_locked": bool(self.is_locked),
-            "is_archived": bool(self.is_archived),
-            "is_stickied": bool(self.is_stickied),
-            "link_url": self.link_url,
-            "domain": self.domain,
-            "handle": self.handle,
-            "display_name": self.display_name,
-            "avatar_url": self.avatar_url,
-            "is_reply": bool(self.is_reply),
-            "is_repost": bool(self.is_repost),
-            "is_quote": bool(self.is_quote),
-            "reply_to": self.reply_to,
-            "repost_of": self.repost_of,
-            "quote_of": self.quote_of,
-            "images": json.loads(self.images) if self.images else [],
-            "links": json.loads(self.links) if self.links else [],
-            "instance": self.instance,
-            "is_reblog": bool(self.is_reblog),
-            "is_sensitive": bool(self.is_sensitive),
-            "is_boosted": bool(self.is_boosted),
-            "reblog_of": self.reblog_of,
-            "language": self.language,
-            "spoiler_text": self.spoiler_text,
-        }
+        return post_row_to_dict(self)
+
+
+class PostCountTable(Base):
+    """Posts per platform and day, kept current by triggers on ``posts``."""
+    
+    __tablename__ = "post_counts"
+    
+    platform = Column(String(50), primary_key=True)
+    day = Column(String(10), primary_key=True)  # YYYY-MM-DD of created_at
+    count = Column(Integer, nullable=False, default=0)
+
+
+# Indexes made redundant by the composite ones above: platform and
+# (platform, object_id) prefixes are covered, object_id alone is never queried
+DROPPED_INDEXES = ("ix_posts_platform", "ix_posts_object_id")
+
+
+# Triggers maintaining post_counts; every write path (bulk upsert, ORM insert,
+# manual SQL) goes through them, so the counters cannot drift
+POST_COUNT_TRIGGERS = {
+    "posts_count_insert": """
+        CREATE TRIGGER IF NOT EXISTS posts_count_insert AFTER INSERT ON posts
+        BEGIN
+            INSERT INTO post_counts (platform, day, count)
+            VALUES (NEW.platform, date(NEW.created_at), 1)
+            ON CONFLICT (platform, day) DO UPDATE SET count = count + 1;
+        END
+    """,
+    "posts_count_delete": """
+        CREATE TRIGGER IF NOT EXISTS posts_count_delete AFTER DELETE ON posts
+        BEGIN
+            UPDATE post_counts SET count = count - 1
+            WHERE platform = OLD.platform AND day = date(OLD.created_at);
+        END
+    """,
+    "posts_count_update": """
+        CREATE TRIGGER IF NOT EXISTS posts_count_update AFTER UPDATE OF platform, created_at ON posts
+        WHEN OLD.platform IS NOT NEW.platform OR date(OLD.created_at) IS NOT date(NEW.created_at)
+        BEGIN
+            UPDATE post_counts SET count = count - 1
+            WHERE platform = OLD.platform AND day = date(OLD.created_at);
+            INSERT INTO post_counts (platform, day, count)
+            VALUES (NEW.platform, date(NEW.created_at), 1)
+            ON CONFLICT (platform, day) DO UPDATE SET count = count + 1;
+        END
+    """,
+}
+
+
+# External-content FTS5 index over posts; triggers mirror every change to
+# the indexed columns. Rank weights: text 1.0, title 2.0.
+FTS_TRIGGERS = {
+    "posts_fts_insert": """
+        CREATE TRIGGER IF NOT EXISTS posts_fts_insert AFTER INSERT ON posts
+        BEGIN
+            INSERT INTO posts_fts (rowid, text, title) VALUES (NEW.id, NEW.text, NEW.title);
+        END
+    """,
+    "posts_fts_delete": """
+        CREATE TRIGGER IF NOT EXISTS posts_fts_delete AFTER DELETE ON posts
+        BEGIN
+            INSERT INTO posts_fts (posts_fts, rowid, text, title) VALUES ('delete', OLD.id, OLD.text, OLD.title);
+        END
+    """,
+    "posts_fts_update": """
+        CREATE TRIGGER IF NOT EXISTS posts_fts_update AFTER UPDATE OF text, title ON posts
+        BEGIN
+            INSERT INTO posts_fts (posts_fts, rowid, text, title) VALUES ('delete', OLD.id, OLD.text, OLD.title);
+            INSERT INTO posts_fts (rowid, text, title) VALUES (NEW.id, NEW.text, NEW.title);
+        END
+    """,
+}
+
+
+# Fragments of SQLite errors caused by malformed MATCH expressions
+FTS_QUERY_ERRORS = ("fts5", "syntax error", "unterminated string", "no such column", "unknown special query")
+
+
+class MetricsHistoryTable(Base):
+    """Append-only engagement samples of each post.
+    
+    Stored ``WITHOUT ROWID`` and clustered by ``(post_id, observed_at)``, so
+    one post's series is a single contiguous range scan.
+    """
+    
+    __tablename__ = "post_metrics_history"
+    __table_args__ = {"sqlite_with_rowid": False}
+    
+    post_id = Column(Integer, primary_key=True, autoincrement=False)  # posts.id
+    observed_at = Column(DateTime, primary_key=True)  # UTC
+    likes = Column(Integer, nullable=False, default=0)
+    shares = Column(Integer, nullable=False, default=0)
+    comments = Column(Integer, nullable=False, default=0)
+    score = Column(Integer, nullable=False, default=0)
+
+
+class PostRawTable(Base):
+    """Raw platform payload of each post, compressed and stored apart from ``posts``.
+    
+    Payloads are only read when a caller asks for them (``include_raw``),
+    so scans, counts and exports of ``posts`` never page them in.
+    """
+    
+    __tablename__ = "post_raw"
+    
+    post_id = Column(Integer, primary_key=True, autoincrement=False)  # posts.id
+    codec = Column(String(8), nullable=False)  # see utils.compression
+    data = Column(LargeBinary, nullable=False)  # Compressed JSON
+
+
+# Drop a post's side-table rows together with the post
+SIDE_TABLE_TRIGGERS = {
+    "posts_history_delete": """
+        CREATE TRIGGER IF NOT EXISTS posts_history_delete AFTER DELETE ON posts
+        BEGIN
+            DELETE FROM post_metrics_history WHERE post_id = OLD.id;
+        END
+    """,
+    "posts_raw_delete": """
+        CREATE TRIGGER IF NOT EXISTS posts_raw_delete AFTER DELETE ON posts
+        BEGIN
+            DELETE FROM post_raw WHERE post_id = OLD.id;
+        END
+    """,
+}
+
+
+class ExportWatermarkTable(Base):
+    """Position reached by the last incremental export to each destination."""
+    
+    __tablename__ = "export_watermarks"
+    
+    destination = Column(String(1000), primary_key=True)
+    last_rowid = Column(Integer, nullable=False)
+    last_updated_at = Column(DateTime, nullable=False)
+    exported_at = Column(DateTime, nullable=False)
+
+
+# Write statements shared by SQLiteManager and AsyncSQLiteManager. The async
+# manager runs them as SQL text; see compile_statement.
+
+def post_upsert_statement():
+    """Upsert of full post rows: edits rewrite the post, unchanged text is left alone."""
+    table = PostTable.__table__
+    stmt = sqlite_insert(table)
+    return stmt.on_conflict_do_update(
+        index_elements=[table.c.platform, table.c.object_id],
+        set_={
+            "text": stmt.excluded.text,
+            "metrics": stmt.excluded.metrics,
+            "text_hash": stmt.excluded.text_hash,
+            "metrics_hash": stmt.excluded.metrics_hash,
+            "updated_at": stmt.excluded.updated_at,
+            # Only posts with a title (Reddit) overwrite it
+            "title": func.coalesce(stmt.excluded.title, table.c.title),
+        },
+        where=stmt.excluded.text_hash.is_distinct_from(table.c.text_hash),
+    )
+
+
+def metrics_update_statement():
+    """Metrics refresh of a stored post, taking the ``key_*``/``new_*`` parameters of :func:`plan_post_writes`."""
+    table = PostTable.__table__
+    return (
+        table.update()
+        .where(table.c.platform == bindparam("key_platform"))
+        .where(table.c.object_id == bindparam("key_object_id"))
+        .values(
+            metrics=bindparam("new_metrics"),
+            metrics_hash=bindparam("new_metrics_hash"),
+            updated_at=bindparam("new_updated_at"),
+        )
+    )
+
+
+def raw_upsert_statement():
+    """Upsert of :func:`raw_payload_row` rows, replacing an older version's payload."""
+    table = PostRawTable.__table__
+    stmt = sqlite_insert(table)
+    return stmt.on_conflict_do_update(
+        index_elements=[table.c.post_id],
+        set_={"codec": stmt.excluded.codec, "data": stmt.excluded.data},
+    )
+
+
+def raw_delete_statement():
+    """Delete of a post's payload by ``row_id``."""
+    table = PostRawTable.__table__
+    return table.delete().where(table.c.post_id == bindparam("row_id"))
+
+
+def history_insert_statement():
+    """Insert of :func:`plan_history_samples` rows."""
+    return MetricsHistoryTable.__table__.insert()
+
+
+# Every posts column except the rowid, in table order
+POST_COLUMNS = [column.name for column in PostTable.__table__.columns if column.name != "id"]
+
+# Named parameters match the keys of the row dictionaries
+_NAMED_DIALECT = sqlite_dialect(paramstyle="named")
+
+
+def compile_statement(stmt, column_keys: Optional[List[str]] = None) -> str:
+    """Render a write statement as SQLite SQL with ``:name`` parameters.
+    
+    Args:
+        stmt: Statement from one of the builders above
+        column_keys: Columns given by an INSERT's parameters
+        
+    Returns:
+        SQL text for a DB-API ``executemany`` with dictionary rows
+    """
+    return str(stmt.compile(dialect=_NAMED_DIALECT, column_keys=column_keys))
+
+
+def key_lookup_queries(post_keys: List[Tuple[str, str]], columns: Tuple[str, ...]) -> Iterator[Tuple[str, List[str]]]:
+    """Queries looking up stored posts by ``(platform, object_id)``.
+    
+    Keys are matched in chunks of ``BULK_CHUNK_SIZE`` against a ``VALUES``
+    list, answered from the identity/hash index. ``INDEXED BY`` keeps the
+    planner off the unique index, which would have to visit each row to read
+    the hashes; the rowid is part of every index entry, so ``id`` is free.
+    
+    Args:
+        post_keys: Unique ``(platform, object_id)`` keys
+        columns: Columns of the index to select after the key
+        
+    Returns:
+        ``(sql, params)`` pairs with ``?`` placeholders, one per chunk
+    """
+    selected = ", ".join(("platform", "object_id") + tuple(columns))
+    for start in range(0, len(post_keys), BULK_CHUNK_SIZE):
+        chunk = post_keys[start:start + BULK_CHUNK_SIZE]
+        values = ", ".join(["(?, ?)"] * len(chunk))
+        sql = (
+            f"SELECT {selected} "
+            "FROM posts INDEXED BY ix_posts_identity_hashes "
+            f"WHERE (platform, object_id) IN (VALUES {values})"
+        )
+        yield sql, [value for key in chunk for value in key]
 
 
 class SQLiteManager(DatabaseManager):
@@ -118,61 +506,435 @@ class SQLiteManager(DatabaseManager):
     - Proper SQLite multi-threading configuration
     """
     
-    def __init__(self, connection_string: str, separate_databases: bool = False):
-        """Initialize SQLite manager with thread safety."""
+    def __init__(
+        self,
+        connection_string: str,
+        separate_databases: bool = False,
+        performance: Optional[SQLitePerformanceConfig] = None,
+        search: Optional[SearchConfig] = None,
+        metrics_history: Optional[MetricsHistoryConfig] = None
+    ):
+        """Initialize SQLite manager with thread safety.
+        
+        Args:
+            connection_string: Database connection string
+            separate_databases: Store each platform's posts in its own database file
+                with its own write lock; the main file keeps export watermarks
+            performance: Connection tuning profile; defaults to the standard profile
+            search: Full-text search settings; the index is off by default
+            metrics_history: Engagement time-series settings; off by default
+        """
         # Initialize lock for thread-safe operations
         self._lock = threading.Lock()
+        self.performance = performance or SQLitePerformanceConfig()
+        self.search_config = search or SearchConfig()
+        self.history_config = metrics_history or MetricsHistoryConfig()
+        self.read_engine = None
+        self.read_session_factory: Optional[sessionmaker] = None
+        # Per-platform (writer, reader) engines and write locks with separate_databases
+        self._platform_engines: Dict[str, Tuple[Engine, Engine]] = {}
+        self._platform_locks: Dict[str, threading.Lock] = {}
+        self._platforms_lock = threading.RLock()
         super().__init__(connection_string, separate_databases)
     
     def _setup_connection(self) -> None:
         """Setup SQLite connection with thread-safe configuration."""
-        # Ensure directory exists
-        db_path = Path(self.connection_string.replace("sqlite:///", ""))
-        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.engine, self.read_engine = self._create_engines(self.connection_string)
+        
+        if self.separate_databases:
+            if self._is_memory(self.connection_string):
+                raise ValueError("separate_databases requires a file-based SQLite database")
+            # Cross-platform reads go through a reader that attaches every platform file
+            if self.read_engine is not self.engine:
+                self.read_engine.dispose()
+            self.read_engine = self._create_union_reader()
+            for platform in self._discover_platforms():
+                self._platform_engine(platform)
         
-        # Configure SQLite for multi-threaded access
-        # check_same_thread=False allows connections from different threads
-        # pool_size and max_overflow enable connection pooling for concurrent access
-        self.engine = create_engine(
-            self.connection_string,
-            echo=False,
-            pool_pre_ping=True,
-            pool_size=10,  # Connection pool for concurrent threads
-            max_overflow=20,  # Additional connections beyond pool_size
-            connect_args={
-                "check_same_thread": False,  # Allow multi-threaded access
-                "timeout": 30.0,  # Wait up to 30 seconds for locks
-            }
-        )
         self.session_factory = sessionmaker(
             bind=self.engine,
             expire_on_commit=False  # Better for concurrent access
         )
+        self.read_session_factory = sessionmaker(
+            bind=self.read_engine,
+            expire_on_commit=False
+        )
+    
+    @staticmethod
+    def _is_memory(connection_string: str) -> bool:
+        """Whether a connection string names an in-memory database."""
+        return connection_string in ("sqlite://", "sqlite:///:memory:")
+    
+    def _create_engines(self, connection_string: str) -> Tuple[Engine, Engine]:
+        """Create the writer and reader engines for one database file.
+        
+        Args:
+            connection_string: SQLite connection string
+            
+        Returns:
+            ``(writer, reader)``; the same engine twice when the performance profile is off
+        """
+        is_memory = self._is_memory(connection_string)
+        if not is_memory:
+            # Ensure directory exists
+            db_path = Path(connection_string.replace("sqlite:///", ""))
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        if not self.performance.enabled or is_memory:
+            # Configure SQLite for multi-threaded access
+            # check_same_thread=False allows connections from different threads
+            # pool_size and max_overflow enable connection pooling for concurrent access
+            engine = create_engine(
+                connection_string,
+                echo=False,
+                pool_pre_ping=True,
+                pool_size=10,  # Connection pool for concurrent threads
+                max_overflow=20,  # Additional connections beyond pool_size
+                connect_args={
+                    "check_same_thread": False,  # Allow multi-threaded access
+                    "timeout": 30.0,  # Wait up to 30 seconds for locks
+                }
+            )
+            return engine, engine
+        
+        # SQLite allows one writer at a time, so writes share a single
+        # connection while readers get their own pool. In WAL mode readers
+        # never block the writer and the writer never blocks readers.
+        timeout = self.performance.busy_timeout_ms / 1000
+        engine = create_engine(
+            connection_string,
+            echo=False,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=timeout,
+            connect_args={"check_same_thread": False, "timeout": timeout}
+        )
+        event.listen(engine, "connect", self._configure_writer_connection)
+        
+        read_engine = create_engine(
+            connection_string,
+            echo=False,
+            pool_size=self.performance.reader_pool_size,
+            max_overflow=0,
+            pool_timeout=timeout,
+            connect_args={"check_same_thread": False, "timeout": timeout}
+        )
+        event.listen(read_engine, "connect", self._configure_reader_connection)
+        
+        # Open the writer once so the journal mode is in place before any reader connects
+        with engine.connect():
+            pass
+        return engine, read_engine
+    
+    def _create_union_reader(self) -> Engine:
+        """Create the reader for the main file that sees every platform's posts."""
+        timeout = self.performance.busy_timeout_ms / 1000
+        engine = create_engine(
+            self.connection_string,
+            echo=False,
+            pool_size=self.performance.reader_pool_size,
+            max_overflow=0,
+            pool_timeout=timeout,
+            connect_args={"check_same_thread": False, "timeout": timeout}
+        )
+        event.listen(engine, "connect", self._configure_union_reader_connection)
+        return engine
+    
+    def _platform_path(self, platform: str) -> Path:
+        """Database file holding one platform's posts."""
+        db_path = Path(self.connection_string.replace("sqlite:///", ""))
+        return db_path.parent / f"{platform}_{db_path.name}"
+    
+    def _discover_platforms(self) -> List[str]:
+        """Platforms that already have a database file next to the main one."""
+        db_path = Path(self.connection_string.replace("sqlite:///", ""))
+        suffix = f"_{db_path.name}"
+        platforms = []
+        for path in db_path.parent.glob(f"*{suffix}"):
+            platform = path.name[:-len(suffix)]
+            if PLATFORM_NAME.match(platform):
+                platforms.append(platform)
+        return sorted(platforms)
+    
+    def _platform_engine(self, platform: str) -> Tuple[Engine, Engine]:
+        """Get a platform's ``(writer, reader)`` engines, creating its database on first use."""
+        engines = self._platform_engines.get(platform)
+        if engines is not None:
+            return engines
+        
+        with self._platforms_lock:
+            engines = self._platform_engines.get(platform)
+            if engines is not None:
+                return engines
+            if not PLATFORM_NAME.match(platform):
+                raise ValueError(f"Invalid platform name for a separate database: {platform!r}")
+            
+            engines = self._create_engines(f"sqlite:///{self._platform_path(platform)}")
+            lock = threading.Lock()
+            Base.metadata.create_all(engines[0])
+            self._migrate_schema(engines[0], lock)
+            
+            self._platform_locks[platform] = lock
+            self._platform_engines[platform] = engines
+            # Pooled union readers predate this file; new connections attach it
+            self.read_engine.dispose()
+            return engines
+    
+    def _platform_names(self) -> List[str]:
+        """Platforms with their own database, in name order."""
+        with self._platforms_lock:
+            return sorted(self._platform_engines)
+    
+    def _write_locks(self) -> List[threading.Lock]:
+        """Every write lock, in a fixed order so holding them all cannot deadlock."""
+        with self._platforms_lock:
+            return [self._lock] + [self._platform_locks[name] for name in sorted(self._platform_locks)]
+    
+    def _writer_for(self, platform: Optional[str]) -> Tuple[Engine, threading.Lock]:
+        """Engine and write lock that own a platform's posts."""
+        if not self.separate_databases or platform is None:
+            return self.engine, self._lock
+        engine = self._platform_engine(platform)[0]
+        return engine, self._platform_locks[platform]
+    
+    @staticmethod
+    @contextmanager
+    def _write_transaction(engine: Engine) -> Iterator[Any]:
+        """Open a transaction that holds the database write lock from its start.
+        
+        A deferred transaction only takes the lock at its first write, so
+        anything read or stamped before that could be overtaken by a writer
+        in another process. ``BEGIN IMMEDIATE`` waits for the lock up front.
+        """
+        with engine.begin() as conn:
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+            yield conn
+    
+    def _reader_for(self, platform: Optional[str]) -> Engine:
+        """Reader for one platform's posts, or for all posts when ``platform`` is None."""
+        if self.separate_databases and platform:
+            engines = self._platform_engines.get(platform)
+            if engines is not None:
+                return engines[1]
+        return self.read_engine
+    
+    def _apply_pragmas(self, dbapi_connection) -> None:
+        """Apply the per-connection pragmas of the performance profile."""
+        profile = self.performance
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute(f"PRAGMA busy_timeout = {int(profile.busy_timeout_ms)}")
+            cursor.execute(f"PRAGMA synchronous = {profile.synchronous.upper()}")
+            cursor.execute(f"PRAGMA cache_size = {int(profile.cache_size)}")
+            cursor.execute(f"PRAGMA mmap_size = {int(profile.mmap_size)}")
+            cursor.execute(f"PRAGMA temp_store = {profile.temp_store.upper()}")
+        finally:
+            cursor.close()
+    
+    def _configure_writer_connection(self, dbapi_connection, connection_record) -> None:
+        """Connect hook for the writer engine."""
+        cursor = dbapi_connection.cursor()
+        try:
+            # page_size and auto_vacuum only apply before the first table is
+            # created; existing databases pick up auto_vacuum on the next VACUUM
+            cursor.execute(f"PRAGMA auto_vacuum = {self.performance.auto_vacuum.upper()}")
+            cursor.execute(f"PRAGMA page_size = {int(self.performance.page_size)}")
+            cursor.execute(f"PRAGMA journal_mode = {self.performance.journal_mode.upper()}")
+        finally:
+            cursor.close()
+        self._apply_pragmas(dbapi_connection)
+    
+    def _configure_reader_connection(self, dbapi_connection, connection_record) -> None:
+        """Connect hook for the reader engine."""
+        self._apply_pragmas(dbapi_connection)
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute("PRAGMA query_only = ON")
+        finally:
+            cursor.close()
+    
+    def _configure_union_reader_connection(self, dbapi_connection, connection_record) -> None:
+        """Connect hook for the cross-platform reader with separate databases.
+        
+        Every platform file is attached and ``posts`` and ``post_counts`` are
+        shadowed by temporary ``UNION ALL`` views over the attached tables, so
+        queries written for a single database read all platforms unchanged.
+        """
+        self._apply_pragmas(dbapi_connection)
+        with self._platforms_lock:
+            platforms = sorted(self._platform_engines)
+        
+        post_columns = ", ".join(column.name for column in PostTable.__table__.columns)
+        cursor = dbapi_connection.cursor()
+        try:
+            for platform in platforms:
+                cursor.execute(f"ATTACH DATABASE ? AS platform_{platform}", (str(self._platform_path(platform)),))
+            if platforms:
+                cursor.execute("CREATE TEMP VIEW posts AS " + " UNION ALL ".join(
+                    f"SELECT {post_columns} FROM platform_{platform}.posts" for platform in platforms
+                ))
+                cursor.execute("CREATE TEMP VIEW post_counts AS " + " UNION ALL ".join(
+                    f"SELECT platform, day, count FROM platform_{platform}.post_counts" for platform in platforms
+                ))
+            cursor.execute("PRAGMA query_only = ON")
+        finally:
+            cursor.close()
     
     def create_tables(self, platforms: List[str]) -> None:
         """Create necessary tables."""
+        # The main database holds every table; with separate databases its
+        # posts table stays empty and only export watermarks are written to it
+        Base.metadata.create_all(self.engine)
+        self._migrate_schema(self.engine)
+        
         if self.separate_databases:
-            # Create separate databases for each platform
+            # Create (or migrate) a database for each platform
             for platform in platforms:
-                db_path = Path(self.connection_string.replace("sqlite:///", ""))
-                platform_db_path = db_path.parent / f"{platform}_{db_path.name}"
-                platform_connection_string = f"sqlite:///{platform_db_path}"
+                self._platform_engine(platform)
+    
+    def _migrate_schema(self, engine, lock: Optional[threading.Lock] = None) -> None:
+        """Bring a database created by an older version up to the current schema.
+        
+        ``create_all`` only creates missing tables, so columns and indexes added
+        to existing tables are applied here. Safe to run repeatedly.
+        
+        Args:
+            engine: Writer engine of the database to migrate
+            lock: Write lock of that database; defaults to the main database's
+        """
+        table = PostTable.__table__
+        existing_columns = {column["name"] for column in inspect(engine).get_columns(table.name)}
+        
+        with lock or self._lock:
+            with engine.begin() as conn:
+                for column in table.columns:
+                    if column.name not in existing_columns:
+                        column_type = column.type.compile(dialect=engine.dialect)
+                        conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
                 
-                # Create engine for platform-specific database
-                platform_engine = create_engine(platform_connection_string)
-                Base.metadata.create_all(platform_engine)
-                platform_engine.dispose()
-        else:
-            # Create single database with all tables
-            Base.metadata.create_all(self.engine)
+                if "updated_at" not in existing_columns:
+                    # Older rows have never been touched since they were created
+                    conn.execute(table.update().where(table.c.updated_at.is_(None)).values(updated_at=table.c.created_at))
+                
+                for index in table.indexes:
+                    index.create(conn, checkfirst=True)
+                for name in DROPPED_INDEXES:
+                    conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+                
+                self._install_count_triggers(conn)
+                for ddl in SIDE_TABLE_TRIGGERS.values():
+                    conn.execute(text(ddl))
+                if self.search_config.enabled:
+                    self._install_fts(conn)
+            
+            self._backfill_hashes(engine)
+            if "raw_data" in existing_columns:
+                self._move_raw_payloads(engine)
+    
+    def _install_count_triggers(self, conn) -> None:
+        """Create the post_counts triggers, rebuilding the counters if any were missing."""
+        installed = {
+            name for (name,) in conn.execute(
+                text("SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'posts'")
+            )
+        }
+        if installed >= set(POST_COUNT_TRIGGERS):
+            return
+        
+        for ddl in POST_COUNT_TRIGGERS.values():
+            conn.execute(text(ddl))
+        # Same transaction as the triggers, so no insert is counted twice or missed
+        conn.execute(text("DELETE FROM post_counts"))
+        conn.execute(text(
+            "INSERT INTO post_counts (platform, day, count) "
+            "SELECT platform, date(created_at), COUNT(*) FROM posts GROUP BY platform, date(created_at)"
+        ))
+    
+    def _install_fts(self, conn) -> None:
+        """Create the FTS5 index and its triggers, indexing existing posts on first creation."""
+        exists = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'posts_fts'")
+        ).first()
+        if not exists:
+            tokenizer = self.search_config.tokenizer.replace("'", "''")
+            conn.execute(text(
+                "CREATE VIRTUAL TABLE posts_fts USING fts5("
+                f"text, title, content='posts', content_rowid='id', tokenize='{tokenizer}')"
+            ))
+        for ddl in FTS_TRIGGERS.values():
+            conn.execute(text(ddl))
+        if not exists:
+            conn.execute(text("INSERT INTO posts_fts (posts_fts) VALUES ('rebuild')"))
+    
+    def _backfill_hashes(self, engine, batch_size: int = 5000) -> None:
+        """Compute text and metrics hashes for rows written before they existed."""
+        table = PostTable.__table__
+        update = (
+            table.update()
+            .where(table.c.id == bindparam("row_id"))
+            .values(text_hash=bindparam("new_text_hash"), metrics_hash=bindparam("new_metrics_hash"))
+        )
+        while True:
+            with engine.begin() as conn:
+                rows = conn.execute(
+                    select(table.c.id, table.c.text, table.c.metrics)
+                    .where(table.c.text_hash.is_(None))
+                    .limit(batch_size)
+                ).all()
+                if not rows:
+                    return
+                conn.execute(update, [
+                    {
+                        "row_id": row_id,
+                        "new_text_hash": hash_text(text_value),
+                        "new_metrics_hash": hash_metrics(json.loads(metrics) if metrics else {}),
+                    }
+                    for row_id, text_value, metrics in rows
+                ])
+    
+    def _move_raw_payloads(self, engine, batch_size: int = 5000) -> None:
+        """Move payloads from the legacy ``posts.raw_data`` column into ``post_raw``.
+        
+        The column is emptied rather than dropped; ``VACUUM`` returns the
+        freed pages to the file system.
+        """
+        table = PostRawTable.__table__
+        last_id = 0
+        while True:
+            with engine.begin() as conn:
+                rows = conn.execute(
+                    text(
+                        "SELECT id, raw_data FROM posts "
+                        "WHERE id > :last_id AND raw_data IS NOT NULL ORDER BY id LIMIT :limit"
+                    ),
+                    {"last_id": last_id, "limit": batch_size},
+                ).all()
+                if not rows:
+                    return
+                conn.execute(
+                    sqlite_insert(table).prefix_with("OR REPLACE"),
+                    [raw_payload_row(row_id, raw_data) for row_id, raw_data in rows]
+                )
+                conn.execute(
+                    text("UPDATE posts SET raw_data = NULL WHERE id = :row_id"),
+                    [{"row_id": row_id} for row_id, _ in rows]
+                )
+                last_id = rows[-1][0]
     
     def insert_post(self, post: "BasePost") -> None:
         """Insert a single post."""
-        session = self.session_factory()
+        session = self.session_factory(bind=self._writer_for(post.platform)[0])
         try:
+            # updated_at is stamped at flush, under the database write lock
+            session.connection().exec_driver_sql("BEGIN IMMEDIATE")
             # Convert post to database row
-            db_post = self._post_to_db_row(post)
+            row = post_to_row(post)
+            raw_data = row.pop("raw_data")
+            db_post = PostTable(**row)
             session.add(db_post)
+            if raw_data:
+                session.flush()
+                session.execute(PostRawTable.__table__.insert(), [raw_payload_row(db_post.id, raw_data)])
             session.commit()
         except Exception as e:
             session.rollback()
@@ -180,89 +942,198 @@ class SQLiteManager(DatabaseManager):
         finally:
             session.close()
     
-    def insert_posts(self, posts: List["BasePost"]) -> None:
+    def insert_posts(self, posts: List["BasePost"]) -> Dict[str, int]:
         """Insert multiple posts with deduplication and update handling.
         
+        Stored text and metrics hashes are looked up in bulk. New and edited
+        posts are then written with one prepared
+        ``INSERT ... ON CONFLICT DO UPDATE`` statement executed for all rows,
+        posts whose only change is engagement get their metrics refreshed,
+        and unchanged posts are skipped.
+        
         Thread-safe operation using locks to prevent race conditions.
+        
+        Returns:
+            Dictionary with ``inserted``, ``updated``, ``metrics_updated`` and ``skipped`` counts
         """
         if not posts:
-            return
+            return empty_insert_counts()
+        return self.insert_post_batches([posts])[0]
+    
+    def insert_post_batches(self, batches: List[List["BasePost"]]) -> List[Dict[str, int]]:
+        """Insert several batches in a single transaction (group commit).
         
-        # Use lock to ensure thread-safe database access
-        with self._lock:
-            session = self.session_factory()
-            try:
-                # Get existing posts to check for duplicates and updates
-                existing_posts = self._get_existing_posts(session, posts)
-                
-                # Process posts for insertion/update
-                new_posts = []
-                updated_posts = []
-                
-                for post in posts:
-                    post_key = (post.platform, post.object_id)
-                    
-                    if post_key in existing_posts:
-                        # Post exists - check if it's been updated
-                        existing_post = existing_posts[post_key]
-                        if existing_post.text != post.text:
-                            # Post has been edited - update it
-                            updated_posts.append((existing_post, post))
-                    else:
-                        # New post
-                        new_posts.append(self._post_to_db_row(post))
-                        # Add to existing set to avoid duplicates within this batch
-                        existing_posts[post_key] = post
-                
-                # Insert new posts
-                if new_posts:
-                    session.add_all(new_posts)
-                
-                # Update edited posts
-                for existing_post, updated_post in updated_posts:
-                    # Update the existing post with new data
-                    existing_post.text = updated_post.text
-                    existing_post.raw_data = json.dumps(updated_post.raw_data, default=str) if updated_post.raw_data else None
-                    existing_post.metrics = json.dumps(updated_post.metrics.dict(), default=str)
-                    # Update other fields as needed
-                    if hasattr(updated_post, 'title'):
-                        existing_post.title = getattr(updated_post, 'title', None)
-                
-                if new_posts or updated_posts:
-                    session.commit()
-                    
-            except Exception as e:
-                session.rollback()
-                raise e
-            finally:
-                session.close()
+        Batches are applied in order on one connection, so a later batch
+        sees the rows written by an earlier one. With separate databases
+        each platform's posts are committed in that platform's database
+        under its own lock, so platforms never wait on each other.
+        
+        A platform whose group transaction fails is retried batch by batch,
+        so one bad batch does not fail the others.
+        
+        Raises:
+            BatchWriteError: If some batches failed after others were committed
+        """
+        results = [empty_insert_counts() for _ in batches]
+        
+        # Posts per target database, tagged with the batch they came from
+        routes: Dict[Optional[str], List[Tuple[int, List["BasePost"]]]] = {}
+        for index, posts in enumerate(batches):
+            if not self.separate_databases:
+                if posts:
+                    routes.setdefault(None, []).append((index, posts))
+                continue
+            for platform, platform_posts in group_by_platform(posts).items():
+                routes.setdefault(platform, []).append((index, platform_posts))
+        
+        errors: Dict[int, Exception] = {}
+        committed = False
+        for platform, parts in routes.items():
+            engine, lock = self._writer_for(platform)
+            # Use lock to ensure thread-safe database access
+            with lock:
+                try:
+                    written = list(zip(parts, self._write_parts(engine, parts)))
+                except Exception:
+                    if len(routes) == 1 and len(parts) == 1:
+                        raise
+                    written = []
+                    for part in parts:
+                        try:
+                            written.append((part, self._write_parts(engine, [part])[0]))
+                        except Exception as e:
+                            errors[part[0]] = e
+            for (index, _), counts in written:
+                for key, value in counts.items():
+                    results[index][key] += value
+            committed = committed or bool(written)
+        
+        if errors:
+            if not committed:
+                raise next(iter(errors.values()))
+            raise BatchWriteError(results, errors)
+        return results
+    
+    def _write_parts(self, engine: Engine, parts: List[Tuple[int, List["BasePost"]]]) -> List[Dict[str, int]]:
+        """Write batches in one transaction on a database; the caller holds its lock."""
+        with self._write_transaction(engine) as conn:
+            return [self._write_posts(conn, posts) for _, posts in parts]
+    
+    def _write_posts(self, conn, posts: List["BasePost"]) -> Dict[str, int]:
+        """Write a batch of posts on an open connection (caller commits)."""
+        # Stored (text_hash, metrics_hash), keyed by (platform, object_id)
+        existing_posts = self._get_existing_posts(conn, posts)
+        # Stamped inside the caller's BEGIN IMMEDIATE transaction; see iter_changed_posts
+        now = utcnow()
+        rows, metrics_rows, counts = plan_post_writes(posts, existing_posts, now)
+        # Payloads go to post_raw once the rows have ids
+        raw_data = {key: row.pop("raw_data") for key, row in rows.items()}
+        
+        if rows:
+            # executemany reuses one compiled, prepared statement; a multi-row
+            # VALUES clause would be recompiled for every distinct batch size
+            conn.execute(post_upsert_statement(), list(rows.values()))
+        
+        if metrics_rows:
+            conn.execute(metrics_update_statement(), list(metrics_rows.values()))
+        
+        history = self.history_config.enabled and bool(rows or metrics_rows)
+        if rows or history:
+            post_ids = self._get_post_ids(conn, [*rows, *metrics_rows] if history else list(rows))
+            self._write_raw_payloads(conn, raw_data, post_ids)
+            if history:
+                self._append_metrics_history(conn, posts, rows, metrics_rows, post_ids, now)
+        
+        return counts
+    
+    def _write_raw_payloads(
+        self,
+        conn,
+        raw_data: Dict[Tuple[str, str], Optional[str]],
+        post_ids: Dict[Tuple[str, str], int]
+    ) -> None:
+        """Store the compressed payloads of written posts, replacing older versions."""
+        payloads = [raw_payload_row(post_ids[key], raw) for key, raw in raw_data.items() if raw]
+        # An edit without a payload drops the previous version's
+        cleared = [{"row_id": post_ids[key]} for key, raw in raw_data.items() if not raw]
+        
+        if payloads:
+            conn.execute(raw_upsert_statement(), payloads)
+        if cleared:
+            conn.execute(raw_delete_statement(), cleared)
+    
+    def _append_metrics_history(
+        self,
+        conn,
+        posts: List["BasePost"],
+        rows: Dict[Tuple[str, str], Dict[str, Any]],
+        metrics_rows: Dict[Tuple[str, str], Dict[str, Any]],
+        post_ids: Dict[Tuple[str, str], int],
+        now: datetime
+    ) -> None:
+        """Append engagement samples for the posts a batch inserted or changed."""
+        metrics = {key: row["metrics"] for key, row in rows.items()}
+        metrics.update({key: row["new_metrics"] for key, row in metrics_rows.items()})
+        created_at = {(post.platform, post.object_id): post.created_at for post in posts}
+        
+        observations = {
+            post_id: (created_at[key], metrics[key]) for key, post_id in post_ids.items()
+        }
+        samples = plan_history_samples(
+            observations, self._get_last_samples(conn, list(observations)), now, self.history_config
+        )
+        if samples:
+            conn.execute(history_insert_statement(), samples)
+    
+    def _get_post_ids(self, conn, post_keys: List[Tuple[str, str]]) -> Dict[Tuple[str, str], int]:
+        """Get rowids of stored posts, keyed by ``(platform, object_id)``."""
+        post_ids = {}
+        for sql, params in key_lookup_queries(post_keys, ("id",)):
+            for platform, object_id, post_id in conn.exec_driver_sql(sql, tuple(params)):
+                post_ids[(platform, object_id)] = post_id
+        return post_ids
+    
+    def _get_last_samples(self, conn, post_ids: List[int]) -> Dict[int, Tuple[datetime, Tuple[int, int, int, int]]]:
+        """Get the newest engagement sample of each post."""
+        table = MetricsHistoryTable.__table__
+        last_samples = {}
+        for start in range(0, len(post_ids), BULK_CHUNK_SIZE):
+            chunk = post_ids[start:start + BULK_CHUNK_SIZE]
+            # SQLite takes the bare columns from the row holding max(observed_at)
+            query = (
+                select(table.c.post_id, func.max(table.c.observed_at), table.c.likes,
+                       table.c.shares, table.c.comments, table.c.score)
+                .where(table.c.post_id.in_(chunk))
+                .group_by(table.c.post_id)
+            )
+            for post_id, observed_at, *values in conn.execute(query):
+                last_samples[post_id] = (observed_at, tuple(values))
+        return last_samples
     
-    def _get_existing_posts(self, session, posts: List["BasePost"]) -> dict:
-        """Get existing posts to check for duplicates and updates."""
+    def _get_existing_posts(self, conn, posts: List["BasePost"]) -> dict:
+        """Get stored hashes of existing posts to check for duplicates and updates.
+        
+        Keys are looked up with chunked ``(platform, object_id) IN (...)``
+        queries answered from the identity/hash index, so post text is never
+        read back. Keys the :attr:`key_filter` knows are new are not looked up.
+        """
         existing_posts = {}
         
         # Get unique combinations of platform and object_id from incoming posts
-        post_keys = [(post.platform, post.object_id) for post in posts]
+        post_keys = list(dict.fromkeys((post.platform, post.object_id) for post in posts))
+        if self.key_filter is not None:
+            unseen = self.key_filter.claim_unseen(post_keys)
+            post_keys = [key for key in post_keys if key not in unseen]
         
-        if not post_keys:
-            return existing_posts
-            
-        # Query existing posts
-        for platform, object_id in post_keys:
-            existing = session.query(PostTable).filter(
-                PostTable.platform == platform,
-                PostTable.object_id == object_id
-            ).first()
-            
-            if existing:
-                # Store the actual post object for potential updates
-                existing_posts[(platform, object_id)] = existing
+        for sql, params in key_lookup_queries(post_keys, ("text_hash", "metrics_hash")):
+            for platform, object_id, text_hash, metrics_hash in conn.exec_driver_sql(sql, tuple(params)):
+                existing_posts[(platform, object_id)] = (text_hash, metrics_hash)
         
         return existing_posts
     
     def get_duplicate_count(self) -> int:
         """Get count of duplicate posts that were prevented."""
-        session = self.session_factory()
+        session = self.read_session_factory()
         try:
             # This is a simplified approach - in practice, you might want to track this differently
             # For now, we'll return 0 as the deduplication happens at insert time
@@ -274,83 +1145,666 @@ class SQLiteManager(DatabaseManager):
         self, 
         platform: Optional[str] = None,
         limit: Optional[int] = None,
-        offset: Optional[int] = None
+        offset: Optional[int] = None,
+        include_raw: bool = False
     ) -> List[Dict[str, Any]]:
         """Get posts from database."""
-        session = self.session_factory()
-        try:
-            query = session.query(PostTable)
+        # Core rather than ORM: with separate databases row ids repeat across
+        # platforms, and the session's identity map would collapse them
+        table = PostTable.__table__
+        query = select(table)
+        
+        if platform:
+            query = query.where(table.c.platform == platform)
+        
+        if offset:
+            query = query.offset(offset)
+        
+        if limit:
+            query = query.limit(limit)
+        
+        with self._reader_for(platform).connect() as conn:
+            posts = [post_row_to_dict(row) for row in conn.execute(query)]
+        if include_raw:
+            self._load_raw_payloads(posts)
+        return posts
+    
+    def get_latest_posts(
+        self,
+        platform: Optional[str] = None,
+        subreddit: Optional[str] = None,
+        instance: Optional[str] = None,
+        limit: int = 50,
+        include_raw: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Get the newest posts by walking a ``(..., created_at)`` index backwards.
+        
+        With separate databases and no platform filter, each platform's
+        newest posts are fetched and the overall newest kept.
+        """
+        if self.separate_databases and not platform:
+            posts = heapq.nlargest(
+                limit,
+                chain.from_iterable(
+                    self._get_latest_posts(self._reader_for(name), name, subreddit, instance, limit)
+                    for name in self._platform_names()
+                ),
+                key=lambda post: (post["created_at"], post["id"]),
+            )
+        else:
+            posts = self._get_latest_posts(self._reader_for(platform), platform, subreddit, instance, limit)
+        
+        if include_raw:
+            self._load_raw_payloads(posts)
+        return posts
+    
+    def _get_latest_posts(
+        self,
+        engine: Engine,
+        platform: Optional[str],
+        subreddit: Optional[str],
+        instance: Optional[str],
+        limit: int
+    ) -> List[Dict[str, Any]]:
+        """Newest-first query behind :meth:`get_latest_posts` on one database."""
+        table = PostTable.__table__
+        query = select(table).order_by(table.c.created_at.desc(), table.c.id.desc()).limit(limit)
+        if platform:
+            query = query.where(table.c.platform == platform)
+        if subreddit:
+            query = query.where(table.c.subreddit == subreddit)
+        if instance:
+            query = query.where(table.c.instance == instance)
+        
+        with engine.connect() as conn:
+            return [post_row_to_dict(row) for row in conn.execute(query)]
+    
+    def iter_posts(
+        self,
+        platform: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        batch_size: int = 1000,
+        include_raw: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream posts in ``(created_at, id)`` order with constant memory.
+        
+        Each batch is a separate keyset query that resumes after the last
+        row of the previous one, so later pages cost the same as the first
+        and no connection is held between batches. With separate databases
+        and no platform filter, the platforms' streams are merged.
+        """
+        if self.separate_databases and not platform:
+            return heapq.merge(
+                *[self.iter_posts(name, since, until, batch_size, include_raw) for name in self._platform_names()],
+                key=lambda post: (post["created_at"], post["id"]),
+            )
+        return self._iter_posts(self._reader_for(platform), platform, since, until, batch_size, include_raw)
+    
+    def _iter_posts(
+        self,
+        engine: Engine,
+        platform: Optional[str],
+        since: Optional[datetime],
+        until: Optional[datetime],
+        batch_size: int,
+        include_raw: bool
+    ) -> Iterator[Dict[str, Any]]:
+        """Keyset scan behind :meth:`iter_posts` on one database."""
+        table = PostTable.__table__
+        base_query = select(table).order_by(table.c.created_at, table.c.id).limit(batch_size)
+        
+        if platform:
+            base_query = base_query.where(table.c.platform == platform)
+        if since:
+            base_query = base_query.where(table.c.created_at >= since)
+        if until:
+            base_query = base_query.where(table.c.created_at < until)
+        
+        last_key = None
+        while True:
+            query = base_query
+            if last_key is not None:
+                query = query.where(tuple_(table.c.created_at, table.c.id) > tuple_(*last_key))
+            
+            with engine.connect() as conn:
+                result = conn.execution_options(stream_results=True).execute(query)
+                rows = result.fetchall()
             
-            if platform:
-                query = query.filter(PostTable.platform == platform)
+            posts = [post_row_to_dict(row) for row in rows]
+            if include_raw:
+                self._load_raw_payloads(posts)
+            yield from posts
             
-            if offset:
-                query = query.offset(offset)
+            if len(rows) < batch_size:
+                return
+            last_key = (rows[-1].created_at, rows[-1].id)
+    
+    def iter_changed_posts(
+        self,
+        after: Optional[Tuple[datetime, int]] = None,
+        platform: Optional[str] = None,
+        batch_size: int = 1000,
+        include_raw: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream posts inserted or changed after a watermark, in ``(updated_at, id)`` order.
+        
+        Writes stamp ``updated_at`` inside a ``BEGIN IMMEDIATE`` transaction,
+        and the upper bound is read inside one too, so SQLite's write lock
+        orders them even across processes: every row stamped before the
+        horizon is already committed and every later write is stamped after
+        it. A watermark taken from the last yielded row therefore never skips
+        a row on the next run.
+        
+        With separate databases the horizon is read holding every database's
+        write lock and the platforms' streams are merged. Row ids are only
+        unique within a platform, so two platforms would have to stamp the
+        same microsecond for the shared watermark to be ambiguous.
+        """
+        with ExitStack() as stack:
+            for lock in self._write_locks():
+                stack.enter_context(lock)
+            for engine, _ in self._database_writers():
+                stack.enter_context(self._write_transaction(engine))
+            horizon = utcnow()
+        
+        if self.separate_databases and not platform:
+            return heapq.merge(
+                *[
+                    self._iter_changed_posts(self._reader_for(name), horizon, after, name, batch_size, include_raw)
+                    for name in self._platform_names()
+                ],
+                key=lambda post: (post["updated_at"], post["id"]),
+            )
+        return self._iter_changed_posts(
+            self._reader_for(platform), horizon, after, platform, batch_size, include_raw
+        )
+    
+    def _iter_changed_posts(
+        self,
+        engine: Engine,
+        horizon: datetime,
+        after: Optional[Tuple[datetime, int]],
+        platform: Optional[str],
+        batch_size: int,
+        include_raw: bool
+    ) -> Iterator[Dict[str, Any]]:
+        """Keyset scan behind :meth:`iter_changed_posts` on one database."""
+        table = PostTable.__table__
+        base_query = (
+            select(table)
+            .where(table.c.updated_at < horizon)
+            .order_by(table.c.updated_at, table.c.id)
+            .limit(batch_size)
+        )
+        if platform:
+            base_query = base_query.where(table.c.platform == platform)
+        
+        last_key = after
+        while True:
+            query = base_query
+            if last_key is not None:
+                query = query.where(tuple_(table.c.updated_at, table.c.id) > tuple_(*last_key))
             
-            if limit:
-                query = query.limit(limit)
+            with engine.connect() as conn:
+                rows = conn.execute(query).fetchall()
             
-            posts = query.all()
-            return [post.to_dict() for post in posts]
-        finally:
-            session.close()
+            posts = [post_row_to_dict(row) for row in rows]
+            if include_raw:
+                self._load_raw_payloads(posts)
+            yield from posts
+            
+            if len(rows) < batch_size:
+                return
+            last_key = (rows[-1].updated_at, rows[-1].id)
     
-    def get_post_count(self, platform: Optional[str] = None) -> int:
-        """Get total number of posts (thread-safe)."""
-        # Use lock for thread-safe read operations
+    def get_metrics_history(self, platform: str, object_id: str) -> List[Dict[str, Any]]:
+        """Get a post's engagement samples, oldest first."""
+        posts = PostTable.__table__
+        history = MetricsHistoryTable.__table__
+        query = (
+            select(history.c.observed_at, history.c.likes, history.c.shares, history.c.comments, history.c.score)
+            .join_from(history, posts, history.c.post_id == posts.c.id)
+            .where(posts.c.platform == platform, posts.c.object_id == object_id)
+            .order_by(history.c.observed_at)
+        )
+        with self._reader_for(platform).connect() as conn:
+            return [dict(row._mapping) for row in conn.execute(query)]
+    
+    def get_export_watermark(self, destination: str) -> Optional[Tuple[datetime, int]]:
+        """Get the ``(updated_at, id)`` of the last post exported to a destination."""
+        table = ExportWatermarkTable.__table__
+        with self.read_engine.connect() as conn:
+            row = conn.execute(
+                select(table.c.last_updated_at, table.c.last_rowid)
+                .where(table.c.destination == destination)
+            ).first()
+        return (row.last_updated_at, row.last_rowid) if row else None
+    
+    def set_export_watermark(self, destination: str, last_updated_at: datetime, last_rowid: int) -> None:
+        """Record the last post exported to a destination."""
+        table = ExportWatermarkTable.__table__
+        stmt = sqlite_insert(table).values(
+            destination=destination,
+            last_rowid=last_rowid,
+            last_updated_at=last_updated_at,
+            exported_at=utcnow(),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.destination],
+            set_={
+                "last_rowid": stmt.excluded.last_rowid,
+                "last_updated_at": stmt.excluded.last_updated_at,
+                "exported_at": stmt.excluded.exported_at,
+            },
+        )
         with self._lock:
-            session = self.session_factory()
+            with self.engine.begin() as conn:
+                conn.execute(stmt)
+    
+    def search(
+        self,
+        query: str,
+        platform: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: int = 50,
+        offset: int = 0,
+        include_raw: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Full-text search over post text and titles, best matches first.
+        
+        ``query`` uses FTS5 syntax: bare terms are ANDed, ``"exact phrase"``,
+        ``OR``, ``NOT``, ``prefix*`` and ``NEAR(a b, 5)`` are supported.
+        Results carry a ``score`` (bm25, lower is better) and a highlighted
+        ``snippet`` of the text.
+        
+        With separate databases and no platform filter, each platform's
+        index is searched for the top ``offset + limit`` matches and the
+        results are merged by score.
+        
+        Raises:
+            RuntimeError: If the full-text index has not been created
+            ValueError: If the query is not valid FTS5 syntax
+        """
+        if self.separate_databases and not platform:
+            platforms = self._platform_names()
+            if not platforms:
+                raise RuntimeError(
+                    "Full-text search is not enabled. Set database.search.enabled "
+                    "and run setup (e.g. make setup-db) to build the index."
+                )
+            matches = heapq.merge(
+                *[
+                    self._search(self._reader_for(name), query, name, since, until, offset + limit, 0)
+                    for name in platforms
+                ],
+                key=lambda post: post["score"],
+            )
+            results = list(matches)[offset:offset + limit]
+        else:
+            results = self._search(self._reader_for(platform), query, platform, since, until, limit, offset)
+        
+        if include_raw:
+            self._load_raw_payloads(results)
+        return results
+    
+    def _search(
+        self,
+        engine: Engine,
+        query: str,
+        platform: Optional[str],
+        since: Optional[datetime],
+        until: Optional[datetime],
+        limit: int,
+        offset: int
+    ) -> List[Dict[str, Any]]:
+        """Full-text query behind :meth:`search` on one database."""
+        table = PostTable.__table__
+        columns = ", ".join(f"posts.{column.name}" for column in table.columns)
+        conditions = ["posts_fts MATCH :query"]
+        params: Dict[str, Any] = {"query": query, "limit": limit, "offset": offset}
+        if platform:
+            conditions.append("posts.platform = :platform")
+            params["platform"] = platform
+        if since:
+            conditions.append("posts.created_at >= :since")
+            params["since"] = since
+        if until:
+            conditions.append("posts.created_at < :until")
+            params["until"] = until
+        
+        statement = text(
+            f"SELECT {columns}, "
+            "bm25(posts_fts, 1.0, 2.0) AS score, "
+            "snippet(posts_fts, 0, '[', ']', '...', 16) AS snippet "
+            "FROM posts_fts JOIN posts ON posts.id = posts_fts.rowid "
+            f"WHERE {' AND '.join(conditions)} "
+            "ORDER BY score LIMIT :limit OFFSET :offset"
+        ).columns(*table.columns, score=Float, snippet=Text)
+        # Bind datetimes through DateTime so they match the stored string format
+        statement = statement.bindparams(
+            *[bindparam(name, type_=DateTime) for name in ("since", "until") if name in params]
+        )
+        
+        with engine.connect() as conn:
+            has_index = conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'posts_fts'")
+            ).first()
+            if not has_index:
+                raise RuntimeError(
+                    "Full-text search is not enabled. Set database.search.enabled "
+                    "and run setup (e.g. make setup-db) to build the index."
+                )
             try:
-                query = session.query(PostTable)
-                
-                if platform:
-                    query = query.filter(PostTable.platform == platform)
-                
-                return query.count()
+                rows = conn.execute(statement, params).all()
+            except OperationalError as e:
+                message = str(e.orig).lower()
+                if any(marker in message for marker in FTS_QUERY_ERRORS):
+                    raise ValueError(f"Invalid search query {query!r}: {e.orig}") from e
+                raise
+        
+        results = []
+        for row in rows:
+            post = post_row_to_dict(row)
+            post["score"] = row.score
+            post["snippet"] = row.snippet
+            results.append(post)
+        return results
+    
+    def _load_raw_payloads(self, posts: List[Dict[str, Any]]) -> None:
+        """Fill in ``raw_data`` of post dictionaries from ``post_raw``.
+        
+        Row ids are only unique within a database, so with separate
+        databases each platform's posts are looked up in their own file.
+        """
+        table = PostRawTable.__table__
+        groups: Dict[Optional[str], Dict[int, Dict[str, Any]]] = {}
+        for post in posts:
+            platform = post["platform"] if self.separate_databases else None
+            groups.setdefault(platform, {})[post["id"]] = post
+        
+        for platform, by_id in groups.items():
+            post_ids = list(by_id)
+            with self._reader_for(platform).connect() as conn:
+                for start in range(0, len(post_ids), BULK_CHUNK_SIZE):
+                    chunk = post_ids[start:start + BULK_CHUNK_SIZE]
+                    query = select(table.c.post_id, table.c.codec, table.c.data).where(table.c.post_id.in_(chunk))
+                    for post_id, codec, data in conn.execute(query):
+                        by_id[post_id]["raw_data"] = load_raw_payload(codec, data)
+    
+    def get_post_count(self, platform: Optional[str] = None) -> int:
+        """Get total number of posts from the trigger-maintained counters.
+        
+        Reads a handful of counter rows instead of scanning ``posts``, so it
+        needs no lock and never waits on the writer.
+        """
+        table = PostCountTable.__table__
+        query = select(func.coalesce(func.sum(table.c.count), 0))
+        if platform:
+            query = query.where(table.c.platform == platform)
+        with self.read_engine.connect() as conn:
+            return conn.execute(query).scalar_one()
+    
+    def get_post_counts(self) -> Dict[str, int]:
+        """Get the number of posts for every platform in one query."""
+        table = PostCountTable.__table__
+        with self.read_engine.connect() as conn:
+            rows = conn.execute(
+                select(table.c.platform, func.sum(table.c.count)).group_by(table.c.platform)
+            ).all()
+        return {platform: count for platform, count in rows}
+    
+    def get_daily_post_counts(
+        self,
+        platform: Optional[str] = None,
+        since: Optional[date] = None
+    ) -> List[Tuple[str, str, int]]:
+        """Get post counts per platform and day."""
+        table = PostCountTable.__table__
+        query = (
+            select(table.c.platform, table.c.day, table.c.count)
+            .where(table.c.count > 0)
+            .order_by(table.c.day, table.c.platform)
+        )
+        if platform:
+            query = query.where(table.c.platform == platform)
+        if since:
+            query = query.where(table.c.day >= since.isoformat())
+        with self.read_engine.connect() as conn:
+            return [tuple(row) for row in conn.execute(query)]
+    
+    def iter_post_keys(self, batch_size: int = 10000) -> Iterator[Tuple[str, str]]:
+        """Iterate over the key of every stored post, paging by rowid."""
+        if self.separate_databases:
+            # Row ids are per file, so page through each platform in turn
+            return chain.from_iterable(
+                self._iter_post_keys(self._reader_for(name), batch_size) for name in self._platform_names()
+            )
+        return self._iter_post_keys(self.read_engine, batch_size)
+    
+    def _iter_post_keys(self, engine: Engine, batch_size: int) -> Iterator[Tuple[str, str]]:
+        """Rowid scan behind :meth:`iter_post_keys` on one database."""
+        table = PostTable.__table__
+        last_id = 0
+        while True:
+            with engine.connect() as conn:
+                rows = conn.execute(
+                    select(table.c.id, table.c.platform, table.c.object_id)
+                    .where(table.c.id > last_id)
+                    .order_by(table.c.id)
+                    .limit(batch_size)
+                ).all()
+            if not rows:
+                return
+            for _, platform, object_id in rows:
+                yield platform, object_id
+            last_id = rows[-1][0]
+    
+    def get_recent_post_hashes(self, limit: int) -> List[Tuple[str, str, str, str]]:
+        """Get the most recently stored posts' keys and content hashes, newest first."""
+        table = PostTable.__table__
+        if self.separate_databases:
+            # Row ids are per file; interleave the platforms by last write time
+            rows = []
+            for name in self._platform_names():
+                with self._reader_for(name).connect() as conn:
+                    rows += conn.execute(
+                        select(
+                            table.c.platform, table.c.object_id, table.c.text_hash, table.c.metrics_hash,
+                            table.c.updated_at,
+                        )
+                        .order_by(table.c.id.desc())
+                        .limit(limit)
+                    ).all()
+            rows.sort(key=lambda row: row.updated_at or datetime.min, reverse=True)
+            return [tuple(row)[:4] for row in rows[:limit]]
+        
+        with self.read_engine.connect() as conn:
+            rows = conn.execute(
+                select(table.c.platform, table.c.object_id, table.c.text_hash, table.c.metrics_hash)
+                .order_by(table.c.id.desc())
+                .limit(limit)
+            ).all()
+        return [tuple(row) for row in rows]
+    
+    def _retention_writer(self, platform: str) -> Optional[Tuple[Engine, threading.Lock]]:
+        """Writer and lock holding a platform's posts, or None if it has no database yet."""
+        if self.separate_databases and platform not in self._platform_names():
+            return None
+        return self._writer_for(platform)
+    
+    def delete_posts(
+        self,
+        platform: str,
+        created_before: datetime,
+        batch_size: int = 1000,
+        pause: float = 0.0
+    ) -> int:
+        """Delete a platform's posts created before a cutoff, in small batches.
+        
+        Each batch is its own short write transaction, so collectors keep
+        writing in between. Triggers remove the posts' counters, search index
+        entries, metrics history and raw payloads with them.
+        """
+        writer = self._retention_writer(platform)
+        if writer is None:
+            return 0
+        engine, lock = writer
+        
+        table = PostTable.__table__
+        batch = (
+            select(table.c.id)
+            .where(table.c.platform == platform, table.c.created_at < created_before)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        stmt = table.delete().where(table.c.id.in_(batch))
+        
+        deleted = 0
+        while True:
+            with lock:
+                with engine.begin() as conn:
+                    count = conn.execute(stmt).rowcount
+            deleted += count
+            if count < batch_size:
+                return deleted
+            time.sleep(pause)
+    
+    def drop_raw_data(
+        self,
+        platform: str,
+        created_before: datetime,
+        batch_size: int = 1000,
+        pause: float = 0.0
+    ) -> int:
+        """Drop the raw payloads of a platform's posts created before a cutoff.
+        
+        Walks the posts in ``(created_at, id)`` order on the platform's time
+        index and deletes each batch's ``post_raw`` rows in its own transaction.
+        """
+        writer = self._retention_writer(platform)
+        if writer is None:
+            return 0
+        engine, lock = writer
+        
+        posts = PostTable.__table__
+        raw = PostRawTable.__table__
+        query = (
+            select(posts.c.created_at, posts.c.id)
+            .where(posts.c.platform == platform, posts.c.created_at < created_before)
+            .order_by(posts.c.created_at, posts.c.id)
+            .limit(batch_size)
+        )
+        
+        dropped = 0
+        last_key = None
+        while True:
+            batch_query = query
+            if last_key is not None:
+                batch_query = query.where(tuple_(posts.c.created_at, posts.c.id) > tuple_(*last_key))
+            with lock:
+                with engine.begin() as conn:
+                    rows = conn.execute(batch_query).all()
+                    if rows:
+                        post_ids = [post_id for _, post_id in rows]
+                        dropped += conn.execute(raw.delete().where(raw.c.post_id.in_(post_ids))).rowcount
+            if len(rows) < batch_size:
+                return dropped
+            last_key = tuple(rows[-1])
+            time.sleep(pause)
+    
+    def _database_writers(self) -> List[Tuple[Engine, threading.Lock]]:
+        """Writer and lock of every database file, main file first."""
+        writers = [(self.engine, self._lock)]
+        if self.separate_databases:
+            writers += [self._writer_for(name) for name in self._platform_names()]
+        return writers
+    
+    def reclaim_space(self, pages_per_step: int = 1000, pause: float = 0.0) -> Dict[str, int]:
+        """Return free pages to the file system with ``PRAGMA incremental_vacuum``.
+        
+        Each step releases at most ``pages_per_step`` pages from the end of the
+        file under the write lock, so a collector is never blocked for long.
+        Only files created with ``auto_vacuum = incremental`` (or converted by
+        :meth:`vacuum`) can release pages; others are counted and left alone.
+        """
+        result = {"freed_bytes": 0, "free_bytes": 0, "files_without_incremental": 0}
+        for engine, lock in self._database_writers():
+            with engine.connect() as conn:
+                auto_vacuum = conn.exec_driver_sql("PRAGMA auto_vacuum").scalar()
+                page_size = conn.exec_driver_sql("PRAGMA page_size").scalar()
+                free_pages = conn.exec_driver_sql("PRAGMA freelist_count").scalar()
+            if auto_vacuum != 2:  # 2 = incremental
+                result["free_bytes"] += free_pages * page_size
+                result["files_without_incremental"] += bool(free_pages)
+                continue
+            
+            initial_pages = free_pages
+            while free_pages:
+                with lock:
+                    with engine.connect() as conn:
+                        # The pragma frees one page per step of its statement; the sqlite3
+                        # module steps plain statements only once, executescript to completion
+                        conn.connection.driver_connection.executescript(
+                            f"PRAGMA incremental_vacuum({int(pages_per_step)});"
+                        )
+                        remaining = conn.exec_driver_sql("PRAGMA freelist_count").scalar()
+                if remaining >= free_pages:
+                    break
+                free_pages = remaining
+                if free_pages:
+                    time.sleep(pause)
+            result["freed_bytes"] += (initial_pages - free_pages) * page_size
+            result["free_bytes"] += free_pages * page_size
+        return result
+    
+    def vacuum(self) -> None:
+        """Rebuild every database file with ``VACUUM``.
+        
+        Also switches files created before ``auto_vacuum`` was configured to
+        the configured mode. Holds each file's write lock for the whole
+        rebuild, which can take minutes on a large database.
+        """
+        for engine, lock in self._database_writers():
+            with lock:
+                with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                    conn.exec_driver_sql(f"PRAGMA auto_vacuum = {self.performance.auto_vacuum.upper()}")
+                    conn.exec_driver_sql("VACUUM")
+    
+    def backup_to(self, directory: Path) -> None:
+        """Copy every database file into a directory with the online backup API.
+        
+        Each file is copied in a single backup step from a pooled reader, so
+        the copy is one consistent read snapshot. In WAL mode the writer keeps
+        committing while the copy runs.
+        """
+        if self._is_memory(self.connection_string):
+            raise ValueError("Snapshots require a file-based SQLite database")
+        
+        directory.mkdir(parents=True, exist_ok=True)
+        main_name = Path(self.connection_string.replace("sqlite:///", "")).name
+        sources = [(self.read_engine, main_name)]
+        if self.separate_databases:
+            sources += [(self._reader_for(name), self._platform_path(name).name) for name in self._platform_names()]
+        
+        for engine, name in sources:
+            target = sqlite3.connect(directory / name)
+            try:
+                with engine.connect() as conn:
+                    # Only the main schema is copied, never attached platform files
+                    conn.connection.driver_connection.backup(target, name="main")
             finally:
-                session.close()
+                target.close()
     
     def close(self) -> None:
         """Close database connection."""
+        with self._platforms_lock:
+            for engine, read_engine in self._platform_engines.values():
+                if read_engine is not engine:
+                    read_engine.dispose()
+                engine.dispose()
+        if self.read_engine is not None and self.read_engine is not self.engine:
+            self.read_engine.dispose()
         if self.engine:
             self.engine.dispose()
-    
-    def _post_to_db_row(self, post: "BasePost") -> PostTable:
-        """Convert BasePost to database row - simplified schema."""
-        # Only store tags for Bluesky platform
-        tags_json = json.dumps(post.tags) if post.platform == "bluesky" else None
-        
-        return PostTable(
-            # Core fields
-            platform=post.platform,
-            object_id=post.object_id,
-            author_handle=post.author_handle,
-            text=post.text,
-            created_at=post.created_at,
-            url=post.url,
-            parent_id=post.parent_id,
-            is_comment=1 if post.is_comment else 0,
-            raw_data=json.dumps(post.raw_data, default=str) if post.raw_data else None,
-            metrics=json.dumps(post.metrics.dict(), default=str),
-            
-            # Reddit-specific fields (only essential ones)
-            subreddit=getattr(post, 'subreddit', None),
-            title=getattr(post, 'title', None),
-            is_nsfw=1 if bool(getattr(post, 'is_nsfw', False)) else 0,
-            
-            # Bluesky-specific fields (only essential ones)
-            handle=getattr(post, 'handle', None),
-            display_name=getattr(post, 'display_name', None),
-            avatar_url=getattr(post, 'avatar_url', None),
-            is_reply=1 if bool(getattr(post, 'is_reply', False)) else 0,
-            is_repost=1 if bool(getattr(post, 'is_repost', False)) else 0,
-            reply_to=getattr(post, 'reply_to', None),
-            repost_of=getattr(post, 'repost_of', None),
-            tags=tags_json,  # Only for Bluesky
-            
-            # Mastodon-specific fields (only essential ones)
-            instance=getattr(post, 'instance', None),
-            is_reblog=1 if bool(getattr(post, 'is_reblog', False)) else 0,
-            is_sensitive=1 if bool(getattr(post, 'is_sensitive', False)) else 0,
-            reblog_of=getattr(post, 'reblog_of', None),
-        )
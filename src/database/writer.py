@@ -0,0 +1,286 @@
+"""Single-writer service with group commit.
+
+Collector threads hand their batches to a :class:`DatabaseWriter` instead of
+calling ``insert_posts`` themselves. One background thread owns every write,
+so network collection never waits on a slow commit.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, List, Tuple
+
+from ..models.base import BasePost
+from .base import BatchWriteError, DatabaseManager, empty_insert_counts, group_by_platform
+
+# Sentinel placed on the queue to stop the writer thread
+_STOP = object()
+
+# Seconds between attempts to queue a batch while the queue is full
+SUBMIT_RETRY_INTERVAL = 0.01
+
+
+class DatabaseWriter:
+    """Background thread that owns all post writes for a database manager.
+    
+    Batches submitted with :meth:`submit` are coalesced into group commits
+    bounded by ``max_batch_size`` posts or ``max_latency`` seconds, whichever
+    is reached first. Each submitted batch gets its own future, which resolves
+    to the insert counts for that batch.
+    """
+    
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        max_batch_size: int = 1000,
+        max_latency: float = 0.25,
+        max_queue_size: int = 0,
+        name: str = "DatabaseWriter",
+    ):
+        """Initialize and start the writer thread.
+        
+        Args:
+            db_manager: Database manager that performs the writes
+            max_batch_size: Maximum number of posts per group commit
+            max_latency: Maximum seconds a batch waits before being committed
+            max_queue_size: Maximum queued batches before submit blocks (0 = unbounded)
+            name: Name of the writer thread
+        """
+        self.db_manager = db_manager
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue_size)
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self.groups_committed = 0
+        self.batches_committed = 0
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+    
+    def submit(self, posts: List[BasePost]) -> Future:
+        """Queue a batch of posts for writing.
+        
+        Args:
+            posts: Posts to insert
+        
+        Returns:
+            Future resolving to the batch's ``inserted``/``updated``/``skipped`` counts
+        
+        Raises:
+            RuntimeError: If the writer has been closed
+        """
+        future: Future = Future()
+        if not posts:
+            future.set_result(empty_insert_counts())
+            return future
+        
+        item = (list(posts), future)
+        while True:
+            # Never block on a full queue while holding the lock, or close() would wait too
+            with self._close_lock:
+                if self._closed:
+                    raise RuntimeError("Database writer is closed")
+                try:
+                    self._queue.put_nowait(item)
+                    return future
+                except queue.Full:
+                    pass
+            time.sleep(SUBMIT_RETRY_INTERVAL)
+    
+    @property
+    def pending(self) -> int:
+        """Number of batches waiting to be committed."""
+        return self._queue.qsize()
+    
+    def _run(self) -> None:
+        """Writer loop: gather a group of batches, then commit it."""
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            
+            group = [item]
+            size = len(item[0])
+            deadline = time.monotonic() + self.max_latency
+            
+            # Keep collecting until the group is full or the latency budget is spent
+            while size < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                group.append(item)
+                size += len(item[0])
+            
+            self._commit(group)
+    
+    def _commit(self, group: List[Tuple[List[BasePost], Future]]) -> None:
+        """Commit a group of batches and resolve their futures."""
+        group = [(posts, future) for posts, future in group if future.set_running_or_notify_cancel()]
+        if not group:
+            return
+        
+        try:
+            results = self.db_manager.insert_post_batches([posts for posts, _ in group])
+        except BatchWriteError as e:
+            # Part of the group is committed; retrying would write it twice
+            for index, (_, future) in enumerate(group):
+                if index in e.errors:
+                    future.set_exception(e.errors[index])
+                else:
+                    future.set_result(e.results[index])
+            self.batches_committed += len(group) - len(e.errors)
+            return
+        except Exception:
+            # Nothing was committed: retry batch by batch so one bad batch doesn't fail the whole group
+            for posts, future in group:
+                try:
+                    future.set_result(self.db_manager.insert_posts(posts))
+                except Exception as e:
+                    future.set_exception(e)
+            self.batches_committed += len(group)
+            return
+        
+        for (_, future), result in zip(group, results):
+            future.set_result(result)
+        self.groups_committed += 1
+        self.batches_committed += len(group)
+    
+    def close(self, timeout: float = 30.0) -> None:
+        """Flush queued batches and stop the writer thread.
+        
+        Args:
+            timeout: Maximum seconds to wait for queued batches to be written
+        """
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+        deadline = time.monotonic() + timeout
+        # Submits after this point fail, so the sentinel is queued after every batch
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            # Still writing after timeout; the daemon thread carries on with the queue
+            return
+        self._thread.join(max(deadline - time.monotonic(), 0))
+    
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+
+class PlatformWriters:
+    """One :class:`DatabaseWriter` per platform.
+    
+    Used with ``separate_databases``, where each platform's posts live in
+    their own database with their own write lock: every platform gets its
+    own writer thread, so one platform's commits never queue behind
+    another's. Batches mixing platforms are split, and their future
+    resolves to the summed counts.
+    """
+    
+    def __init__(self, db_manager: DatabaseManager, **writer_options: Any):
+        """Initialize without starting any threads.
+        
+        Args:
+            db_manager: Database manager that performs the writes
+            **writer_options: Keyword arguments for each :class:`DatabaseWriter`
+        """
+        self.db_manager = db_manager
+        self.writer_options = writer_options
+        self._writers: Dict[str, DatabaseWriter] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+    
+    def _writer(self, platform: str) -> DatabaseWriter:
+        """Get the platform's writer, starting it on first use."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Database writer is closed")
+            writer = self._writers.get(platform)
+            if writer is None:
+                writer = DatabaseWriter(self.db_manager, name=f"DatabaseWriter-{platform}", **self.writer_options)
+                self._writers[platform] = writer
+            return writer
+    
+    def submit(self, posts: List[BasePost]) -> Future:
+        """Queue a batch of posts on the writers of its platforms.
+        
+        Args:
+            posts: Posts to insert
+        
+        Returns:
+            Future resolving to the batch's ``inserted``/``updated``/``skipped`` counts
+        
+        Raises:
+            RuntimeError: If the writers have been closed
+        """
+        futures = [self._writer(platform).submit(part) for platform, part in group_by_platform(posts).items()]
+        if not futures:
+            future: Future = Future()
+            future.set_result(empty_insert_counts())
+            return future
+        if len(futures) == 1:
+            return futures[0]
+        
+        combined: Future = Future()
+        remaining = [len(futures)]
+        lock = threading.Lock()
+        
+        def on_done(_):
+            with lock:
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+            errors = [future.exception() for future in futures if future.exception()]
+            if errors:
+                combined.set_exception(errors[0])
+                return
+            counts = empty_insert_counts()
+            for future in futures:
+                for key, value in future.result().items():
+                    counts[key] += value
+            combined.set_result(counts)
+        
+        for future in futures:
+            future.add_done_callback(on_done)
+        return combined
+    
+    @property
+    def pending(self) -> int:
+        """Number of batches waiting to be committed across all platforms."""
+        with self._lock:
+            return sum(writer.pending for writer in self._writers.values())
+    
+    def close(self, timeout: float = 30.0) -> None:
+        """Flush and stop every platform's writer.
+        
+        Args:
+            timeout: Maximum seconds to wait for each writer's queued batches
+        """
+        with self._lock:
+            self._closed = True
+            writers = list(self._writers.values())
+        for writer in writers:
+            writer.close(timeout)
+    
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
@@ -0,0 +1,19 @@
+"""Streaming data exporters for SocFlow."""
+
+from .base import BaseExporter, iter_batches
+from .csv_exporter import CSVExporter
+from .json_exporter import JSONExporter, JSONLinesExporter
+from .parquet_exporter import ParquetExporter
+from .partitioned import PartitionedParquetExporter
+from .factory import create_exporter
+
+__all__ = [
+    "BaseExporter",
+    "CSVExporter",
+    "JSONExporter",
+    "JSONLinesExporter",
+    "ParquetExporter",
+    "PartitionedParquetExporter",
+    "create_exporter",
+    "iter_batches",
+]
@@ -0,0 +1,153 @@
+"""Base exporter interface."""
+
+import json
+from abc import ABC, abstractmethod
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Union
+
+# Column order shared by every tabular export format
+EXPORT_COLUMNS = [
+    "id",
+    "platform",
+    "object_id",
+    "author_handle",
+    "text",
+    "created_at",
+    "updated_at",
+    "tags",
+    "metrics",
+    "url",
+    "parent_id",
+    "is_comment",
+    "raw_data",
+    "subreddit",
+    "title",
+    "is_nsfw",
+    "handle",
+    "display_name",
+    "avatar_url",
+    "is_reply",
+    "is_repost",
+    "reply_to",
+    "repost_of",
+    "instance",
+    "is_reblog",
+    "is_sensitive",
+    "reblog_of",
+]
+
+# Columns holding lists/dicts, stored as JSON text in flat formats
+JSON_COLUMNS = {"tags", "metrics", "raw_data"}
+
+
+def iter_batches(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Group an iterable into lists of at most ``size`` items.
+    
+    Args:
+        items: Items to group
+        size: Maximum batch size
+    
+    Yields:
+        Lists of items
+    """
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def flatten_row(post: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a post dictionary to a flat row with JSON-encoded nested fields.
+    
+    Args:
+        post: Post dictionary as returned by the database manager
+    
+    Returns:
+        Row with exactly the :data:`EXPORT_COLUMNS` keys
+    """
+    row = {}
+    for column in EXPORT_COLUMNS:
+        value = post.get(column)
+        if column in JSON_COLUMNS and value is not None:
+            value = json.dumps(value, default=str)
+        row[column] = value
+    return row
+
+
+class BaseExporter(ABC):
+    """Abstract base class for incremental file exporters.
+    
+    Exporters receive posts in batches so memory use is bounded by the
+    batch size, not by the number of posts exported.
+    """
+    
+    # Whether the format can add rows to an existing file
+    supports_append = False
+    
+    def __init__(self, output_path: Union[str, Path], append: bool = False):
+        """Initialize exporter.
+        
+        Args:
+            output_path: Path to output file
+            append: Add to existing output instead of replacing it
+            
+        Raises:
+            ValueError: If the format cannot be appended to
+        """
+        if append and not self.supports_append:
+            raise ValueError(f"{type(self).__name__} does not support appending")
+        self.output_path = Path(output_path)
+        self.append = append
+        self.rows_written = 0
+        self._opened = False
+    
+    def open(self) -> None:
+        """Create the output file and write any header."""
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._open()
+        self._opened = True
+    
+    def write_batch(self, posts: List[Dict[str, Any]]) -> None:
+        """Append a batch of posts to the output.
+        
+        Args:
+            posts: Post dictionaries as returned by the database manager
+        """
+        if not posts:
+            return
+        if not self._opened:
+            self.open()
+        self._write_batch(posts)
+        self.rows_written += len(posts)
+    
+    def close(self) -> None:
+        """Finish the output file."""
+        if self._opened:
+            self._close()
+            self._opened = False
+    
+    @abstractmethod
+    def _open(self) -> None:
+        """Open the output file."""
+        pass
+    
+    @abstractmethod
+    def _write_batch(self, posts: List[Dict[str, Any]]) -> None:
+        """Write a non-empty batch."""
+        pass
+    
+    @abstractmethod
+    def _close(self) -> None:
+        """Flush and close the output file."""
+        pass
+    
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
@@ -0,0 +1,28 @@
+"""CSV exporter."""
+
+import csv
+from typing import Any, Dict, List
+
+from .base import EXPORT_COLUMNS, BaseExporter, flatten_row
+
+
+class CSVExporter(BaseExporter):
+    """Writes CSV in chunks with a fixed column set."""
+    
+    supports_append = True
+    
+    def _open(self) -> None:
+        """Open the file and write the header unless appending to existing rows."""
+        has_rows = self.append and self.output_path.exists() and self.output_path.stat().st_size > 0
+        self._file = open(self.output_path, 'a' if has_rows else 'w', newline='')
+        self._writer = csv.DictWriter(self._file, fieldnames=EXPORT_COLUMNS)
+        if not has_rows:
+            self._writer.writeheader()
+    
+    def _write_batch(self, posts: List[Dict[str, Any]]) -> None:
+        """Append rows for a batch of posts."""
+        self._writer.writerows(flatten_row(post) for post in posts)
+    
+    def _close(self) -> None:
+        """Close the file."""
+        self._file.close()
@@ -0,0 +1,61 @@
+"""Exporter factory."""
+
+from pathlib import Path
+from typing import Optional, Union
+
+from .base import BaseExporter
+from .csv_exporter import CSVExporter
+from .json_exporter import JSONExporter, JSONLinesExporter
+from .parquet_exporter import ParquetExporter
+from .partitioned import PartitionedParquetExporter
+
+
+def create_exporter(
+    output_path: Union[str, Path],
+    partitioned: bool = False,
+    compression: str = "snappy",
+    row_group_size: Optional[int] = None,
+    max_workers: int = 4,
+    append: bool = False,
+    sorted_by_date: bool = True
+) -> BaseExporter:
+    """Create an exporter based on the output file extension.
+    
+    Args:
+        output_path: Path to output file, or dataset directory when partitioned
+        partitioned: Write a hive-partitioned Parquet dataset
+        compression: Parquet compression codec
+        row_group_size: Rows per Parquet row group
+        max_workers: Partitions written concurrently (partitioned only)
+        append: Add to existing output instead of replacing it
+        sorted_by_date: Whether posts arrive in ``created_at`` order (partitioned only)
+    
+    Returns:
+        Exporter instance
+    
+    Raises:
+        ValueError: If the file format is not supported, or cannot be appended to
+    """
+    output_path = Path(output_path)
+    if partitioned:
+        return PartitionedParquetExporter(
+            output_path,
+            compression=compression,
+            row_group_size=row_group_size or 100_000,
+            max_workers=max_workers,
+            sorted_by_date=sorted_by_date,
+            append=append
+        )
+    
+    suffix = output_path.suffix
+    
+    if suffix == ".json":
+        return JSONExporter(output_path, append)
+    elif suffix in (".jsonl", ".ndjson"):
+        return JSONLinesExporter(output_path, append)
+    elif suffix == ".csv":
+        return CSVExporter(output_path, append)
+    elif suffix == ".parquet":
+        return ParquetExporter(output_path, compression=compression, row_group_size=row_group_size, append=append)
+    else:
+        raise ValueError(f"Unsupported file format: {suffix}")
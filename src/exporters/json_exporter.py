@@ -0,0 +1,46 @@
+"""JSON and JSON Lines exporters."""
+
+import json
+from typing import Any, Dict, List
+
+from .base import BaseExporter
+
+
+class JSONExporter(BaseExporter):
+    """Writes a single JSON array, one element at a time."""
+    
+    def _open(self) -> None:
+        """Open the file and start the array."""
+        self._file = open(self.output_path, 'w')
+        self._file.write("[")
+        self._first = True
+    
+    def _write_batch(self, posts: List[Dict[str, Any]]) -> None:
+        """Append posts to the array."""
+        for post in posts:
+            self._file.write("\n" if self._first else ",\n")
+            self._file.write(json.dumps(post, indent=2, default=str))
+            self._first = False
+    
+    def _close(self) -> None:
+        """Close the array and the file."""
+        self._file.write("\n]\n")
+        self._file.close()
+
+
+class JSONLinesExporter(BaseExporter):
+    """Writes one JSON object per line."""
+    
+    supports_append = True
+    
+    def _open(self) -> None:
+        """Open the file."""
+        self._file = open(self.output_path, 'a' if self.append else 'w')
+    
+    def _write_batch(self, posts: List[Dict[str, Any]]) -> None:
+        """Append one line per post."""
+        self._file.writelines(json.dumps(post, default=str) + "\n" for post in posts)
+    
+    def _close(self) -> None:
+        """Close the file."""
+        self._file.close()
@@ -0,0 +1,147 @@
+"""Parquet exporter."""
+
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from .base import BaseExporter, flatten_row
+
+
+def _require_pyarrow():
+    """Import pyarrow, with an install hint if it is missing."""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError(
+            "pyarrow is required for Parquet export. "
+            "Install it with: pip install pyarrow or pip install socflow[parquet]"
+        )
+    return pyarrow
+
+
+def parquet_schema():
+    """Arrow schema for exported posts."""
+    pa = _require_pyarrow()
+    return pa.schema([
+        ("id", pa.int64()),
+        ("platform", pa.string()),
+        ("object_id", pa.string()),
+        ("author_handle", pa.string()),
+        ("text", pa.string()),
+        ("created_at", pa.timestamp("us")),
+        ("updated_at", pa.timestamp("us")),
+        ("tags", pa.string()),
+        ("metrics", pa.string()),
+        ("url", pa.string()),
+        ("parent_id", pa.string()),
+        ("is_comment", pa.bool_()),
+        ("raw_data", pa.string()),
+        ("subreddit", pa.string()),
+        ("title", pa.string()),
+        ("is_nsfw", pa.bool_()),
+        ("handle", pa.string()),
+        ("display_name", pa.string()),
+        ("avatar_url", pa.string()),
+        ("is_reply", pa.bool_()),
+        ("is_repost", pa.bool_()),
+        ("reply_to", pa.string()),
+        ("repost_of", pa.string()),
+        ("instance", pa.string()),
+        ("is_reblog", pa.bool_()),
+        ("is_sensitive", pa.bool_()),
+        ("reblog_of", pa.string()),
+    ])
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO timestamp, normalizing timezone-aware values to naive UTC."""
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def parquet_row(post: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten a post dictionary into a row matching :func:`parquet_schema`."""
+    row = flatten_row(post)
+    row["created_at"] = _parse_timestamp(row["created_at"])
+    row["updated_at"] = _parse_timestamp(row["updated_at"])
+    return row
+
+
+def posts_to_table(posts: List[Dict[str, Any]], schema=None):
+    """Build an Arrow table from post dictionaries.
+    
+    Args:
+        posts: Post dictionaries as returned by the database manager
+        schema: Arrow schema (defaults to :func:`parquet_schema`)
+        
+    Returns:
+        pyarrow.Table
+    """
+    pa = _require_pyarrow()
+    rows = [parquet_row(post) for post in posts]
+    return pa.Table.from_pylist(rows, schema=schema or parquet_schema())
+
+
+def next_sibling_path(path: Path) -> Path:
+    """First of ``path``, ``stem-1.suffix``, ``stem-2.suffix``... that does not exist."""
+    candidate = path
+    number = 0
+    while candidate.exists():
+        number += 1
+        candidate = path.with_name(f"{path.stem}-{number}{path.suffix}")
+    return candidate
+
+
+class ParquetExporter(BaseExporter):
+    """Writes a Parquet file one row group per batch.
+    
+    Parquet files cannot be extended, so appending writes the rows to a new
+    sibling file (``export-1.parquet``, ``export-2.parquet``...) instead.
+    """
+    
+    supports_append = True
+    
+    def __init__(
+        self,
+        output_path: Union[str, Path],
+        compression: str = "snappy",
+        row_group_size: Optional[int] = None,
+        append: bool = False
+    ):
+        """Initialize exporter.
+        
+        Args:
+            output_path: Path to output file
+            compression: Parquet compression codec
+            row_group_size: Maximum rows per row group (defaults to the batch size)
+            append: Write to the next unused sibling file if the output exists
+        """
+        super().__init__(output_path, append)
+        self.compression = compression
+        self.row_group_size = row_group_size
+        self._writer = None
+    
+    def _open(self) -> None:
+        """Open the Parquet writer."""
+        _require_pyarrow()
+        import pyarrow.parquet as pq
+        
+        if self.append:
+            self.output_path = next_sibling_path(self.output_path)
+        self._schema = parquet_schema()
+        self._writer = pq.ParquetWriter(str(self.output_path), self._schema, compression=self.compression)
+    
+    def _write_batch(self, posts: List[Dict[str, Any]]) -> None:
+        """Write a batch as one or more row groups."""
+        table = posts_to_table(posts, self._schema)
+        self._writer.write_table(table, row_group_size=self.row_group_size or len(posts))
+    
+    def _close(self) -> None:
+        """Write the footer and close the file."""
+        self._writer.close()
+        self._writer = None
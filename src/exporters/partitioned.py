@@ -0,0 +1,209 @@
+"""Hive-partitioned Parquet dataset exporter."""
+
+import re
+import threading
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .base import BaseExporter
+from .parquet_exporter import _require_pyarrow, parquet_row, parquet_schema
+
+# Partition value used for posts without a creation date
+UNKNOWN_DATE = "unknown"
+
+_PART_PATTERN = re.compile(r"^part-(\d+)\.parquet$")
+
+
+def next_part_path(directory: Path) -> Path:
+    """Path of the next unused ``part-N.parquet`` file in a partition directory.
+    
+    Existing parts are never overwritten, so repeated exports into the same
+    dataset add new files instead of clobbering old ones.
+    """
+    numbers = [
+        int(match.group(1))
+        for match in (_PART_PATTERN.match(path.name) for path in directory.glob("part-*.parquet"))
+        if match
+    ]
+    return directory / f"part-{max(numbers, default=-1) + 1}.parquet"
+
+
+class _PartitionWriter:
+    """Buffers rows for one partition and writes them in fixed-size row groups."""
+    
+    def __init__(self, directory: Path, schema, compression: str, row_group_size: int):
+        """Initialize writer; the file is created on the first row group."""
+        self.directory = directory
+        self.schema = schema
+        self.compression = compression
+        self.row_group_size = row_group_size
+        self.lock = threading.Lock()
+        self._rows: List[Dict[str, Any]] = []
+        self._writer = None
+    
+    def append(self, rows: List[Dict[str, Any]]) -> None:
+        """Buffer rows, writing a row group each time the buffer is full."""
+        with self.lock:
+            self._rows.extend(rows)
+            while len(self._rows) >= self.row_group_size:
+                self._flush(self.row_group_size)
+    
+    @property
+    def buffered(self) -> int:
+        """Rows waiting for the next row group."""
+        return len(self._rows)
+    
+    def flush(self) -> None:
+        """Write every buffered row now, as a short row group."""
+        with self.lock:
+            if self._rows:
+                self._flush(len(self._rows))
+    
+    def close(self) -> None:
+        """Write any buffered rows and close the file."""
+        with self.lock:
+            if self._rows:
+                self._flush(len(self._rows))
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+    
+    def _flush(self, count: int) -> None:
+        """Write the first ``count`` buffered rows as one row group (caller holds the lock)."""
+        pa = _require_pyarrow()
+        import pyarrow.parquet as pq
+        
+        chunk, self._rows = self._rows[:count], self._rows[count:]
+        if self._writer is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._writer = pq.ParquetWriter(
+                str(next_part_path(self.directory)), self.schema, compression=self.compression
+            )
+        self._writer.write_table(pa.Table.from_pylist(chunk, schema=self.schema))
+
+
+class PartitionedParquetExporter(BaseExporter):
+    """Writes a ``platform=.../date=.../part-N.parquet`` dataset.
+    
+    Each partition has its own writer, and the writers for a batch run in a
+    thread pool (pyarrow releases the GIL while encoding and compressing).
+    When posts are streamed in ``created_at`` order, a partition is closed as
+    soon as the stream has moved past its date; otherwise the least recently
+    written partitions are closed once ``max_open_partitions`` is exceeded.
+    Rows buffered across all open partitions are capped at
+    ``max_buffered_rows``; past it the largest buffers are written early as
+    short row groups. Either way open files and memory stay bounded.
+    
+    Every export adds new part files, so appending needs no special handling.
+    The ``platform`` column is carried by the directory name only, as DuckDB
+    and Spark expect for hive partitioning.
+    """
+    
+    supports_append = True
+    
+    def __init__(
+        self,
+        output_path: Union[str, Path],
+        compression: str = "snappy",
+        row_group_size: int = 100_000,
+        max_workers: int = 4,
+        sorted_by_date: bool = True,
+        max_open_partitions: int = 256,
+        max_buffered_rows: int = 1_000_000,
+        append: bool = False
+    ):
+        """Initialize exporter.
+        
+        Args:
+            output_path: Dataset root directory
+            compression: Parquet compression codec
+            row_group_size: Rows per row group within each part file
+            max_workers: Number of partitions written concurrently
+            sorted_by_date: Whether posts arrive in ``created_at`` order
+            max_open_partitions: Maximum partitions kept open at once
+            max_buffered_rows: Maximum rows buffered across all open partitions
+            append: Accepted for interface compatibility; parts are never overwritten
+        """
+        super().__init__(output_path, append)
+        if row_group_size <= 0:
+            raise ValueError("Row group size must be positive")
+        if max_buffered_rows <= 0:
+            raise ValueError("Max buffered rows must be positive")
+        self.compression = compression
+        self.row_group_size = row_group_size
+        self.max_workers = max_workers
+        self.sorted_by_date = sorted_by_date
+        self.max_open_partitions = max_open_partitions
+        self.max_buffered_rows = max_buffered_rows
+        self._partitions: "OrderedDict[Tuple[str, str], _PartitionWriter]" = OrderedDict()
+        self._executor: Optional[ThreadPoolExecutor] = None
+    
+    def _open(self) -> None:
+        """Create the dataset directory and the writer pool."""
+        schema = parquet_schema()
+        self._schema = schema.remove(schema.get_field_index("platform"))
+        self.output_path.mkdir(parents=True, exist_ok=True)
+        self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="ParquetPartition")
+    
+    def _partition(self, key: Tuple[str, str]) -> _PartitionWriter:
+        """Get or create the writer for a partition."""
+        writer = self._partitions.get(key)
+        if writer is None:
+            platform, date = key
+            directory = self.output_path / f"platform={platform}" / f"date={date}"
+            writer = _PartitionWriter(directory, self._schema, self.compression, self.row_group_size)
+            self._partitions[key] = writer
+        self._partitions.move_to_end(key)
+        return writer
+    
+    def _write_batch(self, posts: List[Dict[str, Any]]) -> None:
+        """Route a batch to its partitions and write them in parallel."""
+        groups: Dict[Tuple[str, str], List[Dict[str, Any]]] = defaultdict(list)
+        for post in posts:
+            row = parquet_row(post)
+            platform = row.pop("platform")
+            date = row["created_at"].date().isoformat() if row["created_at"] else UNKNOWN_DATE
+            groups[(platform, date)].append(row)
+        
+        self._run([
+            (self._partition(key).append, rows) for key, rows in groups.items()
+        ])
+        
+        finished = []
+        dated = [date for _, date in groups if date != UNKNOWN_DATE]
+        if self.sorted_by_date and dated:
+            # The stream is ordered by created_at, so earlier dates are complete
+            oldest = min(dated)
+            finished = [key for key in self._partitions if key[1] != UNKNOWN_DATE and key[1] < oldest]
+        excess = len(self._partitions) - len(finished) - self.max_open_partitions
+        if excess > 0:
+            finished += [key for key in self._partitions if key not in finished][:excess]
+        self._run([(self._partitions.pop(key).close,) for key in finished])
+        
+        # Unsorted streams can keep many partitions half full; spill the largest buffers
+        buffered = {key: writer.buffered for key, writer in self._partitions.items()}
+        total = sum(buffered.values())
+        spill = []
+        for key in sorted(buffered, key=buffered.get, reverse=True):
+            if total <= self.max_buffered_rows:
+                break
+            spill.append(key)
+            total -= buffered[key]
+        self._run([(self._partitions[key].flush,) for key in spill])
+    
+    def _run(self, calls: List[tuple]) -> None:
+        """Run calls on the writer pool and wait for all of them."""
+        futures = [self._executor.submit(*call) for call in calls]
+        for future in futures:
+            future.result()
+    
+    def _close(self) -> None:
+        """Close every open partition and shut down the pool."""
+        try:
+            self._run([(writer.close,) for writer in self._partitions.values()])
+        finally:
+            self._partitions.clear()
+            self._executor.shutdown()
+            self._executor = None
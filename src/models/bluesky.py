@@ -1,6 +1,6 @@
 """Bluesky-specific data models."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 from pydantic import Field
@@ -93,3 +93,51 @@ class BlueskyPost(BasePost):
                 metrics=BlueskyMetrics(),
                 raw_data=str(post_view)
             )
+    
+    @classmethod
+    def from_jetstream_event(cls, event: Dict[str, Any]) -> "BlueskyPost":
+        """Create BlueskyPost from a Jetstream commit event for an ``app.bsky.feed.post`` record.
+        
+        Jetstream events identify the author by DID only, so the DID is used
+        as the handle.
+        
+        Args:
+            event: Decoded Jetstream event (``kind`` ``commit``)
+            
+        Returns:
+            Bluesky post
+        """
+        did = event.get("did", "")
+        commit = event.get("commit", {})
+        record = commit.get("record", {})
+        rkey = commit.get("rkey", "")
+        
+        try:
+            created_at = datetime.fromisoformat(record.get("createdAt", "").replace("Z", "+00:00"))
+        except ValueError:
+            created_at = datetime.fromtimestamp(event.get("time_us", 0) / 1_000_000, timezone.utc)
+        
+        tags = [
+            feature["tag"]
+            for facet in record.get("facets", [])
+            for feature in facet.get("features", [])
+            if feature.get("$type") == "app.bsky.richtext.facet#tag" and feature.get("tag")
+        ]
+        reply = record.get("reply") or {}
+        
+        return cls(
+            platform="bluesky",
+            object_id=rkey,
+            author_handle=did,
+            text=record.get("text", ""),
+            created_at=created_at,
+            tags=tags,
+            handle=did,
+            is_reply=bool(reply),
+            is_repost=False,
+            reply_to=reply.get("parent", {}).get("uri"),
+            repost_of=None,
+            url=f"https://bsky.app/profile/{did}/post/{rkey}",
+            metrics=BlueskyMetrics(),
+            raw_data=event
+        )
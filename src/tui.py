@@ -22,6 +22,8 @@ from rich.text import Text
 
 from .app import SocFlowApp
 from .collectors import BlueskyCollector, MastodonCollector, RedditCollector
+from .database import create_async_database_manager
+from .utils.rate_limit import IDLE_POLL_INTERVAL
 
 
 class SocFlowTUI:
@@ -48,6 +50,7 @@ class SocFlowTUI:
             'mastodon': {'posts': 0, 'status': 'Starting...', 'last_update': None}
         }
         self.total_posts = 0
+        self.async_db = None  # AsyncDatabaseManager for the asyncio path, opened on first use
         self.last_db_update = {}  # Cache for database counts
         self.db_update_interval = 10  # Update database counts every 10 seconds
         
@@ -89,6 +92,9 @@ class SocFlowTUI:
         """Create the footer panel."""
         total = sum(stats['posts'] for stats in self.collection_stats.values())
         footer_text = f"Total Posts: {total} | Press Ctrl+C to stop"
+        if self.app.dedup:
+            dedup = self.app.dedup.stats()
+            footer_text = f"Total Posts: {total} | Dedup hits: {dedup['hits']} ({dedup['hit_rate']:.0%}) | Press Ctrl+C to stop"
         return Panel(Align.center(footer_text), style="green")
     
     def _create_platform_panel(self, platform: str) -> Panel:
@@ -121,7 +127,7 @@ class SocFlowTUI:
             if should_update_db:
                 try:
                     # Database query is thread-safe (handled by database manager)
-                    db_count = self.app.db_manager.get_post_count(platform)
+                    db_count = self.app.read_db.get_post_count(platform)
                     self.collection_stats[platform]['posts'] = db_count
                     self.last_db_update[platform] = current_time
                 except:
@@ -135,6 +141,12 @@ class SocFlowTUI:
             self.collection_stats[platform]['last_update'] = current_time
             self.total_posts = sum(stats['posts'] for stats in self.collection_stats.values())
     
+    def _on_posts_written(self, platform: str, future):
+        """Show a failed write in the platform panel."""
+        error = future.exception()
+        if error:
+            self._update_stats(platform, 0, f"Error: {str(error)[:30]}...")
+    
     async def _collect_platform(self, platform: str, collector, kwargs: Dict[str, Any]):
         """Collect data from a specific platform asynchronously."""
         while self.running:
@@ -158,17 +170,28 @@ class SocFlowTUI:
                         )
                 except Exception as e:
                     print(f"Collection error for {platform}: {e}")
-                    posts = []
+                    # The cursors may have moved past posts that were never returned
+                    collector.restore_cursors()
+                    self._update_stats(platform, 0, f"Error: {str(e)[:30]}...")
+                    await asyncio.sleep(10)
+                    continue
+                checkpoint = collector.checkpoint()
                 
                 if posts:
-                    # Save to database
-                    self.app.db_manager.insert_posts(posts)
+                    # Same dedup filter and writer as the threaded path, without blocking the other tasks
+                    try:
+                        await self.app.submit_posts_async(posts, self.async_db)
+                    except Exception:
+                        collector.restore_cursors()
+                        raise
+                    # Every earlier batch was awaited, so this commit is in order
+                    collector.commit_checkpoint(checkpoint)
                     self._update_stats(platform, len(posts), f"Active - {len(posts)} posts")
                 else:
+                    # Nothing new yet; busy cycles are paced by the collectors' rate limiter
+                    collector.commit_checkpoint(checkpoint)
                     self._update_stats(platform, 0, "Active - No new posts")
-                
-                # Small delay between collections
-                await asyncio.sleep(10)
+                    await asyncio.sleep(IDLE_POLL_INTERVAL)
                 
             except Exception as e:
                 self._update_stats(platform, 0, f"Error: {str(e)[:30]}...")
@@ -178,6 +201,15 @@ class SocFlowTUI:
         """Start collection tasks for all platforms using asyncio."""
         tasks = []
         
+        if self.async_db is None:
+            try:
+                self.async_db = create_async_database_manager(self.app.settings.database)
+                await self.async_db.connect()
+            except (ImportError, NotImplementedError) as e:
+                # Fall back to the blocking manager, run off the event loop
+                print(f"Async database unavailable, using worker threads: {e}")
+                self.async_db = None
+        
         # Reddit task
         if 'reddit' in self.app.collectors:
             reddit_task = asyncio.create_task(
@@ -201,6 +233,16 @@ class SocFlowTUI:
         
         return tasks
     
+    async def _stop_collection_tasks(self, tasks: List[asyncio.Task]):
+        """Cancel the collection tasks and close the async database."""
+        self.running = False
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self.async_db is not None:
+            await self.async_db.close()
+            self.async_db = None
+    
     def _start_collection_subprocesses(self):
         """Start collection subprocesses for true parallelism using subprocess."""
         processes = []
@@ -223,11 +265,14 @@ while True:
         posts = collector.collect_continuous(subreddits=["all"])
         if posts:
             app.db_manager.insert_posts(posts)
+        collector.commit_checkpoint(collector.checkpoint())
         stats = {{"posts": len(posts), "status": "Active", "last_update": datetime.now().strftime("%H:%M:%S")}}
         with open(stats_file, "w") as f:
             json.dump(stats, f)
         time.sleep(10)
     except Exception as e:
+        # Refetch from the last commit instead of skipping posts that were never stored
+        collector.restore_cursors()
         stats = {{"posts": 0, "status": f"Error: {{str(e)[:30]}}", "last_update": datetime.now().strftime("%H:%M:%S")}}
         with open(stats_file, "w") as f:
             json.dump(stats, f)
@@ -254,11 +299,14 @@ while True:
         posts = collector.collect_continuous()
         if posts:
             app.db_manager.insert_posts(posts)
+        collector.commit_checkpoint(collector.checkpoint())
         stats = {{"posts": len(posts), "status": "Active", "last_update": datetime.now().strftime("%H:%M:%S")}}
         with open(stats_file, "w") as f:
             json.dump(stats, f)
         time.sleep(10)
     except Exception as e:
+        # Refetch from the last commit instead of skipping posts that were never stored
+        collector.restore_cursors()
         stats = {{"posts": 0, "status": f"Error: {{str(e)[:30]}}", "last_update": datetime.now().strftime("%H:%M:%S")}}
         with open(stats_file, "w") as f:
             json.dump(stats, f)
@@ -285,11 +333,14 @@ while True:
         posts = collector.collect_continuous()
         if posts:
             app.db_manager.insert_posts(posts)
+        collector.commit_checkpoint(collector.checkpoint())
         stats = {{"posts": len(posts), "status": "Active", "last_update": datetime.now().strftime("%H:%M:%S")}}
         with open(stats_file, "w") as f:
             json.dump(stats, f)
         time.sleep(10)
     except Exception as e:
+        # Refetch from the last commit instead of skipping posts that were never stored
+        collector.restore_cursors()
         stats = {{"posts": 0, "status": f"Error: {{str(e)[:30]}}", "last_update": datetime.now().strftime("%H:%M:%S")}}
         with open(stats_file, "w") as f:
             json.dump(stats, f)
@@ -339,6 +390,7 @@ while True:
                 # Collect posts
                 posts = collector.collect_continuous(**kwargs)
                 
+                checkpoint = collector.checkpoint()
                 if posts:
                     # Save to database
                     app.db_manager.insert_posts(posts)
@@ -346,6 +398,7 @@ while True:
                     stats_dict['status'] = f'Active - {len(posts)} posts'
                 else:
                     stats_dict['status'] = 'Active - No new posts'
+                collector.commit_checkpoint(checkpoint)
                 
                 # Write stats to file
                 with open(stats_file, 'w') as f:
@@ -355,6 +408,8 @@ while True:
                 time.sleep(10)
                 
             except Exception as e:
+                # Refetch from the last commit instead of skipping posts that were never stored
+                collector.restore_cursors()
                 stats_dict['status'] = f'Error: {str(e)[:30]}...'
                 with open(stats_file, 'w') as f:
                     json.dump(dict(stats_dict), f)
@@ -433,22 +488,37 @@ while True:
                 # Update status to show we're starting collection
                 self._update_stats(platform, 0, "Collecting...")
                 
+                if collector.restore_cursors_after_failed_write():
+                    print(f"Refetching unsaved posts from {platform} after a failed write")
+                
                 # Collect posts with timeout handling
                 try:
                     posts = collector.collect_continuous(**kwargs)
                 except Exception as e:
                     print(f"Collection error for {platform}: {e}")
-                    posts = []
+                    # The cursors may have moved past posts that were never returned
+                    collector.restore_cursors()
+                    self._update_stats(platform, 0, f"Error: {str(e)[:30]}...")
+                    time.sleep(10)
+                    continue
+                checkpoint = collector.checkpoint()
                 
                 if posts:
-                    # Save to database
-                    self.app.db_manager.insert_posts(posts)
+                    # Queue for the database writer (inserts directly when disabled)
+                    try:
+                        future = self.app.submit_posts(posts)
+                    except Exception:
+                        collector.restore_cursors()
+                        raise
+                    # Cursors are committed once these posts and every earlier batch are stored
+                    collector.commit_after_write(checkpoint, future)
+                    future.add_done_callback(lambda f, platform=platform: self._on_posts_written(platform, f))
                     self._update_stats(platform, len(posts), f"Active - {len(posts)} posts")
                 else:
+                    collector.commit_after_write(checkpoint)
+                    # Nothing new yet; busy cycles are paced by the collectors' rate limiter
                     self._update_stats(platform, 0, "Active - No new posts")
-                
-                # Small delay between collections
-                time.sleep(10)
+                    time.sleep(IDLE_POLL_INTERVAL)
                 
             except Exception as e:
                 self._update_stats(platform, 0, f"Error: {str(e)[:30]}...")
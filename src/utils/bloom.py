@@ -0,0 +1,102 @@
+"""Bloom filters for fast set-membership checks."""
+
+import hashlib
+import math
+from typing import Iterator, List
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings.
+    
+    Membership tests can return false positives (at roughly ``error_rate``
+    once ``capacity`` items are added) but never false negatives.
+    """
+    
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """Initialize an empty filter.
+        
+        Args:
+            capacity: Number of items the filter is sized for
+            error_rate: Target false-positive rate at capacity
+        """
+        if capacity <= 0:
+            raise ValueError("Bloom filter capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("Bloom filter error rate must be between 0 and 1")
+        
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+    
+    def _positions(self, item: str) -> Iterator[int]:
+        """Bit positions for an item using double hashing."""
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+    
+    def add(self, item: str) -> None:
+        """Add an item to the filter."""
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+    
+    def __contains__(self, item: str) -> bool:
+        """Check whether an item may have been added."""
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+    
+    @property
+    def is_full(self) -> bool:
+        """Whether the filter has reached its sized capacity."""
+        return self.count >= self.capacity
+
+
+class ScalableBloomFilter:
+    """Bloom filter that grows by chaining larger filters.
+    
+    Each new filter doubles the capacity and tightens the error rate so the
+    compound false-positive rate stays close to the configured target.
+    """
+    
+    GROWTH_FACTOR = 2
+    TIGHTENING_RATIO = 0.9
+    
+    def __init__(self, initial_capacity: int = 1_000_000, error_rate: float = 0.001):
+        """Initialize with a single filter.
+        
+        Args:
+            initial_capacity: Capacity of the first filter
+            error_rate: Target overall false-positive rate
+        """
+        self.error_rate = error_rate
+        self._filters: List[BloomFilter] = [
+            BloomFilter(initial_capacity, error_rate * (1 - self.TIGHTENING_RATIO))
+        ]
+    
+    def add(self, item: str) -> None:
+        """Add an item, growing the filter chain when the newest filter is full."""
+        current = self._filters[-1]
+        if current.is_full:
+            current = BloomFilter(
+                current.capacity * self.GROWTH_FACTOR,
+                current.error_rate * self.TIGHTENING_RATIO
+            )
+            self._filters.append(current)
+        current.add(item)
+    
+    def __contains__(self, item: str) -> bool:
+        """Check whether an item may have been added."""
+        return any(item in bloom for bloom in reversed(self._filters))
+    
+    def __len__(self) -> int:
+        """Number of items added."""
+        return sum(bloom.count for bloom in self._filters)
+    
+    @property
+    def size_bytes(self) -> int:
+        """Memory used by the bit arrays."""
+        return sum(len(bloom._bits) for bloom in self._filters)
@@ -0,0 +1,92 @@
+"""Compression of raw platform payloads kept outside the posts table."""
+
+import threading
+import zlib
+from typing import Tuple
+
+# zstd's default level: fast, and well ahead of zlib on JSON
+ZSTD_LEVEL = 3
+
+# zstandard's compressor and decompressor objects must not be shared between
+# threads, so each thread gets its own
+_local = threading.local()
+
+
+def _zstandard_compress(data: bytes) -> bytes:
+    """Compress with this thread's ``zstandard`` compressor."""
+    compressor = getattr(_local, "compressor", None)
+    if compressor is None:
+        compressor = _local.compressor = _zstd.ZstdCompressor(level=ZSTD_LEVEL)
+    return compressor.compress(data)
+
+
+def _zstandard_decompress(data: bytes) -> bytes:
+    """Decompress with this thread's ``zstandard`` decompressor."""
+    decompressor = getattr(_local, "decompressor", None)
+    if decompressor is None:
+        decompressor = _local.decompressor = _zstd.ZstdDecompressor()
+    return decompressor.decompress(data)
+
+
+try:
+    # Python 3.14+ standard library; the module-level functions are thread-safe
+    from compression import zstd as _zstd
+    _zstd_compress = _zstd.compress
+    _zstd_decompress = _zstd.decompress
+except ImportError:
+    try:
+        import zstandard as _zstd
+        _zstd_compress = _zstandard_compress
+        _zstd_decompress = _zstandard_decompress
+    except ImportError:
+        _zstd = None
+
+# zlib level 6 is its default; raw payloads are written once and rarely read
+ZLIB_LEVEL = 6
+
+# Codec used for new payloads: zstd when available, zlib otherwise
+DEFAULT_CODEC = "zstd" if _zstd is not None else "zlib"
+
+
+def compress(data: bytes, codec: str = DEFAULT_CODEC) -> Tuple[str, bytes]:
+    """Compress a payload.
+    
+    Args:
+        data: Uncompressed bytes
+        codec: ``zstd`` or ``zlib``
+        
+    Returns:
+        ``(codec, compressed bytes)``; store the codec with the bytes
+    """
+    if codec == "zstd":
+        if _zstd is None:
+            raise ImportError(
+                "zstandard is required for zstd compression. "
+                "Install it with: pip install zstandard or pip install socflow[zstd]"
+            )
+        return codec, _zstd_compress(data)
+    if codec == "zlib":
+        return codec, zlib.compress(data, ZLIB_LEVEL)
+    raise ValueError(f"Unknown compression codec: {codec}")
+
+
+def decompress(codec: str, data: bytes) -> bytes:
+    """Decompress a payload written by :func:`compress`.
+    
+    Args:
+        codec: Codec stored with the payload
+        data: Compressed bytes
+        
+    Returns:
+        Uncompressed bytes
+    """
+    if codec == "zstd":
+        if _zstd is None:
+            raise ImportError(
+                "zstandard is required to read zstd-compressed payloads. "
+                "Install it with: pip install zstandard or pip install socflow[zstd]"
+            )
+        return _zstd_decompress(data)
+    if codec == "zlib":
+        return zlib.decompress(data)
+    raise ValueError(f"Unknown compression codec: {codec}")
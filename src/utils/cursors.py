@@ -0,0 +1,105 @@
+"""Persistent collection cursors.
+
+Incremental collectors remember where each feed left off: a Mastodon
+``min_id``, a Bluesky search watermark, a Reddit fullname, a Jetstream
+``time_us``. :class:`CursorStore` keeps them in a small JSON file, one
+namespace per platform.
+
+Collectors move cursors forward in memory as they fetch. A cursor should only
+become durable once the posts fetched up to it are stored, so the ingest loop
+takes a :meth:`CursorStore.snapshot` when a collector hands over its posts and
+:meth:`CursorStore.commit` s it after the write succeeds. A crash in between
+refetches at most one cycle; it never skips posts. After a failed write,
+:meth:`CursorStore.restore` moves the current cursors back to the committed
+ones so the lost posts are fetched again.
+"""
+
+import copy
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+class CursorStore:
+    """Thread-safe cursor values by namespace and key, persisted as JSON."""
+    
+    def __init__(self, path: Optional[Path] = None):
+        """Load stored cursors.
+        
+        Args:
+            path: JSON file holding the cursors; None keeps them in memory only
+        """
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        self._durable: Dict[str, Dict[str, Any]] = {}
+        if self.path and self.path.exists():
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._durable = json.load(f)
+        # Cursors advanced by collectors but not committed yet
+        self._current = copy.deepcopy(self._durable)
+    
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        """Get the current value of a cursor.
+        
+        Args:
+            namespace: Platform or collector name
+            key: Feed within the namespace (instance, query, subreddit...)
+            default: Returned when the cursor was never set
+            
+        Returns:
+            A copy of the cursor value
+        """
+        with self._lock:
+            return copy.deepcopy(self._current.get(namespace, {}).get(key, default))
+    
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        """Advance a cursor in memory; it is persisted by :meth:`commit`.
+        
+        Args:
+            namespace: Platform or collector name
+            key: Feed within the namespace
+            value: JSON-serializable cursor value
+        """
+        with self._lock:
+            self._current.setdefault(namespace, {})[key] = copy.deepcopy(value)
+    
+    def snapshot(self, namespace: str) -> Dict[str, Any]:
+        """Current cursors of a namespace, to commit once the matching posts are stored."""
+        with self._lock:
+            return copy.deepcopy(self._current.get(namespace, {}))
+    
+    def commit(self, namespace: str, cursors: Optional[Dict[str, Any]] = None) -> None:
+        """Persist a namespace's cursors.
+        
+        Args:
+            namespace: Platform or collector name
+            cursors: Values from :meth:`snapshot`; defaults to the current values
+        """
+        with self._lock:
+            if cursors is None:
+                cursors = copy.deepcopy(self._current.get(namespace, {}))
+            self._durable.setdefault(namespace, {}).update(cursors)
+            self._write()
+    
+    def restore(self, namespace: str) -> None:
+        """Reset a namespace's current cursors to the committed ones.
+        
+        Args:
+            namespace: Platform or collector name
+        """
+        with self._lock:
+            self._current[namespace] = copy.deepcopy(self._durable.get(namespace, {}))
+    
+    def _write(self) -> None:
+        """Atomically replace the cursor file with the durable cursors."""
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(f".{self.path.name}.tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self._durable, f, indent=2, sort_keys=True)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
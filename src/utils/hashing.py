@@ -0,0 +1,48 @@
+"""Content hashing utilities for change detection."""
+
+import hashlib
+import json
+import unicodedata
+from typing import Any, Dict, Optional
+
+# Hex digest width stored in the database (8 bytes -> 16 characters)
+HASH_SIZE = 8
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """Normalize post text so formatting-only differences hash the same.
+    
+    Args:
+        text: Raw post text
+    
+    Returns:
+        NFC-normalized text with whitespace collapsed
+    """
+    if not text:
+        return ""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def hash_text(text: Optional[str]) -> str:
+    """Fixed-width hash of normalized post text.
+    
+    Args:
+        text: Raw post text
+    
+    Returns:
+        Hex digest
+    """
+    return hashlib.blake2b(normalize_text(text).encode("utf-8"), digest_size=HASH_SIZE).hexdigest()
+
+
+def hash_metrics(metrics: Optional[Dict[str, Any]]) -> str:
+    """Fixed-width hash of a metrics dictionary.
+    
+    Args:
+        metrics: Metrics as stored (e.g. ``post.metrics.dict()``)
+    
+    Returns:
+        Hex digest
+    """
+    payload = json.dumps(metrics or {}, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=HASH_SIZE).hexdigest()
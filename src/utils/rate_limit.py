@@ -0,0 +1,247 @@
+"""Token-bucket rate limiting driven by the quotas APIs report.
+
+Every platform tells clients how much of its quota is left:
+
+- Reddit: ``X-Ratelimit-Remaining``, ``X-Ratelimit-Used`` and
+  ``X-Ratelimit-Reset`` (seconds), surfaced by praw as ``reddit.auth.limits``
+- Mastodon: ``X-RateLimit-Limit``, ``X-RateLimit-Remaining`` and
+  ``X-RateLimit-Reset`` (ISO 8601 timestamp), parsed by Mastodon.py into
+  ``ratelimit_*`` client attributes
+- Bluesky: ``RateLimit-Limit``, ``RateLimit-Remaining`` and
+  ``RateLimit-Reset`` (Unix timestamp)
+
+:class:`TokenBucket` spreads the remaining requests evenly over what is left
+of the server's window, so collectors run exactly as fast as their quota
+allows instead of sleeping a fixed time between calls. :data:`rate_limiter`
+holds one bucket per platform, account and instance and is shared by every
+collector in the process.
+"""
+
+import math
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, Mapping, Optional, Tuple
+
+# Requests per second before a platform has reported its quota
+DEFAULT_RATES = {
+    "reddit": 100 / 60,  # 100 requests per minute with OAuth
+    "mastodon": 300 / 300,  # 300 requests per 5 minutes
+    "bluesky": 3000 / 300,  # 3000 requests per 5 minutes
+}
+FALLBACK_RATE = 1.0
+
+# Requests that may be issued back to back when the bucket is full
+DEFAULT_BURST = 5.0
+
+# Seconds to wait after a collection cycle that found nothing new
+IDLE_POLL_INTERVAL = 5.0
+
+# Reset values above this are Unix timestamps rather than seconds from now
+EPOCH_THRESHOLD = 1e9
+
+
+def parse_rate_limit_headers(
+    headers: Mapping[str, str],
+    now: Optional[float] = None
+) -> Optional[Tuple[float, float, Optional[float]]]:
+    """Read a quota from ``X-RateLimit-*`` or ``RateLimit-*`` response headers.
+    
+    Args:
+        headers: Response headers (any case)
+        now: Current Unix time; defaults to ``time.time()``
+        
+    Returns:
+        ``(remaining, seconds until reset, limit)``, or None when the response
+        carries no quota; ``limit`` is None when not reported
+    """
+    lowered = {key.lower(): value for key, value in headers.items()}
+    
+    def header(name: str) -> Optional[str]:
+        return lowered.get(f"x-ratelimit-{name}", lowered.get(f"ratelimit-{name}"))
+    
+    remaining, reset = header("remaining"), header("reset")
+    if remaining is None or reset is None:
+        return None
+    now = time.time() if now is None else now
+    
+    try:
+        remaining = float(remaining)
+        try:
+            reset = float(reset)
+            # Bluesky sends a Unix timestamp, Reddit the seconds left in the window
+            reset_in = reset - now if reset > EPOCH_THRESHOLD else reset
+        except ValueError:
+            # Mastodon sends an ISO 8601 timestamp
+            reset_at = datetime.fromisoformat(reset.replace("Z", "+00:00"))
+            if reset_at.tzinfo is None:
+                reset_at = reset_at.replace(tzinfo=timezone.utc)
+            reset_in = reset_at.timestamp() - now
+        
+        limit = header("limit")
+        used = header("used")
+        if limit is not None:
+            limit = float(limit)
+        elif used is not None:
+            limit = remaining + float(used)
+    except ValueError:
+        return None
+    return remaining, max(reset_in, 0.0), limit
+
+
+class TokenBucket:
+    """Thread-safe token bucket whose refill rate follows the server's quota.
+    
+    Until the server reports a quota the bucket refills at ``base_rate``.
+    After :meth:`update` it refills so that the reported remaining requests
+    last exactly until the window resets; with nothing left it stays empty
+    until the reset. Requests costing more than ``burst`` tokens (several
+    pages in one call) wait for a full bucket and leave it in debt.
+    """
+    
+    def __init__(
+        self,
+        base_rate: float,
+        burst: float = DEFAULT_BURST,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """Initialize a full bucket.
+        
+        Args:
+            base_rate: Tokens per second while no quota is known
+            burst: Bucket capacity
+            clock: Monotonic clock in seconds
+            sleep: Function used to wait
+        """
+        if base_rate <= 0 or burst <= 0:
+            raise ValueError("Rate and burst must be positive")
+        self.base_rate = base_rate
+        self.rate = base_rate
+        self.burst = burst
+        self.tokens = burst
+        self.limit: Optional[float] = None
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._reset_at: Optional[float] = None
+        self._lock = threading.Lock()
+    
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last call."""
+        if self._reset_at is not None and now >= self._reset_at:
+            # The server's window rolled over: its full quota is available again
+            self._reset_at = None
+            self.rate = self.base_rate
+            self.tokens = max(self.tokens, self.burst)
+        else:
+            self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Wait until a request may be issued and take its tokens.
+        
+        Args:
+            tokens: Cost of the request, e.g. the number of pages it fetches
+            
+        Returns:
+            Seconds spent waiting
+        """
+        needed = min(tokens, self.burst)
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                if self.tokens >= needed:
+                    self.tokens -= tokens
+                    return waited
+                wait = (needed - self.tokens) / self.rate if self.rate > 0 else math.inf
+                if self._reset_at is not None:
+                    wait = min(wait, self._reset_at - now)
+            wait = max(wait, 0.001)
+            self._sleep(wait)
+            waited += wait
+    
+    def update(self, remaining: float, reset_in: float, limit: Optional[float] = None) -> None:
+        """Align the bucket with the quota the server reported.
+        
+        Args:
+            remaining: Requests left in the current window
+            reset_in: Seconds until the window resets
+            limit: Requests allowed per window, if reported
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self.limit = limit
+            self._reset_at = now + reset_in
+            # Never hold more tokens than the server still allows
+            self.tokens = min(self.tokens, max(remaining, 0.0))
+            if reset_in <= 0:
+                self.rate = self.base_rate
+            else:
+                # Spread what is left after the tokens in hand over the rest of the window
+                self.rate = max(remaining - self.tokens, 0.0) / reset_in
+    
+    def status(self) -> Dict[str, Optional[float]]:
+        """Current tokens, refill rate and quota limit, for logging."""
+        with self._lock:
+            self._refill(self._clock())
+            return {"tokens": self.tokens, "rate": self.rate, "limit": self.limit}
+
+
+class RateLimiter:
+    """Token buckets keyed by platform, account and instance."""
+    
+    def __init__(self, rates: Optional[Dict[str, float]] = None, burst: float = DEFAULT_BURST):
+        """Initialize without buckets; they are created on first use.
+        
+        Args:
+            rates: Requests per second per platform before a quota is reported
+            burst: Capacity of every bucket
+        """
+        self.rates = dict(DEFAULT_RATES if rates is None else rates)
+        self.burst = burst
+        self._buckets: Dict[Tuple[str, str, str], TokenBucket] = {}
+        self._lock = threading.Lock()
+    
+    def configure(self, platform: str, requests_per_minute: float) -> None:
+        """Set a platform's rate for buckets created from now on."""
+        self.rates[platform] = requests_per_minute / 60
+    
+    def bucket(self, platform: str, account: str = "", instance: str = "") -> TokenBucket:
+        """Get the bucket of a platform, account and instance, creating it if needed."""
+        key = (platform, account, instance)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = TokenBucket(self.rates.get(platform, FALLBACK_RATE), self.burst)
+                self._buckets[key] = bucket
+            return bucket
+    
+    def acquire(self, platform: str, account: str = "", instance: str = "", tokens: float = 1.0) -> float:
+        """Wait for a bucket's tokens; see :meth:`TokenBucket.acquire`."""
+        return self.bucket(platform, account, instance).acquire(tokens)
+    
+    def update_from_headers(
+        self,
+        headers: Mapping[str, str],
+        platform: str,
+        account: str = "",
+        instance: str = ""
+    ) -> bool:
+        """Feed a bucket from response headers.
+        
+        Returns:
+            True if the headers carried a quota
+        """
+        quota = parse_rate_limit_headers(headers)
+        if quota is None:
+            return False
+        self.bucket(platform, account, instance).update(*quota)
+        return True
+
+
+# Shared by every collector in the process
+rate_limiter = RateLimiter()
@@ -0,0 +1,89 @@
+"""Tests for the SocFlow application."""
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from src.app import SocFlowApp
+from src.database.sqlite import SQLiteManager
+
+
+@pytest.fixture
+def dedup_config_file(temp_dir: Path, temp_config_file: Path) -> Path:
+    """Test config with the dedup filter enabled and output under the temp dir."""
+    with open(temp_config_file) as f:
+        config = yaml.safe_load(f)
+    config['app']['output_dir'] = str(temp_dir / 'data')
+    config['database']['dedup'] = {'enabled': True}
+    with open(temp_config_file, 'w') as f:
+        yaml.dump(config, f)
+    return temp_config_file
+
+
+class TestDedupWarm:
+    """Test lazy warming of the dedup filter."""
+
+    def test_warmed_on_first_submit(self, dedup_config_file, temp_dir, sample_posts):
+        """Construction does not scan the database; the first write does."""
+        manager = SQLiteManager(f"sqlite:///{temp_dir / 'test.db'}")
+        manager.create_tables([])
+        manager.insert_posts(sample_posts)
+        manager.close()
+
+        app = SocFlowApp(str(dedup_config_file))
+        try:
+            assert app.dedup.stats()["cached_keys"] == 0
+
+            counts = app.submit_posts(sample_posts[:2]).result(timeout=10)
+
+            assert app.dedup.stats()["cached_keys"] == len(sample_posts)
+            # Both posts were known from the warm scan and never reached the database
+            assert counts["skipped"] == 2
+            assert counts["inserted"] == 0
+        finally:
+            app.close()
+
+
+class TestSubmitPostsAsync:
+    """Test the event-loop write path used by the TUI."""
+
+    @pytest.mark.asyncio
+    async def test_async_db_path_uses_dedup(self, dedup_config_file, sample_posts):
+        """Without the writer, batches go to the async manager through the dedup filter."""
+        pytest.importorskip("aiosqlite")
+        from src.database import create_async_database_manager
+
+        app = SocFlowApp(str(dedup_config_file))
+        app.create_tables()
+        async_db = create_async_database_manager(app.settings.database)
+        await async_db.connect()
+        try:
+            first = await app.submit_posts_async(sample_posts, async_db)
+            again = await app.submit_posts_async(sample_posts, async_db)
+        finally:
+            await async_db.close()
+            app.close()
+
+        assert first["inserted"] == len(sample_posts)
+        # Dropped by the filter before reaching the database
+        assert again["skipped"] == len(sample_posts)
+        assert app.dedup.stats()["hits"] == len(sample_posts)
+
+    @pytest.mark.asyncio
+    async def test_writer_path(self, dedup_config_file, sample_posts):
+        """With the writer enabled, batches join its queue."""
+        with open(dedup_config_file) as f:
+            config = yaml.safe_load(f)
+        config['database']['writer'] = {'enabled': True, 'max_latency_ms': 10}
+        with open(dedup_config_file, 'w') as f:
+            yaml.dump(config, f)
+
+        app = SocFlowApp(str(dedup_config_file))
+        app.create_tables()
+        try:
+            counts = await app.submit_posts_async(sample_posts, async_db=None)
+            assert counts["inserted"] == len(sample_posts)
+            assert app.db_writer is not None
+        finally:
+            app.close()
@@ -0,0 +1,77 @@
+"""Tests for the asyncio database manager."""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+
+from src.config.settings import MetricsHistoryConfig
+from src.database.sqlite import SQLiteManager
+from src.models.base import BasePost, Metrics
+
+pytest.importorskip("aiosqlite")
+
+from src.database.async_sqlite import AsyncSQLiteManager  # noqa: E402
+
+
+def make_post(i: int, text: str = None, likes: int = 0, raw_data: dict = None) -> BasePost:
+    """A post keyed by ``i``."""
+    return BasePost(
+        platform="mastodon",
+        object_id=str(i),
+        author_handle="user",
+        text=text or f"Post {i}",
+        created_at=datetime.now() - timedelta(minutes=i),
+        metrics=Metrics(likes=likes),
+        raw_data=raw_data,
+    )
+
+
+@pytest_asyncio.fixture
+async def managers(temp_dir: Path):
+    """Async and blocking managers on one database file, both recording metrics history."""
+    connection_string = f"sqlite:///{temp_dir / 'async.db'}"
+    history = MetricsHistoryConfig(enabled=True)
+    async_manager = AsyncSQLiteManager(connection_string, metrics_history=history)
+    await async_manager.connect()
+    await async_manager.create_tables([])
+    sync_manager = SQLiteManager(connection_string, metrics_history=history)
+    yield async_manager, sync_manager
+    await async_manager.close()
+    sync_manager.close()
+
+
+class TestAsyncSQLiteManager:
+    """Test the aiosqlite manager against the blocking one."""
+
+    @pytest.mark.asyncio
+    async def test_writes_match_blocking_manager(self, managers):
+        """Both managers see each other's rows as stored and unchanged."""
+        async_manager, sync_manager = managers
+        posts = [make_post(i, raw_data={"i": i}) for i in range(10)]
+
+        assert (await async_manager.insert_posts(posts))["inserted"] == 10
+        assert sync_manager.insert_posts(posts)["skipped"] == 10
+
+        counts = await async_manager.insert_posts([make_post(0, text="Edited"), make_post(1, likes=4)])
+        assert (counts["updated"], counts["metrics_updated"]) == (1, 1)
+        assert sync_manager.insert_posts([make_post(0, text="Edited"), make_post(1, likes=4)])["skipped"] == 2
+
+        stored = {post["object_id"]: post for post in sync_manager.iter_posts(include_raw=True)}
+        assert stored["0"]["text"] == "Edited"
+        # The edit carried no payload, so the old one was dropped
+        assert stored["0"]["raw_data"] is None
+        assert stored["2"]["raw_data"] == {"i": 2}
+        assert sync_manager.get_metrics_history("mastodon", "1")
+        assert await async_manager.get_post_count("mastodon") == 10
+
+    @pytest.mark.asyncio
+    async def test_iter_posts_order(self, managers):
+        async_manager, sync_manager = managers
+        sync_manager.insert_posts([make_post(i) for i in range(25)])
+
+        posts = [post async for post in async_manager.iter_posts(batch_size=4)]
+
+        # make_post(i) is i minutes old, so creation order is descending i
+        assert [post["object_id"] for post in posts] == [str(i) for i in range(24, -1, -1)]
@@ -0,0 +1,520 @@
+"""Tests for the data collectors (mocked)."""
+
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import Future
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import websockets
+
+from src.collectors import bluesky as bluesky_module
+from src.collectors import mastodon as mastodon_module
+from src.collectors import reddit as reddit_module
+from src.collectors.bluesky import BlueskyCollector
+from src.collectors.jetstream import JetstreamCollector
+from src.collectors.mastodon import MastodonCollector
+from src.collectors.reddit import LISTING_PAGE_SIZE, RedditCollector
+from src.utils.cursors import CursorStore
+
+
+class FakeReddit:
+    """Serves ``new`` listings and ``/api/info`` from in-memory subreddits."""
+
+    def __init__(self):
+        self.subreddits = {}
+        self.deleted = []
+        self.published = {}
+        self.calls = []
+        self.auth = SimpleNamespace(limits={})
+
+    def add(self, name: str, count: int, start: float, step: float) -> None:
+        """Publish ``count`` submissions, ``step`` seconds apart."""
+        listing = self.subreddits.setdefault(name, [])
+        for i in range(count):
+            number = self.published.get(name, 0) + i
+            listing.append(SimpleNamespace(
+                id=f"{name}{number}", fullname=f"t3_{name}{number}", created_utc=start + i * step, author="user",
+            ))
+        self.published[name] = self.published.get(name, 0) + count
+
+    def delete(self, name: str) -> None:
+        """Delete the newest submission; it leaves the listing but ``/api/info`` still returns it."""
+        submission = self.subreddits[name].pop()
+        submission.author = None
+        self.deleted.append(submission)
+
+    def get(self, path: str, params: dict) -> list:
+        self.calls.append((path, dict(params)))
+        if path == "api/info":
+            everything = [s for listing in self.subreddits.values() for s in listing] + self.deleted
+            return [s for s in everything if s.fullname == params["id"]]
+        newest_first = self.subreddits[path.split("/")[1]][::-1]
+        limit = params["limit"]
+        for key in ("before", "after"):
+            if key in params:
+                index = next((i for i, s in enumerate(newest_first) if s.fullname == params[key]), None)
+                if index is None:
+                    return []
+                return newest_first[max(0, index - limit):index] if key == "before" else newest_first[index + 1:index + 1 + limit]
+        return newest_first[:limit]
+
+
+@pytest.fixture
+def reddit(monkeypatch):
+    """Incremental Reddit collector on a fake client and clock."""
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(reddit_module, "time", SimpleNamespace(time=lambda: clock.now))
+    monkeypatch.setattr(reddit_module.praw, "Reddit", lambda **kwargs: FakeReddit())
+    monkeypatch.setattr(reddit_module.RedditPost, "from_praw_submission", staticmethod(lambda s: s.id))
+    collector = RedditCollector({
+        "client_id": "id", "client_secret": "secret", "incremental": True,
+        "max_pages_per_cycle": 10, "max_poll_interval": 300,
+    })
+    monkeypatch.setattr(collector, "_acquire", lambda *args, **kwargs: None)
+    return collector, collector.reddit, clock
+
+
+class TestRedditIncremental:
+    """Test ``before=`` paging of the ``new`` listing."""
+
+    def test_pages_forward_and_schedules_by_rate(self, reddit):
+        collector, fake, clock = reddit
+        fake.add("busy", 150, 0, 1.0)
+        fake.add("quiet", 5, 0, 100.0)
+
+        assert len(collector.collect_continuous(subreddits=["busy", "quiet"])) == 105
+        state = collector.cursors.get("reddit", "busy")
+        assert state["before"] == "t3_busy149"
+        assert state["rate"] == pytest.approx(1.0, rel=0.02)
+
+        # Neither subreddit expects enough new submissions yet
+        clock.now += 10
+        fake.calls.clear()
+        assert collector.collect_continuous(subreddits=["busy", "quiet"]) == []
+        assert fake.calls == []
+
+        # A burst larger than the page budget is read over two cycles, in order
+        clock.now += 50
+        fake.add("busy", 350, 150, 0.17)
+        collector.config["max_pages_per_cycle"] = 2
+        got = collector.collect_continuous(subreddits=["busy", "quiet"])
+        assert got == [f"busy{i}" for i in range(150, 350)]
+        assert collector.cursors.get("reddit", "busy")["behind"]
+
+        clock.now += 1
+        got += collector.collect_continuous(subreddits=["busy", "quiet"])
+        assert got == [f"busy{i}" for i in range(150, 500)]
+        assert not collector.cursors.get("reddit", "busy")["behind"]
+
+    def test_empty_page_with_live_cursor(self, reddit):
+        """Nothing new costs the ``before=`` page and the cursor check, not the newest page."""
+        collector, fake, clock = reddit
+        fake.add("news", 10, 0, 1.0)
+        collector.collect_continuous(subreddits=["news"])
+
+        clock.now += 400
+        fake.calls.clear()
+        assert collector.collect_continuous(subreddits=["news"]) == []
+        assert [path for path, _ in fake.calls] == ["r/news/new", "api/info"]
+        assert collector.cursors.get("reddit", "news")["before"] == "t3_news9"
+
+    def test_deleted_cursor_falls_back_to_newest_page(self, reddit):
+        collector, fake, clock = reddit
+        fake.add("news", 10, 0, 1.0)
+        collector.collect_continuous(subreddits=["news"])
+
+        clock.now += 400
+        fake.delete("news")
+        fake.add("news", 3, 1000, 1.0)
+        assert collector.collect_continuous(subreddits=["news"]) == ["news10", "news11", "news12"]
+        assert collector.cursors.get("reddit", "news")["before"] == "t3_news12"
+
+        # The new cursor works with before= again
+        clock.now += 400
+        fake.calls.clear()
+        assert collector.collect_continuous(subreddits=["news"]) == []
+        assert [path for path, _ in fake.calls] == ["r/news/new", "api/info"]
+
+    def test_deleted_cursor_gap_is_backfilled(self, reddit):
+        """A full fallback page records the submissions before it as a gap and pages back to the old cursor."""
+        collector, fake, clock = reddit
+        fake.add("news", 10, 0, 1.0)
+        collector.collect_continuous(subreddits=["news"])
+
+        clock.now += 400
+        fake.delete("news")
+        fake.add("news", 2 * LISTING_PAGE_SIZE + 30, 1000, 1.0)
+        collector.config["max_pages_per_cycle"] = 3
+        got = collector.collect_continuous(subreddits=["news"])
+        # The newest page, then one page of the gap
+        assert len(got) == 2 * LISTING_PAGE_SIZE
+        state = collector.cursors.get("reddit", "news")
+        assert state["behind"] and state["gaps"]
+
+        clock.now += 1
+        got += collector.collect_continuous(subreddits=["news"])
+        assert sorted(got, key=lambda id_: int(id_[4:])) == [f"news{i}" for i in range(10, 10 + 2 * LISTING_PAGE_SIZE + 30)]
+        assert len(set(got)) == len(got)
+        state = collector.cursors.get("reddit", "news")
+        assert state["gaps"] == [] and not state["behind"]
+
+
+class FakeMastodon:
+    """Serves a public timeline of statuses with ids ``1..n``."""
+
+    ratelimit_remaining = 300
+    ratelimit_limit = 300
+
+    def __init__(self, access_token: str, api_base_url: str):
+        self.api_base_url = api_base_url
+        self.ids = []
+        self.calls = []
+
+    @property
+    def ratelimit_reset(self) -> float:
+        return time.time() + 300
+
+    def account_verify_credentials(self) -> dict:
+        return {}
+
+    def timeline_public(self, limit: int, min_id=None, max_id=None, since_id=None) -> list:
+        self.calls.append({"min_id": min_id, "max_id": max_id, "since_id": since_id})
+        ids = [
+            i for i in self.ids
+            if (max_id is None or i < int(max_id))
+            and (since_id is None or i > int(since_id))
+            and (min_id is None or i > int(min_id))
+        ]
+        # min_id pages start just after the cursor; the others start at the newest status
+        ids = ids[:limit] if min_id is not None else ids[-limit:]
+        return [{"id": str(i)} for i in sorted(ids, reverse=True)]
+
+
+@pytest.fixture
+def mastodon(monkeypatch):
+    """Factory of Mastodon collectors on one fake instance, returning status ids."""
+    monkeypatch.setattr(mastodon_module, "Mastodon", FakeMastodon)
+
+    def make(cursors: CursorStore, **config) -> MastodonCollector:
+        collector = MastodonCollector({
+            "access_token": "token", "instances": ["https://example.social"],
+            "page_size": 10, "max_pages_per_cycle": 3, **config,
+        })
+        collector.cursors = cursors
+        monkeypatch.setattr(collector, "_acquire", lambda *args, **kwargs: None)
+        monkeypatch.setattr(collector, "_convert_statuses", lambda client, statuses: [int(s["id"]) for s in statuses])
+        return collector
+
+    return make
+
+
+class TestMastodonIncremental:
+    """Test ``min_id`` paging and gap backfill."""
+
+    def test_pages_forward_from_min_id(self, mastodon):
+        collector = mastodon(CursorStore())
+        instance = collector.clients["https://example.social"]
+        instance.ids = list(range(1, 31))
+
+        assert collector.collect_continuous() == list(range(30, 20, -1))
+        assert collector.cursors.get("mastodon", "https://example.social#public") == {"min_id": "30", "gaps": []}
+
+        instance.ids += list(range(31, 56))
+        instance.calls.clear()
+        assert sorted(collector.collect_continuous()) == list(range(31, 56))
+        assert [call["min_id"] for call in instance.calls] == ["30", "40", "50"]
+
+        instance.calls.clear()
+        assert collector.collect_continuous() == []
+        assert instance.calls == [{"min_id": "55", "max_id": None, "since_id": None}]
+
+    def test_backfill_on_first_poll(self, mastodon):
+        collector = mastodon(CursorStore(), backfill_pages=2)
+        collector.clients["https://example.social"].ids = list(range(1, 131))
+        # The newest page and two pages of history
+        assert collector.collect_continuous() == list(range(130, 100, -1))
+
+    def test_restart_resumes_from_committed_cursor(self, mastodon, temp_dir):
+        """Statuses published while stopped are backfilled from the committed ``min_id``."""
+        path = temp_dir / "cursors.json"
+        collector = mastodon(CursorStore(path))
+        collector.clients["https://example.social"].ids = list(range(1, 31))
+        collector.collect_continuous()
+        collector.commit_checkpoint(collector.checkpoint())
+        # Fetched but never stored
+        collector.clients["https://example.social"].ids = list(range(1, 41))
+        collector.collect_continuous()
+
+        restarted = mastodon(CursorStore(path))
+        restarted.clients["https://example.social"].ids = list(range(1, 81))
+        seen = []
+        for _ in range(4):
+            seen += restarted.collect_continuous()
+
+        assert sorted(seen) == list(range(31, 81))
+        assert restarted.cursors.get("mastodon", "https://example.social#public") == {"min_id": "80", "gaps": []}
+
+
+
+class TestCheckpointOrdering:
+    """Test that checkpoints are committed in hand-off order and only after their writes."""
+
+    def test_empty_cycle_waits_for_pending_write(self, mastodon, temp_dir):
+        path = temp_dir / "cursors.json"
+        collector = mastodon(CursorStore(path))
+        collector.clients["https://example.social"].ids = list(range(1, 11))
+        collector.collect_continuous()
+        write = Future()
+        first = collector.commit_after_write(collector.checkpoint(), write)
+        # The next cycle finds nothing new; its checkpoint includes the queued posts
+        assert collector.collect_continuous() == []
+        second = collector.commit_after_write(collector.checkpoint())
+
+        assert not first.done() and not second.done()
+        assert CursorStore(path).get("mastodon", "https://example.social#public") is None
+
+        write.set_result(None)
+        second.result(timeout=1)
+        assert CursorStore(path).get("mastodon", "https://example.social#public")["min_id"] == "10"
+
+    def test_failed_write_blocks_later_commits_and_restores(self, mastodon, temp_dir):
+        path = temp_dir / "cursors.json"
+        collector = mastodon(CursorStore(path))
+        instance = collector.clients["https://example.social"]
+        instance.ids = list(range(1, 11))
+        collector.collect_continuous()
+        collector.commit_after_write(collector.checkpoint()).result(timeout=1)
+
+        instance.ids = list(range(1, 21))
+        collector.collect_continuous()
+        write = Future()
+        collector.commit_after_write(collector.checkpoint(), write)
+        instance.ids = list(range(1, 31))
+        collector.collect_continuous()
+        later = Future()
+        collector.commit_after_write(collector.checkpoint(), later)
+
+        write.set_exception(RuntimeError("disk full"))
+        later.set_result(None)
+        assert CursorStore(path).get("mastodon", "https://example.social#public")["min_id"] == "10"
+
+        assert collector.restore_cursors_after_failed_write()
+        assert not collector.restore_cursors_after_failed_write()
+        # Everything since the last commit is fetched again
+        assert sorted(collector.collect_continuous()) == list(range(11, 31))
+        collector.commit_after_write(collector.checkpoint()).result(timeout=1)
+        assert CursorStore(path).get("mastodon", "https://example.social#public")["min_id"] == "30"
+
+
+class FakeBlueskySearch:
+    """Serves ``searchPosts`` over posts ``1..count``, newest first, two per timestamp."""
+
+    def __init__(self):
+        self.count = 0
+        self.calls = []
+
+    @staticmethod
+    def stamp(i: int) -> str:
+        return (datetime(2025, 1, 1) + timedelta(seconds=i // 2)).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+    def search_posts(self, params: dict) -> SimpleNamespace:
+        self.calls.append(dict(params))
+        assert params["sort"] == "latest"
+        posts = [
+            SimpleNamespace(uri=f"at://post/{i}", indexed_at=self.stamp(i), record=SimpleNamespace(created_at=self.stamp(i)))
+            for i in range(self.count, 0, -1)
+        ]
+        if "since" in params:
+            posts = [post for post in posts if post.indexed_at >= params["since"]]
+        offset = int(params.get("cursor") or 0)
+        page = posts[offset:offset + params["limit"]]
+        more = offset + len(page) < len(posts)
+        return SimpleNamespace(posts=page, cursor=str(offset + len(page)) if more else None)
+
+
+@pytest.fixture
+def bluesky(monkeypatch):
+    """Bluesky collector on a fake search endpoint, returning post numbers."""
+    search = FakeBlueskySearch()
+    client = SimpleNamespace(login=lambda handle, password: None, app=SimpleNamespace(bsky=SimpleNamespace(feed=search)))
+    monkeypatch.setattr(bluesky_module, "Client", lambda **kwargs: client)
+    monkeypatch.setattr(bluesky_module, "Request", lambda **kwargs: None)
+    collector = BlueskyCollector({"handle": "user", "password": "secret", "page_size": 10, "max_pages_per_cycle": 3})
+    monkeypatch.setattr(collector, "_acquire", lambda *args, **kwargs: None)
+    monkeypatch.setattr(collector, "_convert_post_views", lambda views: [int(view.uri.rsplit("/", 1)[1]) for view in views])
+    return collector, search
+
+
+class TestBlueskyIncremental:
+    """Test ``since`` watermarks of keyword searches."""
+
+    def test_since_watermark(self, bluesky):
+        """Posts sharing the watermark's timestamp are returned once."""
+        collector, search = bluesky
+        search.count = 25
+        assert collector._search_incremental("ai") == list(range(25, 15, -1))
+        assert collector._search_incremental("ai") == []
+        assert search.calls[-1]["since"] == FakeBlueskySearch.stamp(25)
+
+        # 26 shares a timestamp with the old watermark
+        search.count = 27
+        assert collector._search_incremental("ai") == [27, 26]
+
+    def test_resumes_paging_cursor(self, bluesky):
+        """A burst larger than the page budget continues from the stored cursor without gaps."""
+        collector, search = bluesky
+        search.count = 27
+        collector._search_incremental("ai")
+
+        search.count = 80
+        assert collector._search_incremental("ai") == list(range(80, 50, -1))
+        assert collector.cursors.get("bluesky", "ai")["resume"]["cursor"] == "30"
+
+        # New posts shift the results, so the resumed pages may repeat some but skip none
+        search.count = 85
+        assert set(range(28, 51)) <= set(collector._search_incremental("ai"))
+        assert "resume" not in collector.cursors.get("bluesky", "ai")
+        assert collector._search_incremental("ai") == [85, 84, 83, 82, 81]
+
+
+def jetstream_event(i: int, operation: str = "create", collection: str = "app.bsky.feed.post") -> dict:
+    """A Jetstream commit event, ``i`` seconds after a fixed time."""
+    return {
+        "did": f"did:plc:user{i}",
+        "time_us": 1_700_000_000_000_000 + i * 1_000_000,
+        "kind": "commit",
+        "commit": {
+            "operation": operation,
+            "collection": collection,
+            "rkey": f"k{i}",
+            "record": {"text": f"Post {i}", "createdAt": "2024-09-09T19:46:02.102Z"},
+        },
+    }
+
+
+@pytest.fixture
+def jetstream_server():
+    """Local Jetstream replaying ``events`` from the requested cursor.
+
+    The first connection is dropped after ``drop_after`` events. Yields the
+    server state: its ``uri`` and the query of each ``connection``.
+    """
+    server = SimpleNamespace(events=[], drop_after=None, connections=[], uri=None)
+    ready = threading.Event()
+    loop = asyncio.new_event_loop()
+
+    async def handler(websocket):
+        query = parse_qs(urlsplit(websocket.request.path).query)
+        server.connections.append(query)
+        start = int(query["cursor"][0]) if "cursor" in query else 0
+        first = len(server.connections) == 1
+        sent = 0
+        for event in server.events:
+            if event["time_us"] < start:
+                continue
+            await websocket.send(json.dumps(event))
+            sent += 1
+            if first and sent == server.drop_after:
+                return
+        await websocket.wait_closed()
+
+    async def main():
+        async with websockets.serve(handler, "127.0.0.1", 0) as ws_server:
+            server.uri = f"ws://127.0.0.1:{ws_server.sockets[0].getsockname()[1]}/subscribe"
+            ready.set()
+            await stopped
+
+    stopped = loop.create_future()
+    thread = threading.Thread(target=lambda: loop.run_until_complete(main()), daemon=True)
+    thread.start()
+    ready.wait()
+    yield server
+    loop.call_soon_threadsafe(stopped.set_result, None)
+    thread.join(timeout=10)
+    loop.close()
+
+
+def jetstream_collector(uri: str, cursors: CursorStore = None, **config) -> JetstreamCollector:
+    """Jetstream collector with short batches and reconnect delays."""
+    collector = JetstreamCollector({
+        "enabled": True, "uri": uri, "batch_size": 10, "batch_latency_ms": 300,
+        "reconnect_initial_seconds": 0.05, "cursor_rewind_seconds": 0, **config,
+    })
+    if cursors is not None:
+        collector.cursors = cursors
+    return collector
+
+
+class TestJetstream:
+    """Test the Jetstream subscription against a local server."""
+
+    def test_reconnect_resumes_from_last_event(self, jetstream_server, temp_dir):
+        jetstream_server.events = [jetstream_event(i) for i in range(1, 41)]
+        jetstream_server.events += [jetstream_event(41, operation="delete"), jetstream_event(42, collection="app.bsky.feed.like")]
+        jetstream_server.drop_after = 15
+        collector = jetstream_collector(jetstream_server.uri, CursorStore(temp_dir / "cursors.json"))
+
+        seen = []
+        deadline = time.monotonic() + 10
+        try:
+            while time.monotonic() < deadline and len(set(seen)) < 40:
+                batch = collector.collect_continuous()
+                assert len(batch) <= 10
+                seen += [post.object_id for post in batch]
+                collector.commit_checkpoint(collector.checkpoint())
+        finally:
+            collector.close()
+
+        # The event at the cursor is replayed after the reconnect
+        assert list(dict.fromkeys(seen)) == [f"k{i}" for i in range(1, 41)]
+        assert collector.reconnects == 1
+        first, second = jetstream_server.connections
+        assert second["wantedCollections"] == ["app.bsky.feed.post"]
+        assert int(second["cursor"][0]) == jetstream_server.events[14]["time_us"]
+        # Deletes and likes are not posts, but the stored cursor is that of the last post
+        stored = json.loads((temp_dir / "cursors.json").read_text())
+        assert stored["jetstream"]["time_us"] == jetstream_server.events[39]["time_us"]
+
+    def test_restart_resumes_from_committed_cursor(self, jetstream_server, temp_dir):
+        jetstream_server.events = [jetstream_event(i) for i in range(1, 41)]
+        cursors = CursorStore(temp_dir / "cursors.json")
+        cursors.set("jetstream", "time_us", jetstream_server.events[39]["time_us"])
+        cursors.commit("jetstream", cursors.snapshot("jetstream"))
+
+        collector = jetstream_collector(jetstream_server.uri, CursorStore(temp_dir / "cursors.json"), cursor_rewind_seconds=5)
+        try:
+            batch = collector.collect_continuous()
+        finally:
+            collector.close()
+
+        assert int(jetstream_server.connections[0]["cursor"][0]) == jetstream_server.events[39]["time_us"] - 5_000_000
+        assert [post.object_id for post in batch] == [f"k{i}" for i in range(35, 41)]
+
+    def test_backoff_when_unreachable(self):
+        collector = jetstream_collector("ws://127.0.0.1:1/subscribe", reconnect_max_seconds=0.2)
+        assert collector.collect_continuous() == []
+        time.sleep(1.0)
+        collector.close()
+        # Doubling from 0.05 s up to 0.2 s, with jitter, fits a handful of attempts in a second
+        assert 3 <= collector.reconnects <= 15
+
+    def test_close_with_full_queue(self, jetstream_server):
+        """A stream held back by a full queue still stops on close."""
+        jetstream_server.events = [jetstream_event(i) for i in range(1, 11)]
+        collector = jetstream_collector(jetstream_server.uri, max_queue_size=2)
+        collector.start()
+        deadline = time.monotonic() + 5
+        while not collector._events.full() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        thread = collector._thread
+
+        started = time.monotonic()
+        collector.close()
+
+        assert time.monotonic() - started < 3
+        assert not thread.is_alive()
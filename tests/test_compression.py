@@ -0,0 +1,72 @@
+"""Tests for raw payload compression."""
+
+import json
+import os
+import threading
+
+import pytest
+
+from src.utils import compression
+from src.utils.compression import DEFAULT_CODEC, compress, decompress
+
+# Before Python 3.14 zstd comes from the zstandard package
+USES_ZSTANDARD = compression._zstd_compress is compression._zstandard_compress
+
+
+def payload(i: int) -> bytes:
+    """A JSON payload of a few kilobytes, different for every ``i``."""
+    return json.dumps({"id": i, "text": "lorem ipsum " * (50 + i % 50), "noise": os.urandom(64).hex()}).encode()
+
+
+class TestCompression:
+    """Test the compression codecs."""
+
+    @pytest.mark.parametrize("codec", sorted({"zlib", DEFAULT_CODEC}))
+    def test_round_trip(self, codec):
+        data = payload(1)
+        stored_codec, compressed = compress(data, codec)
+        assert stored_codec == codec
+        assert len(compressed) < len(data)
+        assert decompress(stored_codec, compressed) == data
+
+    def test_unknown_codec(self):
+        with pytest.raises(ValueError):
+            compress(b"data", "lz4")
+        with pytest.raises(ValueError):
+            decompress("lz4", b"data")
+
+    def test_concurrent_threads(self):
+        """Threads compressing and decompressing at once never corrupt each other's data."""
+        errors = []
+        barrier = threading.Barrier(8)
+
+        def work(offset: int) -> None:
+            try:
+                barrier.wait()
+                for i in range(offset, offset + 300):
+                    data = payload(i)
+                    assert decompress(*compress(data)) == data
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=work, args=(n * 1000,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
+
+    @pytest.mark.skipif(not USES_ZSTANDARD, reason="zstandard package not in use")
+    def test_zstandard_objects_per_thread(self):
+        """Each thread gets its own zstandard compressor."""
+        compress(b"main thread")
+        compressors = [compression._local.compressor]
+
+        def work() -> None:
+            compress(b"other thread")
+            compressors.append(compression._local.compressor)
+
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+        assert compressors[0] is not compressors[1]
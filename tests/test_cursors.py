@@ -0,0 +1,62 @@
+"""Tests for persistent collection cursors."""
+
+import json
+
+from src.utils.cursors import CursorStore
+
+
+class TestCursorStore:
+    """Test the snapshot and commit cycle."""
+
+    def test_set_is_not_durable_until_commit(self, temp_dir):
+        path = temp_dir / "cursors.json"
+        store = CursorStore(path)
+        store.set("mastodon", "feed", {"min_id": "10"})
+        assert store.get("mastodon", "feed") == {"min_id": "10"}
+        assert not path.exists()
+        assert CursorStore(path).get("mastodon", "feed") is None
+
+    def test_commit_snapshot_not_later_values(self, temp_dir):
+        """Only the cursors taken with the stored posts are persisted."""
+        path = temp_dir / "cursors.json"
+        store = CursorStore(path)
+        store.set("mastodon", "feed", {"min_id": "10"})
+        checkpoint = store.snapshot("mastodon")
+        store.set("mastodon", "feed", {"min_id": "20"})
+        store.commit("mastodon", checkpoint)
+
+        assert json.loads(path.read_text()) == {"mastodon": {"feed": {"min_id": "10"}}}
+        assert store.get("mastodon", "feed") == {"min_id": "20"}
+
+        resumed = CursorStore(path)
+        assert resumed.get("mastodon", "feed") == {"min_id": "10"}
+
+    def test_commit_keeps_other_namespaces(self, temp_dir):
+        path = temp_dir / "cursors.json"
+        store = CursorStore(path)
+        store.set("jetstream", "time_us", 1)
+        store.commit("jetstream")
+        store.set("reddit", "news", {"before": "t3_a"})
+        store.commit("reddit")
+
+        resumed = CursorStore(path)
+        assert resumed.get("jetstream", "time_us") == 1
+        assert resumed.get("reddit", "news") == {"before": "t3_a"}
+
+    def test_values_are_copies(self):
+        store = CursorStore()
+        state = {"gaps": []}
+        store.set("mastodon", "feed", state)
+        state["gaps"].append(1)
+        store.get("mastodon", "feed")["gaps"].append(2)
+        assert store.get("mastodon", "feed") == {"gaps": []}
+
+    def test_restore_returns_to_committed_values(self):
+        store = CursorStore()
+        store.set("mastodon", "feed", {"min_id": "10"})
+        store.commit("mastodon")
+        store.set("mastodon", "feed", {"min_id": "20"})
+        store.set("mastodon", "local", {"min_id": "5"})
+        store.restore("mastodon")
+        assert store.get("mastodon", "feed") == {"min_id": "10"}
+        assert store.get("mastodon", "local") is None
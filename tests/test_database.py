@@ -0,0 +1,467 @@
+"""Tests for the SQLite database manager."""
+
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.database.base import BatchWriteError
+from src.database.retention import compact_database
+from src.config.settings import MetricsHistoryConfig, RetentionConfig, RetentionPolicy
+from src.database import sqlite as sqlite_module
+from src.database.sqlite import SQLiteManager, plan_history_samples, utcnow
+from src.database.writer import DatabaseWriter, PlatformWriters
+from src.models.base import BasePost, Metrics
+
+
+def make_post(i: int, text: str = None, likes: int = 0, platform: str = "reddit") -> BasePost:
+    """A post keyed by ``i``."""
+    return BasePost(
+        platform=platform,
+        object_id=str(i),
+        author_handle=f"user_{i}",
+        text=text or f"Post {i}",
+        created_at=datetime(2025, 1, 1) + timedelta(minutes=i),
+        metrics=Metrics(likes=likes),
+    )
+
+
+@pytest.fixture
+def manager(test_db_manager: SQLiteManager) -> SQLiteManager:
+    """Test manager with its tables created."""
+    test_db_manager.create_tables([])
+    return test_db_manager
+
+
+class TestInsertPosts:
+    """Test the bulk upsert path."""
+
+    def test_counts(self, manager):
+        assert manager.insert_posts([make_post(i) for i in range(20)]) == {
+            "inserted": 20, "updated": 0, "metrics_updated": 0, "skipped": 0,
+        }
+
+        counts = manager.insert_posts([make_post(0, text="Edited"), make_post(1, likes=3), make_post(2), make_post(20)])
+        assert counts == {"inserted": 1, "updated": 1, "metrics_updated": 1, "skipped": 1}
+        assert manager.get_post_count() == 21
+
+        stored = {post["object_id"]: post for post in manager.iter_posts()}
+        assert stored["0"]["text"] == "Edited"
+        assert stored["1"]["metrics"]["likes"] == 3
+
+    def test_duplicate_in_batch_keeps_last(self, manager):
+        counts = manager.insert_posts([make_post(0), make_post(0, text="Later")])
+        assert (counts["inserted"], counts["skipped"]) == (1, 1)
+        assert [post["text"] for post in manager.iter_posts()] == ["Later"]
+
+    def test_batches_counted_separately(self, manager):
+        """A group commit reports each batch's counts as if it were written alone."""
+        results = manager.insert_post_batches([[make_post(0)], [make_post(0, text="Edited"), make_post(1)]])
+        assert [(counts["inserted"], counts["updated"]) for counts in results] == [(1, 0), (1, 1)]
+
+
+
+def metrics_json(likes: int) -> str:
+    return f'{{"likes": {likes}}}'
+
+
+class TestMetricsHistory:
+    """Test engagement sampling and where its rows are stored."""
+
+    NOW = datetime(2025, 1, 10)
+    CONFIG = MetricsHistoryConfig(intervals=[(1, 1), (24, 15)], max_interval=60)
+
+    def test_first_observation_is_sampled(self):
+        samples = plan_history_samples({7: (self.NOW, metrics_json(3))}, {}, self.NOW, self.CONFIG)
+        assert samples == [{"post_id": 7, "observed_at": self.NOW, "likes": 3, "shares": 0, "comments": 0, "score": 0}]
+
+    def test_unchanged_metrics_are_not_sampled(self):
+        last = {7: (self.NOW - timedelta(days=30), (3, 0, 0, 0))}
+        assert plan_history_samples({7: (self.NOW - timedelta(days=60), metrics_json(3))}, last, self.NOW, self.CONFIG) == []
+
+    def test_changes_sampled_once_per_age_tier_interval(self):
+        # A post two hours old is sampled at most every 15 minutes
+        created_at = self.NOW - timedelta(hours=2)
+        observations = {7: (created_at, metrics_json(4))}
+        recent = {7: (self.NOW - timedelta(minutes=10), (3, 0, 0, 0))}
+        due = {7: (self.NOW - timedelta(minutes=15), (3, 0, 0, 0))}
+        assert plan_history_samples(observations, recent, self.NOW, self.CONFIG) == []
+        assert [s["likes"] for s in plan_history_samples(observations, due, self.NOW, self.CONFIG)] == [4]
+
+        # Posts older than every tier use max_interval
+        old = {7: (self.NOW - timedelta(days=5), metrics_json(4))}
+        assert plan_history_samples(old, due, self.NOW, self.CONFIG) == []
+
+    def test_samples_written_on_change_after_interval(self, temp_dir, monkeypatch):
+        clock = [self.NOW]
+        monkeypatch.setattr(sqlite_module, "utcnow", lambda: clock[0])
+        manager = SQLiteManager(f"sqlite:///{temp_dir / 'history.db'}", metrics_history=MetricsHistoryConfig(enabled=True))
+        try:
+            manager.create_tables([])
+            manager.insert_posts([make_post(0, likes=1)])
+            manager.insert_posts([make_post(0, likes=2)])
+            clock[0] += timedelta(days=2)
+            manager.insert_posts([make_post(0, likes=2)])
+            manager.insert_posts([make_post(0, likes=5), make_post(1)])
+            history = manager.get_metrics_history("reddit", "0")
+        finally:
+            manager.close()
+
+        assert [(row["observed_at"], row["likes"]) for row in history] == [
+            (self.NOW, 1),
+            (self.NOW + timedelta(days=2), 5),
+        ]
+
+    def test_history_follows_platform_database(self, temp_dir):
+        path = temp_dir / "split.db"
+        manager = SQLiteManager(
+            f"sqlite:///{path}", separate_databases=True, metrics_history=MetricsHistoryConfig(enabled=True)
+        )
+        try:
+            manager.create_tables(["reddit", "mastodon"])
+            manager.insert_posts([make_post(0, likes=1, platform="reddit"), make_post(0, likes=2, platform="mastodon")])
+            assert [row["likes"] for row in manager.get_metrics_history("mastodon", "0")] == [2]
+            assert [row["likes"] for row in manager.get_metrics_history("reddit", "0")] == [1]
+        finally:
+            manager.close()
+
+        for platform, likes in (("reddit", 1), ("mastodon", 2)):
+            with sqlite3.connect(temp_dir / f"{platform}_split.db") as conn:
+                assert conn.execute("SELECT likes FROM post_metrics_history").fetchall() == [(likes,)]
+        with sqlite3.connect(path) as conn:
+            assert conn.execute("SELECT count(*) FROM post_metrics_history").fetchone() == (0,)
+
+
+
+def assert_counts_match(manager: SQLiteManager) -> None:
+    """The trigger-maintained counters agree with a scan of ``posts``."""
+    with manager.engine.connect() as conn:
+        total = conn.exec_driver_sql("SELECT count(*) FROM posts").scalar()
+        by_platform = dict(conn.exec_driver_sql("SELECT platform, count(*) FROM posts GROUP BY platform").all())
+        daily = conn.exec_driver_sql(
+            "SELECT platform, date(created_at), count(*) FROM posts GROUP BY 2, 1 ORDER BY 2, 1"
+        ).all()
+    assert manager.get_post_count() == total
+    # Platforms whose posts were all deleted keep a zero counter
+    assert {platform: count for platform, count in manager.get_post_counts().items() if count} == by_platform
+    assert {platform: manager.get_post_count(platform) for platform in by_platform} == by_platform
+    assert manager.get_daily_post_counts() == [tuple(row) for row in daily]
+
+
+class TestPostCounts:
+    """Test that the post_counts triggers track every change to ``posts``."""
+
+    def test_insert_and_update(self, manager):
+        manager.insert_posts([make_post(i) for i in range(2000)] + [make_post(i, platform="mastodon") for i in range(5)])
+        assert_counts_match(manager)
+
+        manager.insert_posts([make_post(0, text="Edited"), make_post(1, likes=4), make_post(2000)])
+        assert manager.get_post_count("reddit") == 2001
+        assert_counts_match(manager)
+
+    def test_manual_update_moves_count(self, manager):
+        manager.insert_posts([make_post(i) for i in range(3)])
+        with manager.engine.begin() as conn:
+            conn.exec_driver_sql("UPDATE posts SET created_at = '2025-03-01 00:00:00.000000' WHERE object_id = '0'")
+            conn.exec_driver_sql("UPDATE posts SET platform = 'bluesky' WHERE object_id = '1'")
+        assert manager.get_post_counts() == {"reddit": 2, "bluesky": 1}
+        assert_counts_match(manager)
+
+    def test_delete_and_retention(self, manager):
+        manager.insert_posts([make_post(i) for i in range(10)] + [make_post(i, platform="mastodon") for i in range(10)])
+        with manager.engine.begin() as conn:
+            conn.exec_driver_sql("DELETE FROM posts WHERE platform = 'mastodon' AND object_id IN ('0', '1')")
+        assert_counts_match(manager)
+
+        assert manager.delete_posts("reddit", datetime(2025, 1, 1, 0, 4), batch_size=3) == 4
+        assert_counts_match(manager)
+
+        config = RetentionConfig(default=RetentionPolicy(post_days=1), batch_size=3, batch_pause_ms=0)
+        compact_database(manager, config, now=datetime(2025, 1, 3))
+        assert manager.get_post_count() == 0
+        assert_counts_match(manager)
+
+    def test_backfill_of_existing_database(self, temp_dir):
+        """Databases created before the triggers get their counters rebuilt once."""
+        path = temp_dir / "old.db"
+        manager = SQLiteManager(f"sqlite:///{path}")
+        manager.create_tables([])
+        manager.insert_posts([make_post(i) for i in range(7)] + [make_post(i, platform="mastodon") for i in range(3)])
+        manager.close()
+        with sqlite3.connect(path) as conn:
+            for name in ("posts_count_insert", "posts_count_delete", "posts_count_update"):
+                conn.execute(f"DROP TRIGGER {name}")
+            conn.execute("DELETE FROM post_counts")
+            conn.execute("INSERT INTO post_counts VALUES ('reddit', '2025-01-01', 99)")
+
+        manager = SQLiteManager(f"sqlite:///{path}")
+        try:
+            manager.create_tables([])
+            assert manager.get_post_counts() == {"reddit": 7, "mastodon": 3}
+            assert_counts_match(manager)
+            # Created again without double counting
+            manager.create_tables([])
+            manager.insert_posts([make_post(7)])
+            assert manager.get_post_count() == 11
+            assert_counts_match(manager)
+        finally:
+            manager.close()
+
+
+class TestIterPosts:
+    """Test keyset-paginated streaming."""
+
+    def test_order_across_batches(self, manager):
+        """Rows sharing a timestamp are ordered by id, with none skipped or repeated at batch edges."""
+        posts = [make_post(i) for i in range(10)]
+        for post in posts[4:8]:
+            post.created_at = posts[4].created_at
+        manager.insert_posts(posts[::-1])
+
+        streamed = list(manager.iter_posts(batch_size=3))
+
+        keys = [(post["created_at"], post["id"]) for post in streamed]
+        assert keys == sorted(keys)
+        assert sorted(post["object_id"] for post in streamed) == sorted(str(i) for i in range(10))
+
+    def test_filters(self, manager):
+        manager.insert_posts([make_post(i) for i in range(10)] + [make_post(i, platform="mastodon") for i in range(3)])
+        start = datetime(2025, 1, 1) + timedelta(minutes=2)
+        end = datetime(2025, 1, 1) + timedelta(minutes=5)
+
+        streamed = manager.iter_posts(platform="reddit", since=start, until=end, batch_size=2)
+
+        assert [post["object_id"] for post in streamed] == ["2", "3", "4"]
+
+    def test_separate_databases_merged(self, temp_dir):
+        manager = SQLiteManager(f"sqlite:///{temp_dir / 'split.db'}", separate_databases=True)
+        try:
+            manager.create_tables(["reddit", "mastodon"])
+            manager.insert_posts([make_post(i, platform="reddit") for i in range(0, 10, 2)])
+            manager.insert_posts([make_post(i, platform="mastodon") for i in range(1, 10, 2)])
+
+            streamed = list(manager.iter_posts(batch_size=2))
+        finally:
+            manager.close()
+
+        assert [post["object_id"] for post in streamed] == [str(i) for i in range(10)]
+
+
+
+@pytest.fixture
+def split_manager(temp_dir):
+    """Manager storing reddit and mastodon posts in their own database files."""
+    manager = SQLiteManager(f"sqlite:///{temp_dir / 'split.db'}", separate_databases=True)
+    manager.create_tables(["reddit", "mastodon"])
+    yield manager
+    manager.close()
+
+
+class TestSeparateDatabases:
+    """Test reads and writes across two platform databases."""
+
+    def test_merged_keyset_order(self, split_manager):
+        # Both files hand out the same row ids; several posts share a timestamp across platforms
+        reddit = [make_post(i, platform="reddit") for i in range(0, 30, 2)]
+        mastodon = [make_post(i, platform="mastodon") for i in range(1, 30, 2)]
+        for post in mastodon[:5]:
+            post.created_at = reddit[3].created_at
+        split_manager.insert_posts(reddit[::-1])
+        split_manager.insert_posts(mastodon)
+
+        streamed = list(split_manager.iter_posts(batch_size=4))
+        keys = [(post["created_at"], post["id"]) for post in streamed]
+        assert keys == sorted(keys)
+        assert sorted((post["platform"], post["object_id"]) for post in streamed) == sorted(
+            (post.platform, post.object_id) for post in reddit + mastodon
+        )
+
+        start = datetime(2025, 1, 1) + timedelta(minutes=10)
+        window = split_manager.iter_posts(since=start, until=start + timedelta(minutes=5), batch_size=2)
+        assert [post["object_id"] for post in window] == ["10", "11", "12", "13", "14"]
+
+    def test_combined_counts(self, split_manager):
+        split_manager.insert_posts([make_post(i, platform="reddit") for i in range(7)])
+        split_manager.insert_posts([make_post(i, platform="mastodon") for i in range(3)])
+        assert split_manager.get_post_count() == 10
+        assert split_manager.get_post_count("mastodon") == 3
+        assert split_manager.get_post_counts() == {"reddit": 7, "mastodon": 3}
+        assert split_manager.get_daily_post_counts() == [("mastodon", "2025-01-01", 3), ("reddit", "2025-01-01", 7)]
+
+    def test_platform_writers_mixed_batches(self, split_manager, temp_dir):
+        with PlatformWriters(split_manager, max_latency=0.05) as writers:
+            first = writers.submit([make_post(i, platform=("reddit", "mastodon")[i % 2]) for i in range(10)])
+            second = writers.submit([
+                make_post(0, text="Edited", platform="reddit"),
+                make_post(1, likes=2, platform="mastodon"),
+                make_post(10, platform="mastodon"),
+            ])
+            reddit_only = writers.submit([make_post(2, platform="reddit")])
+            assert first.result(timeout=10) == {"inserted": 10, "updated": 0, "metrics_updated": 0, "skipped": 0}
+            assert second.result(timeout=10) == {"inserted": 1, "updated": 1, "metrics_updated": 1, "skipped": 0}
+            assert reddit_only.result(timeout=10)["skipped"] == 1
+            assert sorted(writers._writers) == ["mastodon", "reddit"]
+
+        assert split_manager.get_post_counts() == {"reddit": 5, "mastodon": 6}
+        for platform, count in (("reddit", 5), ("mastodon", 6)):
+            with sqlite3.connect(temp_dir / f"{platform}_split.db") as conn:
+                assert conn.execute("SELECT platform, count(*) FROM posts GROUP BY platform").fetchall() == [(platform, count)]
+
+
+class TestChangedPosts:
+    """Test incremental export scans."""
+
+    def test_watermark_resumes_after_last_row(self, manager):
+        """A watermark from the last exported row picks up only later changes."""
+        manager.insert_posts([make_post(i) for i in range(10)])
+        first = list(manager.iter_changed_posts(batch_size=3))
+        assert [post["object_id"] for post in first] == [str(i) for i in range(10)]
+
+        last = first[-1]
+        manager.set_export_watermark("out.csv", datetime.fromisoformat(last["updated_at"]), last["id"])
+        watermark = manager.get_export_watermark("out.csv")
+        assert list(manager.iter_changed_posts(after=watermark)) == []
+
+        # An edit and an engagement change are both picked up
+        manager.insert_posts([make_post(3, text="Edited"), make_post(7, likes=5)])
+        changed = list(manager.iter_changed_posts(after=watermark, batch_size=1))
+        assert [post["object_id"] for post in changed] == ["3", "7"]
+
+    def test_horizon_excludes_later_writes(self, manager):
+        """Rows stamped after the scan starts wait for the next run."""
+        manager.insert_posts([make_post(i) for i in range(3)])
+        posts = manager.iter_changed_posts(batch_size=1)
+        manager.insert_posts([make_post(3)])
+        assert [post["object_id"] for post in posts] == ["0", "1", "2"]
+
+    def test_horizon_waits_for_other_process_writer(self, manager, temp_dir):
+        """The horizon is ordered after a write transaction open in another connection."""
+        manager.insert_posts([make_post(0)])
+
+        # Another process stamps a row and holds its transaction open
+        other = sqlite3.connect(temp_dir / "test.db", isolation_level=None)
+        other.execute("BEGIN IMMEDIATE")
+        other.execute(
+            "INSERT INTO posts (platform, object_id, author_handle, text, created_at, updated_at) "
+            "VALUES ('reddit', 'late', 'user', 'Late', ?, ?)",
+            (datetime(2025, 1, 1).isoformat(" "), utcnow().isoformat(" "))
+        )
+
+        result = []
+        scan = threading.Thread(target=lambda: result.extend(manager.iter_changed_posts()))
+        scan.start()
+        time.sleep(0.2)
+        assert scan.is_alive()
+        other.execute("COMMIT")
+        other.close()
+        scan.join(timeout=10)
+
+        assert [post["object_id"] for post in result] == ["0", "late"]
+
+
+class TestDatabaseWriter:
+    """Test group commits through the writer thread."""
+
+    def test_futures_resolve_per_batch(self, manager):
+        """Batches committed as one group each get their own counts."""
+        with DatabaseWriter(manager, max_latency=0.5) as writer:
+            first = writer.submit([make_post(i) for i in range(3)])
+            second = writer.submit([make_post(0, text="Edited"), make_post(3)])
+            assert first.result(timeout=10)["inserted"] == 3
+            assert (second.result(timeout=10)["inserted"], second.result()["updated"]) == (1, 1)
+            assert (writer.groups_committed, writer.batches_committed) == (1, 2)
+
+    def test_failed_batch_fails_only_its_future(self, manager, monkeypatch):
+        insert_post_batches = manager.insert_post_batches
+
+        def failing_insert(batches):
+            if any(post.text == "Bad" for posts in batches for post in posts):
+                raise ValueError("bad batch")
+            return insert_post_batches(batches)
+
+        # The group fails, then each batch is retried on its own
+        monkeypatch.setattr(manager, "insert_post_batches", failing_insert)
+
+        with DatabaseWriter(manager, max_latency=0.5) as writer:
+            good = writer.submit([make_post(0)])
+            bad = writer.submit([make_post(1, text="Bad")])
+            assert good.result(timeout=10)["inserted"] == 1
+            with pytest.raises(ValueError, match="bad batch"):
+                bad.result(timeout=10)
+        assert manager.get_post_count() == 1
+
+    def test_submit_after_close(self, manager):
+        writer = DatabaseWriter(manager)
+        writer.close()
+        with pytest.raises(RuntimeError):
+            writer.submit([make_post(0)])
+
+    def test_partial_group_is_not_rewritten(self, temp_dir, monkeypatch):
+        """A group whose other platform committed reports those posts as inserted, not as retried duplicates."""
+        manager = SQLiteManager(f"sqlite:///{temp_dir / 'split.db'}", separate_databases=True)
+        manager.create_tables(["reddit", "mastodon"])
+        write_posts = manager._write_posts
+
+        def failing_write(conn, posts):
+            if any(post.text == "Bad" for post in posts):
+                raise ValueError("bad batch")
+            return write_posts(conn, posts)
+
+        monkeypatch.setattr(manager, "_write_posts", failing_write)
+        try:
+            mixed = [make_post(0), make_post(1, platform="mastodon")]
+            bad = [make_post(2, text="Bad", platform="mastodon")]
+            with pytest.raises(BatchWriteError) as raised:
+                manager.insert_post_batches([mixed, bad])
+            assert raised.value.results[0]["inserted"] == 2
+            assert list(raised.value.errors) == [1]
+
+            with DatabaseWriter(manager, max_latency=0.5) as writer:
+                good = writer.submit([make_post(3), make_post(4, platform="mastodon")])
+                failed = writer.submit(bad)
+                assert good.result(timeout=10)["inserted"] == 2
+                with pytest.raises(ValueError):
+                    failed.result(timeout=10)
+            assert manager.get_post_counts() == {"reddit": 2, "mastodon": 2}
+        finally:
+            manager.close()
+
+    def test_close_with_full_queue(self, manager, monkeypatch):
+        """Closing never waits on a submit blocked by a full queue."""
+        release = threading.Event()
+        insert_post_batches = manager.insert_post_batches
+        monkeypatch.setattr(manager, "insert_post_batches", lambda batches: release.wait() and insert_post_batches(batches))
+
+        writer = DatabaseWriter(manager, max_latency=0, max_queue_size=1)
+        first = writer.submit([make_post(0)])
+        # The writer holds the first batch, so this one fills the queue
+        time.sleep(0.1)
+        writer.submit([make_post(1)])
+        errors = []
+
+        def blocked_submit():
+            try:
+                writer.submit([make_post(2)])
+            except RuntimeError as e:
+                errors.append(e)
+
+        submitter = threading.Thread(target=blocked_submit)
+        submitter.start()
+        time.sleep(0.1)
+
+        started = time.monotonic()
+        writer.close(timeout=0.2)
+        assert time.monotonic() - started < 2
+        submitter.join(timeout=2)
+        assert len(errors) == 1
+
+        release.set()
+        assert first.result(timeout=10)["inserted"] == 1
+
+    def test_platform_writers_sum_counts(self, manager):
+        with PlatformWriters(manager, max_latency=0.05) as writers:
+            counts = writers.submit([make_post(0), make_post(1, platform="mastodon")]).result(timeout=10)
+        assert counts["inserted"] == 2
+        assert manager.get_post_counts() == {"reddit": 1, "mastodon": 1}
@@ -0,0 +1,102 @@
+"""Tests for the dedup filter in front of the database."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.database import sqlite as sqlite_module
+from src.database.dedup import DedupFilter
+from src.database.sqlite import SQLiteManager
+from src.models.base import BasePost, Metrics
+
+
+def make_post(i: int, text: str = None, likes: int = 0) -> BasePost:
+    """A post keyed by ``i``."""
+    return BasePost(
+        platform="reddit",
+        object_id=str(i),
+        author_handle="user",
+        text=text or f"Post {i}",
+        created_at=datetime(2025, 1, 1) + timedelta(minutes=i),
+        metrics=Metrics(likes=likes),
+    )
+
+
+@pytest.fixture
+def manager(test_db_manager: SQLiteManager) -> SQLiteManager:
+    """Test manager with its tables created."""
+    test_db_manager.create_tables([])
+    return test_db_manager
+
+
+@pytest.fixture
+def looked_up(monkeypatch):
+    """Keys the SQLite manager looks up, per query."""
+    queries = []
+    key_lookup_queries = sqlite_module.key_lookup_queries
+
+    def recording(post_keys, columns):
+        queries.append(list(post_keys))
+        return key_lookup_queries(post_keys, columns)
+
+    monkeypatch.setattr(sqlite_module, "key_lookup_queries", recording)
+    return queries
+
+
+class TestDedupFilter:
+    """Test the Bloom filter and LRU."""
+
+    def test_bloom_miss_claimed_once(self):
+        dedup = DedupFilter(lru_size=10, bloom_capacity=100)
+        assert dedup.filter([make_post(0)]) == [make_post(0)]
+        # A second copy before the first is written hits the Bloom filter
+        assert len(dedup.filter([make_post(0)])) == 1
+
+        assert dedup.claim_unseen([("reddit", "0"), ("reddit", "1")]) == {("reddit", "0")}
+        assert dedup.claim_unseen([("reddit", "0")]) == set()
+        assert dedup.stats()["definitely_new"] == 1
+
+    def test_drops_stored_unchanged(self):
+        dedup = DedupFilter(lru_size=10, bloom_capacity=100)
+        dedup.remember(dedup.filter([make_post(0), make_post(1)]))
+
+        kept = dedup.filter([make_post(0), make_post(1, likes=2), make_post(2)])
+
+        assert [post.object_id for post in kept] == ["1", "2"]
+        assert dedup.stats()["hits"] == 1
+
+    def test_remember_clears_unclaimed_keys(self):
+        """A post written without a claim, e.g. by a manager without the hook, is looked up next time."""
+        dedup = DedupFilter(lru_size=10, bloom_capacity=100)
+        dedup.remember(dedup.filter([make_post(0)]))
+        assert dedup.claim_unseen([("reddit", "0")]) == set()
+
+
+class TestExistenceLookup:
+    """Test the lookups the filter saves the database."""
+
+    def test_new_keys_are_not_looked_up(self, manager, looked_up):
+        manager.insert_posts([make_post(i) for i in range(5)])
+        dedup = DedupFilter(lru_size=2, bloom_capacity=100)
+        dedup.warm(manager, limit=2)
+        manager.key_filter = dedup
+        looked_up.clear()
+
+        posts = dedup.filter([make_post(i, text=f"Edited {i}") for i in range(3, 8)])
+        counts = manager.insert_posts(posts)
+
+        assert (counts["inserted"], counts["updated"]) == (3, 2)
+        # Only the stored keys were looked up; ids are looked up afterwards for the payloads
+        assert sorted(looked_up[0]) == [("reddit", "3"), ("reddit", "4")]
+        assert dedup.stats()["lookups_skipped"] == 3
+
+    def test_second_write_of_new_key_is_looked_up(self, manager, looked_up):
+        dedup = DedupFilter(lru_size=10, bloom_capacity=100)
+        manager.key_filter = dedup
+        first = dedup.filter([make_post(0)])
+        second = dedup.filter([make_post(0, likes=3)])
+
+        assert manager.insert_posts(first)["inserted"] == 1
+        looked_up.clear()
+        assert manager.insert_posts(second)["metrics_updated"] == 1
+        assert looked_up[0] == [("reddit", "0")]
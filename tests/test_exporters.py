@@ -0,0 +1,129 @@
+"""Tests for data exporters."""
+
+import csv
+import json
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.exporters import PartitionedParquetExporter, create_exporter, iter_batches
+from src.exporters.base import EXPORT_COLUMNS, flatten_row
+from src.models.base import BasePost, Metrics
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+@pytest.fixture
+def stored_posts(test_db_manager):
+    """Post dictionaries spread over 20 days, in random order."""
+    test_db_manager.create_tables([])
+    test_db_manager.insert_posts([
+        BasePost(
+            platform="reddit",
+            object_id=str(i),
+            author_handle="user",
+            text=f"Post {i}",
+            created_at=datetime(2025, 1, 1) + timedelta(days=i % 20, seconds=i),
+            metrics=Metrics(likes=i),
+        )
+        for i in range(1000)
+    ])
+    posts = list(test_db_manager.iter_posts())
+    random.Random(0).shuffle(posts)
+    return posts
+
+
+def read_back(path) -> list:
+    """Rows of an exported file, as comparable dictionaries."""
+    if path.suffix == ".json":
+        return json.loads(path.read_text())
+    if path.suffix == ".jsonl":
+        return [json.loads(line) for line in path.read_text().splitlines()]
+    if path.suffix == ".csv":
+        with open(path, newline="") as f:
+            return list(csv.DictReader(f))
+    return pq.read_table(path).to_pylist()
+
+
+def expected_rows(posts: list, suffix: str) -> list:
+    """What :func:`read_back` returns for the exported posts."""
+    if suffix in (".json", ".jsonl"):
+        return [json.loads(json.dumps(post, default=str)) for post in posts]
+    rows = [flatten_row(post) for post in posts]
+    if suffix == ".csv":
+        return [{key: "" if value is None else str(value) for key, value in row.items()} for row in rows]
+    for row in rows:
+        for column in ("created_at", "updated_at"):
+            row[column] = datetime.fromisoformat(row[column])
+        for column in ("is_comment", "is_nsfw", "is_reply", "is_repost", "is_reblog", "is_sensitive"):
+            if row[column] is not None:
+                row[column] = bool(row[column])
+    return rows
+
+
+class TestExporters:
+    """Test that every format round-trips posts streamed in chunks."""
+
+    @pytest.mark.parametrize("suffix", [".json", ".jsonl", ".csv", ".parquet"])
+    def test_round_trip_over_several_chunks(self, temp_dir, stored_posts, suffix):
+        path = temp_dir / f"export{suffix}"
+        with create_exporter(path) as exporter:
+            # A generator, as streamed from the database, spanning four chunks
+            for batch in iter_batches((post for post in stored_posts), 300):
+                exporter.write_batch(batch)
+
+        assert exporter.rows_written == 1000
+        assert read_back(path) == expected_rows(stored_posts, suffix)
+        if suffix == ".csv":
+            with open(path, newline="") as f:
+                assert next(csv.reader(f)) == EXPORT_COLUMNS
+        if suffix == ".parquet":
+            assert pq.ParquetFile(path).num_row_groups == 4
+
+    @pytest.mark.parametrize("suffix", [".jsonl", ".csv"])
+    def test_append_keeps_earlier_rows(self, temp_dir, stored_posts, suffix):
+        path = temp_dir / f"export{suffix}"
+        for start in (0, 500):
+            with create_exporter(path, append=True) as exporter:
+                for batch in iter_batches(stored_posts[start:start + 500], 300):
+                    exporter.write_batch(batch)
+
+        assert read_back(path) == expected_rows(stored_posts, suffix)
+
+    @pytest.mark.parametrize("suffix", [".json", ".jsonl", ".csv", ".parquet"])
+    def test_empty_iterator(self, temp_dir, suffix):
+        path = temp_dir / f"export{suffix}"
+        with create_exporter(path) as exporter:
+            for batch in iter_batches(iter([]), 300):
+                exporter.write_batch(batch)
+
+        assert exporter.rows_written == 0
+        assert not path.exists()
+
+    def test_empty_partitioned_dataset(self, temp_dir):
+        with create_exporter(temp_dir / "dataset", partitioned=True) as exporter:
+            for batch in iter_batches(iter([]), 300):
+                exporter.write_batch(batch)
+        assert exporter.rows_written == 0
+        assert not (temp_dir / "dataset").exists()
+
+
+class TestPartitionedParquetExporter:
+    """Test the hive-partitioned Parquet exporter."""
+
+    def test_buffered_rows_are_capped(self, temp_dir, stored_posts):
+        """Unsorted streams spill the largest buffers instead of growing without bound."""
+        exporter = PartitionedParquetExporter(
+            temp_dir / "dataset", row_group_size=500, sorted_by_date=False, max_buffered_rows=120
+        )
+        with exporter:
+            for batch in iter_batches(stored_posts, 50):
+                exporter.write_batch(batch)
+                assert sum(writer.buffered for writer in exporter._partitions.values()) <= 120
+                # Every partition stays open; only its buffer was written early
+                assert len(exporter._partitions) <= 20
+
+        table = pq.read_table(temp_dir / "dataset")
+        assert table.num_rows == 1000
+        assert len(list((temp_dir / "dataset" / "platform=reddit").iterdir())) == 20
@@ -0,0 +1,146 @@
+"""Tests for the PostgreSQL database manager.
+
+Tests that need a server run only when ``SOCFLOW_TEST_POSTGRESQL_URL`` is
+set, e.g. ``postgresql+psycopg://socflow@localhost/socflow_test``. They drop
+and recreate SocFlow's tables in that database.
+"""
+
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.config.settings import PostgreSQLConfig
+from src.database.postgresql import uncovered_ranges
+from src.models.base import BasePost, Metrics
+
+POSTGRESQL_URL = os.environ.get("SOCFLOW_TEST_POSTGRESQL_URL")
+
+JAN = datetime(2025, 1, 1)
+FEB = datetime(2025, 2, 1)
+
+
+def make_post(i: int, created_at: datetime, text: str = None, likes: int = 0) -> BasePost:
+    """A post keyed by ``i``."""
+    return BasePost(
+        platform="reddit",
+        object_id=str(i),
+        author_handle="user",
+        text=text or f"Post {i}",
+        created_at=created_at,
+        metrics=Metrics(likes=likes),
+    )
+
+
+class TestUncoveredRanges:
+    """Test the gap computation behind partition creation."""
+
+    def test_no_partitions(self):
+        assert uncovered_ranges(JAN, FEB, []) == [(JAN, FEB)]
+
+    def test_covered_by_wider_partition(self):
+        """Day partitions inside an existing month partition are not created."""
+        day = datetime(2025, 1, 10)
+        assert uncovered_ranges(day, day + timedelta(days=1), [(JAN, FEB)]) == []
+
+    def test_gaps_between_narrower_partitions(self):
+        """A month partition over existing day partitions fills only the gaps."""
+        jan2, jan3, jan5 = datetime(2025, 1, 2), datetime(2025, 1, 3), datetime(2025, 1, 5)
+        existing = [(jan3, jan3 + timedelta(days=1)), (JAN, jan2), (jan5, jan5 + timedelta(days=1))]
+        assert uncovered_ranges(JAN, FEB, existing) == [
+            (jan2, jan3),
+            (jan3 + timedelta(days=1), jan5),
+            (jan5 + timedelta(days=1), FEB),
+        ]
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not POSTGRESQL_URL, reason="SOCFLOW_TEST_POSTGRESQL_URL not set")
+class TestPostgreSQLManager:
+    """Test the PostgreSQL manager against a live server."""
+
+    @pytest.fixture
+    def make_manager(self):
+        """Factory for managers on a freshly emptied database."""
+        from src.database.postgresql import PostgreSQLManager, metadata
+
+        managers = []
+
+        def make(interval: str = "month") -> PostgreSQLManager:
+            manager = PostgreSQLManager(POSTGRESQL_URL, config=PostgreSQLConfig(partition_interval=interval))
+            if not managers:
+                metadata.drop_all(manager.engine)
+            manager.create_tables([])
+            managers.append(manager)
+            return manager
+
+        yield make
+        metadata.drop_all(managers[0].engine)
+        for manager in managers:
+            manager.close()
+
+    def test_insert_and_update_counts(self, make_manager):
+        manager = make_manager()
+        posts = [make_post(i, JAN + timedelta(days=i)) for i in range(40)]
+        assert manager.insert_posts(posts)["inserted"] == 40
+
+        counts = manager.insert_posts([
+            make_post(0, posts[0].created_at, text="Edited"),
+            make_post(1, posts[1].created_at, likes=3),
+            posts[2],
+        ])
+        assert (counts["updated"], counts["metrics_updated"], counts["skipped"]) == (1, 1, 1)
+        assert manager.get_post_count("reddit") == 40
+
+    def test_partition_interval_change(self, make_manager):
+        """Switching interval reuses old partitions and fills the gaps."""
+        make_manager("day").insert_posts([make_post(0, datetime(2025, 1, 10, 12))])
+
+        manager = make_manager("month")
+        manager.insert_posts([make_post(i, datetime(2025, 1, i, 8)) for i in range(1, 32)])
+        assert manager.get_post_count("reddit") == 32
+
+        day = make_manager("day")
+        day.insert_posts([make_post(100, datetime(2025, 1, 20, 9))])
+        assert day.get_post_count("reddit") == 33
+
+    def test_changed_posts_watermark(self, make_manager):
+        manager = make_manager()
+        manager.insert_posts([make_post(i, JAN + timedelta(hours=i)) for i in range(5)])
+        posts = list(manager.iter_changed_posts(batch_size=2))
+        assert len(posts) == 5
+
+        last = posts[-1]
+        after = (datetime.fromisoformat(last["updated_at"]), last["id"])
+        manager.insert_posts([make_post(3, JAN + timedelta(hours=3), text="Edited")])
+        assert [post["object_id"] for post in manager.iter_changed_posts(after=after)] == ["3"]
+
+    def test_changed_created_at_updates_existing_post(self, make_manager):
+        """A post reported again with another creation time is not stored twice."""
+        manager = make_manager()
+        manager.insert_posts([make_post(0, JAN + timedelta(days=3))])
+
+        counts = manager.insert_posts([
+            make_post(0, FEB + timedelta(days=3), text="Edited"),
+            make_post(1, FEB, likes=1),
+            make_post(1, FEB + timedelta(hours=1), likes=2),
+        ])
+        assert (counts["inserted"], counts["updated"]) == (1, 1)
+        posts = {post["object_id"]: post for post in manager.get_posts()}
+        assert len(posts) == 2
+        assert posts["0"]["text"] == "Edited"
+        assert datetime.fromisoformat(posts["0"]["created_at"]).replace(tzinfo=None) == JAN + timedelta(days=3)
+        assert manager.get_post_count() == 2
+
+    def test_post_keys_backfilled_for_existing_database(self, make_manager):
+        from sqlalchemy import text
+
+        manager = make_manager()
+        manager.insert_posts([make_post(i, JAN + timedelta(days=i)) for i in range(3)])
+        with manager.engine.begin() as conn:
+            conn.execute(text("DROP TABLE post_keys"))
+
+        upgraded = make_manager()
+        counts = upgraded.insert_posts([make_post(1, FEB, text="Edited")])
+        assert (counts["inserted"], counts["updated"]) == (0, 1)
+        assert upgraded.get_post_count() == 3
@@ -0,0 +1,205 @@
+"""Tests for quota-driven rate limiting."""
+
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from src.collectors import bluesky as bluesky_module
+from src.collectors import mastodon as mastodon_module
+from src.collectors import reddit as reddit_module
+from src.collectors.bluesky import BlueskyCollector
+from src.collectors.mastodon import MastodonCollector
+from src.collectors.reddit import RedditCollector
+from src.utils.rate_limit import RateLimiter, TokenBucket, parse_rate_limit_headers
+
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc).timestamp()
+
+
+class FakeClock:
+    """Monotonic clock that only moves when the bucket sleeps."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def make_bucket(clock: FakeClock, rate: float = 2.0, burst: float = 4.0) -> TokenBucket:
+    return TokenBucket(rate, burst, clock=clock, sleep=clock.sleep)
+
+
+class TestParseHeaders:
+    """Test reading quotas from each platform's headers."""
+
+    def test_reddit_seconds_until_reset(self):
+        headers = {"X-Ratelimit-Remaining": "95.0", "X-Ratelimit-Used": "5", "X-Ratelimit-Reset": "42"}
+        assert parse_rate_limit_headers(headers, now=NOW) == (95.0, 42.0, 100.0)
+
+    def test_mastodon_iso_reset(self):
+        headers = {
+            "X-RateLimit-Limit": "300",
+            "X-RateLimit-Remaining": "299",
+            "X-RateLimit-Reset": "2025-01-01T00:05:00.000Z",
+        }
+        assert parse_rate_limit_headers(headers, now=NOW) == (299.0, 300.0, 300.0)
+
+    def test_naive_iso_reset_is_utc(self):
+        headers = {"X-RateLimit-Remaining": "1", "X-RateLimit-Reset": "2025-01-01T00:01:00"}
+        assert parse_rate_limit_headers(headers, now=NOW) == (1.0, 60.0, None)
+
+    def test_bluesky_epoch_reset(self):
+        headers = {"ratelimit-limit": "3000", "ratelimit-remaining": "2999", "ratelimit-reset": str(int(NOW) + 120)}
+        assert parse_rate_limit_headers(headers, now=NOW) == (2999.0, 120.0, 3000.0)
+
+    def test_reset_in_the_past(self):
+        headers = {"RateLimit-Remaining": "0", "RateLimit-Reset": str(int(NOW) - 5)}
+        assert parse_rate_limit_headers(headers, now=NOW) == (0.0, 0.0, None)
+
+    @pytest.mark.parametrize("headers", [
+        {},
+        {"X-RateLimit-Remaining": "10"},
+        {"X-RateLimit-Reset": "10"},
+        {"X-RateLimit-Remaining": "many", "X-RateLimit-Reset": "10"},
+        {"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "soon"},
+        {"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "10", "X-RateLimit-Limit": "lots"},
+    ])
+    def test_missing_or_malformed(self, headers):
+        assert parse_rate_limit_headers(headers, now=NOW) is None
+
+
+class TestTokenBucket:
+    """Test refill and blocking with an injected clock."""
+
+    def test_rejects_non_positive_rate(self, clock):
+        with pytest.raises(ValueError):
+            make_bucket(clock, rate=0)
+
+    def test_burst_then_paced(self, clock):
+        bucket = make_bucket(clock)
+        assert [bucket.acquire() for _ in range(4)] == [0.0] * 4
+        assert bucket.acquire() == pytest.approx(0.5)
+        assert clock.now == pytest.approx(0.5)
+
+    def test_refill_is_capped_at_burst(self, clock):
+        bucket = make_bucket(clock)
+        bucket.acquire(4)
+        clock.now += 100
+        assert bucket.status()["tokens"] == 4.0
+
+    def test_large_request_waits_for_full_bucket(self, clock):
+        bucket = make_bucket(clock)
+        bucket.acquire(2)
+        # Costs more than the bucket holds: wait until full, then go into debt
+        assert bucket.acquire(10) == pytest.approx(1.0)
+        assert bucket.tokens == pytest.approx(-6.0)
+        assert bucket.acquire() == pytest.approx(3.5)
+
+    def test_update_spreads_remaining_quota(self, clock):
+        bucket = make_bucket(clock)
+        bucket.update(remaining=24, reset_in=100, limit=300)
+        assert bucket.status() == {"tokens": 4.0, "rate": pytest.approx(0.2), "limit": 300}
+
+    def test_exhausted_quota_blocks_until_reset(self, clock):
+        bucket = make_bucket(clock)
+        bucket.update(remaining=0, reset_in=30)
+        assert bucket.tokens == 0.0 and bucket.rate == 0.0
+        assert bucket.acquire() == pytest.approx(30.0)
+        # The window rolled over: base rate and a full bucket
+        assert bucket.rate == 2.0
+        assert bucket.tokens == pytest.approx(3.0)
+
+    def test_update_with_reset_now_keeps_base_rate(self, clock):
+        bucket = make_bucket(clock)
+        bucket.update(remaining=10, reset_in=0)
+        assert bucket.rate == 2.0
+
+
+class TestRateLimiter:
+    """Test the per-platform, account and instance buckets."""
+
+    def test_buckets_are_keyed(self):
+        limiter = RateLimiter({"mastodon": 1.0})
+        a = limiter.bucket("mastodon", "me", "https://a.social")
+        assert limiter.bucket("mastodon", "me", "https://a.social") is a
+        assert limiter.bucket("mastodon", "me", "https://b.social") is not a
+
+    def test_configure_sets_rate_of_new_buckets(self):
+        limiter = RateLimiter({})
+        assert limiter.bucket("reddit").base_rate == 1.0
+        limiter.configure("bluesky", 120)
+        assert limiter.bucket("bluesky").base_rate == 2.0
+
+    def test_update_from_headers(self):
+        limiter = RateLimiter()
+        assert not limiter.update_from_headers({"Content-Type": "application/json"}, "bluesky")
+        assert limiter.bucket("bluesky").limit is None
+
+        headers = {"RateLimit-Limit": "3000", "RateLimit-Remaining": "2000", "RateLimit-Reset": str(int(time.time()) + 300)}
+        assert limiter.update_from_headers(headers, "bluesky")
+        assert limiter.bucket("bluesky").limit == 3000.0
+
+
+class TestCollectorHooks:
+    """Test that collectors feed their platform's quota to the shared limiter."""
+
+    @pytest.fixture
+    def limiter(self, monkeypatch):
+        limiter = RateLimiter()
+        for module in (reddit_module, mastodon_module, bluesky_module):
+            monkeypatch.setattr(module, "rate_limiter", limiter)
+        return limiter
+
+    def test_acquire_uses_platform_account_and_instance(self, limiter, monkeypatch):
+        calls = []
+        monkeypatch.setattr(limiter, "acquire", lambda *args: calls.append(args))
+        monkeypatch.setattr("src.collectors.base.rate_limiter", limiter)
+        collector = SimpleNamespace(account="me", get_platform_name=lambda: "mastodon")
+        MastodonCollector._acquire(collector, "https://a.social", requests=3)
+        assert calls == [("mastodon", "me", "https://a.social", 3)]
+
+    def test_reddit_limits(self, limiter, monkeypatch):
+        monkeypatch.setattr(reddit_module, "time", SimpleNamespace(time=lambda: NOW))
+        reddit = SimpleNamespace(auth=SimpleNamespace(limits={"remaining": 90.0, "used": 10, "reset_timestamp": NOW + 60}))
+        RedditCollector._record_limits(SimpleNamespace(reddit=reddit, account="id"))
+        bucket = limiter.bucket("reddit", "id")
+        assert bucket.limit == 100.0
+        assert bucket.rate == pytest.approx((90 - bucket.tokens) / 60)
+
+    def test_reddit_without_limits(self, limiter):
+        reddit = SimpleNamespace(auth=SimpleNamespace(limits={"remaining": None}))
+        RedditCollector._record_limits(SimpleNamespace(reddit=reddit, account="id"))
+        assert limiter.bucket("reddit", "id").limit is None
+
+    def test_mastodon_limits_per_instance(self, limiter):
+        client = SimpleNamespace(
+            api_base_url="https://a.social",
+            ratelimit_remaining=0,
+            ratelimit_reset=time.time() + 300,
+            ratelimit_limit=300,
+        )
+        MastodonCollector._record_limits(SimpleNamespace(account="me"), client)
+        assert limiter.bucket("mastodon", "me", "https://a.social").tokens == 0.0
+        assert limiter.bucket("mastodon", "me", "https://b.social").tokens > 0
+
+    def test_bluesky_response_hook(self, limiter):
+        response = SimpleNamespace(headers={
+            "ratelimit-limit": "3000",
+            "ratelimit-remaining": "1",
+            "ratelimit-reset": str(int(time.time()) + 300),
+        })
+        BlueskyCollector._record_limits(SimpleNamespace(account="me.bsky.social"), response)
+        bucket = limiter.bucket("bluesky", "me.bsky.social")
+        assert (bucket.limit, bucket.tokens) == (3000.0, 1.0)
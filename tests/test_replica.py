@@ -0,0 +1,74 @@
+"""Tests for the snapshot read replica."""
+
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from src.config.settings import DatabaseConfig, ReadReplicaConfig
+from src.database import replica as replica_module
+from src.database.replica import SnapshotReplica
+from src.database.sqlite import SQLiteManager
+from src.models.base import BasePost
+
+
+@pytest.fixture
+def live(temp_dir: Path):
+    """Live database with one post, and its configuration."""
+    config = DatabaseConfig(path=str(temp_dir / "live.db"), read_replica=ReadReplicaConfig(enabled=True))
+    manager = SQLiteManager(f"sqlite:///{temp_dir / 'live.db'}")
+    manager.create_tables([])
+    manager.insert_posts([BasePost(platform="reddit", object_id="1", author_handle="a", text="Hi", created_at=datetime(2025, 1, 1))])
+    yield manager, config
+    manager.close()
+
+
+def foreign_generation(directory: Path, age: float) -> Path:
+    """An empty generation directory taken ``age`` seconds ago by another process."""
+    path = directory / f"{int((time.time() - age) * 1000)}-{os.getpid() + 1}"
+    path.mkdir(parents=True)
+    return path
+
+
+class TestSnapshotReplica:
+    """Test snapshot generations."""
+
+    def test_default_staleness_is_not_a_copy_per_minute(self):
+        assert ReadReplicaConfig().max_staleness_seconds >= 3600
+
+    def test_reuses_fresh_snapshot(self, live, temp_dir):
+        manager, config = live
+        replica = SnapshotReplica(manager, config, temp_dir / "snapshots")
+        try:
+            first = replica.get()
+            assert first.get_post_count() == 1
+            assert replica.get() is first
+            assert len(list((temp_dir / "snapshots").iterdir())) == 1
+        finally:
+            replica.close()
+
+    def test_only_removes_own_or_abandoned_generations(self, live, temp_dir, monkeypatch):
+        """Generations other processes may still read survive this process's cleanup."""
+        manager, config = live
+        directory = temp_dir / "snapshots"
+        staleness = config.read_replica.max_staleness_seconds
+        recent = foreign_generation(directory, staleness + 60)
+        abandoned = foreign_generation(directory, staleness + replica_module.FOREIGN_GENERATION_GRACE + 60)
+
+        replica = SnapshotReplica(manager, config, directory)
+        try:
+            own = []
+            for _ in range(4):
+                replica.refresh()
+                own.append(max(replica._created))
+                time.sleep(0.002)
+        finally:
+            replica.close()
+
+        remaining = set(directory.iterdir())
+        assert recent in remaining
+        assert abandoned not in remaining
+        # The newest two of this process's own generations are kept
+        assert remaining == {recent, own[-2], own[-1]}
@@ -0,0 +1,129 @@
+"""Tests for retention policies and space reclamation."""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from src.config.settings import RetentionConfig, RetentionPolicy, SQLitePerformanceConfig
+from src.database.retention import compact_database
+from src.database.sqlite import SQLiteManager
+from src.models.base import BasePost, Metrics
+
+NOW = datetime(2025, 1, 1)
+
+
+def make_post(platform: str, i: int, age_days: int) -> BasePost:
+    """A post ``age_days`` old with a large raw payload."""
+    return BasePost(
+        platform=platform,
+        object_id=str(i),
+        author_handle="user",
+        text=f"Post {i} " + "x" * 300,
+        created_at=NOW - timedelta(days=age_days, seconds=i),
+        metrics=Metrics(likes=i),
+        raw_data={"blob": "y" * 3000 + str(i)},
+    )
+
+
+def scalar(manager: SQLiteManager, sql: str):
+    """Run a scalar query on the writer engine."""
+    with manager.engine.connect() as conn:
+        return conn.exec_driver_sql(sql).scalar()
+
+
+@pytest.fixture
+def manager(temp_dir: Path):
+    """SQLite manager with incremental auto-vacuum."""
+    manager = SQLiteManager(f"sqlite:///{temp_dir / 'retention.db'}")
+    manager.create_tables([])
+    yield manager
+    manager.close()
+
+
+class TestRetention:
+    """Test retention policies."""
+
+    def test_delete_posts_older_than_cutoff(self, manager):
+        """Posts older than post_days are deleted with their side tables."""
+        manager.insert_posts([make_post("reddit", i, i % 100) for i in range(1000)])
+        config = RetentionConfig(default=RetentionPolicy(post_days=50), batch_size=77, batch_pause_ms=0)
+
+        result = compact_database(manager, config, now=NOW)
+
+        kept = manager.get_post_count("reddit")
+        assert kept == 500
+        assert result["deleted_posts"]["reddit"] == 500
+        assert scalar(manager, "SELECT count(*) FROM post_raw r LEFT JOIN posts p ON p.id = r.post_id WHERE p.id IS NULL") == 0
+
+    def test_drop_raw_data_keeps_posts(self, manager):
+        """raw_data_days drops payloads but keeps the posts."""
+        manager.insert_posts([make_post("bluesky", i, i % 100) for i in range(1000)])
+        config = RetentionConfig(
+            platforms={"bluesky": RetentionPolicy(raw_data_days=10)}, batch_size=100, batch_pause_ms=0
+        )
+
+        result = compact_database(manager, config, now=NOW)
+
+        assert manager.get_post_count("bluesky") == 1000
+        assert scalar(manager, "SELECT count(*) FROM post_raw") == 100
+        assert result["dropped_raw"]["bluesky"] == 900
+        # Running again finds nothing left to do
+        again = compact_database(manager, config, now=NOW)
+        assert again["dropped_raw"]["bluesky"] == 0
+
+
+class TestReclaimSpace:
+    """Test incremental vacuum."""
+
+    def test_each_step_frees_pages_per_step(self, manager, monkeypatch):
+        """One reclaim step releases pages_per_step pages, not one."""
+        manager.insert_posts([make_post("reddit", i, 0) for i in range(1000)])
+        manager.delete_posts("reddit", NOW + timedelta(days=1))
+        free_pages = scalar(manager, "PRAGMA freelist_count")
+        assert free_pages > 150
+
+        # reclaim_space pauses between steps; count them
+        pauses = []
+        monkeypatch.setattr("src.database.sqlite.time.sleep", pauses.append)
+        result = manager.reclaim_space(pages_per_step=50, pause=0.01)
+
+        assert len(pauses) == -(-free_pages // 50) - 1
+        assert scalar(manager, "PRAGMA freelist_count") == 0
+        page_size = scalar(manager, "PRAGMA page_size")
+        assert result["freed_bytes"] == free_pages * page_size
+        assert result["free_bytes"] == 0
+
+    def test_file_shrinks(self, manager, temp_dir):
+        """Compaction hands the freed pages back to the file system."""
+        manager.insert_posts([make_post("reddit", i, i % 100) for i in range(2000)])
+        with manager.engine.begin() as conn:
+            conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+        before = (temp_dir / "retention.db").stat().st_size
+
+        compact_database(manager, RetentionConfig(default=RetentionPolicy(post_days=20), batch_pause_ms=0), now=NOW)
+        with manager.engine.begin() as conn:
+            conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+
+        assert (temp_dir / "retention.db").stat().st_size < before * 0.5
+
+    def test_full_vacuum_converts_legacy_file(self, temp_dir):
+        """Files created without auto_vacuum are reported, and converted by a full vacuum."""
+        path = temp_dir / "legacy.db"
+        legacy = SQLiteManager(f"sqlite:///{path}", performance=SQLitePerformanceConfig(auto_vacuum="none"))
+        legacy.create_tables([])
+        legacy.insert_posts([make_post("reddit", i, i % 100) for i in range(500)])
+        legacy.close()
+
+        manager = SQLiteManager(f"sqlite:///{path}")
+        config = RetentionConfig(default=RetentionPolicy(post_days=50), batch_pause_ms=0)
+        try:
+            result = compact_database(manager, config, now=NOW)
+            assert result["files_without_incremental"] == 1
+            assert result["free_bytes"] > 0
+
+            result = compact_database(manager, config, now=NOW, full_vacuum=True)
+            assert result["files_without_incremental"] == 0
+            assert scalar(manager, "PRAGMA auto_vacuum") == 2
+        finally:
+            manager.close()
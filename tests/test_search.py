@@ -0,0 +1,176 @@
+"""Tests for SQLite full-text search and the search command."""
+
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+import yaml
+from click.testing import CliRunner
+
+from src.app import cli
+from src.config.settings import RetentionConfig, RetentionPolicy, SearchConfig
+from src.database.retention import compact_database
+from src.database.sqlite import SQLiteManager
+from src.models.base import BasePost, Metrics
+
+NOW = datetime(2025, 1, 10)
+
+
+def make_post(i: int, text: str, platform: str = "reddit", age_days: int = 0) -> BasePost:
+    """A post keyed by ``i``."""
+    return BasePost(
+        platform=platform,
+        object_id=str(i),
+        author_handle=f"user_{i}",
+        text=text,
+        created_at=NOW - timedelta(days=age_days, minutes=i),
+        metrics=Metrics(),
+    )
+
+
+def matches(manager: SQLiteManager, query: str, **kwargs) -> list:
+    """Object ids of the posts matching a query."""
+    return sorted(post["object_id"] for post in manager.search(query, **kwargs))
+
+
+@pytest.fixture
+def manager(temp_dir: Path):
+    """SQLite manager with the FTS5 index."""
+    manager = SQLiteManager(f"sqlite:///{temp_dir / 'test.db'}", search=SearchConfig(enabled=True))
+    manager.create_tables([])
+    yield manager
+    manager.close()
+
+
+class TestSearchIndex:
+    """Test that the FTS5 triggers keep the index in step with posts."""
+
+    def test_match_after_insert(self, manager):
+        manager.insert_posts([make_post(0, "Large language models"), make_post(1, "Garden tomatoes")])
+        results = manager.search("language")
+        assert [post["object_id"] for post in results] == ["0"]
+        assert results[0]["snippet"] == "Large [language] models"
+
+    def test_update_replaces_indexed_text(self, manager):
+        manager.insert_posts([make_post(0, "Original wording")])
+        manager.insert_posts([make_post(0, "Edited phrasing")])
+        assert matches(manager, "original") == []
+        assert matches(manager, "edited") == ["0"]
+
+    def test_delete_posts_removes_entries(self, manager):
+        manager.insert_posts([make_post(0, "Expiring post", age_days=30), make_post(1, "Fresh post")])
+        assert manager.delete_posts("reddit", NOW - timedelta(days=7)) == 1
+        assert matches(manager, "post") == ["1"]
+        assert matches(manager, "expiring") == []
+
+    def test_retention_removes_entries(self, manager):
+        manager.insert_posts([make_post(i, f"Retained post {i}", age_days=i * 10) for i in range(5)])
+        config = RetentionConfig(default=RetentionPolicy(post_days=25), batch_size=2, batch_pause_ms=0)
+        compact_database(manager, config, now=NOW)
+        assert matches(manager, "retained") == ["0", "1", "2"]
+
+    def test_index_built_for_existing_posts(self, temp_dir):
+        path = temp_dir / "existing.db"
+        plain = SQLiteManager(f"sqlite:///{path}")
+        plain.create_tables([])
+        plain.insert_posts([make_post(0, "Collected before search was enabled")])
+        plain.close()
+
+        manager = SQLiteManager(f"sqlite:///{path}", search=SearchConfig(enabled=True))
+        try:
+            manager.create_tables([])
+            assert matches(manager, "enabled") == ["0"]
+        finally:
+            manager.close()
+
+    def test_without_index(self, temp_dir):
+        manager = SQLiteManager(f"sqlite:///{temp_dir / 'plain.db'}")
+        try:
+            manager.create_tables([])
+            with pytest.raises(RuntimeError, match="not enabled"):
+                manager.search("anything")
+        finally:
+            manager.close()
+
+
+class TestQueryInput:
+    """Test operators, quotes and malformed queries in user input."""
+
+    @pytest.fixture
+    def posts(self, manager):
+        manager.insert_posts([
+            make_post(0, "Cats or dogs"),
+            make_post(1, "Cats and birds"),
+            make_post(2, "Dogs NOT allowed"),
+            make_post(3, "Don't panic"),
+        ])
+        return manager
+
+    def test_operators(self, posts):
+        assert matches(posts, "cats OR allowed") == ["0", "1", "2"]
+        assert matches(posts, "cats NOT birds") == ["0"]
+        assert matches(posts, "cat*") == ["0", "1"]
+
+    def test_quoted_operators_are_terms(self, posts):
+        assert matches(posts, '"or"') == ["0"]
+        assert matches(posts, '"NOT" allowed') == ["2"]
+
+    def test_quotes(self, posts):
+        # An apostrophe is not FTS5 syntax outside a phrase
+        with pytest.raises(ValueError, match="Invalid search query"):
+            posts.search("don't")
+        assert matches(posts, '"don\'t"') == ["3"]
+        # A doubled quote is a literal quote inside a phrase
+        assert matches(posts, '"don""t"') == ["3"]
+
+    @pytest.mark.parametrize("query", ['"unterminated', "cats AND", "NEAR(", "platform:reddit"])
+    def test_malformed_query(self, posts, query):
+        with pytest.raises(ValueError, match="Invalid search query"):
+            posts.search(query)
+
+    def test_sql_is_not_interpolated(self, posts):
+        with pytest.raises(ValueError):
+            posts.search("'; DROP TABLE posts; --")
+        assert posts.get_post_count() == 4
+
+
+class TestSearchCommand:
+    """Test the ``search`` CLI command."""
+
+    @pytest.fixture
+    def config_file(self, temp_config_file: Path) -> Path:
+        with open(temp_config_file) as f:
+            config = yaml.safe_load(f)
+        config['database']['search'] = {'enabled': True}
+        with open(temp_config_file, 'w') as f:
+            yaml.dump(config, f)
+
+        manager = SQLiteManager(f"sqlite:///{config['database']['path']}", search=SearchConfig(enabled=True))
+        manager.create_tables([])
+        manager.insert_posts([make_post(0, "Rust compiler release"), make_post(1, "Compiler bug", platform="mastodon")])
+        manager.close()
+        return temp_config_file
+
+    def run(self, config_file: Path, *args: str):
+        return CliRunner().invoke(cli, ["--config", str(config_file), "search", *args])
+
+    def test_results(self, config_file):
+        result = self.run(config_file, "compiler", "--platform", "reddit")
+        assert result.exit_code == 0
+        assert "[reddit]" in result.output
+        assert "Rust [compiler] release" in result.output
+        assert "mastodon" not in result.output
+
+    def test_json(self, config_file):
+        result = self.run(config_file, "compiler", "--json")
+        # Log lines may share the captured output
+        lines = [json.loads(line) for line in result.output.splitlines() if line.startswith("{")]
+        assert sorted(post["object_id"] for post in lines) == ["0", "1"]
+
+    def test_no_match(self, config_file):
+        assert "No matching posts" in self.run(config_file, "python").output
+
+    def test_invalid_query_reported(self, config_file):
+        result = self.run(config_file, '"unterminated')
+        assert "Error: Invalid search query" in result.output